@@ -20,7 +20,7 @@ from rex.multi_year_resource import (MultiYearNSRDB, MultiYearResource,
                                      MultiYearWindResource)
 from rex.multi_res_resource import MultiResolutionResource
 from rex.rechunk_h5 import (ArrayChunkSize, TimeseriesChunkSize, CombineH5,
-                            RechunkH5, get_dataset_attributes)
+                            RechunkH5, VirtualH5, get_dataset_attributes)
 from rex.renewable_resource import (NSRDB, WaveResource, WindResource,
                                     GeothermalResource)
 from rex.resource_extraction import (ResourceX, MultiFileResourceX,
@@ -31,11 +31,13 @@ from rex.resource_extraction import (ResourceX, MultiFileResourceX,
                                      MultiTimeWindX, MultiYearWindX,
                                      WaveX, MultiTimeWaveX, MultiYearWaveX)
 from rex.temporal_stats import TemporalStats
-from rex.utilities import (SpawnProcessPool, SLURM, init_logger, init_mult,
-                           setup_logger, log_mem, log_versions, LOGGERS,
-                           SolarPosition, safe_json_load, jsonify_dict,
-                           parse_year, check_res_file, parse_table,
-                           check_eval_str, to_records_array)
+from rex.utilities import (ChunkCache, HandlePool, LazyResource, SidecarCache,
+                           SpawnProcessPool, SLURM, init_logger, init_mult,
+                           setup_logger, log_mem,
+                           log_versions, LOGGERS, SolarPosition,
+                           safe_json_load, jsonify_dict, parse_year,
+                           check_res_file, parse_table, check_eval_str,
+                           to_records_array)
 from rex.resource import Resource
 from rex.outputs import Outputs
 from rex.version import __version__
@@ -3,6 +3,7 @@
 General Joint Probabilty Distribution calculator
 """
 from concurrent.futures import as_completed
+from contextlib import nullcontext
 import gc
 import logging
 import h5py
@@ -17,6 +18,7 @@ from rex.resource import Resource
 from rex.utilities.execution import SpawnProcessPool
 from rex.utilities.loggers import log_mem, log_versions
 from rex.utilities.utilities import slice_sites, to_records_array
+from rex.utilities.worker_pool import SharedArray, get_worker_resource
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +27,8 @@ class JointPD:
     """
     Compute the joint probability distribution between the desired variables
     """
-    def __init__(self, res_h5, res_cls=Resource, hsds=False):
+    def __init__(self, res_h5, res_cls=Resource, hsds=False,
+                 shared_memory=False):
         """
         Parameters
         ----------
@@ -37,11 +40,18 @@ class JointPD:
         hsds : bool, optional
             Boolean flag to use h5pyd to handle .h5 'files' hosted on AWS
             behind HSDS, by default False
+        shared_memory : bool, optional
+            Flag to run parallel computations with long-lived workers that
+            keep res_h5 open across tasks and write the joint probability
+            densities into a preallocated shared memory array indexed by gid
+            instead of pickling them back to the main process,
+            by default False
         """
         log_versions(logger)
         self._res_h5 = res_h5
         self._res_cls = res_cls
         self._hsds = hsds
+        self._shared_memory = shared_memory
 
     @property
     def res_h5(self):
@@ -91,7 +101,7 @@ class JointPD:
     @classmethod
     def compute_joint_pd(cls, res_h5, dset1, dset2, bins1, bins2,
                          res_cls=Resource, hsds=False,
-                         sites_slice=None):
+                         sites_slice=None, keep_open=False):
         """
         Compute the joint probability distribution between the two given
         datasets using the given bins for given sites
@@ -123,6 +133,9 @@ class JointPD:
         sites_slice : slice | None, optional
             Sites to extract, if None all, by default None
             (sites is synonymous with gids aka spatial indices)
+        keep_open : bool, optional
+            Flag to keep res_h5 open for the life of the (worker) process and
+            re-use it in later calls, by default False
 
         Returns
         -------
@@ -135,7 +148,12 @@ class JointPD:
         elif isinstance(sites_slice, int):
             sites_slice = [sites_slice]
 
-        with res_cls(res_h5, hsds=hsds) as f:
+        if keep_open:
+            res = nullcontext(get_worker_resource(res_cls, res_h5, hsds=hsds))
+        else:
+            res = res_cls(res_h5, hsds=hsds)
+
+        with res as f:
             arr1 = f[dset1, :, sites_slice]
             arr2 = f[dset2, :, sites_slice]
 
@@ -155,6 +173,115 @@ class JointPD:
 
         return jpd
 
+    @classmethod
+    def _compute_shared_joint_pd(cls, out, rows, res_h5, dset1, dset2, bins1,
+                                 bins2, **kwargs):
+        """
+        Compute the joint probability distribution for given sites on a
+        long-lived worker and write it into a shared memory array
+
+        Parameters
+        ----------
+        out : rex.utilities.worker_pool.SharedArray
+            Shared (n_sites, n_bins1 * n_bins2) array of joint probability
+            distribution densities
+        rows : slice
+            Rows of out to write the densities of sites_slice to
+        res_h5 : str
+            Path to resource h5 file(s)
+        dset1 : str
+            Dataset 1 to generate joint probability distribution for
+        dset2 : str
+            Dataset 2 to generate joint probabilty distribution for
+        bins1 : tuple
+            (start, stop, step) for dataset 1 bins
+        bins2 : tuple
+            (start, stop, step) for dataset 2 bins
+        kwargs : dict
+            Additional kwargs for compute_joint_pd
+
+        Returns
+        -------
+        n_sites : int
+            Number of sites written to out
+        """
+        jpd = cls.compute_joint_pd(res_h5, dset1, dset2, bins1, bins2,
+                                   keep_open=True, **kwargs)
+        out.array[rows] = [v.flatten(order='F') for v in jpd.values()]
+        out.close()
+
+        return len(jpd)
+
+    def _compute_shared(self, dset1, dset2, bins1, bins2, slices,
+                        max_workers):
+        """
+        Compute the joint probability distribution in parallel with
+        long-lived workers writing into a preallocated shared memory result
+        array
+
+        Parameters
+        ----------
+        dset1 : str
+            Dataset 1 to generate joint probability distribution for
+        dset2 : str
+            Dataset 2 to generate joint probabilty distribution for
+        bins1 : tuple
+            (start, stop, step) for dataset 1 bins
+        bins2 : tuple
+            (start, stop, step) for dataset 2 bins
+        slices : list
+            List of sites slices to extract
+        max_workers : int
+            Number of workers to use
+
+        Returns
+        -------
+        jpd : dict
+            Dictionary of flattened joint probabilty distribution densities
+            for all sites
+        """
+        gids = []
+        for sites_slice in slices:
+            if isinstance(sites_slice, slice):
+                gids.append(np.arange(*sites_slice.indices(sites_slice.stop)))
+            else:
+                gids.append(np.atleast_1d(sites_slice))
+
+        rows = np.cumsum([0] + [len(g) for g in gids])
+        gids = np.concatenate(gids)
+        n_bins = ((len(self._make_bins(*bins1)) - 1)
+                  * (len(self._make_bins(*bins2)) - 1))
+
+        msg = ('Computing the joint probability distribution between {} '
+               'and {} in parallel using {} workers and a shared memory '
+               'result array of shape {}'
+               .format(dset1, dset2, max_workers, (len(gids), n_bins)))
+        logger.info(msg)
+
+        loggers = [__name__, 'rex']
+        with SharedArray((len(gids), n_bins), dtype=np.float32) as out:
+            with SpawnProcessPool(max_workers=max_workers,
+                                  loggers=loggers) as exe:
+                futures = []
+                for i, sites_slice in enumerate(slices):
+                    future = exe.submit(self._compute_shared_joint_pd,
+                                        out, slice(rows[i], rows[i + 1]),
+                                        self.res_h5, dset1, dset2,
+                                        bins1, bins2,
+                                        res_cls=self.res_cls,
+                                        hsds=self._hsds,
+                                        sites_slice=sites_slice)
+                    futures.append(future)
+
+                for i, future in enumerate(as_completed(futures)):
+                    future.result()
+                    logger.debug('Completed {} out of {} workers'
+                                 .format((i + 1), len(futures)))
+
+            jpd = dict(zip(gids.tolist(), out.array.copy()))
+
+        return jpd
+
     def _get_slices(self, dset1, dset2, sites=None, chunks_per_slice=5):
         """
         Get slices to extract, ensure the shapes of dset1 and 2 match.
@@ -237,7 +364,10 @@ class JointPD:
             max_workers = 1
 
         jpd = {}
-        if max_workers > 1:
+        if max_workers > 1 and self._shared_memory:
+            jpd = self._compute_shared(dset1, dset2, bins1, bins2, slices,
+                                       max_workers)
+        elif max_workers > 1:
             msg = ('Computing the joint probability distribution between {} '
                    'and {} in parallel using {} workers'
                    .format(dset1, dset2, max_workers))
@@ -445,7 +575,7 @@ class JointPD:
     def wind_rose(cls, wind_h5, hub_height, wspd_bins=(0, 30, 1),
                   wdir_bins=(0, 360, 5), sites=None, res_cls=WindResource,
                   hsds=False, max_workers=None, chunks_per_worker=5,
-                  out_fpath=None):
+                  out_fpath=None, shared_memory=False):
         """
         Compute wind rose at given hub height
 
@@ -474,6 +604,9 @@ class JointPD:
             Number of chunks to extract on each worker, by default 5
         out_fpath : str, optional
             .csv, or .h5 file path to save wind rose to
+        shared_memory : bool, optional
+            Flag to run parallel computations with long-lived workers
+            writing into a shared memory result array, by default False
 
         Returns
         -------
@@ -489,7 +622,8 @@ class JointPD:
                      '\n-chunks per worker: {}'
                      .format(wspd_bins, wdir_bins, max_workers,
                              chunks_per_worker))
-        wind_rose = cls(wind_h5, res_cls=res_cls, hsds=hsds)
+        wind_rose = cls(wind_h5, res_cls=res_cls, hsds=hsds,
+                        shared_memory=shared_memory)
         wspd_dset = 'windspeed_{}m'.format(hub_height)
         wdir_dset = 'winddirection_{}m'.format(hub_height)
         out = wind_rose.compute(wspd_dset, wdir_dset, wspd_bins, wdir_bins,
@@ -2,9 +2,11 @@
 """
 Classes to handle resource data
 """
+import hashlib
 import os
 from glob import glob
 import logging
+
 import numpy as np
 
 from rex.renewable_resource import (NSRDB, SolarResource, GeothermalResource,
@@ -12,6 +14,8 @@ from rex.renewable_resource import (NSRDB, SolarResource, GeothermalResource,
                                     AbstractInterpolatedResource)
 from rex.resource import Resource, BaseDatasetIterable
 from rex.utilities.exceptions import FileInputError, ResourceRuntimeError
+from rex.utilities.sidecar_cache import (SidecarCache, load_manifest,
+                                         save_manifest)
 from rex.utilities.utilities import unstupify_path
 
 
@@ -23,16 +27,31 @@ class MultiH5(BaseDatasetIterable):
     Class to handle multiple h5 file Resources
     """
 
-    def __init__(self, h5_files, check_files=False):
+    def __init__(self, h5_files, check_files=False, manifest=None):
         """
         Parameters
         ----------
         h5_files : list
             List of .h5 files to source data from
         check_files : bool
-            Check to ensure files have the same coordinates and time_index
+            Check to ensure files have the same coordinates and time_index.
+            With a manifest the check compares the hashes in the manifest,
+            so coordinates must match exactly instead of within the
+            np.allclose tolerance used without a manifest
+        manifest : str, optional
+            Path to a .json manifest of the datasets (with their shapes,
+            dtypes, chunks and attributes) and the time_index and
+            coordinate hashes of each file. Local files that are unchanged
+            since the manifest was written (same size and modification time)
+            are not opened until data is requested from them, new or changed
+            files are opened and the manifest is (re-)written. Remote (HSDS
+            or S3) files have no signature, so their manifest entries are
+            never invalidated and the manifest must be deleted when they
+            change, by default None
         """
-        self._dset_map = self._map_file_dsets(h5_files)
+        self._manifest = self._get_manifest(h5_files, manifest=manifest)
+        self._dset_map = self._map_file_dsets(h5_files,
+                                              manifest=self._manifest)
         self._h5_map = self._map_file_instances(set(self._dset_map.values()))
 
         if check_files:
@@ -59,7 +78,7 @@ class MultiH5(BaseDatasetIterable):
     def __getitem__(self, dset):
         if dset in self:
             path = self._dset_map[dset]
-            h5 = self._h5_map[path]
+            h5 = self._get_h5(path)
             ds = h5[dset]
         else:
             msg = f'{dset} is invalid must be one of: {self.datasets}'
@@ -82,7 +101,7 @@ class MultiH5(BaseDatasetIterable):
             .h5 file attributes sourced from first .h5 file
         """
         path = self.h5_files[0]
-        attrs = dict(self._h5_map[path].attrs)
+        attrs = dict(self._get_h5(path).attrs)
 
         return attrs
 
@@ -110,6 +129,151 @@ class MultiH5(BaseDatasetIterable):
         """
         return sorted(self._h5_map)
 
+    @property
+    def dset_properties(self):
+        """
+        Shape, dtype, chunks and attributes of each dataset from the file
+        manifest
+
+        Returns
+        -------
+        dict | None
+            Dictionary mapping datasets to dictionaries of their shape,
+            dtype, chunks and attrs, None if the handler has no manifest
+        """
+        if self._manifest is None:
+            return None
+
+        return {dset: self._manifest[path]['datasets'][dset]
+                for dset, path in self._dset_map.items()}
+
+    def _get_h5(self, path):
+        """
+        Get the open h5py instance of a file, opening it on first access
+
+        Parameters
+        ----------
+        path : str
+            Path to .h5 file
+
+        Returns
+        -------
+        h5 : h5py.File
+        """
+        h5 = self._h5_map[path]
+        if h5 is None:
+            h5 = Resource.open_file(path, mode='r')
+            self._h5_map[path] = h5
+
+        return h5
+
+    @staticmethod
+    def _hash_array(arr):
+        """
+        Hash the values of an array
+
+        Parameters
+        ----------
+        arr : ndarray
+            Array to hash
+
+        Returns
+        -------
+        str
+            Hex digest of the array values
+        """
+        arr = np.ascontiguousarray(arr)
+
+        return hashlib.sha1(arr.tobytes()).hexdigest()
+
+    @classmethod
+    def _get_file_entry(cls, h5_path):
+        """
+        Get the manifest entry of a file: its datasets with their shapes,
+        dtypes, chunks and attributes, and hashes of its time_index and
+        coordinates
+
+        Parameters
+        ----------
+        h5_path : str
+            Path to .h5 file
+
+        Returns
+        -------
+        entry : dict
+            File manifest entry
+        """
+        entry = {'datasets': {}, 'time_index_hash': None,
+                 'coordinates_hash': None}
+        try:
+            with Resource(h5_path) as f:
+                for dset in f.datasets:
+                    ds = f.h5[dset]
+                    entry['datasets'][dset] = {
+                        'shape': ds.shape,
+                        'dtype': ds.dtype,
+                        'chunks': f._check_chunks(ds.chunks),
+                        'attrs': dict(ds.attrs)}
+
+                if 'time_index' in f:
+                    time_index = f.h5['time_index'][...]
+                    entry['time_index_hash'] = cls._hash_array(time_index)
+
+                if 'coordinates' in f or 'meta' in f:
+                    entry['coordinates_hash'] = cls._hash_array(f.lat_lon)
+        except Exception as e:
+            msg = ('Could not read file: "{}"'.format(h5_path))
+            logger.error(msg)
+            raise IOError(msg) from e
+
+        return entry
+
+    @classmethod
+    def _get_manifest(cls, h5_files, manifest=None):
+        """
+        Get the manifest entry of each file, from the manifest file for
+        files that are unchanged since it was written (or any remote file)
+        and by opening the file otherwise
+
+        Parameters
+        ----------
+        h5_files : list
+            List of .h5 files to source data from
+        manifest : str, optional
+            Path to .json manifest, updated if any file had to be
+            opened, by default None
+
+        Returns
+        -------
+        entries : dict | None
+            Dictionary mapping file paths to manifest entries, None if
+            manifest is None
+        """
+        if manifest is None:
+            return None
+
+        cached = load_manifest(manifest)
+        entries = {}
+        stale = False
+        for h5_path in h5_files:
+            signature = SidecarCache.file_signature(h5_path)
+            if signature is not None:
+                signature = signature[1:]
+
+            entry = cached.get(h5_path)
+            if entry is None or entry['signature'] != signature:
+                entry = cls._get_file_entry(h5_path)
+                entry['signature'] = signature
+                stale = True
+
+            entries[h5_path] = entry
+
+        if stale:
+            cached.update(entries)
+            save_manifest(manifest, cached)
+
+        return entries
+
     @staticmethod
     def _get_dsets(h5_path):
         """
@@ -144,7 +308,7 @@ class MultiH5(BaseDatasetIterable):
         return unique_dsets, shared_dsets
 
     @classmethod
-    def _map_file_dsets(cls, h5_files):
+    def _map_file_dsets(cls, h5_files, manifest=None):
         """
         Map 5min variables to their .h5 files in given directory
 
@@ -152,6 +316,9 @@ class MultiH5(BaseDatasetIterable):
         ----------
         h5_files : list
             List of h5_files to source data from
+        manifest : dict, optional
+            Dictionary mapping file paths to manifest entries, used instead
+            of opening the files if provided, by default None
 
         Returns
         -------
@@ -160,7 +327,14 @@ class MultiH5(BaseDatasetIterable):
         """
         dset_map = {}
         for file in h5_files:
-            unique_dsets, shared_dsets = cls._get_dsets(file)
+            if manifest is None:
+                unique_dsets, shared_dsets = cls._get_dsets(file)
+            else:
+                dsets = manifest[file]['datasets']
+                shared_dsets = [d for d in dsets
+                                if d in ['meta', 'time_index', 'coordinates']]
+                unique_dsets = [d for d in dsets if d not in shared_dsets]
+
             for dset in shared_dsets:
                 if dset not in dset_map:
                     dset_map[dset] = file
@@ -173,29 +347,30 @@ class MultiH5(BaseDatasetIterable):
     @staticmethod
     def _map_file_instances(h5_files):
         """
-        Open all .h5 files and map the open h5py instances to the
-        associated file paths
+        Map the .h5 files to their h5py instances, which are opened on first
+        access
 
         Parameters
         ----------
         h5_files : list
-            List of .h5 files to open
+            List of .h5 files to map
 
         Returns
         -------
         h5_map : dict
-            Dictionary mapping file paths to open resource instances
+            Dictionary mapping file paths to open h5py instances (None until
+            opened)
         """
-        h5_map = {}
-        for f_path in h5_files:
-            h5_map[f_path] = Resource.open_file(f_path, mode='r')
-
-        return h5_map
+        return {f_path: None for f_path in h5_files}
 
     def _preflight_check(self):
         """
         Check time_index and coordinates accross files
         """
+        if self._manifest is not None:
+            self._manifest_check()
+            return
+
         time_index = None
         lat_lon = None
 
@@ -226,12 +401,37 @@ class MultiH5(BaseDatasetIterable):
             logger.error(msg)
             raise ResourceRuntimeError(msg)
 
+    def _manifest_check(self):
+        """
+        Check time_index and coordinates accross files using the hashes in
+        the file manifest, without opening the files. Unlike
+        _preflight_check, which compares coordinates with np.allclose, the
+        coordinates must match exactly (e.g. coordinates that only differ
+        by rounding do not match). Hashes of remote files are never
+        refreshed, see MultiH5.
+        """
+        bad_files = []
+        for key in ('time_index_hash', 'coordinates_hash'):
+            hashes = [(file, self._manifest[file][key])
+                      for file in self.h5_files
+                      if self._manifest[file][key] is not None]
+            bad_files += [file for file, file_hash in hashes
+                          if file_hash != hashes[0][1]]
+
+        bad_files = list(set(bad_files))
+        if bad_files:
+            msg = ("The following files' coordinates and time-index do not "
+                   "match:\n{}".format(bad_files))
+            logger.error(msg)
+            raise ResourceRuntimeError(msg)
+
     def close(self):
         """
-        Close all h5py.File instances
+        Close all open h5py.File instances
         """
         for f in self._h5_map.values():
-            f.close()
+            if f is not None:
+                f.close()
 
 
 class MultiH5Path(MultiH5):
@@ -239,7 +439,7 @@ class MultiH5Path(MultiH5):
     Class to handle multiple h5 file Resources derived from a path
     """
 
-    def __init__(self, h5_path, check_files=False):
+    def __init__(self, h5_path, check_files=False, manifest=None):
         """
         Parameters
         ----------
@@ -249,9 +449,12 @@ class MultiH5Path(MultiH5):
             coordinates but can have different datasets.
         check_files : bool
             Check to ensure files have the same coordinates and time_index
+        manifest : str, optional
+            Path to .json manifest, see MultiH5, by default None
         """
         self.h5_path, h5_files = self._get_h5_files(h5_path)
-        super().__init__(h5_files, check_files=check_files)
+        super().__init__(h5_files, check_files=check_files,
+                         manifest=manifest)
 
     def __repr__(self):
         msg = ("{} for {}:\n Contains {} files and {} datasets"
@@ -359,7 +562,7 @@ class MultiFileResource(AbstractInterpolatedResource):
     VARIABLE_UNIT = "m"
 
     def __init__(self, h5_source, unscale=True, str_decode=True,
-                 check_files=False, use_lapse_rate=True):
+                 check_files=False, use_lapse_rate=True, manifest=None):
         """
         Parameters
         ----------
@@ -383,6 +586,13 @@ class MultiFileResource(AbstractInterpolatedResource):
             `False`, the value of these variables at the single available
             hub-height will be returned for *all* requested heights. This
             option has no effect if data is available at multiple hub-heights.
+        manifest : str, optional
+            Path to a .json manifest of the datasets, shapes, dtypes,
+            chunks, attributes and time_index/coordinate hashes of each file.
+            Built on first use and re-used by later handlers so that files are
+            only opened when data is requested from them. Entries are rebuilt
+            automatically when a file's size or modification time changes,
+            by default None
         """
         self._unscale = unscale
         self._meta = None
@@ -391,13 +601,15 @@ class MultiFileResource(AbstractInterpolatedResource):
         self._str_decode = str_decode
         self._group = None
         # Map variables to their .h5 files
-        self._h5 = self._init_multi_h5(h5_source, check_files=check_files)
+        self._h5 = self._init_multi_h5(h5_source, check_files=check_files,
+                                       manifest=manifest)
         self._h5_files = self._h5.h5_files
         self.h5_file = self._h5_files[0]
         self._attrs = None
         self._shapes = None
         self._chunks = None
         self._dtypes = None
+        self._init_read_opts()
 
         self._interp_var = None
         self._use_lapse = use_lapse_rate
@@ -411,8 +623,83 @@ class MultiFileResource(AbstractInterpolatedResource):
         msg = "{}".format(self.__class__.__name__)
         return msg
 
+    @property
+    def datasets(self):
+        """
+        Datasets available in any of the files
+
+        Returns
+        -------
+        list
+        """
+        return self._h5.datasets
+
+    @property
+    def attrs(self):
+        """
+        Dictionary of all dataset attributes, from the file manifest if
+        available
+
+        Returns
+        -------
+        attrs : dict
+        """
+        props = self._h5.dset_properties
+        if self._attrs is None and props is not None:
+            self._attrs = {dset: dict(p['attrs']) for dset, p in props.items()}
+
+        return super().attrs
+
+    @property
+    def shapes(self):
+        """
+        Dictionary of all dataset shapes, from the file manifest if
+        available
+
+        Returns
+        -------
+        shapes : dict
+        """
+        props = self._h5.dset_properties
+        if self._shapes is None and props is not None:
+            self._shapes = {dset: p['shape'] for dset, p in props.items()}
+
+        return super().shapes
+
+    @property
+    def dtypes(self):
+        """
+        Dictionary of all dataset dtypes, from the file manifest if
+        available
+
+        Returns
+        -------
+        dtypes : dict
+        """
+        props = self._h5.dset_properties
+        if self._dtypes is None and props is not None:
+            self._dtypes = {dset: p['dtype'] for dset, p in props.items()}
+
+        return super().dtypes
+
+    @property
+    def chunks(self):
+        """
+        Dictionary of all dataset chunk sizes, from the file manifest if
+        available
+
+        Returns
+        -------
+        chunks : dict
+        """
+        props = self._h5.dset_properties
+        if self._chunks is None and props is not None:
+            self._chunks = {dset: p['chunks'] for dset, p in props.items()}
+
+        return super().chunks
+
     @staticmethod
-    def _init_multi_h5(h5_source, check_files=False):
+    def _init_multi_h5(h5_source, check_files=False, manifest=None):
         """
         Initialize MultiH5 handler class based on input type
 
@@ -425,6 +712,8 @@ class MultiFileResource(AbstractInterpolatedResource):
             explicit list of complete filepaths.
         check_files : bool
             Check to ensure files have the same coordinates and time_index
+        manifest : str, optional
+            Path to .json manifest, by default None
 
         Returns
         -------
@@ -432,9 +721,11 @@ class MultiFileResource(AbstractInterpolatedResource):
             Initialized multi h5 handler
         """
         if isinstance(h5_source, str):
-            multi_h5 = MultiH5Path(h5_source, check_files=check_files)
+            multi_h5 = MultiH5Path(h5_source, check_files=check_files,
+                                   manifest=manifest)
         elif isinstance(h5_source, (list, tuple)):
-            multi_h5 = MultiH5(h5_source, check_files=check_files)
+            multi_h5 = MultiH5(h5_source, check_files=check_files,
+                               manifest=manifest)
         else:
             msg = ('Cannot initialize MultiH5 from {}, expecting a path or a '
                    'list of .h5 file paths'.format(type(h5_source)))
@@ -459,7 +750,7 @@ class MultiFileNSRDB(MultiFileResource, NSRDB):
     def preload_SAM(cls, h5_source, sites, unscale=True, str_decode=True,
                     tech='pvwattsv7', time_index_step=None, means=False,
                     clearsky=False, bifacial=False, downscale=None,
-                    check_files=False):
+                    check_files=False, manifest=None):
         """
         Pre-load project_points for SAM
 
@@ -496,6 +787,8 @@ class MultiFileNSRDB(MultiFileResource, NSRDB):
             e.g. '5min'.
         check_files : bool
             Check to ensure files have the same coordinates and time_index
+        manifest : str, optional
+            Path to .json manifest, by default None
 
         Returns
         -------
@@ -504,7 +797,7 @@ class MultiFileNSRDB(MultiFileResource, NSRDB):
             in project_points
         """
         with cls(h5_source, unscale=unscale, str_decode=str_decode,
-                 check_files=check_files) as res:
+                 check_files=check_files, manifest=manifest) as res:
             # pylint: disable=assignment-from-no-return
             SAM_res = res._preload_SAM(res, sites, tech=tech,
                                        time_index_step=time_index_step,
@@ -557,7 +850,7 @@ class MultiFileWTK(MultiFileResource, WindResource):
     def preload_SAM(cls, h5_source, sites, hub_heights, unscale=True,
                     str_decode=True, time_index_step=None, means=False,
                     require_wind_dir=False, precip_rate=False, icing=False,
-                    check_files=False):
+                    check_files=False, manifest=None):
         """
         Placeholder for classmethod that will pre-load project_points for SAM
 
@@ -572,7 +865,9 @@ class MultiFileWTK(MultiFileResource, WindResource):
             List of sites to be provided to SAM
             (sites is synonymous with gids aka spatial indices)
         hub_heights : int | float | list
-            Hub heights to extract for SAM
+            Hub height to extract for SAM, or a list of hub heights, one for
+            each site. Every available height needed by any of the sites is
+            read only once.
         unscale : bool
             Boolean flag to automatically unscale variables on extraction
         str_decode : bool
@@ -593,6 +888,8 @@ class MultiFileWTK(MultiFileResource, WindResource):
             This will preload relative humidity.
         check_files : bool
             Check to ensure files have the same coordinates and time_index
+        manifest : str, optional
+            Path to .json manifest, by default None
 
         Returns
         -------
@@ -601,7 +898,7 @@ class MultiFileWTK(MultiFileResource, WindResource):
             in project_points
         """
         with cls(h5_source, unscale=unscale, str_decode=str_decode,
-                 check_files=check_files) as res:
+                 check_files=check_files, manifest=manifest) as res:
             # pylint: disable=assignment-from-no-return
             SAM_res = res._preload_SAM(res, sites, hub_heights,
                                        time_index_step=time_index_step,
@@ -2,7 +2,7 @@
 """
 Classes to handle resource data at multiple spatiotemporal resolutions
 """
-import pandas as pd
+import numpy as np
 import os
 import copy
 import logging
@@ -70,6 +70,7 @@ class MultiResolutionResource:
         self._lr_res = handler_class(h5_lr, **handle_kwargs)
         self._nn_map = nn_map
         self._nn_d = nn_d
+        self._time_interp_weights = None
 
         if self._nn_map is None:
             self._nn_d, self._nn_map = self.make_nn_map(self._hr_res,
@@ -146,6 +147,123 @@ class MultiResolutionResource:
         s_slice = self._nn_map[s_slice]
         return (t_slice, s_slice)
 
+    @property
+    def time_interp_weights(self):
+        """Temporal interpolation plan from the low-res time index to the
+        high-res time index, built once per handler. Each high-res time step
+        is a linear combination of two low-res time steps:
+        ``hr[i] = lr[left[i]] * (1 - weight[i]) + lr[right[i]] * weight[i]``.
+        Like a linear interpolation on the high-res time index, the weights
+        are based on the positions of the low-res time steps in the high-res
+        time index, and high-res time steps before / after the first / last
+        low-res time step take its value.
+
+        Returns
+        -------
+        left : np.ndarray
+            1D array of the low-res time step before each high-res time step
+        right : np.ndarray
+            1D array of the low-res time step after each high-res time step
+        weight : np.ndarray
+            1D array of the fractional weight of the right low-res time step
+        """
+        if self._time_interp_weights is None:
+            hr_ti = self._hr_res.time_index
+            lr_ti = self._lr_res.time_index
+            hr_pos = hr_ti.get_indexer(lr_ti)
+            lr_steps = np.where(hr_pos >= 0)[0]
+            hr_pos = hr_pos[lr_steps]
+            if not len(hr_pos):
+                msg = ('None of the low-res time steps in {} are in the '
+                       'high-res time index of {}, cannot interpolate '
+                       'low-res data in time!'.format(self._h5_lr,
+                                                      self._h5_hr))
+                logger.error(msg)
+                raise ResourceRuntimeError(msg)
+
+            order = np.argsort(hr_pos, kind='stable')
+            lr_steps = lr_steps[order]
+            hr_pos = hr_pos[order]
+
+            steps = np.arange(len(hr_ti))
+            right = np.searchsorted(hr_pos, steps)
+            right = np.minimum(right, len(hr_pos) - 1)
+            left = np.maximum(right - 1, 0)
+            exact = hr_pos[right] == steps
+            left[exact] = right[exact]
+
+            delta = hr_pos[right] - hr_pos[left]
+            weight = np.divide(steps - hr_pos[left], delta,
+                               out=np.zeros(len(steps)),
+                               where=delta > 0)
+            self._time_interp_weights = (lr_steps[left], lr_steps[right],
+                                         np.clip(weight, 0, 1))
+
+        return self._time_interp_weights
+
+    def map_time_slice(self, time_slice=slice(None)):
+        """Map a high-res time slice to the block of low-res time steps
+        needed to interpolate it
+
+        Parameters
+        ----------
+        time_slice : int | slice | list | np.ndarray, optional
+            Time slice in the high-res time index, by default slice(None)
+
+        Returns
+        -------
+        lr_slice : slice
+            Contiguous slice of the low-res time steps needed for time_slice
+        weights : tuple
+            (left, right, weight) interpolation plan for the high-res time
+            steps in time_slice, see time_interp_weights. left and right are
+            relative to lr_slice.
+        """
+        left, right, weight = (arr[time_slice]
+                               for arr in self.time_interp_weights)
+        start = int(left.min()) if left.size else 0
+        stop = int(right.max()) + 1 if right.size else 0
+
+        return slice(start, stop), (left - start, right - start, weight)
+
+    @staticmethod
+    def _apply_time_interp(arr, left, right, weight):
+        """Apply a (left, right, weight) temporal interpolation plan to
+        (time, ...) data, see time_interp_weights
+
+        Parameters
+        ----------
+        arr : np.ndarray
+            Low-resolution data with time on the first axis
+        left : int | np.ndarray
+            Low-res time step(s) before each output time step
+        right : int | np.ndarray
+            Low-res time step(s) after each output time step
+        weight : float | np.ndarray
+            Fractional weight(s) of the right low-res time step
+
+        Returns
+        -------
+        out : np.ndarray
+            Interpolated data with time on the first axis, float64 for
+            integer data
+        """
+        arr = np.asarray(arr)
+        dtype = arr.dtype
+        if not np.issubdtype(dtype, np.floating):
+            # match pandas reindex / interpolate upcasting of integer data
+            dtype = np.float64
+
+        weight = np.reshape(weight, np.shape(weight) + (1,) * (arr.ndim - 1))
+
+        out = arr[right].astype(dtype)
+        lr_left = arr[left]
+        out -= lr_left
+        out *= weight
+        out += lr_left
+
+        return out
+
     def time_interp(self, arr):
         """Perform temporal interpolation on the low-res data to match the
         high-res data.
@@ -162,13 +280,7 @@ class MultiResolutionResource:
             2D array with shape (time, sites) where the time axis has been
             linearly interpolated to the high-resolution time index.
         """
-        ndim = len(arr.shape)
-        arr = pd.DataFrame(arr, index=self._lr_res.time_index)
-        arr = arr.reindex(self._hr_res.time_index)
-        arr = arr.interpolate('linear').ffill().bfill().values
-        if ndim == 1 and len(arr.shape) == 2:
-            arr = arr.flatten()
-        return arr
+        return self._apply_time_interp(arr, *self.time_interp_weights)
 
     def close(self):
         """Close active file handlers."""
@@ -221,9 +333,10 @@ class MultiResolutionResource:
             out = self._hr_res._get_ds(ds, ds_slice)
 
         elif ds_name in self._lr_res.dsets or len(lr_heights) > 0:
-            ds_slice = self.map_ds_slice(ds_slice)
-            out = self._lr_res._get_ds(ds, ds_slice)
-            out = self.time_interp(out)
+            t_slice, s_slice = self.map_ds_slice(ds_slice)
+            t_slice, weights = self.map_time_slice(t_slice)
+            out = self._lr_res._get_ds(ds, (t_slice, s_slice))
+            out = self._apply_time_interp(out, *weights)
 
         else:
             msg = ('Could not find data for ds_name = {}. Available dsets in '
@@ -3,6 +3,7 @@
 Classes to handle resource data stored over multiple files
 """
 import os
+from concurrent.futures import ThreadPoolExecutor
 from glob import glob
 from itertools import chain
 from fnmatch import fnmatch
@@ -20,20 +21,57 @@ from rex.renewable_resource import (
 )
 from rex.resource import Resource, BaseDatasetIterable
 from rex.utilities.exceptions import FileInputError
+from rex.utilities.execution import SpawnProcessPool
+from rex.utilities.handle_pool import HandlePool, LazyResource
 from rex.utilities.parse_keys import parse_keys, parse_slice
+from rex.utilities.sidecar_cache import (SidecarCache, load_manifest,
+                                         save_manifest)
 from rex.utilities.utilities import is_hsds_file, is_s3_file
+from rex.utilities.worker_pool import SharedArray, get_worker_resource
 
 
 logger = logging.getLogger(__name__)
 
 
+def read_time_segment(out, rows, res_cls, res_h5, res_cls_kwargs, ds_name,
+                      ds_slice):
+    """
+    Read a time segment of a dataset from a single file into rows of a
+    shared output array (run in a worker process). The file is opened once
+    per worker and re-used by later reads.
+
+    Parameters
+    ----------
+    out : rex.utilities.worker_pool.SharedArray
+        Shared output array
+    rows : slice
+        Rows (time steps) of out to fill
+    res_cls : Class
+        Resource class to open res_h5 with
+    res_h5 : str | list
+        Path to the resource h5 file(s) of the segment
+    res_cls_kwargs : dict
+        Kwargs for res_cls
+    ds_name : str
+        Dataset to read
+    ds_slice : tuple
+        Slice of the file's dataset to read
+    """
+    res = get_worker_resource(res_cls, res_h5, **res_cls_kwargs)
+    try:
+        res.get_dset_arr(ds_name, ds_slice, out=out.array[rows])
+    finally:
+        out.close()
+
+
 class MultiTimeH5:
     """
     Class to handle h5 Resources stored over multiple temporal files
     """
 
     def __init__(self, h5_path, res_cls=Resource, hsds=False, hsds_kwargs=None,
-                 **res_cls_kwargs):
+                 max_workers=None, process_pool=False, max_open=None,
+                 manifest=None, **res_cls_kwargs):
         """
         Parameters
         ----------
@@ -51,6 +89,29 @@ class MultiTimeH5:
         hsds_kwargs : dict, optional
             Dictionary of optional kwargs for h5pyd, e.g., bucket, username,
             password, by default None
+        max_workers : int, optional
+            Number of files to read concurrently when a request spans
+            multiple files. Each file fills its time segment of a single
+            pre-allocated output array. None or 1 reads the files serially,
+            by default None
+        process_pool : bool, optional
+            Flag to read files in a pool of max_workers processes instead of
+            threads. h5py serializes reads (and decompression) across
+            threads, processes decompress in parallel at the cost of a copy
+            out of shared memory. Worker processes keep their files open
+            until the handler is closed, by default False
+        max_open : int, optional
+            Maximum number of files to keep open at once. Files are opened
+            lazily on first access and the least-recently-used file is
+            closed (and re-opened on its next access) when more than
+            max_open files are open. None keeps every accessed file open,
+            by default None
+        manifest : str, optional
+            Path to a .json file with the time_index, datasets and shape of
+            each file. If it exists, files that are unchanged since the
+            manifest was written (or any remote file) are not opened to map
+            the time index. New or changed files are opened and the manifest
+            is (re-)written, by default None
         res_cls_kwargs : dict, optional
             Kwargs for `res_cls`
         """
@@ -58,14 +119,19 @@ class MultiTimeH5:
         self._file_paths = self._get_file_paths(h5_path, hsds=hsds,
                                                 hsds_kwargs=hsds_kwargs)
         res_cls_kwargs.update({'hsds': hsds})
+        self._res_cls_kwargs = res_cls_kwargs
+        self._init_handles(max_workers=max_workers,
+                           process_pool=process_pool, max_open=max_open)
         self._h5_map = self._map_file_instances(self._file_paths,
+                                                self._handles,
                                                 res_cls=res_cls,
+                                                manifest=manifest,
                                                 **res_cls_kwargs)
 
         self._datasets = None
         self._shape = None
         self._time_index = None
-        self._time_slice_map = []
+        self._time_offsets = None
 
     def __repr__(self):
         msg = ("{} for {}:\n Contains data from {} files"
@@ -124,14 +190,25 @@ class MultiTimeH5:
     @property
     def h5(self):
         """
-        open h5 file handler for a single .h5 file
+        Lazy resource handler for the first .h5 file
 
         Returns
         -------
-        h5py.File
+        rex.utilities.handle_pool.LazyResource
         """
         return self._h5_map['h5'].values[0]
 
+    @property
+    def handle_pool(self):
+        """
+        Pool of the open file handlers
+
+        Returns
+        -------
+        rex.utilities.handle_pool.HandlePool
+        """
+        return self._handles
+
     @property
     def datasets(self):
         """
@@ -172,7 +249,8 @@ class MultiTimeH5:
         tuple
         """
         if self._shape is None:
-            self._shape = (len(self.time_index), self.h5.shape[1])
+            self._shape = (len(self.time_index),
+                           self._h5_map['shape'].values[0][1])
 
         return self._shape
 
@@ -186,12 +264,7 @@ class MultiTimeH5:
         pandas.DatatimeIndex
         """
         if self._time_index is None:
-            time_slice_map = []
-            for _, row in self._h5_map.iterrows():
-                h5 = row['h5']
-                fp = row['fp']
-                ti = h5.time_index
-                time_slice_map.append(np.full(len(ti), os.path.basename(fp)))
+            for ti in self._time_indexes:
                 if self._time_index is None:
                     self._time_index = ti
                 else:
@@ -206,10 +279,61 @@ class MultiTimeH5:
                        .format(len(duplicates), duplicates))
                 raise RuntimeError(msg)
 
-            self._time_slice_map = np.concatenate(time_slice_map, axis=0)
-
         return self._time_index
 
+    @property
+    def _time_handlers(self):
+        """
+        Lazy resource handlers in the order their time indexes are combined
+        in time_index
+
+        Returns
+        -------
+        list
+        """
+        return self._h5_map['h5'].values.tolist()
+
+    @property
+    def _time_indexes(self):
+        """
+        Time indexes of the _time_handlers from the file manifest
+
+        Returns
+        -------
+        list
+        """
+        return self._h5_map['time_index'].values.tolist()
+
+    @property
+    def _time_sources(self):
+        """
+        (res_cls, res_h5, res_cls_kwargs) needed to re-open each of the
+        _time_handlers, e.g. in a worker process
+
+        Returns
+        -------
+        list
+        """
+        return [(h5.res_cls, h5.res_h5, h5.res_cls_kwargs)
+                for h5 in self._time_handlers]
+
+    @property
+    def time_offsets(self):
+        """
+        Cumulative time offsets of the files, i.e. the position of the first
+        time step of each file in time_index followed by the length of
+        time_index. File i covers time_index[offsets[i]:offsets[i + 1]].
+
+        Returns
+        -------
+        ndarray
+        """
+        if self._time_offsets is None:
+            lengths = [len(ti) for ti in self._time_indexes]
+            self._time_offsets = np.concatenate([[0], np.cumsum(lengths)])
+
+        return self._time_offsets
+
     @staticmethod
     def _get_hsds_file_paths(h5_path, hsds_kwargs=None):
         """
@@ -354,31 +478,84 @@ class MultiTimeH5:
 
         return file_paths
 
-    @staticmethod
-    def _map_file_instances(file_paths, res_cls=Resource, **res_cls_kwargs):
+    @classmethod
+    def _get_manifest(cls, handles, manifest=None):
         """
-        Open all .h5 files and map the open h5py instances to the
+        Get the time_index, datasets and shape of each file, from the
+        manifest file for files that are unchanged since it was written and
+        by opening the file otherwise
+
+        Parameters
+        ----------
+        handles : dict
+            Dictionary mapping file paths to LazyResource handles
+        manifest : str, optional
+            Path to .json manifest, updated if any file had to be
+            opened, by default None
+
+        Returns
+        -------
+        entries : dict
+            Dictionary mapping file paths to dictionaries of the file's
+            signature, time_index, dsets and shape
+        """
+        cached = load_manifest(manifest)
+        entries = {}
+        for fp, handle in handles.items():
+            signature = SidecarCache.file_signature(fp)
+            entry = cached.get(fp)
+            if entry is None or entry['signature'] != signature:
+                res = handle.handler
+                entry = {'signature': signature,
+                         'time_index': res.time_index,
+                         'dsets': list(res.dsets),
+                         'shape': res.shape}
+
+            entries[fp] = entry
+
+        if manifest is not None and any(cached.get(fp) is not entry
+                                        for fp, entry in entries.items()):
+            cached.update(entries)
+            save_manifest(manifest, cached)
+
+        return entries
+
+    @classmethod
+    def _map_file_instances(cls, file_paths, pool, res_cls=Resource,
+                            manifest=None, **res_cls_kwargs):
+        """
+        Map lazy resource handlers and the file manifest entries to the
         associated file paths
 
         Parameters
         ----------
         file_paths : list
             List of filepaths for this handler to handle.
+        pool : rex.utilities.handle_pool.HandlePool
+            Pool to open the files through
+        res_cls : obj
+            Resource class to use to open and access resource data
+        manifest : str, optional
+            Path to .json manifest, by default None
 
         Returns
         -------
         h5_map : pd.DataFrame
-            DataFrame mapping file paths to open resource instances and
-            datasets per file (columns: fp, h5, and dsets)
+            DataFrame mapping file paths to lazy resource handlers, time
+            extents, time indexes, datasets and shapes per file (columns: fp,
+            h5, t0, t1, time_index, dsets, and shape)
         """
-        h5_map = pd.DataFrame({'fp': file_paths, 'h5': None,
-                               't0': None, 't1': None})
-        for i, f_path in enumerate(file_paths):
-            h5_map.at[i, 'h5'] = res_cls(f_path, **res_cls_kwargs)
-            h5_map.at[i, 't0'] = h5_map.at[i, 'h5'].time_index.values[0]
-            h5_map.at[i, 't1'] = h5_map.at[i, 'h5'].time_index.values[1]
+        handles = {fp: LazyResource(res_cls, fp, pool=pool, **res_cls_kwargs)
+                   for fp in file_paths}
+        entries = cls._get_manifest(handles, manifest=manifest)
+
+        h5_map = pd.DataFrame({'fp': file_paths,
+                               'h5': [handles[fp] for fp in file_paths]})
+        for k in ('time_index', 'dsets', 'shape'):
+            h5_map[k] = [entries[fp][k] for fp in file_paths]
 
-        h5_map['dsets'] = [h5.dsets for h5 in h5_map['h5'].values]
+        h5_map['t0'] = [ti.values[0] for ti in h5_map['time_index']]
+        h5_map['t1'] = [ti.values[-1] for ti in h5_map['time_index']]
         h5_map = h5_map.sort_values('t0').reset_index(drop=True)
 
         return h5_map
@@ -405,28 +582,156 @@ class MultiTimeH5:
 
         return time_slice
 
+    def _init_handles(self, max_workers=None, process_pool=False,
+                      max_open=None):
+        """
+        Initialize the file handle pool and the parallel segment read state
+        shared by all multi-file time handlers
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            Number of workers used to read the per-file segments of a
+            request spanning multiple files, by default None
+        process_pool : bool, optional
+            Flag to read segments with worker processes instead of threads,
+            by default False
+        max_open : int, optional
+            Maximum number of files to keep open at once, None keeps every
+            accessed file open, by default None
+        """
+        self._max_workers = max_workers
+        self._process_pool = process_pool
+        self._executor = None
+        self._segment_dtypes = {}
+        self._handles = HandlePool(max_open=max_open)
+
+    def _get_time_position(self, time_step):
+        """
+        Map a single time step to the file it is in using the time offsets
+
+        Parameters
+        ----------
+        time_step : int
+            Position in time_index, can be negative
+
+        Returns
+        -------
+        h5 : Resource
+            Open resource handler of the file containing time_step
+        file_step : int
+            Position of time_step in the file's time_index
+        """
+        offsets = self.time_offsets
+        n_steps = offsets[-1]
+        if not -n_steps <= time_step < n_steps:
+            msg = ('Time step {} is out of bounds for time_index of length '
+                   '{}'.format(time_step, n_steps))
+            logger.error(msg)
+            raise IndexError(msg)
+
+        time_step %= n_steps
+        i = np.searchsorted(offsets, time_step, side='right') - 1
+
+        return self._time_handlers[i], int(time_step - offsets[i])
+
+    def _get_time_positions(self, time_slice):
+        """
+        Get the sorted, unique positions in time_index of a list of time
+        steps, boolean mask or slice with a negative step
+
+        Parameters
+        ----------
+        time_slice : list | slice | ndarray
+            Positions, boolean mask or slice of time_index
+
+        Returns
+        -------
+        positions : ndarray
+            Sorted positions in time_index
+        """
+        n_steps = self.time_offsets[-1]
+        if isinstance(time_slice, slice):
+            positions = np.arange(*time_slice.indices(n_steps))
+        else:
+            positions = np.atleast_1d(time_slice)
+            if positions.dtype == bool:
+                positions = np.flatnonzero(positions)
+
+            if ((positions < -n_steps) | (positions >= n_steps)).any():
+                msg = ('Time steps {} are out of bounds for time_index of '
+                       'length {}'.format(time_slice, n_steps))
+                logger.error(msg)
+                raise IndexError(msg)
+
+            positions = positions % n_steps
+
+        if (np.diff(positions) <= 0).any():
+            positions = np.unique(positions)
+
+        return positions
+
+    def _map_time_range(self, time_slice):
+        """
+        Map a slice of time_index with a positive step to slices of each
+        file's time_index
+
+        Parameters
+        ----------
+        time_slice : slice
+            Slice of time_index with a positive (or no) step
+
+        Returns
+        -------
+        file_times : list
+            List of (h5, file_slice) pairs in temporal order
+        """
+        offsets = self.time_offsets
+        start, stop, step = time_slice.indices(offsets[-1])
+        file_times = []
+        for h5, f_start, f_stop in zip(self._time_handlers, offsets[:-1],
+                                       offsets[1:]):
+            first = max(start, start + -(-(f_start - start) // step) * step)
+            last = min(stop, f_stop)
+            if first < last:
+                file_slice = slice(int(first - f_start), int(last - f_start),
+                                   step if step > 1 else None)
+                file_times.append((h5, file_slice))
+
+        return file_times
+
     def _map_time_slice(self, time_slice):
         """
-        Map timeslices to files
+        Map timeslices to files using the cumulative time offsets of the
+        files. Time steps are extracted in temporal order.
 
         Parameters
         ----------
-        time_slice : int | list | slice
-            tuple describing slice of dataset array to extract
+        time_slice : list | slice | ndarray
+            Slice, positions or boolean mask of time_index to extract
 
         Returns
         -------
-        file_times : dict
-            Dictionary mapping files to the time_slices to extract
-        """
-        time_index = self.time_index[time_slice]
-        files = self._time_slice_map[time_slice]
-        file_times = {}
-        for file in np.unique(files):
-            ti = self[file].time_index
-            file_slice = np.where(ti.isin(time_index))[0]
-            file_slice = self._check_time_slice(file_slice)
-            file_times[file] = file_slice
+        file_times : list
+            List of (h5, file_slice) pairs in temporal order, with the open
+            resource handler of each file and the time_slice to extract
+            from it
+        """
+        if isinstance(time_slice, slice) and (time_slice.step or 1) > 0:
+            return self._map_time_range(time_slice)
+
+        offsets = self.time_offsets
+        positions = self._get_time_positions(time_slice)
+        if not positions.size:
+            return []
+
+        files = np.searchsorted(offsets, positions, side='right') - 1
+        splits = np.flatnonzero(np.diff(files)) + 1
+        file_times = []
+        for i, file_steps in zip(files[np.r_[0, splits]],
+                                 np.split(positions, splits)):
+            file_slice = self._check_time_slice(file_steps - offsets[i])
+            file_times.append((self._time_handlers[i], file_slice))
 
         return file_times
 
@@ -448,31 +753,185 @@ class MultiTimeH5:
             If unscale, returned in native units else in scaled units
         """
         ds_slice = parse_slice(ds_slice)
-        out = []
         time_slice = ds_slice[0]
         if isinstance(time_slice, (int, np.integer)):
-            time_step = self.time_index[time_slice]
-            file = self._time_slice_map[time_slice]
-            time_index = self[file].time_index
-            time_slice = np.where(time_step == time_index)[0][0]
+            h5, time_slice = self._get_time_position(time_slice)
             file_slice = (time_slice, ) + ds_slice[1:]
-            out = self[file]._get_ds(ds_name, file_slice)
+            with h5.checkout() as res:
+                out = res._get_ds(ds_name, file_slice)
         else:
-            file_times = self._map_time_slice(ds_slice[0])
-            for file, time_slice in file_times.items():
-                file_slice = (time_slice, ) + ds_slice[1:]
-                out.append(self[file]._get_ds(ds_name, file_slice))
+            file_times = self._map_time_slice(time_slice)
+            if not file_times:
+                file_times = [(self._time_handlers[0], slice(0, 0))]
+
+            out = self._get_segments(ds_name, ds_slice[1:], file_times)
+
+        return out
+
+    @staticmethod
+    def _get_slice_len(time_slice):
+        """
+        Number of time steps in a file time slice
+
+        Parameters
+        ----------
+        time_slice : slice | list | ndarray
+            File time slice with explicit start and stop if a slice
+
+        Returns
+        -------
+        int
+        """
+        if isinstance(time_slice, slice):
+            return len(range(time_slice.start, time_slice.stop,
+                             time_slice.step or 1))
+
+        return len(time_slice)
+
+    def _get_segment_dtype(self, h5, ds_name, site_slice):
+        """
+        Get the dtype a file's handler extracts a dataset as (e.g. after
+        unscaling), by reading an empty time slice. Cached for each file
+        and dataset.
+
+        Parameters
+        ----------
+        h5 : LazyResource
+            File handle
+        ds_name : str
+            Variable dataset to be extracted
+        site_slice : tuple
+            Slice of the remaining (site) axes to extract
+
+        Returns
+        -------
+        numpy.dtype
+        """
+        key = (id(h5), ds_name)
+        if key not in self._segment_dtypes:
+            with h5.checkout() as res:
+                empty = res._get_ds(ds_name, (slice(0, 0), ) + site_slice)
+
+            self._segment_dtypes[key] = empty.dtype
+
+        return self._segment_dtypes[key]
 
-            out = np.concatenate(out, axis=0)
+    def _get_segments(self, ds_name, site_slice, file_times):
+        """
+        Read the time segments of a dataset from each file into a single
+        pre-allocated output array. The output dtype is the common dtype of
+        all segments, so files that store (or scale) the dataset differently
+        are not truncated. The remaining segments are filled in place,
+        serially or concurrently if max_workers > 1.
+
+        Parameters
+        ----------
+        ds_name : str
+            Variable dataset to be extracted
+        site_slice : tuple
+            Slice of the remaining (site) axes to extract
+        file_times : list
+            List of (h5, file_slice) pairs in temporal order, see
+            _map_time_slice
+
+        Returns
+        -------
+        out : ndarray
+            ndarray of variable timeseries data
+        """
+        h5, time_slice = file_times[0]
+        with h5.checkout() as res:
+            first = res._get_ds(ds_name, (time_slice, ) + site_slice)
+        if len(file_times) == 1:
+            return first
+
+        segments = []
+        stop = len(first)
+        for h5, time_slice in file_times[1:]:
+            start, stop = stop, stop + self._get_slice_len(time_slice)
+            segments.append((h5, (time_slice, ) + site_slice,
+                             slice(start, stop)))
+
+        shape = (stop, ) + first.shape[1:]
+        dtype = np.result_type(first.dtype, *(
+            self._get_segment_dtype(h5, ds_name, site_slice)
+            for h5, _, _ in segments))
+        max_workers = min(self._max_workers or 1, len(segments))
+        if self._process_pool and max_workers > 1:
+            return self._get_segments_processes(ds_name, first, segments,
+                                                shape, dtype)
+
+        out = np.empty(shape, dtype=dtype)
+        out[:len(first)] = first
+
+        def read(segment):
+            h5, file_slice, rows = segment
+            with h5.checkout() as res:
+                res.get_dset_arr(ds_name, file_slice, out=out[rows])
+
+        if max_workers > 1:
+            logger.debug('Reading {} from {} files using {} threads'
+                         .format(ds_name, len(file_times), max_workers))
+            with ThreadPoolExecutor(max_workers=max_workers) as exe:
+                list(exe.map(read, segments))
+        else:
+            for segment in segments:
+                read(segment)
 
         return out
 
+    def _get_segments_processes(self, ds_name, first, segments, shape,
+                                dtype):
+        """
+        Read time segments of a dataset in the handler's process pool into
+        an output array in shared memory
+
+        Parameters
+        ----------
+        ds_name : str
+            Variable dataset to be extracted
+        first : ndarray
+            Already extracted first time segment
+        segments : list
+            List of (h5, file_slice, rows) for the remaining segments
+        shape : tuple
+            Output shape
+        dtype : numpy.dtype
+            Output dtype
+
+        Returns
+        -------
+        out : ndarray
+            ndarray of variable timeseries data
+        """
+        if self._executor is None:
+            self._executor = SpawnProcessPool(max_workers=self._max_workers)
+
+        sources = dict(zip(map(id, self._time_handlers), self._time_sources))
+        logger.debug('Reading {} from {} files using {} processes'
+                     .format(ds_name, len(segments) + 1, self._max_workers))
+        with SharedArray(shape, dtype=dtype) as out:
+            out.array[:len(first)] = first
+            futures = [self._executor.submit(read_time_segment, out, rows,
+                                             *sources[id(h5)], ds_name,
+                                             file_slice)
+                       for h5, file_slice, rows in segments]
+            for future in futures:
+                future.result()
+
+            arr = out.array.copy()
+
+        return arr
+
     def close(self):
         """
-        Close all h5py.File instances
+        Close all open h5py.File instances and the process pool
         """
-        for f in self._h5_map['h5']:
-            f.close()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+        self._handles.close()
 
 
 class MultiTimeResource(BaseDatasetIterable):
@@ -543,7 +1002,9 @@ class MultiTimeResource(BaseDatasetIterable):
     """
 
     def __init__(self, h5_path, unscale=True, str_decode=True,
-                 res_cls=Resource, hsds=False, hsds_kwargs=None):
+                 res_cls=Resource, hsds=False, hsds_kwargs=None,
+                 max_workers=None, process_pool=False, max_open=None,
+                 manifest=None):
         """
         Parameters
         ----------
@@ -566,6 +1027,18 @@ class MultiTimeResource(BaseDatasetIterable):
         hsds_kwargs : dict, optional
             Dictionary of optional kwargs for h5pyd, e.g., bucket, username,
             password, by default None
+        max_workers : int, optional
+            Number of files to read concurrently when a request spans
+            multiple files, by default None (serial reads)
+        process_pool : bool, optional
+            Flag to read files in a pool of max_workers processes instead of
+            threads, by default False
+        max_open : int, optional
+            Maximum number of files to keep open at once, by default None
+            (no limit)
+        manifest : str, optional
+            Path to a .json file used to persist the time_index, datasets
+            and shape of each file between handlers, by default None
         """
 
         self.h5_path = h5_path
@@ -573,7 +1046,11 @@ class MultiTimeResource(BaseDatasetIterable):
         # Map variables to their .h5 files
         cls_kwargs = {'unscale': unscale, 'str_decode': str_decode,
                       'hsds': hsds, 'hsds_kwargs': hsds_kwargs}
-        self._h5 = MultiTimeH5(self.h5_path, res_cls=res_cls, **cls_kwargs)
+        self._h5 = MultiTimeH5(self.h5_path, res_cls=res_cls,
+                               max_workers=max_workers,
+                               process_pool=process_pool,
+                               max_open=max_open, manifest=manifest,
+                               **cls_kwargs)
         self.h5_files = self._h5.h5_files
         self.h5_file = self.h5_files[0]
 
@@ -690,6 +1167,18 @@ class MultiTimeResource(BaseDatasetIterable):
 
         return self.h5.h5.meta
 
+    @property
+    def lazy_meta(self):
+        """
+        Lazy, column-oriented view of the meta data, see
+        rex.resource.LazyMeta
+
+        Returns
+        -------
+        lazy_meta : LazyMeta
+        """
+        return self.h5.h5.lazy_meta
+
     @property
     def time_index(self):
         """
@@ -937,7 +1426,8 @@ class MultiTimeNSRDB(MultiTimeResource):
     PREFIX = 'nsrdb'
 
     def __init__(self, h5_path, unscale=True, str_decode=True, hsds=False,
-                 hsds_kwargs=None):
+                 hsds_kwargs=None, max_workers=None,
+                 process_pool=False, max_open=None, manifest=None):
         """
         Parameters
         ----------
@@ -958,10 +1448,24 @@ class MultiTimeNSRDB(MultiTimeResource):
         hsds_kwargs : dict, optional
             Dictionary of optional kwargs for h5pyd, e.g., bucket, username,
             password, by default None
+        max_workers : int, optional
+            Number of files to read concurrently when a request spans
+            multiple files, by default None (serial reads)
+        process_pool : bool, optional
+            Flag to read files in a pool of max_workers processes instead of
+            threads, by default False
+        max_open : int, optional
+            Maximum number of files to keep open at once, by default None
+            (no limit)
+        manifest : str, optional
+            Path to a .json file used to persist the time_index, datasets
+            and shape of each file between handlers, by default None
         """
         super().__init__(h5_path, unscale=unscale, hsds=hsds,
                          hsds_kwargs=hsds_kwargs, str_decode=str_decode,
-                         res_cls=NSRDB)
+                         res_cls=NSRDB, max_workers=max_workers,
+                         process_pool=process_pool, max_open=max_open,
+                         manifest=manifest)
 
 
 class MultiTimeWindResource(MultiTimeResource):
@@ -973,7 +1477,8 @@ class MultiTimeWindResource(MultiTimeResource):
     PREFIX = 'wtk'
 
     def __init__(self, h5_path, unscale=True, str_decode=True, hsds=False,
-                 hsds_kwargs=None):
+                 hsds_kwargs=None, max_workers=None,
+                 process_pool=False, max_open=None, manifest=None):
         """
         Parameters
         ----------
@@ -994,10 +1499,24 @@ class MultiTimeWindResource(MultiTimeResource):
         hsds_kwargs : dict, optional
             Dictionary of optional kwargs for h5pyd, e.g., bucket, username,
             password, by default None
+        max_workers : int, optional
+            Number of files to read concurrently when a request spans
+            multiple files, by default None (serial reads)
+        process_pool : bool, optional
+            Flag to read files in a pool of max_workers processes instead of
+            threads, by default False
+        max_open : int, optional
+            Maximum number of files to keep open at once, by default None
+            (no limit)
+        manifest : str, optional
+            Path to a .json file used to persist the time_index, datasets
+            and shape of each file between handlers, by default None
         """
         super().__init__(h5_path, unscale=unscale, hsds=hsds,
                          hsds_kwargs=hsds_kwargs, str_decode=str_decode,
-                         res_cls=WindResource)
+                         res_cls=WindResource, max_workers=max_workers,
+                         process_pool=process_pool, max_open=max_open,
+                         manifest=manifest)
 
 
 class MultiTimeWaveResource(MultiTimeResource):
@@ -1007,7 +1526,8 @@ class MultiTimeWaveResource(MultiTimeResource):
     """
 
     def __init__(self, h5_path, unscale=True, str_decode=True, hsds=False,
-                 hsds_kwargs=None):
+                 hsds_kwargs=None, max_workers=None,
+                 process_pool=False, max_open=None, manifest=None):
         """
         Parameters
         ----------
@@ -1028,7 +1548,21 @@ class MultiTimeWaveResource(MultiTimeResource):
         hsds_kwargs : dict, optional
             Dictionary of optional kwargs for h5pyd, e.g., bucket, username,
             password, by default None
+        max_workers : int, optional
+            Number of files to read concurrently when a request spans
+            multiple files, by default None (serial reads)
+        process_pool : bool, optional
+            Flag to read files in a pool of max_workers processes instead of
+            threads, by default False
+        max_open : int, optional
+            Maximum number of files to keep open at once, by default None
+            (no limit)
+        manifest : str, optional
+            Path to a .json file used to persist the time_index, datasets
+            and shape of each file between handlers, by default None
         """
         super().__init__(h5_path, unscale=unscale, hsds=hsds,
                          hsds_kwargs=hsds_kwargs, str_decode=str_decode,
-                         res_cls=WaveResource)
+                         res_cls=WaveResource, max_workers=max_workers,
+                         process_pool=process_pool, max_open=max_open,
+                         manifest=manifest)
@@ -14,6 +14,7 @@ from rex.multi_time_resource import MultiTimeH5, MultiTimeResource
 from rex.renewable_resource import (NSRDB, SolarResource, WindResource,
                                     WaveResource)
 from rex.resource import Resource
+from rex.utilities.handle_pool import LazyResource
 from rex.utilities.parse_keys import parse_slice
 from rex.utilities.utilities import parse_year
 
@@ -24,7 +25,8 @@ class MultiYearH5(MultiTimeH5):
     """
 
     def __init__(self, h5_path, years=None, res_cls=Resource, hsds=False,
-                 hsds_kwargs=None, **res_cls_kwargs):
+                 hsds_kwargs=None, max_workers=None, process_pool=False,
+                 max_open=None, manifest=None, **res_cls_kwargs):
         """
         Parameters
         ----------
@@ -44,6 +46,18 @@ class MultiYearH5(MultiTimeH5):
         hsds_kwargs : dict, optional
             Dictionary of optional kwargs for h5pyd, e.g., bucket, username,
             password, by default None
+        max_workers : int, optional
+            Number of years to read concurrently when a request spans
+            multiple years, see MultiTimeH5, by default None
+        process_pool : bool, optional
+            Flag to read years in a pool of max_workers processes instead of
+            threads, see MultiTimeH5, by default False
+        max_open : int, optional
+            Maximum number of years to keep open at once, see MultiTimeH5,
+            by default None
+        manifest : str, optional
+            Path to a .json file with the time_index, datasets and shape of
+            each file, see MultiTimeH5, by default None
         """
         self.h5_path = h5_path
         self._file_paths = self._get_file_paths(h5_path, hsds=hsds,
@@ -51,15 +65,21 @@ class MultiYearH5(MultiTimeH5):
         self._file_paths, self._years = self._get_years(self._file_paths,
                                                         years)
         res_cls_kwargs.update({'hsds': hsds})
+        self._res_cls_kwargs = res_cls_kwargs
+        self._init_handles(max_workers=max_workers,
+                           process_pool=process_pool, max_open=max_open)
         self._h5_map = self._map_file_instances(self._file_paths,
                                                 self._years,
+                                                self._handles,
                                                 res_cls=res_cls,
+                                                manifest=manifest,
                                                 **res_cls_kwargs)
         self._years = self._h5_map['year'].values.tolist()
 
         self._datasets = None
         self._shape = None
         self._time_index = None
+        self._time_offsets = None
 
     def __repr__(self):
         msg = ("{} for {}:\n Contains data for {} years"
@@ -121,51 +141,92 @@ class MultiYearH5(MultiTimeH5):
         pandas.DatatimeIndex
         """
         if self._time_index is None:
-            for h5 in self._h5_map['h5'].unique():
+            for ti in self._time_indexes:
                 if self._time_index is None:
-                    self._time_index = h5.time_index
-                else:
-                    ti = self._time_index.append(h5.time_index)
                     self._time_index = ti
+                else:
+                    self._time_index = self._time_index.append(ti)
 
         return self._time_index
 
-    @staticmethod
-    def _map_file_instances(file_paths, years, res_cls=Resource,
-                            **res_cls_kwargs):
+    @property
+    def _time_handlers(self):
+        """
+        Lazy resource handlers of each year in the order their time indexes
+        are combined in time_index
+
+        Returns
+        -------
+        list
+        """
+        return self._h5_map['h5'].unique().tolist()
+
+    @property
+    def _time_indexes(self):
+        """
+        Time indexes of the _time_handlers from the file manifest
+
+        Returns
+        -------
+        list
         """
-        Open all .h5 files and map the open h5py instances to the
-        associated file paths
+        years = self._h5_map.drop_duplicates('year')
+
+        return years['time_index'].values.tolist()
+
+    @classmethod
+    def _map_file_instances(cls, file_paths, years, pool, res_cls=Resource,
+                            manifest=None, **res_cls_kwargs):
+        """
+        Map lazy resource handlers and the file manifest entries to the
+        associated file paths. Years stored in multiple files are opened
+        as multi-file handlers.
 
         Parameters
         ----------
         file_paths : list
             List of filepaths for this handler to handle.
+        years : list
+            List of integer years corresponding to the file_paths list
+        pool : rex.utilities.handle_pool.HandlePool
+            Pool to open the files through
+        res_cls : obj
+            Resource class to use to open and access resource data
+        manifest : str, optional
+            Path to .json manifest, by default None
 
         Returns
         -------
         h5_map : pd.DataFrame
-            DataFrame mapping file paths to open resource instances and
-            datasets per file (columns: fp, h5, and dsets)
+            DataFrame mapping file paths to lazy resource handlers of each
+            year, time indexes, datasets and shapes per file (columns: fp,
+            year, h5, time_index, dsets, and shape)
         """
 
         h5_map = pd.DataFrame({'fp': file_paths, 'year': years, 'h5': None})
         h5_map = h5_map.sort_values('year').reset_index(drop=True)
 
+        handles = {fp: LazyResource(res_cls, fp, pool=pool, **res_cls_kwargs)
+                   for fp in h5_map['fp']}
+        entries = cls._get_manifest(handles, manifest=manifest)
+
         if len(h5_map['year'].unique()) < len(h5_map):
+            for h5 in handles.values():
+                h5.close()
+
             del res_cls_kwargs['hsds']  # no multi file res on hsds
             for _, subdf in h5_map.groupby('year'):
                 fps = subdf['fp'].values.tolist()
                 handle = MULTI_FILE_CLASS_MAP.get(res_cls, MultiFileResource)
-                h5 = handle(fps, **res_cls_kwargs)
+                h5 = LazyResource(handle, fps, pool=pool, **res_cls_kwargs)
                 for i in subdf.index:
                     h5_map.at[i, 'h5'] = h5
 
         else:
-            for i, f_path in enumerate(h5_map['fp']):
-                h5_map.at[i, 'h5'] = res_cls(f_path, **res_cls_kwargs)
+            h5_map['h5'] = [handles[fp] for fp in h5_map['fp']]
 
-        h5_map['dsets'] = [h5.dsets for h5 in h5_map['h5'].values]
+        for k in ('time_index', 'dsets', 'shape'):
+            h5_map[k] = [entries[fp][k] for fp in h5_map['fp']]
 
         return h5_map
 
@@ -271,50 +332,28 @@ class MultiYearH5(MultiTimeH5):
             If unscale, returned in native units else in scaled units
         """
         ds_slice = parse_slice(ds_slice)
-        out = []
         time_slice = ds_slice[0]
         if self._check_for_years(time_slice):
             years = time_slice
-            year_slice = (slice(None), ) + ds_slice[1:]
             if isinstance(years, str):
                 years = [years]
 
+            # year lengths from the file manifest, so years are only opened
+            # to read their data
+            handlers = self._time_handlers
+            lengths = np.diff(self.time_offsets)
+            file_times = []
             for year in years:
-                year = int(year)
-                out.append(self[year]._get_ds(ds_name, year_slice))
-
-            out = np.concatenate(out, axis=0)
-
-        elif isinstance(time_slice, (int, np.integer)):
-            time_step = self.time_index[time_slice]
-            year = time_step.year
-            year_index = self.year_index(year)
-            year_slice = np.where(time_step == year_index)[0][0]
-            year_slice = (year_slice, ) + ds_slice[1:]
-            out = self[year]._get_ds(ds_name, year_slice)
+                h5 = self[int(year)]
+                n_steps = int(lengths[handlers.index(h5)])
+                file_times.append((h5, slice(0, n_steps)))
 
+            out = self._get_segments(ds_name, ds_slice[1:], file_times)
         else:
-            time_index = self.time_index[time_slice]
-            year_map = time_index.year
-            for year in year_map.unique():
-                year_index = self.year_index(year)
-                year_slice = year_index.isin(time_index[year_map == year])
-                year_slice = \
-                    self._check_time_slice(np.where(year_slice)[0])
-                year_slice = (year_slice, ) + ds_slice[1:]
-                out.append(self[year]._get_ds(ds_name, year_slice))
-
-            out = np.concatenate(out, axis=0)
+            out = super()._get_ds(ds_name, ds_slice)
 
         return out
 
-    def close(self):
-        """
-        Close all h5py.File instances
-        """
-        for f in self._h5_map['h5']:
-            f.close()
-
 
 class MultiYearResource(MultiTimeResource):
     """
@@ -409,7 +448,9 @@ class MultiYearResource(MultiTimeResource):
     """
 
     def __init__(self, h5_path, years=None, unscale=True, str_decode=True,
-                 res_cls=Resource, hsds=False, hsds_kwargs=None):
+                 res_cls=Resource, hsds=False, hsds_kwargs=None,
+                 max_workers=None, process_pool=False, max_open=None,
+                 manifest=None):
         """
         Parameters
         ----------
@@ -436,6 +477,18 @@ class MultiYearResource(MultiTimeResource):
         hsds_kwargs : dict, optional
             Dictionary of optional kwargs for h5pyd, e.g., bucket, username,
             password, by default None
+        max_workers : int, optional
+            Number of years to read concurrently when a request spans
+            multiple years, by default None (serial reads)
+        process_pool : bool, optional
+            Flag to read years in a pool of max_workers processes instead of
+            threads, by default False
+        max_open : int, optional
+            Maximum number of years to keep open at once, by default None
+            (no limit)
+        manifest : str, optional
+            Path to a .json file used to persist the time_index, datasets
+            and shape of each file between handlers, by default None
         """
         self.h5_path = h5_path
         self._time_index = None
@@ -443,6 +496,9 @@ class MultiYearResource(MultiTimeResource):
         cls_kwargs = {'unscale': unscale, 'str_decode': str_decode,
                       'hsds': hsds, 'hsds_kwargs': hsds_kwargs}
         self._h5 = MultiYearH5(self.h5_path, years=years, res_cls=res_cls,
+                               max_workers=max_workers,
+                               process_pool=process_pool,
+                               max_open=max_open, manifest=manifest,
                                **cls_kwargs)
         self.h5_files = self._h5.h5_files
         self.h5_file = self.h5_files[0]
@@ -502,7 +558,8 @@ class MultiYearNSRDB(MultiYearResource):
     """
 
     def __init__(self, h5_path, years=None, unscale=True, str_decode=True,
-                 hsds=False, hsds_kwargs=None):
+                 hsds=False, hsds_kwargs=None, max_workers=None,
+                 process_pool=False, max_open=None, manifest=None):
         """
         Parameters
         ----------
@@ -527,10 +584,24 @@ class MultiYearNSRDB(MultiYearResource):
         hsds_kwargs : dict, optional
             Dictionary of optional kwargs for h5pyd, e.g., bucket, username,
             password, by default None
+        max_workers : int, optional
+            Number of years to read concurrently when a request spans
+            multiple years, by default None (serial reads)
+        process_pool : bool, optional
+            Flag to read years in a pool of max_workers processes instead of
+            threads, by default False
+        max_open : int, optional
+            Maximum number of years to keep open at once, by default None
+            (no limit)
+        manifest : str, optional
+            Path to a .json file used to persist the time_index, datasets
+            and shape of each file between handlers, by default None
         """
         super().__init__(h5_path, years=years, unscale=unscale, hsds=hsds,
                          hsds_kwargs=hsds_kwargs, str_decode=str_decode,
-                         res_cls=NSRDB)
+                         res_cls=NSRDB, max_workers=max_workers,
+                         process_pool=process_pool, max_open=max_open,
+                         manifest=manifest)
 
 
 class MultiYearWindResource(MultiYearResource):
@@ -540,7 +611,8 @@ class MultiYearWindResource(MultiYearResource):
     """
 
     def __init__(self, h5_path, years=None, unscale=True, str_decode=True,
-                 hsds=False, hsds_kwargs=None):
+                 hsds=False, hsds_kwargs=None, max_workers=None,
+                 process_pool=False, max_open=None, manifest=None):
         """
         Parameters
         ----------
@@ -565,10 +637,24 @@ class MultiYearWindResource(MultiYearResource):
         hsds_kwargs : dict, optional
             Dictionary of optional kwargs for h5pyd, e.g., bucket, username,
             password, by default None
+        max_workers : int, optional
+            Number of years to read concurrently when a request spans
+            multiple years, by default None (serial reads)
+        process_pool : bool, optional
+            Flag to read years in a pool of max_workers processes instead of
+            threads, by default False
+        max_open : int, optional
+            Maximum number of years to keep open at once, by default None
+            (no limit)
+        manifest : str, optional
+            Path to a .json file used to persist the time_index, datasets
+            and shape of each file between handlers, by default None
         """
         super().__init__(h5_path, years=years, unscale=unscale, hsds=hsds,
                          hsds_kwargs=hsds_kwargs, str_decode=str_decode,
-                         res_cls=WindResource)
+                         res_cls=WindResource, max_workers=max_workers,
+                         process_pool=process_pool, max_open=max_open,
+                         manifest=manifest)
 
 
 class MultiYearWaveResource(MultiYearResource):
@@ -578,7 +664,8 @@ class MultiYearWaveResource(MultiYearResource):
     """
 
     def __init__(self, h5_path, years=None, unscale=True, str_decode=True,
-                 hsds=False, hsds_kwargs=None):
+                 hsds=False, hsds_kwargs=None, max_workers=None,
+                 process_pool=False, max_open=None, manifest=None):
         """
         Parameters
         ----------
@@ -603,7 +690,21 @@ class MultiYearWaveResource(MultiYearResource):
         hsds_kwargs : dict, optional
             Dictionary of optional kwargs for h5pyd, e.g., bucket, username,
             password, by default None
+        max_workers : int, optional
+            Number of years to read concurrently when a request spans
+            multiple years, by default None (serial reads)
+        process_pool : bool, optional
+            Flag to read years in a pool of max_workers processes instead of
+            threads, by default False
+        max_open : int, optional
+            Maximum number of years to keep open at once, by default None
+            (no limit)
+        manifest : str, optional
+            Path to a .json file used to persist the time_index, datasets
+            and shape of each file between handlers, by default None
         """
         super().__init__(h5_path, years=years, unscale=unscale, hsds=hsds,
                          hsds_kwargs=hsds_kwargs, str_decode=str_decode,
-                         res_cls=WaveResource)
+                         res_cls=WaveResource, max_workers=max_workers,
+                         process_pool=process_pool, max_open=max_open,
+                         manifest=manifest)
@@ -444,6 +444,7 @@ class Outputs(BaseResource):
         """
         # pylint: disable=attribute-defined-outside-init
         self._meta = meta
+        self._lazy_meta = None
         if isinstance(meta, pd.DataFrame):
             meta = to_records_array(meta)
 
@@ -5,3 +5,4 @@
 from .chunk_size import ArrayChunkSize, TimeseriesChunkSize
 from .combine_h5 import CombineH5
 from .rechunk_h5 import RechunkH5, get_dataset_attributes
+from .virtual_h5 import VirtualH5
@@ -0,0 +1,394 @@
+# -*- coding: utf-8 -*-
+"""
+Module to present multi-file and multi-year .h5 collections as a single .h5
+file of virtual datasets
+"""
+import h5py
+import logging
+import numpy as np
+import os
+
+from rex.multi_time_resource import MultiTimeH5
+from rex.resource import Resource
+from rex.utilities.loggers import log_versions
+
+logger = logging.getLogger(__name__)
+
+
+class VirtualH5:
+    """
+    Class to write an HDF5 virtual dataset (VDS) file presenting a
+    collection of .h5 files as a single Resource compatible file. Files
+    with the same time_index (e.g. the multi-file NSRDB or 5min WTK layouts)
+    hold different datasets of the same time block, blocks with different
+    time indexes (e.g. years) are concatenated in time. The time_index of all
+    blocks and the meta and coordinates of the first file are copied into
+    the virtual file, every other dataset is a virtual dataset mapping to
+    the source files, so no resource data is copied.
+
+    Examples
+    --------
+    >>> VirtualH5.run('./nsrdb_vds.h5', '/datasets/nsrdb/nsrdb_*.h5')
+    >>> with Resource('./nsrdb_vds.h5') as res:
+    >>>     ghi = res['ghi', :, gid]  # 1998-2020 read by h5py in one call
+    """
+
+    SHARED_DSETS = ('meta', 'time_index', 'coordinates')
+    SCALE_ATTRS = ('scale_factor', 'psm_scale_factor', 'add_offset',
+                   'psm_add_offset')
+
+    def __init__(self, virtual_h5, h5_source, overwrite=True):
+        """
+        Parameters
+        ----------
+        virtual_h5 : str
+            Path to save virtual .h5 file to
+        h5_source : str | list
+            Unix shell style pattern path with * wildcards or list of paths
+            to local source .h5 files. Files must have the same coordinates.
+        overwrite : bool, optional
+            Flag to overwrite an existing virtual_h5 file, by default True
+        """
+        log_versions(logger)
+        self._virtual_h5 = virtual_h5
+        self._source_h5 = sorted(os.path.abspath(fp) for fp in
+                                 MultiTimeH5._get_file_paths(h5_source))
+        self._blocks = self._map_time_blocks(self._source_h5)
+        self._dset_attrs = self._check_datasets()
+        self._dst_h5 = h5py.File(self.virtual_h5,
+                                 mode='w' if overwrite else 'w-')
+        self._transfer_global_attrs()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+        if type is not None:
+            raise
+
+    def close(self):
+        """
+        Close h5 instance
+        """
+        self._dst_h5.close()
+
+    @property
+    def virtual_h5(self):
+        """
+        Path to virtual .h5 file
+
+        Returns
+        -------
+        str
+        """
+        return self._virtual_h5
+
+    @property
+    def source_h5(self):
+        """
+        Paths to source .h5 files
+
+        Returns
+        -------
+        list
+        """
+        return self._source_h5
+
+    @property
+    def blocks(self):
+        """
+        Time blocks in temporal order, each a dictionary with the block's
+        time_index (as stored in the files) and the files that share it
+
+        Returns
+        -------
+        list
+        """
+        return self._blocks
+
+    @property
+    def datasets(self):
+        """
+        Resource datasets to present as virtual datasets
+
+        Returns
+        -------
+        list
+        """
+        return sorted(self._dset_attrs)
+
+    @staticmethod
+    def _map_time_blocks(source_h5):
+        """
+        Group files with identical time indexes into time blocks and sort
+        the blocks in time
+
+        Parameters
+        ----------
+        source_h5 : list
+            Paths to source .h5 files
+
+        Returns
+        -------
+        blocks : list
+            List of dictionaries with the block's raw time_index, first time
+            step and files, in temporal order
+        """
+        blocks = {}
+        for h5_path in source_h5:
+            with Resource(h5_path) as f:
+                if 'time_index' not in f:
+                    msg = '{} does not have a time_index'.format(h5_path)
+                    logger.error(msg)
+                    raise RuntimeError(msg)
+
+                raw = f.h5['time_index'][...]
+                key = raw.tobytes()
+                if key not in blocks:
+                    blocks[key] = {'time_index': raw,
+                                   't0': f.time_index[0],
+                                   'files': []}
+
+                blocks[key]['files'].append(h5_path)
+
+        blocks = sorted(blocks.values(), key=lambda block: block['t0'])
+        time_index = np.concatenate([b['time_index'] for b in blocks])
+        if len(np.unique(time_index)) != len(time_index):
+            msg = ('The time indexes of the {} time blocks overlap, cannot '
+                   'concatenate them in time'.format(len(blocks)))
+            logger.error(msg)
+            raise RuntimeError(msg)
+
+        logger.info('Found {} time blocks in {} files'
+                    .format(len(blocks), len(source_h5)))
+
+        return blocks
+
+    def _check_dset_properties(self, dset_name, file_dsets):
+        """
+        Find the source file of a dataset in each time block and check that
+        the dataset properties match between blocks
+
+        Parameters
+        ----------
+        dset_name : str
+            Dataset to check
+        file_dsets : dict
+            Dictionary mapping source files to their datasets
+
+        Returns
+        -------
+        dset_attrs : dict
+            Dictionary of the dataset attrs, shape, dtype, time dependence,
+            and (file, shape) sources in temporal order
+        """
+        sources = []
+        attrs = None
+        dtype = None
+        for block in self.blocks:
+            h5_path = [fp for fp in block['files']
+                       if dset_name in file_dsets[fp]]
+            if not h5_path:
+                msg = ('{} is not available for time block starting {}'
+                       .format(dset_name, block['t0']))
+                logger.error(msg)
+                raise ValueError(msg)
+
+            h5_path = h5_path[0]
+            with Resource(h5_path) as f:
+                dset_attrs = f.get_attrs(dset=dset_name)
+                shape, dset_dtype, _ = f.get_dset_properties(dset_name)
+
+            if attrs is None:
+                attrs = dset_attrs
+                dtype = dset_dtype
+            else:
+                if dset_dtype != dtype:
+                    msg = ("{} dtypes ({} != {}) do not match between source "
+                           "files!".format(dset_name, dtype, dset_dtype))
+                    logger.error(msg)
+                    raise RuntimeError(msg)
+
+                for k in self.SCALE_ATTRS:
+                    if dset_attrs.get(k) != attrs.get(k):
+                        msg = ("{} {} ({} != {}) does not match between "
+                               "source files!".format(dset_name, k,
+                                                      attrs.get(k),
+                                                      dset_attrs.get(k)))
+                        logger.error(msg)
+                        raise RuntimeError(msg)
+
+                if shape[1:] != sources[0][1][1:]:
+                    msg = ("{} shape ({} != {}) does not match between "
+                           "source files!"
+                           .format(dset_name, shape, sources[0][1]))
+                    logger.error(msg)
+                    raise RuntimeError(msg)
+
+            sources.append((h5_path, shape))
+
+        time_dependent = all(len(shape) > 0
+                             and shape[0] == len(block['time_index'])
+                             for (_, shape), block in zip(sources,
+                                                          self.blocks))
+        if time_dependent:
+            shape = (sum(s[0] for _, s in sources), ) + sources[0][1][1:]
+        elif any(s != sources[0][1] for _, s in sources):
+            msg = ("{} is not time dependent but its shape does not match "
+                   "between source files: {}"
+                   .format(dset_name, [s for _, s in sources]))
+            logger.error(msg)
+            raise RuntimeError(msg)
+        else:
+            sources = sources[:1]
+            shape = sources[0][1]
+
+        return {'attrs': attrs, 'shape': shape, 'dtype': dtype,
+                'time_dependent': time_dependent, 'sources': sources}
+
+    def _check_datasets(self):
+        """
+        Check datasets to ensure compatible dtype, shape and scale factors
+
+        Returns
+        -------
+        dset_attrs : dict
+            Dictionary of virtual dataset properties and attributes
+        """
+        file_dsets = {}
+        for h5_path in self.source_h5:
+            with Resource(h5_path) as f:
+                file_dsets[h5_path] = set(f.datasets)
+
+        dset_attrs = {}
+        for dset in sorted(set().union(*file_dsets.values())):
+            if dset not in self.SHARED_DSETS:
+                dset_attrs[dset] = self._check_dset_properties(dset,
+                                                               file_dsets)
+
+        return dset_attrs
+
+    def _transfer_global_attrs(self):
+        """
+        Transfer global attributes from the first source file
+        """
+        with Resource(self.source_h5[0]) as f:
+            global_attrs = f.get_attrs()
+
+        if global_attrs:
+            logger.info('Transfering global attributes')
+            for k, v in global_attrs.items():
+                logger.debug("- Transfering {}: {}".format(k, v))
+                self._dst_h5.attrs[k] = v
+
+    def _copy_dataset(self, dset_name, data, h5_path):
+        """
+        Write a shared dataset (meta, time_index or coordinates) with the
+        chunks and attributes of the dataset in h5_path
+
+        Parameters
+        ----------
+        dset_name : str
+            Name of dataset to write
+        data : ndarray
+            Dataset values
+        h5_path : str
+            Path to source .h5 file to get chunks and attributes from
+        """
+        with Resource(h5_path) as f:
+            attrs = f.get_attrs(dset_name)
+            chunks = f.get_dset_properties(dset_name)[-1]
+
+        logger.debug('{} has:\n'
+                     'shape: {}\n'
+                     'dtype: {}\n'
+                     'chunks: {}'
+                     .format(dset_name, data.shape, data.dtype, chunks))
+        ds = self._dst_h5.create_dataset(dset_name, shape=data.shape,
+                                         dtype=data.dtype, chunks=chunks,
+                                         data=data)
+        for k, v in attrs.items():
+            logger.debug("- Transfering attr {}: {}".format(k, v))
+            ds.attrs[k] = v
+
+    def _write_shared_datasets(self):
+        """
+        Write the combined time_index and the meta and coordinates of the
+        first file
+        """
+        logger.info('Writing time_index, meta and coordinates')
+        time_index = np.concatenate([b['time_index'] for b in self.blocks])
+        self._copy_dataset('time_index', time_index,
+                           self.blocks[0]['files'][0])
+
+        for dset_name in ('meta', 'coordinates'):
+            for h5_path in self.blocks[0]['files']:
+                with Resource(h5_path) as f:
+                    if dset_name in f:
+                        data = f.h5[dset_name][...]
+                        break
+            else:
+                continue
+
+            self._copy_dataset(dset_name, data, h5_path)
+
+    def _write_virtual_dataset(self, dset_name, dset_attrs):
+        """
+        Write a virtual dataset mapping to the dataset in each time block
+
+        Parameters
+        ----------
+        dset_name : str
+            Name of dataset to write
+        dset_attrs : dict
+            Dictionary of dataset properties, attributes and sources
+        """
+        logger.info('Writing virtual dataset {}'.format(dset_name))
+        layout = h5py.VirtualLayout(shape=dset_attrs['shape'],
+                                    dtype=dset_attrs['dtype'])
+        start = 0
+        for h5_path, shape in dset_attrs['sources']:
+            logger.debug('- Mapping {} from {}'
+                         .format(dset_name, os.path.basename(h5_path)))
+            source = h5py.VirtualSource(h5_path, dset_name, shape=shape)
+            if dset_attrs['time_dependent']:
+                layout[start:start + shape[0]] = source
+                start += shape[0]
+            else:
+                layout[...] = source
+
+        ds = self._dst_h5.create_virtual_dataset(dset_name, layout)
+        for k, v in dset_attrs['attrs'].items():
+            logger.debug("- Transfering attr {}: {}".format(k, v))
+            ds.attrs[k] = v
+
+    def write(self):
+        """
+        Write the shared and virtual datasets
+        """
+        self._write_shared_datasets()
+        for dset_name, dset_attrs in self._dset_attrs.items():
+            self._write_virtual_dataset(dset_name, dset_attrs)
+
+    @classmethod
+    def run(cls, virtual_h5, h5_source, overwrite=True):
+        """
+        Write a virtual .h5 file presenting a collection of source .h5 files
+        as a single file
+
+        Parameters
+        ----------
+        virtual_h5 : str
+            Path to save virtual .h5 file to
+        h5_source : str | list
+            Unix shell style pattern path with * wildcards or list of paths
+            to local source .h5 files. Files must have the same coordinates.
+        overwrite : bool, optional
+            Flag to overwrite an existing virtual_h5 file, by default True
+        """
+        logger.info('Writing virtual datasets for {} to {}'
+                    .format(h5_source, virtual_h5))
+        with cls(virtual_h5, h5_source, overwrite=overwrite) as vds:
+            vds.write()
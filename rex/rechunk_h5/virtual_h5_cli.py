@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+Virtual h5 command line interface
+"""
+import click
+import logging
+import os
+
+from rex.rechunk_h5.virtual_h5 import VirtualH5
+from rex.utilities.loggers import init_logger
+from rex import __version__
+
+logger = logging.getLogger(__name__)
+
+
+@click.command()
+@click.version_option(version=__version__)
+@click.option('--virtual_h5', '-vds', type=click.Path(), required=True,
+              help="Path to save virtual .h5 file to")
+@click.option('--source_h5', '-src', type=str, required=True,
+              multiple=True,
+              help=("Path to source .h5 file(s), may contain * wildcards, "
+                    "may supply multiple"))
+@click.option('--overwrite', '-rm', is_flag=True,
+              help="Flag to overwrite an existing virtual .h5 file")
+@click.option('--log_file', '-log', default=None, type=click.Path(),
+              show_default=True,
+              help='Path to .log file, if None only log to stdout')
+@click.option('--verbose', '-v', is_flag=True,
+              help='If used upgrade logging to DEBUG')
+def main(virtual_h5, source_h5, overwrite, log_file, verbose):
+    """
+    VirtualH5 CLI entry point
+    """
+    if verbose:
+        log_level = 'DEBUG'
+    else:
+        log_level = 'INFO'
+
+    if log_file is not None:
+        log_dir = os.path.dirname(log_file)
+        if not os.path.exists(log_dir):
+            os.makedirs(log_dir)
+
+    init_logger('rex', log_file=log_file, log_level=log_level)
+
+    dst_dir = os.path.dirname(virtual_h5)
+    if dst_dir and not os.path.exists(dst_dir):
+        os.makedirs(dst_dir)
+
+    VirtualH5.run(virtual_h5, list(source_h5), overwrite=overwrite)
+
+
+if __name__ == '__main__':
+    try:
+        main(obj={})
+    except Exception:
+        logger.exception('Error running Virtual H5')
+        raise
@@ -11,7 +11,7 @@ import pandas as pd
 import warnings
 import logging
 
-from rex.resource import BaseResource
+from rex.resource import BaseResource, ResourceDataset
 from rex.sam_resource import SAMResource
 from rex.utilities.exceptions import (ResourceValueError, ExtrapolationWarning,
                                       ResourceWarning, ResourceRuntimeError,
@@ -171,7 +171,8 @@ class AbstractInterpolatedResource(BaseResource):
 
     def __init__(self, h5_file, mode='r', unscale=True, str_decode=True,
                  group=None, use_lapse_rate=True, hsds=False,
-                 hsds_kwargs=None):
+                 hsds_kwargs=None, chunk_cache=None, max_workers=None,
+                 mmap=False, cache_dir=None):
         """
         Parameters
         ----------
@@ -203,12 +204,27 @@ class AbstractInterpolatedResource(BaseResource):
         hsds_kwargs : dict, optional
             Dictionary of optional kwargs for h5pyd, e.g., bucket, username,
             password, by default None
+        chunk_cache : rex.utilities.chunk_cache.ChunkCache, optional
+            Optional LRU cache of dataset chunks shared across datasets,
+            by default None
+        max_workers : int, optional
+            Number of threads used to fetch planned multi-read requests
+            concurrently (useful for HSDS files), by default None
+        mmap : bool, optional
+            Flag to serve reads of contiguous, uncompressed datasets in local
+            files from numpy memory maps instead of h5py, see BaseResource,
+            by default False
+        cache_dir : str, optional
+            Directory to persist the decoded meta and time_index of local
+            files in, by default None
         """
         self._interp_var = None
         self._use_lapse = use_lapse_rate
         super().__init__(h5_file, unscale=unscale, str_decode=str_decode,
                          group=group, hsds=hsds, mode=mode,
-                         hsds_kwargs=hsds_kwargs)
+                         hsds_kwargs=hsds_kwargs, chunk_cache=chunk_cache,
+                         max_workers=max_workers, mmap=mmap,
+                         cache_dir=cache_dir)
 
         # this is where self.heights or self.depths gets set
         self._interpolation_variable = self._parse_interp_var(self.datasets)
@@ -368,7 +384,7 @@ class AbstractInterpolatedResource(BaseResource):
 
         return attrs
 
-    def _get_ds(self, ds_name, ds_slice):
+    def _get_ds(self, ds_name, ds_slice, out=None):
         """
         Extract data from given dataset
 
@@ -379,6 +395,9 @@ class AbstractInterpolatedResource(BaseResource):
         ds_slice : tuple
             Tuple of (int, slice, list, ndarray) of what to extract from
             ds, each arg is for a sequential axis
+        out : ndarray, optional
+            Pre-allocated output array to extract the data into, by default
+            None, see get_dset_arr
 
         Returns
         -------
@@ -387,10 +406,15 @@ class AbstractInterpolatedResource(BaseResource):
             If unscale, returned in native units else in scaled units
         """
         var_name, val = self._parse_name(ds_name)
-        if val is not None and var_name in self._interpolation_variable:
-            out = self._get_ds_interpolated(ds_name, ds_slice)
-        else:
-            out = super()._get_ds(ds_name, ds_slice)
+        if val is None or var_name not in self._interpolation_variable:
+            return super()._get_ds(ds_name, ds_slice, out=out)
+
+        arr = self._get_ds_interpolated(ds_name, ds_slice)
+        if out is None:
+            return arr
+
+        ResourceDataset._check_out(out, arr)
+        out[...] = arr
 
         return out
 
@@ -473,6 +497,37 @@ class AbstractInterpolatedResource(BaseResource):
         """
 
         var_name, val = self._parse_name(ds_name)
+        lapse = self._get_lapse(var_name, val, valid_units=valid_units)
+        interpolation_values = self._interpolation_variable[var_name]
+        ds_name = '{}_{}{}'.format(var_name, int(interpolation_values[0]),
+                                   self.VARIABLE_UNIT)
+        out = super()._get_ds(ds_name, ds_slice)
+
+        return out + lapse
+
+    def _get_lapse(self, var_name, val,
+                   valid_units=('pa', 'pascals',
+                                'c', 'celsius',
+                                'k', 'kelvin')):
+        """Get the lapse rate adjustment from the single elevation
+        temperature or pressure data is available at to a new elevation.
+
+        Parameters
+        ----------
+        var_name : str
+            Variable name without elevation, e.g. 'temperature'
+        val : int | float
+            Elevation to adjust to
+        valid_units : tuple
+            Tuple of valid lower-case units that can be lapse-rate adjusted. If
+            the dataset doesnt have units in this list, a warning will be
+            raised.
+
+        Returns
+        -------
+        lapse : float
+            Lapse rate adjustment to add to the variable data
+        """
         interpolation_values = self._interpolation_variable[var_name]
         ds_name = '{}_{}{}'.format(var_name, int(interpolation_values[0]),
                                    self.VARIABLE_UNIT)
@@ -499,10 +554,9 @@ class AbstractInterpolatedResource(BaseResource):
             logger.warning(msg)
             warnings.warn(msg, ResourceWarning)
 
-        out = super()._get_ds(ds_name, ds_slice)
         delta_h = (interpolation_values[0] - val) / 1000  # to kilometers
-        lapse = delta_h * lapse_rate
-        return out + lapse
+
+        return delta_h * lapse_rate
 
     def _get_calculated_ds(self, val, ds_name, var_name, ds_slice):
         """Get interpolated/extrapolated values for the dataset. """
@@ -992,7 +1046,39 @@ class WindResource(AbstractInterpolatedResource):
         return out
 
     @classmethod
-    def monin_obukhov_extrapolation(cls, ts_1, h_1, z0, L, h):
+    def monin_obukhov_terms(cls, h_1, z0, L):
+        """
+        Compute the Monin-Obukhov stability terms that only depend on the
+        source height h_1, these can be re-used to extrapolate the same
+        time-series to any number of heights
+
+        Parameters
+        ----------
+        h_1 : int | float
+            Height of the time-series to extrapolate from
+        z0: int | float | ndarray
+            Roughness length
+        L : ndarray
+            time-series of Obukhov length (m; measure of stability)
+
+        Returns
+        -------
+        psi_0 : ndarray
+            Stability function at z0
+        denom : ndarray
+            Denominator of the logarithmic extrapolation equation at h_1
+        """
+        # Non dimensional stability parameter at z0
+        psi_0 = cls.stability_function(z0 / L)
+        # Non dimensional stability parameter at h_1
+        denom = np.log(h_1 / z0) - cls.stability_function(h_1 / L)
+        denom += psi_0
+
+        return psi_0, denom
+
+    @classmethod
+    def monin_obukhov_extrapolation(cls, ts_1, h_1, z0, L, h, terms=None,
+                                    out=None):
         """
         Monin-Obukhov extrapolation
 
@@ -1008,27 +1094,40 @@ class WindResource(AbstractInterpolatedResource):
             time-series of Obukhov length (m; measure of stability)
         h : int | float
             Desired height
+        terms : tuple, optional
+            Pre-computed (psi_0, denom) stability terms for h_1, z0 and L,
+            see monin_obukhov_terms, by default None (computed here)
+        out : ndarray, optional
+            Float array to write the extrapolated time-series into, must
+            have the broadcast shape of ts_1, z0 and L, by default None
 
         Returns
         -------
         ndarray
             new wind speed from MO extrapolation.
         """
+        if terms is None:
+            terms = cls.monin_obukhov_terms(h_1, z0, L)
+
+        psi_0, denom = terms
+        if out is None:
+            shape = np.broadcast_shapes(np.shape(ts_1), np.shape(L),
+                                        np.shape(z0))
+            out = np.empty(shape, dtype=np.float64)
+
         # Non dimensional stability parameter at h
-        zeta = cls.stability_function(h / L)
-        # Non dimensional stability parameter at z0
-        zeta_0 = cls.stability_function(z0 / L)
-        # Non dimensional stability parameter at h_1
-        zeta_1 = cls.stability_function(h_1 / L)
+        cls.stability_function(h / L, out=out)
 
         # Logarithmic extrapolation equation
-        out = (ts_1 * (np.log(h / z0) - zeta + zeta_0)
-               / (np.log(h_1 / z0) - zeta_1 + zeta_0))
+        np.subtract(psi_0, out, out=out)
+        out += np.log(h / z0)
+        out /= denom
+        out *= ts_1
 
         return out
 
     @staticmethod
-    def stability_function(zeta):
+    def stability_function(zeta, out=None):
         """
         Calculate stability function depending on sign of L
         (negative is unstable, positive is stable)
@@ -1037,43 +1136,56 @@ class WindResource(AbstractInterpolatedResource):
         ----------
         zeta : ndarray
             Normalized length
+        out : ndarray, optional
+            Float array to write the stability function into, zeta is
+            broadcast to its shape, by default None
 
         Returns
         -------
         numpy.ndarray
             stability measurements.
         """
-        stab_fun = np.zeros(len(zeta))
-        zeta = zeta.astype(float)
+        zeta = np.asarray(zeta, dtype=float)
+        if out is None:
+            out = np.zeros(zeta.shape)
+        else:
+            zeta = np.broadcast_to(zeta, out.shape)
+            out[...] = 0
 
         # Unstable conditions
-        x = (np.power(1 - 16 * zeta[zeta < 0], 0.25))
-        paulson_func = (np.pi / 2 - 2 * np.arctan(x)
-                        + np.log(np.power(1 + x, 2)
-                        * (1 + np.power(x, 2)) / 8))
-
-        y = np.power(1 - 10 * zeta[zeta < 0], 1. / 3)
-        conv_func = (3 / 2 * np.log(np.power(y, 2) + y + 1. / 3) - np.sqrt(3)
-                     * np.arctan(2 * y + 1 / np.sqrt(3)) + np.pi / np.sqrt(3))
-
-        o = ((paulson_func + np.power(zeta[zeta < 0], 2) * conv_func)
-             / (1 + np.power(zeta[zeta < 0], 2)))
-
-        stab_fun[np.where(zeta < 0)] = o
+        unstable = zeta < 0
+        z = zeta[unstable]
+        x = np.power(1 - 16 * z, 0.25)
+        paulson_func = np.log(np.square(1 + x) * (1 + np.square(x)) / 8)
+        paulson_func -= 2 * np.arctan(x)
+        paulson_func += np.pi / 2
+
+        y = np.cbrt(1 - 10 * z)
+        conv_func = 3 / 2 * np.log(np.square(y) + y + 1. / 3)
+        conv_func -= np.sqrt(3) * np.arctan(2 * y + 1 / np.sqrt(3))
+        conv_func += np.pi / np.sqrt(3)
+
+        z = np.square(z, out=z)
+        conv_func *= z
+        paulson_func += conv_func
+        z += 1
+        paulson_func /= z
+        out[unstable] = paulson_func
 
         # Stable conditions
         a = 6.1
         b = 2.5
 
-        o = np.log(zeta[zeta >= 0]
-                   + (1 + np.power(zeta[zeta >= 0], b))**(1 / b))
+        stable = zeta >= 0
+        z = zeta[stable]
+        o = np.log(z + (1 + np.power(z, b))**(1 / b))
         o *= -a
-        stab_fun[np.where(zeta >= 0)] = o
+        out[stable] = o
 
-        return stab_fun
+        return out
 
     @staticmethod
-    def power_law_interp(ts_1, h_1, ts_2, h_2, h, mean=True):
+    def power_law_interp(ts_1, h_1, ts_2, h_2, h, mean=True, axis=None):
         """
         Power-law interpolate/extrapolate time-series data to height h
 
@@ -1091,6 +1203,10 @@ class WindResource(AbstractInterpolatedResource):
             Height of desired time-series
         mean : bool
             Calculate average alpha versus point by point alpha
+        axis : int, optional
+            Axis to average the time-series along when computing the average
+            alpha, e.g. 0 to compute an average alpha for each site of
+            (time, sites) arrays, by default None (a single alpha)
 
         Returns
         -------
@@ -1110,12 +1226,12 @@ class WindResource(AbstractInterpolatedResource):
             ts_1, ts_2 = ts_2, ts_1
 
         if mean:
-            alpha = (np.log(ts_2.mean() / ts_1.mean())
+            alpha = (np.log(ts_2.mean(axis=axis) / ts_1.mean(axis=axis))
                      / np.log(h_2 / h_1))
 
-            if alpha < 0.06:
+            if np.any(alpha < 0.06):
                 warnings.warn('Alpha is < 0.06', RuntimeWarning)
-            elif alpha > 0.6:
+            elif np.any(alpha > 0.6):
                 warnings.warn('Alpha is > 0.6', RuntimeWarning)
         else:
             # Replace zero values for alpha calculation
@@ -1213,7 +1329,24 @@ class WindResource(AbstractInterpolatedResource):
 
         return h
 
-    def _try_monin_obukhov_extrapolation(self, ts_1, ds_slice, h_1, h):
+    def _get_monin_obukhov_inputs(self, ds_slice):
+        """
+        Read the roughness length and Obukhov length needed for
+        Monin-Obukhov extrapolation
+
+        Parameters
+        ----------
+        ds_slice : tuple
+            Tuple of (int, slice, list, ndarray) of what to extract
+            from ds, each arg is for a sequential axis
+
+        Returns
+        -------
+        z0 : int | float | ndarray
+            Roughness length
+        L : ndarray
+            time-series of Obukhov length (m; measure of stability)
+        """
         rmol = 'inversemoninobukhovlength_2m'
         if rmol not in self:
             msg = ("{} is needed to run monin obukhov extrapolation"
@@ -1223,15 +1356,66 @@ class WindResource(AbstractInterpolatedResource):
         if 'roughness_length' in self:
             z0 = self._get_ds('roughness_length', ds_slice)
         elif 'z0' in self.meta:
-            z0 = self.meta['z0']
+            sites = ds_slice[1] if len(ds_slice) > 1 else slice(None)
+            z0 = self.meta['z0'].values[sites]
         else:
             msg = ("roughness length ('z0') is needed to run monin obukhov"
                    "extrapolation")
             raise MoninObukhovExtrapolationError(msg)
 
-        L = 1 / self._get_ds(rmol, ds_slice)
+        L = self._get_ds(rmol, ds_slice)
+        L = np.divide(1, L, out=np.empty(L.shape, dtype=np.float64))
+
+        return z0, L
 
-        out = self.monin_obukhov_extrapolation(ts_1, h_1, z0, L, h)
+    def _try_monin_obukhov_extrapolation(self, ts_1, ds_slice, h_1, h,
+                                         mo_cache=None, cols=None):
+        """
+        Extrapolate ts_1 to height h using Monin-Obukhov extrapolation
+
+        Parameters
+        ----------
+        ts_1 : ndarray
+            Time-series array at height h_1
+        ds_slice : tuple
+            Tuple of (int, slice, list, ndarray) that ts_1 was extracted with
+        h_1 : int | float
+            Height corresponding to time-seris ts_1
+        h : int | float
+            Desired height
+        mo_cache : dict, optional
+            Cache of the stability inputs and terms of a block of sites that
+            is shared by all heights extracted from that block, must contain
+            the 'ds_slice' of the block. By default None (no cache)
+        cols : ndarray, optional
+            Positions of the ts_1 sites in the mo_cache block, by default
+            None (all sites)
+
+        Returns
+        -------
+        out : ndarray
+            Time-series array at height h
+        """
+        if mo_cache is None:
+            mo_cache = {'ds_slice': ds_slice}
+
+        if 'inputs' not in mo_cache:
+            mo_cache['inputs'] = \
+                self._get_monin_obukhov_inputs(mo_cache['ds_slice'])
+
+        z0, L = mo_cache['inputs']
+        if h_1 not in mo_cache:
+            mo_cache[h_1] = self.monin_obukhov_terms(h_1, z0, L)
+
+        terms = mo_cache[h_1]
+        if cols is not None:
+            L = L[..., cols]
+            terms = tuple(t[..., cols] for t in terms)
+            if np.ndim(z0):
+                z0 = z0[..., cols]
+
+        out = self.monin_obukhov_extrapolation(ts_1, h_1, z0, L, h,
+                                               terms=terms)
 
         return out
 
@@ -1281,28 +1465,71 @@ class WindResource(AbstractInterpolatedResource):
         heights = self._interpolation_variable[var_name]
         (h1, h2), extrapolate = self._get_nearest_val(val, heights)
 
-        if extrapolate:
-            msg = 'Extrapolating {}'.format(ds_name)
-
         dset_name_1 = '{}_{}{}'.format(var_name, h1, self.VARIABLE_UNIT)
         ts1 = super()._get_ds(dset_name_1, ds_slice)
         dset_name_2 = '{}_{}{}'.format(var_name, h2, self.VARIABLE_UNIT)
         ts2 = super()._get_ds(dset_name_2, ds_slice)
 
+        return self._calculate_ds(val, ds_name, var_name, ds_slice, ts1, h1,
+                                  ts2, h2, extrapolate)
+
+    def _calculate_ds(self, val, ds_name, var_name, ds_slice, ts1, h1, ts2,
+                      h2, extrapolate, axis=None, mo_cache=None, cols=None):
+        """Interpolate/extrapolate the dataset from the data at the two
+        nearest available heights, see _get_calculated_ds
+
+        Parameters
+        ----------
+        val : int | float
+            Height of desired time-series
+        ds_name : str
+            Variable dataset name at the desired height
+        var_name : str
+            Variable name without height
+        ds_slice : tuple
+            Tuple of (int, slice, list, ndarray) of what was extracted from
+            the available heights, used for Monin-Obukhov extrapolation
+        ts1 : ndarray
+            Time-series array at height h1
+        h1 : int | float
+            Nearest available height
+        ts2 : ndarray
+            Time-series array at height h2
+        h2 : int | float
+            2nd nearest available height
+        extrapolate : bool
+            Flag as to whether val is outside the range of available heights
+        axis : int, optional
+            Axis to average the time-series along to compute the power law
+            alpha, see power_law_interp, by default None
+        mo_cache : dict, optional
+            Cache of Monin-Obukhov stability inputs and terms shared across
+            heights, see _try_monin_obukhov_extrapolation, by default None
+        cols : ndarray, optional
+            Positions of the ts1 sites in the mo_cache block, by default None
+
+        Returns
+        -------
+        out : ndarray
+            Time-series array at height val
+        """
+        if extrapolate:
+            msg = 'Extrapolating {}'.format(ds_name)
+
         if (var_name == 'windspeed') and extrapolate:
             if val < h1:
                 try:
-                    out = self._try_monin_obukhov_extrapolation(ts1,
-                                                                ds_slice,
-                                                                h1, val)
+                    out = self._try_monin_obukhov_extrapolation(
+                        ts1, ds_slice, h1, val, mo_cache=mo_cache, cols=cols)
                     msg += ' using Monin Obukhov Extrapolation'
                     warnings.warn(msg, ExtrapolationWarning)
                 except MoninObukhovExtrapolationError:
-                    out = self.power_law_interp(ts1, h1, ts2, h2, val)
+                    out = self.power_law_interp(ts1, h1, ts2, h2, val,
+                                                axis=axis)
                     msg += ' using Power Law Extrapolation'
                     warnings.warn(msg, ExtrapolationWarning)
             else:
-                out = self.power_law_interp(ts1, h1, ts2, h2, val)
+                out = self.power_law_interp(ts1, h1, ts2, h2, val, axis=axis)
                 msg += ' using Power Law Extrapolation'
                 warnings.warn(msg, ExtrapolationWarning)
         elif var_name == 'winddirection':
@@ -1311,6 +1538,225 @@ class WindResource(AbstractInterpolatedResource):
             out = linear_interp(ts1, h1, ts2, h2, val)
         return out
 
+    def _get_height_sources(self, var_name, heights):
+        """
+        Get the available heights needed to compute var_name at the given
+        heights
+
+        Parameters
+        ----------
+        var_name : str
+            Variable name without height, e.g. 'windspeed'
+        heights : list
+            Unique heights to compute var_name at
+
+        Returns
+        -------
+        sources : dict | None
+            Dictionary mapping each height to the (h1, h2, extrapolate,
+            offset) it is computed from. h2 is None if the height is taken
+            from h1 plus the (lapse rate) offset. None if var_name is not
+            available at any height.
+        """
+        available = self._interpolation_variable.get(var_name, [])
+        if not available:
+            return None
+
+        sources = {}
+        for h in heights:
+            if h in available:
+                sources[h] = (available[available.index(h)], None, False, 0)
+            elif len(available) > 1:
+                (h1, h2), extrapolate = self._get_nearest_val(h, available)
+                sources[h] = (h1, h2, extrapolate, 0)
+            elif self._use_lapse and var_name in self.LAPSE_RATES:
+                sources[h] = (available[0], None, False,
+                              self._get_lapse(var_name, h))
+            else:
+                ds_name = '{}_{}{}'.format(var_name, int(available[0]),
+                                           self.VARIABLE_UNIT)
+                warnings.warn('Only one {} available, returning {!r}'
+                              .format(self.VARIABLE_NAME, ds_name),
+                              ResourceWarning)
+                sources[h] = (available[0], None, False, 0)
+
+        return sources
+
+    def get_multi_height(self, var_name, heights, sites=None,
+                         time_slice=slice(None), per_site=False):
+        """
+        Extract a variable at multiple heights, e.g. wind speed at several
+        turbine hub-heights or at each site's own hub-height. Every available
+        height needed for the requested heights is read once for the given
+        sites and time steps, and all requested heights are interpolated /
+        extrapolated from those reads. The stability inputs of Monin-Obukhov
+        extrapolation are also read once and their terms at each source
+        height are shared by all requested heights. Results match extracting
+        '{var_name}_{height}m' for each height.
+
+        Parameters
+        ----------
+        var_name : str
+            Variable name without height, e.g. 'windspeed' or
+            'winddirection'
+        heights : int | float | list | ndarray
+            Height(s) to extract var_name at. If per_site is True, one
+            height for each of the requested sites.
+        sites : int | list | slice | ndarray, optional
+            Sites to extract, by default None (all sites)
+        time_slice : slice | list | ndarray, optional
+            Time steps to extract, by default slice(None)
+        per_site : bool, optional
+            Flag indicating that heights holds the height of each site. The
+            power law alpha used for extrapolation is then computed for each
+            site, like extracting each site on its own. By default False
+
+        Returns
+        -------
+        out : ndarray
+            (n_heights, n_time, n_sites) array of var_name at each of the
+            requested heights, or (n_time, n_sites) array of var_name at the
+            height of each site if per_site is True (n_sites is 1 for a
+            single site)
+        """
+        if sites is None:
+            sites = slice(None)
+        elif per_site and isinstance(sites, (int, np.integer)):
+            # keep the site axis so each site's column can be selected
+            sites = [sites]
+
+        ds_slice = (time_slice, sites)
+        heights = np.atleast_1d(heights)
+        if per_site:
+            gids = np.atleast_1d(np.arange(self.shape[1])[sites])
+            if len(heights) != len(gids):
+                msg = ('Number of heights ({}) does not match the number of '
+                       'sites ({})!'.format(len(heights), len(gids)))
+                logger.error(msg)
+                raise ResourceValueError(msg)
+
+        sources = self._get_height_sources(
+            var_name, [h.item() for h in np.unique(heights)])
+
+        data = {}
+        if sources is not None:
+            needed = set()
+            for h1, h2, _, _ in sources.values():
+                needed.update(h for h in (h1, h2) if h is not None)
+
+            for h in sorted(needed):
+                ds_name = '{}_{}{}'.format(var_name, h, self.VARIABLE_UNIT)
+                data[h] = super()._get_ds(ds_name, ds_slice)
+
+        mo_cache = {'ds_slice': ds_slice}
+        if per_site:
+            out = self._get_site_heights(var_name, heights, sources, data,
+                                         time_slice, gids, mo_cache=mo_cache)
+        else:
+            out = np.stack([self._get_height(var_name, h, sources, data,
+                                             ds_slice, mo_cache=mo_cache)
+                            for h in heights.tolist()])
+
+        return out
+
+    def _get_height(self, var_name, h, sources, data, ds_slice, cols=None,
+                    mo_cache=None):
+        """
+        Compute var_name at height h from the data at the available heights
+
+        Parameters
+        ----------
+        var_name : str
+            Variable name without height
+        h : int | float
+            Height to compute var_name at
+        sources : dict | None
+            Available heights h is computed from, see _get_height_sources.
+            If None, var_name is extracted with _get_ds
+        data : dict
+            Dictionary mapping available heights to their (time, sites) data
+        ds_slice : tuple
+            (time_slice, sites) slice of the output
+        cols : ndarray, optional
+            Positions of the output sites in data, if provided the power law
+            alpha is computed for each site, by default None (all sites)
+        mo_cache : dict, optional
+            Cache of the Monin-Obukhov stability inputs and terms of the data
+            block, see _try_monin_obukhov_extrapolation, by default None
+
+        Returns
+        -------
+        out : ndarray
+            var_name at height h
+        """
+        ds_name = '{}_{}{}'.format(var_name, h, self.VARIABLE_UNIT)
+        if sources is None:
+            return self._get_ds(ds_name, ds_slice)
+
+        h1, h2, extrapolate, offset = sources[h]
+        ts1 = data[h1]
+        if cols is not None:
+            ts1 = ts1[..., cols]
+
+        if h2 is None:
+            return ts1 + offset if offset else ts1
+
+        ts2 = data[h2]
+        axis = None
+        if cols is not None:
+            ts2 = ts2[..., cols]
+            axis = 0
+
+        return self._calculate_ds(h, ds_name, var_name, ds_slice, ts1, h1,
+                                  ts2, h2, extrapolate, axis=axis,
+                                  mo_cache=mo_cache, cols=cols)
+
+    def _get_site_heights(self, var_name, heights, sources, data,
+                          time_slice, gids, mo_cache=None):
+        """
+        Compute var_name at the height of each site from the data at the
+        available heights, sites with the same height are computed together
+
+        Parameters
+        ----------
+        var_name : str
+            Variable name without height
+        heights : ndarray
+            Height of each site
+        sources : dict | None
+            Available heights each height is computed from, see
+            _get_height_sources
+        data : dict
+            Dictionary mapping available heights to their (time, sites) data
+        time_slice : slice | list | ndarray
+            Time steps data was extracted for
+        gids : ndarray
+            Site gids data was extracted for
+        mo_cache : dict, optional
+            Cache of the Monin-Obukhov stability inputs and terms of the data
+            block, see _try_monin_obukhov_extrapolation, by default None
+
+        Returns
+        -------
+        out : ndarray
+            (time, sites) array of var_name at the height of each site
+        """
+        groups = []
+        for h in np.unique(heights):
+            cols = np.where(heights == h)[0]
+            ds_slice = (time_slice, gids[cols].tolist())
+            groups.append((cols, self._get_height(var_name, h.item(), sources,
+                                                  data, ds_slice, cols=cols,
+                                                  mo_cache=mo_cache)))
+
+        shape = groups[0][1].shape[:-1] + (len(heights), )
+        dtype = np.result_type(*[arr for _, arr in groups])
+        out = np.empty(shape, dtype=dtype)
+        for cols, arr in groups:
+            out[..., cols] = arr
+
+        return out
+
     def get_SAM_df(self, site, height, require_wind_dir=False, icing=False,
                    add_header=False):
         """
@@ -1390,6 +1836,53 @@ class WindResource(AbstractInterpolatedResource):
 
         return res_df
 
+    @staticmethod
+    def _set_sam_res(res, values, dsets, SAM_res, time_slice, sites):
+        """
+        Set the resource for individual sites at various hub-heights. Per
+        site hub-heights are extracted for all sites at once with
+        get_multi_height when res is a WindResource, which reads every
+        available height needed by any of the sites only once. Other
+        handlers are read one hub-height at a time.
+
+        Parameters
+        ----------
+        res : rex.Resource
+            rex Resource handler or similar (WindResource, MultiFileWTK,
+            etc...)
+        values : list | int
+            List of hub heights, one for each site, or a single hub height
+        dsets : list
+            List of dataset names to set
+        SAM_res : SAMResource
+            SAMResource object to load resource data into
+        time_slice : slice
+            Slice object representing any temporal subsampling
+        sites : list | slice
+            Spatial indices to load.
+            (sites is synonymous with gids aka spatial indices)
+        """
+        if np.ndim(values) == 0:
+            SAM_res.load_rex_resource(res, dsets, time_slice, sites,
+                                      hh=values, hh_unit=res.VARIABLE_UNIT)
+        elif isinstance(res, WindResource):
+            for dset in dsets:
+                SAM_res[dset] = res.get_multi_height(dset, values,
+                                                     sites=sites,
+                                                     time_slice=time_slice,
+                                                     per_site=True)
+        else:
+            # handlers that route datasets themselves (e.g.
+            # MultiResolutionResource) are read one height at a time
+            _, unique_index = np.unique(values, return_inverse=True)
+            unique_values = sorted(list(set(values)))
+            for dset in dsets:
+                for index, value in enumerate(unique_values):
+                    pos = np.where(unique_index == index)[0]
+                    sites = np.array(SAM_res.sites)[pos]
+                    ds_name = '{}_{}{}'.format(dset, value, res.VARIABLE_UNIT)
+                    SAM_res[dset, :, pos] = res[ds_name, time_slice, sites]
+
     @staticmethod
     def _preload_SAM(res, sites, hub_heights, time_index_step=None,
                      means=False, require_wind_dir=False,
@@ -1406,7 +1899,8 @@ class WindResource(AbstractInterpolatedResource):
             List of sites to be provided to SAM
             (sites is synonymous with gids aka spatial indices)
         hub_heights : int | float | list
-            Hub heights to extract for SAM
+            Hub height to extract for SAM, or a list of hub heights, one for
+            each site
         time_index_step: int, optional
             Step size for time_index, used to reduce temporal resolution,
             by default None
@@ -1478,7 +1972,9 @@ class WindResource(AbstractInterpolatedResource):
             List of sites to be provided to SAM
             (sites is synonymous with gids aka spatial indices)
         hub_heights : int | float | list
-            Hub heights to extract for SAM
+            Hub height to extract for SAM, or a list of hub heights, one for
+            each site. Every available height needed by any of the sites is
+            read only once.
         unscale : bool
             Boolean flag to automatically unscale variables on extraction
         str_decode : bool
@@ -4,7 +4,10 @@ Classes to handle resource data
 """
 import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+import itertools
 import logging
+import time
 from warnings import warn
 
 import dateutil
@@ -14,8 +17,11 @@ import numpy as np
 import pandas as pd
 
 from rex.sam_resource import SAMResource
-from rex.utilities.exceptions import ResourceKeyError, ResourceRuntimeError
+from rex.utilities.exceptions import (ResourceKeyError, ResourceRuntimeError,
+                                      RetryWarning,
+                                      ResourceValueError)
 from rex.utilities.parse_keys import parse_keys, parse_slice
+from rex.utilities.sidecar_cache import SidecarCache
 from rex.utilities.utilities import (check_tz, get_lat_lon_cols, rex_unscale,
                                      import_io_module_or_fail, is_s3_file,
                                      is_hsds_file, assert_read_only_mode)
@@ -40,9 +46,15 @@ class ResourceDataset:
     """
     h5py.Dataset wrapper for Resource .h5 files
     """
+    # Transient read errors that threaded fetches retry, h5pyd/HSDS HTTP
+    # errors are raised as OSError
+    RETRY_ERRORS = (OSError, )
+    RETRY_TRIES = 3
+    RETRY_WAIT = 1
 
     def __init__(self, ds, scale_attr='scale_factor', add_attr='add_offset',
-                 unscale=True):
+                 unscale=True, chunk_cache=None, max_workers=None,
+                 mmap=None):
         """
         Parameters
         ----------
@@ -56,8 +68,25 @@ class ResourceDataset:
             be a prioritized list of add offset names.
         unscale : bool, optional
             Flag to unscale dataset data, by default True
+        chunk_cache : rex.utilities.chunk_cache.ChunkCache, optional
+            Optional LRU cache of dataset chunks. If provided (and the
+            dataset is chunked), data is read from the dataset one full chunk
+            at a time and chunks are re-used from the cache on subsequent
+            reads, by default None
+        max_workers : int, optional
+            Number of threads used to fetch the reads of a planned multi-read
+            request (e.g. scattered gid lists or chunk cache misses)
+            concurrently. Each read is retried on failure. None or 1 fetches
+            reads serially, by default None
+        mmap : numpy.memmap, optional
+            Memory map of the dataset's contiguous on-disk data (see
+            ResourceDataset.open_mmap). If provided, reads are served from the
+            memory map instead of h5py, by default None
         """
         self._ds = ds
+        self._chunk_cache = chunk_cache
+        self._max_workers = max_workers
+        self._mmap = mmap
 
         self._scale_factor = self._parse_scale_add_attrs(scale_attr, 1)
         self._adder = self._parse_scale_add_attrs(add_attr, 0)
@@ -380,12 +409,51 @@ class ResourceDataset:
 
         return out_shape
 
+    @staticmethod
+    def _plan_list_reads(idx, chunk_size):
+        """
+        Plan the reads needed to extract a list of indices along a chunked
+        axis. Indices are mapped to the chunks they fall in and contiguous
+        runs of touched chunks are coalesced into a single read spanning the
+        requested indices in that run, so every chunk is read exactly once.
+
+        Parameters
+        ----------
+        idx : ndarray
+            Array of (possibly unsorted and duplicated) indices to extract
+        chunk_size : int
+            Chunk size along the axis being indexed
+
+        Returns
+        -------
+        reads : list
+            List of slices to read along the axis, one per run of
+            contiguous chunks, in ascending order
+        pos : ndarray
+            Position of each requested index in the concatenation of the
+            arrays returned by reads
+        """
+        u_idx = np.unique(idx)
+        breaks = np.where(np.diff(u_idx // chunk_size) > 1)[0] + 1
+        starts = u_idx[np.concatenate(([0], breaks))]
+        stops = u_idx[np.concatenate((breaks - 1, [-1]))] + 1
+
+        offsets = np.concatenate(([0], np.cumsum(stops - starts)[:-1]))
+        run_idx = np.searchsorted(starts, idx, side='right') - 1
+        pos = idx - starts[run_idx] + offsets[run_idx]
+
+        reads = [slice(int(s), int(e)) for s, e in zip(starts, stops)]
+
+        return reads, pos
+
     def _extract_list_slice(self, ds_slice):
         """
-        Optimize and extract list slice request along a single dimension. This
-        function checks if sequential gid requests are more than one chunk size
-        apart and then splits them into multiple separate requests (more
-        efficient to do multipl reads than to read all gids in-between).
+        Optimize and extract list slice request along a single dimension.
+        Requested indices are mapped to the dataset chunks they touch and
+        each run of contiguous chunks is read exactly once (more efficient
+        than reading all gids in-between or reading each gid separately).
+        The runs are written to a single pre-allocated buffer which is then
+        re-ordered to the requested order with a single fancy-index.
 
         Parameters
         ----------
@@ -398,52 +466,52 @@ class ResourceDataset:
         out : ndarray
             Extracted array of data from ds
         """
-        out_slices = []
         chunks = self.chunks
-        sort_idx = []
-        list_len = None
-        if chunks:
-            for i, ax_slice in enumerate(ds_slice):
-                c = chunks[i]
-                if isinstance(ax_slice, (list, np.ndarray)):
-                    if not isinstance(ax_slice, np.ndarray):
-                        ax_slice = np.array(ax_slice)
-
-                    idx = np.argsort(ax_slice)
-                    sort_idx.append(np.argsort(idx))
-                    ax_slice = ax_slice[idx]
-
-                    # this checks if sequential gid requests are more than one
-                    # chunk size apart and then splits them into multiple
-                    # separate requests
-                    diff = np.diff(ax_slice) > c
-                    if np.any(diff):
-                        pos = np.where(diff)[0] + 1
-                        ax_slice = np.split(ax_slice, pos)
-                        list_len = len(ax_slice)
-                elif isinstance(ax_slice, slice):
-                    sort_idx.append(slice(None))
-
-                out_slices.append(ax_slice)
-        else:
-            out_slices = ds_slice
+        if not chunks:
+            return self._extract_ds_slice(ds_slice)
+
+        ds_slice += (slice(None), ) * (len(self.shape) - len(ds_slice))
+        axis = [isinstance(ax_slice, (list, np.ndarray))
+                for ax_slice in ds_slice].index(True)
+        idx = np.asarray(ds_slice[axis])
+        if np.issubdtype(idx.dtype, np.dtype(bool)):
+            idx = np.where(idx)[0]
+
+        n = self.shape[axis]
+        if len(idx) and (idx.min() < -n or idx.max() >= n):
+            msg = ('Indices {} are out of bounds for axis {} with size {}'
+                   .format(idx[(idx < -n) | (idx >= n)], axis, n))
+            logger.error(msg)
+            raise IndexError(msg)
 
-        if list_len is not None:
-            out_shape = self._get_out_arr_shape(ds_slice)
-            out_slices = self._make_list_slices(out_slices, list_len)
+        idx = np.where(idx < 0, idx + n, idx)
 
-            out = np.zeros(out_shape, dtype=self.dtype)
-            start = 0
-            for s in zip(*out_slices):
-                arr_slice, stop = self._get_out_arr_slice(s, start)
-                out[arr_slice] = self._extract_ds_slice(s)
-                start = stop
+        reads, pos = self._plan_list_reads(idx, chunks[axis])
+        if len(reads) == 1:
+            return self._extract_ds_slice(ds_slice)
 
-            out = out[tuple(sort_idx)]
-        else:
-            out = self._extract_ds_slice(ds_slice)
+        out_axis = sum(not isinstance(s, (int, np.integer))
+                       for s in ds_slice[:axis])
+        buf_shape = ()
+        for i, (ax_slice, n) in enumerate(zip(ds_slice, self.shape)):
+            if i == axis:
+                buf_shape += (sum(r.stop - r.start for r in reads), )
+            elif isinstance(ax_slice, slice):
+                buf_shape += (len(range(*ax_slice.indices(n))), )
 
-        return out
+        read_slices = [ds_slice[:axis] + (read, ) + ds_slice[axis + 1:]
+                       for read in reads]
+        arrs = self._fetch(self._extract_ds_slice, read_slices)
+
+        buf = np.empty(buf_shape, dtype=self.dtype)
+        start = 0
+        for read, arr in zip(reads, arrs):
+            stop = start + read.stop - read.start
+            buf_slice = (slice(None), ) * out_axis + (slice(start, stop), )
+            buf[buf_slice] = arr
+            start = stop
+
+        return buf[(slice(None), ) * out_axis + (pos, )]
 
     def _extract_multi_list_slice(self, ds_slice, list_len):
         """
@@ -501,7 +569,7 @@ class ResourceDataset:
                 idx_slice += (ax_idx,)
 
         try:
-            out = self.ds[slices]
+            out = self._read_slices(slices)
         except Exception as e:
             msg = (f'Error retrieving data from "{self.ds}" for '
                    f'slice: "{slices}".')
@@ -525,24 +593,265 @@ class ResourceDataset:
 
         return out
 
-    def _unscale_data(self, data):
+    def _read_slices(self, slices):
+        """
+        Read slices from ds, going through the chunk cache if available
+
+        Parameters
+        ----------
+        slices : tuple
+            Tuple of (int, slice) to read from ds, each arg is for a
+            sequential axis
+
+        Returns
+        -------
+        out : ndarray
+            Extracted array of data from ds
+        """
+        if self._mmap is not None:
+            out = self._mmap[slices]
+            if isinstance(out, np.memmap):
+                out = out.view(np.ndarray)
+
+            return out
+
+        if self._chunk_cache is not None and self.chunks:
+            return self._read_cached_chunks(slices)
+
+        return self.ds[slices]
+
+    def _get_cache_key(self, chunk_idx):
         """
-        Unscale dataset data
+        Get the chunk cache key for the given chunk coordinates
+
+        Parameters
+        ----------
+        chunk_idx : tuple
+            Chunk coordinates (chunk index along each axis)
+
+        Returns
+        -------
+        key : tuple
+            (file, dataset, chunk coordinates)
+        """
+        try:
+            fname = self.ds.file.filename
+        except Exception:
+            fname = id(self.ds.file)
+
+        return (fname, self.ds.name, chunk_idx)
+
+    def _read_chunk(self, chunk_idx):
+        """
+        Read a full dataset chunk
+
+        Parameters
+        ----------
+        chunk_idx : tuple
+            Chunk coordinates (chunk index along each axis)
+
+        Returns
+        -------
+        chunk : ndarray
+            Full chunk array (clipped to the dataset shape)
+        """
+        chunk_slice = tuple(slice(i * c, min((i + 1) * c, n))
+                            for i, c, n in zip(chunk_idx, self.chunks,
+                                               self.shape))
+
+        return self.ds[chunk_slice]
+
+    def _get_chunks(self, chunk_idxs):
+        """
+        Get full dataset chunks from the chunk cache, reading the chunks
+        that are not cached from the dataset and adding them to the cache
+
+        Parameters
+        ----------
+        chunk_idxs : list
+            List of chunk coordinates (chunk index along each axis)
+
+        Returns
+        -------
+        chunks : list
+            List of full chunk arrays (clipped to the dataset shape)
+        """
+        keys = [self._get_cache_key(chunk_idx) for chunk_idx in chunk_idxs]
+        chunks = [self._chunk_cache.get(key) for key in keys]
+        missing = [i for i, chunk in enumerate(chunks) if chunk is None]
+        arrs = self._fetch(self._read_chunk,
+                           [chunk_idxs[i] for i in missing])
+        for i, arr in zip(missing, arrs):
+            self._chunk_cache.put(keys[i], arr)
+            chunks[i] = arr
+
+        return chunks
+
+    def _read_cached_chunks(self, slices):
+        """
+        Read slices from ds by assembling the full chunks that they
+        intersect, using the chunk cache to avoid re-reading chunks
+
+        Parameters
+        ----------
+        slices : tuple
+            Tuple of (int, slice) to read from ds, each arg is for a
+            sequential axis
+
+        Returns
+        -------
+        out : ndarray
+            Extracted array of data from ds
+        """
+        shape = self.shape
+        slices += (slice(None), ) * (len(shape) - len(slices))
+
+        bounds = []
+        out_idx = ()
+        for ax_slice, n in zip(slices, shape):
+            if isinstance(ax_slice, slice):
+                start, stop, step = ax_slice.indices(n)
+                if step < 1 or stop <= start:
+                    return self.ds[slices]
+
+                bounds.append((start, stop))
+                out_idx += (slice(None, None, step), )
+            elif isinstance(ax_slice, (int, np.integer)):
+                i = ax_slice + n if ax_slice < 0 else ax_slice
+                bounds.append((i, i + 1))
+                out_idx += (0, )
+            else:
+                return self.ds[slices]
+
+        out = np.empty([stop - start for start, stop in bounds],
+                       dtype=self.dtype)
+        chunk_ranges = [range(start // c, (stop - 1) // c + 1)
+                        for (start, stop), c in zip(bounds, self.chunks)]
+        chunk_idxs = list(itertools.product(*chunk_ranges))
+        for chunk_idx, chunk in zip(chunk_idxs, self._get_chunks(chunk_idxs)):
+            chunk_slice = ()
+            out_slice = ()
+            for (start, stop), c, i in zip(bounds, self.chunks, chunk_idx):
+                c0 = i * c
+                lo = max(start, c0)
+                hi = min(stop, c0 + c)
+                chunk_slice += (slice(lo - c0, hi - c0), )
+                out_slice += (slice(lo - start, hi - start), )
+
+            out[out_slice] = chunk[chunk_slice]
+
+        return out[out_idx]
+
+    def _fetch(self, read_func, read_args):
+        """
+        Run a planned set of dataset reads, fanning them out over a bounded
+        thread pool (retrying transient I/O errors) if max_workers > 1
+
+        Parameters
+        ----------
+        read_func : callable
+            Read function, called with a single argument
+        read_args : list
+            List of arguments to call read_func with, one per read
+
+        Returns
+        -------
+        out : list
+            List of arrays returned by read_func, in the order of read_args
+        """
+        max_workers = min(self._max_workers or 1, len(read_args))
+        if max_workers <= 1:
+            return [read_func(arg) for arg in read_args]
+
+        logger.debug('Fetching {} reads from {} using {} threads'
+                     .format(len(read_args), self.ds.name, max_workers))
+        with ThreadPoolExecutor(max_workers=max_workers) as exe:
+            out = list(exe.map(lambda arg: self._retry_read(read_func, arg),
+                               read_args))
+
+        return out
+
+    def _retry_read(self, read_func, arg):
+        """
+        Run a single read, retrying transient I/O errors (RETRY_ERRORS,
+        directly or as the cause of a ResourceRuntimeError) up to
+        RETRY_TRIES times. Any other error, or the last transient error, is
+        re-raised as is.
+
+        Parameters
+        ----------
+        read_func : callable
+            Read function, called with a single argument
+        arg : obj
+            Argument to call read_func with
+
+        Returns
+        -------
+        out : ndarray
+            Array returned by read_func
+        """
+        for i in range(self.RETRY_TRIES + 1):
+            try:
+                return read_func(arg)
+            except Exception as ex:
+                transient = (isinstance(ex, self.RETRY_ERRORS)
+                             or isinstance(ex.__cause__, self.RETRY_ERRORS))
+                if not transient or i == self.RETRY_TRIES:
+                    raise
+
+                warn('Attempt {} to read from {} failed:\n{}'
+                     .format(i + 1, self.ds.name, ex), RetryWarning)
+                time.sleep(self.RETRY_WAIT)
+
+    def _unscale_data(self, data, out=None):
+        """
+        Unscale dataset data, decoding the native data directly into a
+        (pre-allocated) float32 output array
 
         Parameters
         ----------
         data : ndarray
             Native dataset array
+        out : ndarray, optional
+            Pre-allocated output array to decode data into, by default None
+            which allocates a new float32 array
 
         Returns
         -------
-        data : ndarray
+        out : ndarray
             Unscaled dataset array
         """
-        data = data.astype('float32')
-        return rex_unscale(data, self.scale_factor, self.adder)
+        scalar = np.ndim(data) == 0
+        if out is None:
+            out = np.empty(np.shape(data), dtype=np.float32)
+
+        out = rex_unscale(data, self.scale_factor, self.adder, out=out)
+        if scalar:
+            out = out[()]
+
+        return out
+
+    @staticmethod
+    def _check_out(out, data):
+        """
+        Check that a caller supplied output array can hold the extracted
+        data
+
+        Parameters
+        ----------
+        out : ndarray
+            Caller supplied output array
+        data : ndarray
+            Extracted data
+        """
+        if not isinstance(out, np.ndarray) or out.shape != np.shape(data):
+            msg = ('Output array with shape {} does not match the shape of '
+                   'the extracted data: {}'
+                   .format(np.shape(out), np.shape(data)))
+            logger.error(msg)
+            raise ResourceValueError(msg)
 
-    def _get_ds_slice(self, ds_slice):
+    def _get_ds_slice(self, ds_slice, out=None):
         """
         Get ds_slice from ds as efficiently as possible, unscale if desired
 
@@ -551,29 +860,80 @@ class ResourceDataset:
         ds_slice : tuple
             Tuple of (int, slice, list, ndarray) of what to extract from ds,
             each arg is for a sequential axis
+        out : ndarray, optional
+            Pre-allocated output array to write the (unscaled) data into,
+            e.g. a float32 array, by default None
 
         Returns
         -------
         out : ndarray
-            Extracted array of data from ds
+            Extracted array of data from ds. Data read from a memory map is
+            always copied, so out never shares memory with the file.
         """
         list_len, multi_list = self._check_slice(ds_slice)
         if list_len is not None:
             if multi_list:
-                out = self._extract_multi_list_slice(ds_slice, list_len)
+                data = self._extract_multi_list_slice(ds_slice, list_len)
             else:
-                out = self._extract_list_slice(ds_slice)
+                data = self._extract_list_slice(ds_slice)
         else:
-            out = self._extract_ds_slice(ds_slice)
+            data = self._extract_ds_slice(ds_slice)
 
-        if self._unscale:
-            out = self._unscale_data(out)
+        if out is not None:
+            self._check_out(out, data)
+            if self._unscale:
+                self._unscale_data(data, out=out)
+            else:
+                np.copyto(out, data, casting='same_kind')
+        elif self._unscale:
+            out = self._unscale_data(data)
+        elif isinstance(data, np.ndarray) and not data.flags.writeable:
+            # read-only memory map view, don't hand out views of the file
+            out = data.copy()
+        else:
+            out = data
 
         return out
 
+    @staticmethod
+    def open_mmap(ds):
+        """
+        Memory map a dataset's data if its storage layout allows it: a local
+        h5py dataset stored contiguously (no chunking, and therefore no
+        compression or filters) with a fixed-size dtype and allocated
+        storage.
+
+        Parameters
+        ----------
+        ds : h5py.dataset
+            Open .h5 dataset instance to memory map
+
+        Returns
+        -------
+        mmap : numpy.memmap | None
+            Read-only memory map of the dataset data, None if the dataset
+            layout does not allow memory mapping. Reads through
+            ResourceDataset copy the data out of the map (while unscaling or
+            into out), they never return views of the file.
+        """
+        if not isinstance(ds, h5py.Dataset) or ds.chunks is not None:
+            return None
+
+        if ds.size == 0 or ds.dtype.hasobject or ds.file.driver != 'sec2':
+            return None
+
+        fpath = ds.file.filename
+        offset = ds.id.get_offset()
+        if offset is None or not os.path.isfile(fpath):
+            return None
+
+        return np.memmap(fpath, dtype=ds.dtype, mode='r', offset=offset,
+                         shape=ds.shape)
+
     @classmethod
     def extract(cls, ds, ds_slice, scale_attr='scale_factor',
-                add_attr='add_offset', unscale=True):
+                add_attr='add_offset', unscale=True, chunk_cache=None,
+                max_workers=None, mmap=None, out=None):
         """
         Extract data from Resource Dataset
 
@@ -590,11 +950,219 @@ class ResourceDataset:
             Name of add offset attribute, by default 'add_offset'
         unscale : bool, optional
             Flag to unscale dataset data, by default True
+        chunk_cache : rex.utilities.chunk_cache.ChunkCache, optional
+            Optional LRU cache of dataset chunks shared across datasets,
+            by default None
+        max_workers : int, optional
+            Number of threads used to fetch planned multi-read requests
+            concurrently, by default None
+        mmap : numpy.memmap, optional
+            Memory map of the dataset's contiguous on-disk data to read from
+            instead of h5py, by default None
+        out : ndarray, optional
+            Pre-allocated output array to decode the (unscaled) data into,
+            e.g. a float32 array, by default None
+
+        Returns
+        -------
+        out : ndarray
+            Extracted array of data from ds
         """
         dset = cls(ds, scale_attr=scale_attr, add_attr=add_attr,
-                   unscale=unscale)
+                   unscale=unscale, chunk_cache=chunk_cache,
+                   max_workers=max_workers, mmap=mmap)
+
+        return dset._get_ds_slice(parse_slice(ds_slice), out=out)
 
-        return dset[ds_slice]
+
+class LazyMeta:
+    """
+    Lazy, column-oriented view of a resource meta table. Meta columns are
+    read from the meta dataset on demand, so only the requested record
+    fields are read and only their byte strings are decoded. Each column
+    is cached after the first read. Use this instead of the full meta
+    DataFrame when only a few columns are needed, e.g. (latitude,
+    longitude) or a single region column.
+
+    Examples
+    --------
+    >>> with Resource(file) as res:
+    >>>     lazy_meta = res.lazy_meta
+    >>>     states = lazy_meta['state']
+    >>>     lat_lon = lazy_meta[['latitude', 'longitude']]
+    """
+
+    def __init__(self, res):
+        """
+        Parameters
+        ----------
+        res : BaseResource
+            Open resource handler to read the meta columns from
+        """
+        self._res = res
+        self._cols = {}
+        self._columns = None
+
+    def __repr__(self):
+        msg = ("{} with {} sites and {} columns ({} loaded)"
+               .format(self.__class__.__name__, len(self),
+                       len(self.columns), len(self._cols)))
+
+        return msg
+
+    def __len__(self):
+        return self._res.h5['meta'].shape[0]
+
+    def __contains__(self, col):
+        return col in self.columns
+
+    def __getitem__(self, cols):
+        """
+        Get meta column(s)
+
+        Parameters
+        ----------
+        cols : str | list
+            Column name or list of column names to extract
+
+        Returns
+        -------
+        out : ndarray | pandas.DataFrame
+            Column array if cols is a single column name, else a DataFrame of
+            the requested columns with the same index as the full meta
+        """
+        if isinstance(cols, str):
+            return self._get_column(cols)
+
+        out = pd.DataFrame({c: self._get_column(c) for c in cols},
+                           index=self.index)
+
+        return out
+
+    @property
+    def _full_meta(self):
+        """
+        Full meta DataFrame if it has already been loaded by the resource
+        handler
+
+        Returns
+        -------
+        pandas.DataFrame | None
+        """
+        meta = getattr(self._res, '_meta', None)
+        if not isinstance(meta, pd.DataFrame):
+            meta = None
+
+        return meta
+
+    @property
+    def columns(self):
+        """
+        Meta column names
+
+        Returns
+        -------
+        pandas.Index
+        """
+        if self._columns is None:
+            if self._full_meta is not None:
+                self._columns = self._full_meta.columns
+            else:
+                self._columns = pd.Index(self._res.h5['meta'].dtype.names)
+
+        return self._columns
+
+    @property
+    def str_decode(self):
+        """
+        Flag for whether byte string columns are decoded to strings
+
+        Returns
+        -------
+        bool
+        """
+        return self._res._str_decode
+
+    @property
+    def index(self):
+        """
+        Meta index, i.e. the site gids
+
+        Returns
+        -------
+        pandas.RangeIndex
+        """
+        index = pd.RangeIndex(len(self))
+        if 'gid' not in self.columns:
+            index.name = 'gid'
+
+        return index
+
+    def _get_column(self, col):
+        """
+        Get a single meta column, reading and caching it if needed
+
+        Parameters
+        ----------
+        col : str
+            Column name
+
+        Returns
+        -------
+        arr : ndarray
+            Meta column array
+        """
+        if col not in self._cols:
+            if col not in self:
+                msg = ('{} is not a valid meta column, must be one of: {}'
+                       .format(col, list(self.columns)))
+                logger.error(msg)
+                raise ResourceKeyError(msg)
+
+            if self._full_meta is not None:
+                arr = self._full_meta[col].values
+            else:
+                arr = self._res.h5['meta'][col]
+                if self.str_decode and np.issubdtype(arr.dtype, np.bytes_):
+                    # decode like the meta DataFrame, see df_str_decode
+                    arr = np.char.decode(arr, encoding='utf-8',
+                                         errors='ignore').astype(object)
+
+            self._cols[col] = arr
+
+        return self._cols[col]
+
+    def unique(self, col):
+        """
+        Get the unique values of a meta column in order of appearance
+
+        Parameters
+        ----------
+        col : str
+            Column name
+
+        Returns
+        -------
+        ndarray
+        """
+        return pd.unique(self._get_column(col))
+
+    def to_frame(self):
+        """
+        Get the full meta DataFrame from the resource handler
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        return self._res.meta
+
+    def clear(self):
+        """
+        Clear the cached meta columns
+        """
+        self._cols = {}
+        self._columns = None
 
 
 class BaseResource(BaseDatasetIterable):
@@ -607,7 +1175,8 @@ class BaseResource(BaseDatasetIterable):
     UNIT_ATTR = 'units'
 
     def __init__(self, h5_file, mode='r', unscale=True, str_decode=True,
-                 group=None, hsds=False, hsds_kwargs=None):
+                 group=None, hsds=False, hsds_kwargs=None, chunk_cache=None,
+                 max_workers=None, mmap=False, cache_dir=None):
         """
         Parameters
         ----------
@@ -633,6 +1202,32 @@ class BaseResource(BaseDatasetIterable):
         hsds_kwargs : dict, optional
             Dictionary of optional kwargs for h5pyd, e.g., bucket, username,
             password, by default None
+        chunk_cache : rex.utilities.chunk_cache.ChunkCache, optional
+            Optional LRU cache of dataset chunks. When provided, resource
+            dataset reads are served one full chunk at a time and repeated
+            reads of the same chunks (e.g. site-by-site extraction loops) are
+            served from memory. Can be shared across handlers, by default
+            None
+        max_workers : int, optional
+            Number of threads used to fetch the reads of planned multi-read
+            requests (scattered gid lists, chunk cache misses) concurrently.
+            Intended for HSDS files where every read is a network round trip;
+            h5py-backed (local and S3) reads are serialized by h5py's global
+            lock. Failed reads are retried. None or 1 fetches reads serially,
+            by default None
+        mmap : bool, optional
+            Flag to serve reads of contiguous, uncompressed datasets in local
+            files from numpy memory maps instead of h5py. The requested data
+            is still copied out of the memory map, so returned arrays are
+            writeable and independent of the file. Datasets whose layout does
+            not allow memory mapping (chunked, compressed, remote) are read
+            with h5py as usual, by default False
+        cache_dir : str, optional
+            Directory to persist the decoded meta and time_index of local
+            files in (see rex.utilities.sidecar_cache.SidecarCache). Cache
+            entries are keyed on the file path, size and modification time,
+            so they can be shared by all processes and nodes reading the same
+            file. Only used in read mode, by default None
         """
         self.h5_file = h5_file
 
@@ -654,6 +1249,12 @@ class BaseResource(BaseDatasetIterable):
         self._shapes = None
         self._chunks = None
         self._dtypes = None
+        if mode != 'r':
+            cache_dir = None
+
+        self._init_read_opts(chunk_cache=chunk_cache,
+                             max_workers=max_workers, mmap=mmap,
+                             cache_dir=cache_dir)
 
     def __repr__(self):
         msg = "{} for {}".format(self.__class__.__name__, self.h5_file)
@@ -835,7 +1436,7 @@ class BaseResource(BaseDatasetIterable):
         """
         if self._meta is None:
             if 'meta' in self.h5:
-                self._meta = self._get_meta('meta', slice(None))
+                self._meta = self._get_cached('meta', self._get_meta)
             else:
                 msg = "'meta' is not a valid dataset"
                 logger.error(msg)
@@ -843,6 +1444,27 @@ class BaseResource(BaseDatasetIterable):
 
         return self._meta
 
+    @property
+    def lazy_meta(self):
+        """
+        Lazy, column-oriented view of the meta data. Columns are only read
+        and decoded when requested, use this instead of meta when only a few
+        columns are needed.
+
+        Returns
+        -------
+        lazy_meta : LazyMeta
+        """
+        if self._lazy_meta is None:
+            if 'meta' in self.h5:
+                self._lazy_meta = LazyMeta(self)
+            else:
+                msg = "'meta' is not a valid dataset"
+                logger.error(msg)
+                raise ResourceKeyError(msg)
+
+        return self._lazy_meta
+
     @property
     def time_index(self):
         """
@@ -854,8 +1476,8 @@ class BaseResource(BaseDatasetIterable):
         """
         if self._time_index is None:
             if 'time_index' in self.h5:
-                self._time_index = self._get_time_index('time_index',
-                                                        slice(None))
+                self._time_index = self._get_cached('time_index',
+                                                    self._get_time_index)
             else:
                 msg = "'time_index' is not a valid dataset!"
                 logger.error(msg)
@@ -887,8 +1509,8 @@ class BaseResource(BaseDatasetIterable):
             if 'coordinates' in self:
                 self._lat_lon = self._get_coords('coordinates', slice(None))
             else:
-                lat_lon_cols = get_lat_lon_cols(self.meta)
-                self._lat_lon = self.meta[lat_lon_cols].values
+                lat_lon_cols = get_lat_lon_cols(self.lazy_meta)
+                self._lat_lon = self.lazy_meta[lat_lon_cols].values
 
         return self._lat_lon
 
@@ -903,6 +1525,17 @@ class BaseResource(BaseDatasetIterable):
         """
         return self.global_attrs.get('version', None)
 
+    @property
+    def chunk_cache(self):
+        """
+        Chunk cache used for dataset reads, None if chunk caching is disabled
+
+        Returns
+        -------
+        chunk_cache : rex.utilities.chunk_cache.ChunkCache | None
+        """
+        return self._chunk_cache
+
     @property
     def global_attrs(self):
         """
@@ -1104,10 +1737,68 @@ class BaseResource(BaseDatasetIterable):
             raise ResourceKeyError(msg)
 
         ds = ResourceDataset(self.h5[ds_name], scale_attr=self.SCALE_ATTR,
-                             add_attr=self.ADD_ATTR, unscale=self._unscale)
+                             add_attr=self.ADD_ATTR, unscale=self._unscale,
+                             chunk_cache=self._chunk_cache,
+                             max_workers=self._max_workers,
+                             mmap=self._get_mmap(ds_name))
 
         return ds
 
+    def _init_read_opts(self, chunk_cache=None, max_workers=None,
+                        mmap=False, cache_dir=None):
+        """
+        Initialize the lazy meta, chunk cache, parallel read, memory map and
+        sidecar cache state shared by all resource handlers
+
+        Parameters
+        ----------
+        chunk_cache : rex.utilities.chunk_cache.ChunkCache, optional
+            Optional LRU cache of dataset chunks, by default None
+        max_workers : int, optional
+            Number of threads used to fetch the reads of planned multi-read
+            requests, by default None
+        mmap : bool, optional
+            Flag to serve reads of contiguous, uncompressed datasets in local
+            files from numpy memory maps, by default False
+        cache_dir : str, optional
+            Directory to persist the decoded meta and time_index of local
+            files in, None disables the sidecar cache, by default None
+        """
+        self._lazy_meta = None
+        self._chunk_cache = chunk_cache
+        self._max_workers = max_workers
+        self._mmap = mmap
+        self._mmaps = {}
+        self._sidecar = None
+        if cache_dir is not None:
+            self._sidecar = SidecarCache(cache_dir)
+
+    def _get_mmap(self, ds_name):
+        """
+        Get the (cached) memory map for a dataset if mmap reads are enabled
+
+        Parameters
+        ----------
+        ds_name : str
+            Dataset name
+
+        Returns
+        -------
+        mmap : numpy.memmap | None
+            Memory map of the dataset data, None if mmap reads are disabled
+            or the dataset layout does not allow memory mapping
+        """
+        if not self._mmap:
+            return None
+
+        if ds_name not in self._mmaps:
+            self._mmaps[ds_name] = ResourceDataset.open_mmap(self.h5[ds_name])
+            if self._mmaps[ds_name] is None:
+                logger.debug('Cannot memory map "{}", reading with h5py'
+                             .format(ds_name))
+
+        return self._mmaps[ds_name]
+
     @classmethod
     def open_file(cls, file_path, mode='r', hsds=False, hsds_kwargs=None):
         """Open a filepath to an h5, s3, or hsds nrel resource file with the
@@ -1262,6 +1953,74 @@ class BaseResource(BaseDatasetIterable):
 
         return meta_arr
 
+    def get_dset_arr(self, ds_name, ds_slice=slice(None), out=None):
+        """Get a dataset array, optionally decoding it directly into a
+        pre-allocated (e.g. float32) output array. With out, extracting an
+        unscaled int16 dataset only needs the native read and the output
+        array, no full-size float temporaries.
+
+        Parameters
+        ----------
+        ds_name : str
+            Dataset to extract
+        ds_slice : tuple | int | slice | list, optional
+            Tuple of (int, slice, list, ndarray) of what to extract from ds,
+            each arg is for a sequential axis, by default slice(None)
+        out : ndarray, optional
+            Pre-allocated output array matching the shape of the extracted
+            data, by default None
+
+        Returns
+        -------
+        out : ndarray
+            Extracted (and unscaled if requested) dataset array
+        """
+        ds_slice = parse_slice(ds_slice)
+        if out is None:
+            return self[(ds_name, ) + ds_slice]
+
+        _, name = os.path.split(ds_name)
+        special = name.startswith(('time_index', 'meta', 'coordinates'))
+        if special or 'SAM' in name:
+            arr = self[(ds_name, ) + ds_slice]
+            ResourceDataset._check_out(out, arr)
+            out[...] = arr
+
+            return out
+
+        return self._get_ds(ds_name, ds_slice, out=out)
+
+    def _get_cached(self, ds_name, get_func):
+        """
+        Get a full decoded dataset (e.g. meta or time_index) from the
+        sidecar cache, extracting and caching it if needed
+
+        Parameters
+        ----------
+        ds_name : str
+            Dataset to extract
+        get_func : callable
+            Method to extract and decode the dataset, called as
+            get_func(ds_name, slice(None))
+
+        Returns
+        -------
+        out : object
+            Decoded dataset, e.g. meta DataFrame or time_index DatetimeIndex
+        """
+        key = None
+        if self._sidecar is not None:
+            key = self._sidecar.get_key(self.h5_file, self._group, ds_name,
+                                        self._str_decode)
+
+        out = None if key is None else self._sidecar.load(key)
+        if out is None:
+            out = get_func(ds_name, slice(None))
+            if key is not None:
+                self._sidecar.save(key, out)
+
+        return out
+
     def _get_time_index(self, ds_name, ds_slice):
         """
         Extract and convert time_index to pandas Datetime Index
@@ -1372,7 +2131,7 @@ class BaseResource(BaseDatasetIterable):
         logger.error(msg)
         raise NotImplementedError(msg)
 
-    def _get_ds(self, ds_name, ds_slice):
+    def _get_ds(self, ds_name, ds_slice, out=None):
         """
         Extract data from given dataset
 
@@ -1383,6 +2142,9 @@ class BaseResource(BaseDatasetIterable):
         ds_slice : tuple
             Tuple of (int, slice, list, ndarray) of what to extract from ds,
             each arg is for a sequential axis
+        out : ndarray, optional
+            Pre-allocated output array to extract the data into, by default
+            None, see get_dset_arr
 
         Returns
         -------
@@ -1398,11 +2160,23 @@ class BaseResource(BaseDatasetIterable):
         ds = self.h5[ds_name]
         ds_slice = parse_slice(ds_slice)
         if len(ds_slice) > len(ds.shape):
-            return self._get_ds_with_repeated_values(ds, ds_name, ds_slice)
+            arr = self._get_ds_with_repeated_values(ds, ds_name, ds_slice)
+            if out is None:
+                return arr
+
+            ResourceDataset._check_out(out, arr)
+            out[...] = arr
+
+            return out
+
         return ResourceDataset.extract(ds, ds_slice,
                                        scale_attr=self.SCALE_ATTR,
                                        add_attr=self.ADD_ATTR,
-                                       unscale=self._unscale)
+                                       unscale=self._unscale,
+                                       chunk_cache=self._chunk_cache,
+                                       max_workers=self._max_workers,
+                                       mmap=self._get_mmap(ds_name),
+                                       out=out)
 
     def _get_ds_with_repeated_values(self, ds, ds_name, ds_slice):
         """
@@ -1480,7 +2254,10 @@ class BaseResource(BaseDatasetIterable):
         out = ResourceDataset.extract(ds, ds_slice[:1],
                                       scale_attr=self.SCALE_ATTR,
                                       add_attr=self.ADD_ATTR,
-                                      unscale=self._unscale)
+                                      unscale=self._unscale,
+                                      chunk_cache=self._chunk_cache,
+                                      max_workers=self._max_workers,
+                                      mmap=self._get_mmap(ds_name))
         if not isinstance(out, np.ndarray):
             out *= np.ones(self.shapes['meta'], dtype=np.float32)
             out = out[ds_slice[1]]
@@ -1519,7 +2296,10 @@ class BaseResource(BaseDatasetIterable):
         out = ResourceDataset.extract(ds, ds_slice[1:],
                                       scale_attr=self.SCALE_ATTR,
                                       add_attr=self.ADD_ATTR,
-                                      unscale=self._unscale)
+                                      unscale=self._unscale,
+                                      chunk_cache=self._chunk_cache,
+                                      max_workers=self._max_workers,
+                                      mmap=self._get_mmap(ds_name))
 
         if not isinstance(out, np.ndarray):
             out *= np.ones(self.shapes['time_index'], dtype=np.float32)
@@ -1532,6 +2312,7 @@ class BaseResource(BaseDatasetIterable):
         """
         Close h5 instance
         """
+        self._mmaps = {}
         self._h5.close()
 
     @staticmethod
@@ -1801,7 +2582,8 @@ class Resource(BaseResource):
     UNIT_ATTR = 'units'
 
     def __init__(self, h5_file, unscale=True, str_decode=True, group=None,
-                 hsds=False, hsds_kwargs=None):
+                 hsds=False, hsds_kwargs=None, chunk_cache=None,
+                 max_workers=None, mmap=False, cache_dir=None):
         """
         Parameters
         ----------
@@ -1825,7 +2607,22 @@ class Resource(BaseResource):
         hsds_kwargs : dict, optional
             Dictionary of optional kwargs for h5pyd, e.g., bucket, username,
             password, by default None
+        chunk_cache : rex.utilities.chunk_cache.ChunkCache, optional
+            Optional LRU cache of dataset chunks shared across datasets,
+            by default None
+        max_workers : int, optional
+            Number of threads used to fetch planned multi-read requests
+            concurrently (useful for HSDS files), by default None
+        mmap : bool, optional
+            Flag to serve reads of contiguous, uncompressed datasets in local
+            files from numpy memory maps instead of h5py, see BaseResource,
+            by default False
+        cache_dir : str, optional
+            Directory to persist the decoded meta and time_index of local
+            files in, by default None
         """
         super().__init__(h5_file, unscale=unscale, str_decode=str_decode,
                          group=group, mode='r', hsds=hsds,
-                         hsds_kwargs=hsds_kwargs)
+                         hsds_kwargs=hsds_kwargs, chunk_cache=chunk_cache,
+                         max_workers=max_workers, mmap=mmap,
+                         cache_dir=cache_dir)
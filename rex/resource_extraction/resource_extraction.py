@@ -29,10 +29,16 @@ from rex.renewable_resource import (
 )
 from rex.resource import Resource, ResourceDataset, BaseDatasetIterable
 from rex.temporal_stats.temporal_stats import TemporalStats
-from rex.utilities.exceptions import ResourceValueError, ResourceWarning
+from rex.utilities.exceptions import (ResourceRuntimeError, ResourceValueError,
+                                      ResourceWarning)
 from rex.utilities.execution import SpawnProcessPool
 from rex.utilities.loggers import log_versions
-from rex.utilities.utilities import check_tz, parse_year, res_dist_threshold
+from rex.utilities.shared_tree import (is_shared_tree, load_shared_tree,
+                                       publish_tree)
+from rex.utilities.sidecar_cache import SidecarCache
+from rex.utilities.utilities import (chord_to_great_circle, check_tz,
+                                     lat_lon_to_xyz, parse_year,
+                                     res_dist_threshold)
 
 # pylint: disable=consider-using-with
 TREE_DIR = TemporaryDirectory()
@@ -59,7 +65,8 @@ class ResourceX(BaseDatasetIterable):
             by default Resource (default changes for subclasses like NSRDBX)
         tree : str | cKDTree, optional
             cKDTree or path to .pkl file containing pre-computed tree
-            of lat, lon coordinates, by default None
+            of lat, lon coordinates, or path to a shared tree directory
+            created with ResourceX.share_tree, by default None
         unscale : bool, optional
             Boolean flag to automatically unscale variables on extraction,
             by default True
@@ -86,8 +93,7 @@ class ResourceX(BaseDatasetIterable):
         res_cls = self.DEFAULT_RES_CLS if res_cls is None else res_cls
         self._res = res_cls(res_h5, unscale=unscale, str_decode=str_decode,
                             group=group, hsds=hsds, hsds_kwargs=hsds_kwargs)
-        self._dist_thresh = None
-        self._tree = tree
+        self._init_lookups(tree=tree)
 
     def __repr__(self):
         msg = "{} extractor for {}".format(self._res.__class__.__name__,
@@ -213,6 +219,18 @@ class ResourceX(BaseDatasetIterable):
         """
         return self.resource.meta
 
+    @property
+    def lazy_meta(self):
+        """
+        Lazy, column-oriented view of the resource meta data, columns are
+        only read and decoded when requested
+
+        Returns
+        -------
+        lazy_meta : rex.resource.LazyMeta
+        """
+        return self.resource.lazy_meta
+
     @property
     def time_index(self):
         """
@@ -309,6 +327,63 @@ class ResourceX(BaseDatasetIterable):
 
         return self._dist_thresh
 
+    @property
+    def sphere_tree(self):
+        """
+        Pre-initialized cKDTree on the 3D unit vectors of the resource lat,
+        lon coordinates, used for great circle nearest neighbor searches
+
+        Returns
+        -------
+        tree : cKDTree
+        """
+        if self._sphere_tree is None:
+            tree_file = self._get_tree_file(self.resource.h5_file)
+            tree_path = os.path.join(TREE_DIR.name,
+                                     tree_file.replace('tree.pkl',
+                                                       'sphere_tree.pkl'))
+            if os.path.exists(tree_path):
+                self._sphere_tree = self._load_tree(tree_path)
+
+            if (self._sphere_tree is None
+                    or self._sphere_tree.n != len(self.lat_lon)):
+                xyz = lat_lon_to_xyz(self.lat_lon)
+                self._sphere_tree = cKDTree(xyz)  # pylint: disable=E1102
+                self._save_tree(self._sphere_tree, tree_path)
+
+        return self._sphere_tree
+
+    @property
+    def sphere_distance_threshold(self):
+        """
+        Great circle distance threshold in km, calculated as half of the
+        diagonal between closest resource points, with an extra 5% margin
+
+        Returns
+        -------
+        float
+        """
+        return chord_to_great_circle(self._get_sphere_dist_thresh())
+
+    @property
+    def domain_bounds(self):
+        """
+        Bounding box of the resource coordinates
+
+        Returns
+        -------
+        tuple
+            (lat_min, lat_max, lon_min, lon_max)
+        """
+        if self._bounds is None:
+            lat_lon = self.lat_lon
+            self._bounds = (np.nanmin(lat_lon[:, 0]),
+                            np.nanmax(lat_lon[:, 0]),
+                            np.nanmin(lat_lon[:, 1]),
+                            np.nanmax(lat_lon[:, 1]))
+
+        return self._bounds
+
     @property
     def countries(self):
         """
@@ -318,8 +393,8 @@ class ResourceX(BaseDatasetIterable):
         -------
         countries : ndarray
         """
-        if 'country' in self.meta:
-            countries = self.meta['country'].unique()
+        if 'country' in self.lazy_meta:
+            countries = np.array(list(self.get_region_index('country')))
         else:
             countries = None
 
@@ -334,8 +409,8 @@ class ResourceX(BaseDatasetIterable):
         -------
         states : ndarray
         """
-        if 'state' in self.meta:
-            states = self.meta['state'].unique()
+        if 'state' in self.lazy_meta:
+            states = np.array(list(self.get_region_index('state')))
         else:
             states = None
 
@@ -350,8 +425,8 @@ class ResourceX(BaseDatasetIterable):
         -------
         counties : ndarray
         """
-        if 'county' in self.meta:
-            counties = self.meta['county'].unique()
+        if 'county' in self.lazy_meta:
+            counties = np.array(list(self.get_region_index('county')))
         else:
             counties = None
 
@@ -426,6 +501,89 @@ class ResourceX(BaseDatasetIterable):
             logger.warning('Could not save tree to {}: {}'
                            .format(tree_path, e))
 
+    @staticmethod
+    def _build_region_index(values):
+        """
+        Build inverted index of region values to the gids in each region
+
+        Parameters
+        ----------
+        values : ndarray
+            Region column values for every site in meta
+
+        Returns
+        -------
+        region_index : dict
+            Dictionary mapping each unique region value (in order of first
+            appearance, including null values like meta[col].unique()) to
+            the sorted array of gids in that region
+        """
+        values = np.asarray(values)
+        codes, _ = pd.factorize(values, use_na_sentinel=False)
+        # key each region on its first value so nulls keep their type
+        _, first = np.unique(codes, return_index=True)
+        order = np.argsort(codes, kind='stable')
+        counts = np.bincount(codes, minlength=len(first))
+        gids = np.split(order, np.cumsum(counts)[:-1])
+
+        return dict(zip(values[first].tolist(), gids))
+
+    def _init_lookups(self, tree=None):
+        """
+        Initialize the lazily built coordinate trees, distance thresholds,
+        domain bounds and region indices shared by all extraction classes
+
+        Parameters
+        ----------
+        tree : str | cKDTree, optional
+            cKDTree or path to .pkl file containing pre-computed tree
+            of lat, lon coordinates, by default None
+        """
+        self._dist_thresh = None
+        self._tree = tree
+        self._region_index = {}
+        self._sphere_tree = None
+        self._sphere_dist_thresh = None
+        self._bounds = None
+
+    def get_region_index(self, region_col='state'):
+        """
+        Get the inverted index of region values to the gids in each region.
+        The index is built once per file and region column from the meta
+        column values and cached alongside the pre-computed cKDTree, keyed
+        on the resource file signature (see SidecarCache) so it is rebuilt
+        when the file changes.
+
+        Parameters
+        ----------
+        region_col : str, optional
+            Region column to index, by default 'state'
+
+        Returns
+        -------
+        region_index : dict
+            Dictionary mapping each unique region value (in order of first
+            appearance) to the sorted array of gids in that region
+        """
+        if region_col not in self._region_index:
+            cache = SidecarCache(TREE_DIR.name)
+            key = cache.get_key(self.resource.h5_file, 'region_index',
+                                region_col, self.lazy_meta.str_decode)
+
+            region_index = None
+            if key is not None:
+                region_index = cache.load(key)
+
+            if region_index is None:
+                values = self.lazy_meta[region_col]
+                region_index = self._build_region_index(values)
+                if key is not None:
+                    cache.save(key, region_index)
+
+            self._region_index[region_col] = region_index
+
+        return self._region_index[region_col]
+
     @staticmethod
     def _get_ds_slice(dset, gids, ds_ndim):
         """
@@ -523,7 +681,8 @@ class ResourceX(BaseDatasetIterable):
         Parameters
         ----------
         tree : str | cKDTree | NoneType
-            Path to .pgz file containing pre-computed tree
+            Path to .pgz file containing pre-computed tree or to a shared
+            tree directory (see share_tree)
             If None search bin for .pgz file matching h5 file
             else compute tree
 
@@ -543,7 +702,15 @@ class ResourceX(BaseDatasetIterable):
             if tree_path in os.listdir(TREE_DIR.name):
                 tree = os.path.join(TREE_DIR.name, tree_path)
 
-        if isinstance(tree, str):
+        if is_shared_tree(tree):
+            try:
+                tree = load_shared_tree(tree)
+            except ResourceRuntimeError:
+                logger.warning('Could not load the shared tree in {}, '
+                               'building the tree in this process instead'
+                               .format(tree))
+                tree = None
+        elif isinstance(tree, str):
             tree = self._load_tree(tree)
 
         if tree is None:
@@ -553,6 +720,55 @@ class ResourceX(BaseDatasetIterable):
 
         return tree
 
+    def share_tree(self, tree_dir=None):
+        """
+        Publish the pre-computed cKDTree so that it can be loaded by other
+        processes without rebuilding it. Pass the returned directory as the
+        tree argument when initializing ResourceX handlers in the worker
+        processes: the tree coordinates and indices are memory mapped, so N
+        workers only hold a single copy of them (each worker still holds its
+        own copy of the smaller tree node buffer).
+
+        Examples
+        --------
+        >>> with WindX(res_h5) as f:
+        >>>     tree_dir = f.share_tree()
+        >>>
+        >>> with SpawnProcessPool(max_workers=8) as exe:
+        >>>     for chunk in lat_lon_chunks:
+        >>>         exe.submit(extract, res_h5, chunk, tree=tree_dir)
+
+        Parameters
+        ----------
+        tree_dir : str, optional
+            Directory to save the shared tree to. By default None, which
+            saves the tree to a directory next to the pickled tree in
+            TREE_DIR. This directory is only visible to the current process
+            and its workers.
+
+        Returns
+        -------
+        tree_dir : str | None
+            Directory containing the shared tree, None if the installed scipy
+            version does not support sharing cKDTrees (see
+            rex.utilities.shared_tree). Passing None as the tree argument
+            makes each worker build (or load the pickled) tree itself.
+        """
+        if tree_dir is None:
+            tree_file = self._get_tree_file(self.resource.h5_file)
+            tree_dir = os.path.join(TREE_DIR.name,
+                                    tree_file.replace('.pkl', '_shared'))
+
+        if not is_shared_tree(tree_dir):
+            try:
+                publish_tree(self.tree, tree_dir)
+            except ResourceRuntimeError:
+                logger.warning('The cKDTree cannot be shared with this scipy '
+                               'version, workers will build their own tree')
+                tree_dir = None
+
+        return tree_dir
+
     def _check_lat_lon(self, lat_lon):
         """
         Check lat lon coordinates against domain
@@ -562,8 +778,7 @@ class ResourceX(BaseDatasetIterable):
         lat_lon : ndarray
             Either a single (lat, lon) pair or series of (lat, lon) pairs
         """
-        lat_min, lat_max = np.sort(self.lat_lon[:, 0])[[0, -1]]
-        lon_min, lon_max = np.sort(self.lat_lon[:, 1])[[0, -1]]
+        lat_min, lat_max, lon_min, lon_max = self.domain_bounds
 
         lat = lat_lon[:, 0]
         check = lat < lat_min
@@ -622,6 +837,68 @@ class ResourceX(BaseDatasetIterable):
 
         return gids
 
+    def _get_sphere_dist_thresh(self):
+        """
+        Chord distance threshold between resource unit vectors, see
+        sphere_distance_threshold
+
+        Returns
+        -------
+        float
+        """
+        if self._sphere_dist_thresh is None:
+            self._sphere_dist_thresh = res_dist_threshold(
+                self.sphere_tree.data, tree=self.sphere_tree)
+
+        return self._sphere_dist_thresh
+
+    def batch_lat_lon_gid(self, lat_lon, check_lat_lon=True, workers=1):
+        """
+        Get the nearest gids and great circle distances for a large batch of
+        (lat, lon) pairs in one vectorized pass. Unlike lat_lon_gid, which
+        searches a cKDTree built on lat, lon degrees, the search is done on
+        3D unit vectors so nearest neighbors are correct at all latitudes.
+
+        Parameters
+        ----------
+        lat_lon : ndarray
+            Either a single (lat, lon) pair or series of (lat, lon) pairs
+        check_lat_lon : bool, optional
+            Flag to check to make sure the requested lat lons are inside the
+            resource grid. This is done by ensuring the chord distance between
+            the unit vectors of each requested coordinate and its nearest
+            neighbor is below the sphere distance threshold. Unlike a lat, lon
+            bounding box this is also valid for domains that cross the
+            antimeridian, by default True
+        workers : int, optional
+            Number of workers to use to query the tree, -1 uses all
+            available CPUs, by default 1
+
+        Returns
+        -------
+        gids : ndarray
+            Nearest gid to each (lat, lon) pair
+        dist : ndarray
+            Great circle distance in km between each (lat, lon) pair and the
+            nearest resource coordinate
+        """
+        lat_lon = np.asarray(lat_lon, dtype=np.float64)
+        if len(lat_lon.shape) == 1:
+            lat_lon = np.expand_dims(lat_lon, axis=0)
+
+        chord, gids = self.sphere_tree.query(lat_lon_to_xyz(lat_lon),
+                                             workers=workers)
+
+        if check_lat_lon:
+            dist_check = chord > self._get_sphere_dist_thresh()
+            if np.any(dist_check):
+                msg = ("Latitude, longitude coordinates ({}) do not sit within"
+                       " resource grid!".format(lat_lon[dist_check]))
+                logger.error(msg)
+                raise ResourceValueError(msg)
+
+        return gids, chord_to_great_circle(chord)
+
     def region_gids(self, region, region_col='state'):
         """
         Get the gids for given region
@@ -638,10 +915,13 @@ class ResourceX(BaseDatasetIterable):
         gids : ndarray
             Vector of gids in given region
         """
-        gids = self.meta
-        gids = gids[gids[region_col] == region].index.values
+        gids = np.array([], dtype=np.int64)
+        if not pd.isna(region):
+            # like meta[col] == region, null regions never match
+            region_index = self.get_region_index(region_col=region_col)
+            gids = region_index.get(region, gids)
 
-        return gids
+        return gids.copy()
 
     def box_gids(self, lat_lon_1, lat_lon_2):
         """
@@ -1539,8 +1819,7 @@ class MultiFileResourceX(ResourceX):
         res_cls = self.DEFAULT_RES_CLS if res_cls is None else res_cls
         self._res = res_cls(resource_path, unscale=unscale,
                             str_decode=str_decode, check_files=check_files)
-        self._dist_thresh = None
-        self._tree = tree
+        self._init_lookups(tree=tree)
 
 
 class MultiYearResourceX(ResourceX):
@@ -1585,8 +1864,7 @@ class MultiYearResourceX(ResourceX):
                                       unscale=unscale, str_decode=str_decode,
                                       res_cls=res_cls, hsds=hsds,
                                       hsds_kwargs=hsds_kwargs)
-        self._dist_thresh = None
-        self._tree = tree
+        self._init_lookups(tree=tree)
 
     def get_means_map(self, ds_name, year=None, region=None,
                       region_col='state', max_workers=None,
@@ -1670,8 +1948,7 @@ class MultiTimeResourceX(ResourceX):
         self._res = MultiTimeResource(resource_path, unscale=unscale,
                                       str_decode=str_decode, res_cls=res_cls,
                                       hsds=hsds, hsds_kwargs=hsds_kwargs)
-        self._dist_thresh = None
-        self._tree = tree
+        self._init_lookups(tree=tree)
 
 
 class SolarX(ResourceX):
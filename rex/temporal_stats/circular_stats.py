@@ -0,0 +1,475 @@
+# -*- coding: utf-8 -*-
+"""
+Weighted circular statistics, e.g. of wind direction
+"""
+import logging
+import numpy as np
+
+from rex.temporal_stats.streaming import GroupIndex
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of array elements converted to sine and cosine components
+# at once, bounds the temporary arrays of CircularStats.update
+CHUNK_SIZE = 2 ** 20
+
+
+class CircularStats:
+    """
+    Mergeable (weighted) sums of the sine and cosine components of circular
+    data (e.g. wind direction) for every (group, site) pair. The mean
+    direction, mean resultant length and circular standard deviation are
+    derived from the sums, so the statistics of a dataset can be accumulated
+    one chunk at a time and accumulators of different chunks, sites slices or
+    files can be merged exactly. NaN values (of the data or the weights) are
+    ignored.
+    """
+
+    STATS = ('weight', 'mean', 'resultant_length', 'var', 'std')
+    ARRAYS = ('weight', 'sin', 'cos')
+
+    def __init__(self, n_groups, n_sites, degrees=True,
+                 exponential_weights=True):
+        """
+        Parameters
+        ----------
+        n_groups : int
+            Number of groups
+        n_sites : int
+            Number of sites
+        degrees : bool, optional
+            Flag indicating that data is in degrees and needs to be converted
+            to/from radians, by default True
+        exponential_weights : bool, optional
+            Flag to convert weights to exponential, by default True
+        """
+        shape = (n_groups, n_sites)
+        self._degrees = degrees
+        self._exponential_weights = exponential_weights
+        self.weight = np.zeros(shape, dtype=np.float64)
+        self.sin = np.zeros(shape, dtype=np.float64)
+        self.cos = np.zeros(shape, dtype=np.float64)
+
+    def __repr__(self):
+        msg = ("{} for {} groups and {} sites"
+               .format(self.__class__.__name__, *self.shape))
+
+        return msg
+
+    @property
+    def shape(self):
+        """
+        (n_groups, n_sites)
+
+        Returns
+        -------
+        tuple
+        """
+        return self.weight.shape
+
+    @property
+    def params(self):
+        """
+        Parameters that have to match to merge accumulators
+
+        Returns
+        -------
+        dict
+        """
+        return {'degrees': self._degrees,
+                'exponential_weights': self._exponential_weights}
+
+    @property
+    def mean(self):
+        """
+        (Weighted) circular mean, in [0, 360) if in degrees, NaN for groups
+        without valid data
+
+        Returns
+        -------
+        ndarray
+        """
+        mean = np.arctan2(self.sin, self.cos)
+        mean[self.weight <= 0] = np.nan
+        if self._degrees:
+            mean = np.degrees(mean)
+            mean[mean < 0] += 360
+
+        return mean
+
+    @property
+    def resultant_length(self):
+        """
+        (Weighted) mean resultant length in [0, 1], 1 if all data points in
+        the same direction, NaN for groups without valid data
+
+        Returns
+        -------
+        ndarray
+        """
+        with np.errstate(invalid='ignore', divide='ignore'):
+            length = np.hypot(self.sin, self.cos) / self.weight
+
+        return np.minimum(length, 1)
+
+    @property
+    def var(self):
+        """
+        (Weighted) circular variance: 1 - mean resultant length
+
+        Returns
+        -------
+        ndarray
+        """
+        return 1 - self.resultant_length
+
+    @property
+    def std(self):
+        """
+        (Weighted) circular standard deviation: sqrt(-2 ln(R)), in degrees
+        if in degrees
+
+        Returns
+        -------
+        ndarray
+        """
+        with np.errstate(divide='ignore'):
+            std = np.sqrt(-2 * np.log(self.resultant_length))
+
+        if self._degrees:
+            std = np.degrees(std)
+
+        return std
+
+    def get_stat(self, stat):
+        """
+        Get a statistic, NaN for groups without valid data
+
+        Parameters
+        ----------
+        stat : str
+            Statistic name, one of CircularStats.STATS
+
+        Returns
+        -------
+        out : ndarray
+            (n_groups, n_sites) array of statistic values
+        """
+        if stat not in self.STATS:
+            msg = ('Cannot compute {}, must be one of {}'
+                   .format(stat, self.STATS))
+            logger.error(msg)
+            raise KeyError(msg)
+
+        return getattr(self, stat)
+
+    def _get_components(self, data, weights=None):
+        """
+        Get the weights and weighted sine and cosine components of a chunk
+        of data. Angles are converted in place in single precision, the
+        components are returned in double precision with invalid values set
+        to 0.
+
+        Parameters
+        ----------
+        data : ndarray
+            Chunk of circular data
+        weights : ndarray, optional
+            Weights of data, by default None
+
+        Returns
+        -------
+        weight, sin, cos : ndarray
+            Weights, weighted sine and weighted cosine components
+        """
+        angles = np.array(data, dtype=np.float32)
+        if self._degrees:
+            np.radians(angles, out=angles)
+
+        invalid = np.isnan(angles)
+        if weights is None:
+            weight = (~invalid).astype(np.float64)
+        else:
+            weight = np.array(weights, dtype=np.float64)
+            if self._exponential_weights:
+                np.exp(weight, out=weight)
+
+            invalid |= np.isnan(weight)
+            weight[invalid] = 0
+
+        sin = np.sin(angles).astype(np.float64)
+        cos = np.cos(angles, out=angles).astype(np.float64)
+        sin[invalid] = 0
+        cos[invalid] = 0
+        if weights is not None:
+            sin *= weight
+            cos *= weight
+
+        return weight, sin, cos
+
+    def update(self, data, codes=None, weights=None):
+        """
+        Add a chunk of data to the accumulators. Data is converted to sine
+        and cosine components in blocks of sites to bound the temporary
+        arrays.
+
+        Parameters
+        ----------
+        data : ndarray
+            (time, sites) chunk of data
+        codes : ndarray | GroupIndex, optional
+            Group code of each time step in data, or the pre-computed
+            GroupIndex of those codes, by default None (a single group)
+        weights : ndarray, optional
+            (time, sites) weights of data, e.g. wind speed, by default None
+        """
+        data = np.asarray(data)
+        if weights is not None:
+            weights = np.asarray(weights)
+            if weights.shape != data.shape:
+                msg = ('The shape of weights {} does not match the shape of '
+                       'the data {} to which it is to be applied!'
+                       .format(weights.shape, data.shape))
+                logger.error(msg)
+                raise RuntimeError(msg)
+
+        if codes is None:
+            codes = np.zeros(len(data), dtype=np.int64)
+
+        if not isinstance(codes, GroupIndex):
+            codes = GroupIndex(codes, self.shape[0])
+
+        step = max(1, CHUNK_SIZE // max(1, len(data)))
+        for start in range(0, data.shape[1], step):
+            cols = slice(start, start + step)
+            chunk_weights = None
+            if weights is not None:
+                chunk_weights = codes.sort(weights[:, cols])
+
+            components = self._get_components(codes.sort(data[:, cols]),
+                                              weights=chunk_weights)
+            for name, arr in zip(self.ARRAYS, components):
+                getattr(self, name)[:, cols] += codes.reduce(np.add, arr,
+                                                             sort=False)
+
+    def merge(self, other):
+        """
+        Merge the accumulators of another CircularStats instance (e.g. from
+        a different time chunk or file) into this one in place
+
+        Parameters
+        ----------
+        other : CircularStats
+            Accumulators for the same groups and sites
+        """
+        if other.shape != self.shape or other.params != self.params:
+            msg = ('Cannot merge CircularStats of shape {} with {} into '
+                   'shape {} with {}'
+                   .format(other.shape, other.params, self.shape,
+                           self.params))
+            logger.error(msg)
+            raise ValueError(msg)
+
+        for name in self.ARRAYS:
+            getattr(self, name)[...] += getattr(other, name)
+
+    def regroup(self, codes, n_groups):
+        """
+        Merge groups into coarser groups, e.g. month-hour groups into month
+        groups
+
+        Parameters
+        ----------
+        codes : ndarray
+            New group code of each of the current groups
+        n_groups : int
+            Number of new groups
+
+        Returns
+        -------
+        out : CircularStats
+            Accumulators of the new groups
+        """
+        index = GroupIndex(codes, n_groups)
+        out = CircularStats(n_groups, self.shape[1], **self.params)
+        for name in self.ARRAYS:
+            setattr(out, name, index.reduce(np.add, getattr(self, name)))
+
+        return out
+
+    @classmethod
+    def concat(cls, circular_stats):
+        """
+        Concatenate the accumulators of the same groups for different sites
+
+        Parameters
+        ----------
+        circular_stats : list
+            List of CircularStats instances in site order
+
+        Returns
+        -------
+        out : CircularStats
+            Accumulators for all sites
+        """
+        out = cls(circular_stats[0].shape[0], 0, **circular_stats[0].params)
+        for name in cls.ARRAYS:
+            setattr(out, name, np.concatenate([getattr(stats, name)
+                                               for stats in circular_stats],
+                                              axis=1))
+
+        return out
+
+
+def _get_circular_stats(data, weights=None, degrees=True, axis=0,
+                        exponential_weights=True):
+    """
+    Accumulate the circular statistics of data along the given axis
+
+    Parameters
+    ----------
+    data : ndarray
+        Circular data
+    weights : ndarray, optional
+        Weights to apply to data, must be of the same shape as data,
+        by default None
+    degrees : bool, optional
+        Flag indicating that data is in degrees, by default True
+    axis : int, optional
+        Axis to compute statistics along, by default 0
+    exponential_weights : bool, optional
+        Flag to convert weights to exponential, by default True
+
+    Returns
+    -------
+    stats : CircularStats
+        Accumulated statistics of a single group
+    shape : tuple
+        Shape of data without axis
+    """
+    data = np.asarray(data)
+    if weights is not None:
+        weights = np.asarray(weights)
+        if weights.shape != data.shape:
+            msg = ('The shape of weights {} does not match the shape of the '
+                   'data {} to which it is to be applied!'
+                   .format(weights.shape, data.shape))
+            logger.error(msg)
+            raise RuntimeError(msg)
+
+        weights = np.moveaxis(weights, axis, 0)
+        weights = weights.reshape(len(weights), -1)
+
+    data = np.moveaxis(data, axis, 0)
+    shape = data.shape[1:]
+    data = data.reshape(len(data), -1)
+
+    stats = CircularStats(1, data.shape[1], degrees=degrees,
+                          exponential_weights=exponential_weights)
+    stats.update(data, weights=weights)
+
+    return stats, shape
+
+
+def circular_mean(data, weights=None, degrees=True, axis=0,
+                  exponential_weights=True):
+    """
+    Computed the ciruclar average. if provided compute the weighed average
+    with the given weights. For example, if averaging wind direction with wind
+    speed as weights, wind directions that occur at higher wind speeds will
+    have a larger weight of the final mean value.
+
+    Parameters
+    ----------
+    data : ndarray
+        Data to average
+    weights : ndarray, optional
+        Weights to apply to data during averaging, must be of the same
+        shape as data, by default None
+    degree : bool, optional
+        Flag indicating that data is in degrees and needs to be converted
+        to/from radians during averaging. By default True
+    axis : int, optional
+        Axis to compute average along, by default 0 which will produce
+        site averages
+    exponential_weights : bool
+        Flag to convert weights to exponential, by default True
+
+    Returns
+    -------
+    mean : ndarray
+        Weighted circular mean along the given axis
+    """
+    stats, shape = _get_circular_stats(
+        data, weights=weights, degrees=degrees, axis=axis,
+        exponential_weights=exponential_weights)
+
+    return stats.mean[0].reshape(shape)[()]
+
+
+def resultant_length(data, weights=None, degrees=True, axis=0,
+                     exponential_weights=True):
+    """
+    Compute the (weighted) mean resultant length, a measure of the
+    concentration of circular data between 0 (uniformly spread) and 1 (all
+    data points in the same direction)
+
+    Parameters
+    ----------
+    data : ndarray
+        Circular data
+    weights : ndarray, optional
+        Weights to apply to data, must be of the same shape as data,
+        by default None
+    degrees : bool, optional
+        Flag indicating that data is in degrees, by default True
+    axis : int, optional
+        Axis to compute resultant length along, by default 0 which will
+        produce site values
+    exponential_weights : bool
+        Flag to convert weights to exponential, by default True
+
+    Returns
+    -------
+    length : ndarray
+        Weighted mean resultant length along the given axis
+    """
+    stats, shape = _get_circular_stats(
+        data, weights=weights, degrees=degrees, axis=axis,
+        exponential_weights=exponential_weights)
+
+    return stats.resultant_length[0].reshape(shape)[()]
+
+
+def circular_std(data, weights=None, degrees=True, axis=0,
+                 exponential_weights=True):
+    """
+    Compute the (weighted) circular standard deviation sqrt(-2 ln(R)), where
+    R is the mean resultant length
+
+    Parameters
+    ----------
+    data : ndarray
+        Circular data
+    weights : ndarray, optional
+        Weights to apply to data, must be of the same shape as data,
+        by default None
+    degrees : bool, optional
+        Flag indicating that data is in degrees and the standard deviation
+        is returned in degrees, by default True
+    axis : int, optional
+        Axis to compute standard deviation along, by default 0 which will
+        produce site values
+    exponential_weights : bool
+        Flag to convert weights to exponential, by default True
+
+    Returns
+    -------
+    std : ndarray
+        Weighted circular standard deviation along the given axis
+    """
+    stats, shape = _get_circular_stats(
+        data, weights=weights, degrees=degrees, axis=axis,
+        exponential_weights=exponential_weights)
+
+    return stats.std[0].reshape(shape)[()]
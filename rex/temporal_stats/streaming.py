@@ -0,0 +1,1560 @@
+# -*- coding: utf-8 -*-
+"""
+Single-pass streaming temporal statistics
+"""
+import copy
+import json
+import logging
+import numpy as np
+import os
+import pandas as pd
+
+from rex.utilities.bc_utils import sample_q
+from rex.utilities.sidecar_cache import atomic_write
+
+logger = logging.getLogger(__name__)
+
+GROUP_FIELDS = ('month', 'hour')
+
+
+class GroupIndex:
+    """
+    Precomputed sort order and group boundaries used to reduce arrays along
+    axis 0 by integer group codes with ufunc.reduceat
+    """
+
+    def __init__(self, codes, n_groups):
+        """
+        Parameters
+        ----------
+        codes : ndarray
+            Group code of each row, in the range [0, n_groups)
+        n_groups : int
+            Total number of groups
+        """
+        codes = np.asarray(codes)
+        self._n_groups = n_groups
+        if np.all(codes[1:] >= codes[:-1]):
+            self._order = None
+            sorted_codes = codes
+        else:
+            self._order = np.argsort(codes, kind='stable')
+            sorted_codes = codes[self._order]
+
+        change = np.ones(len(sorted_codes), dtype=bool)
+        change[1:] = sorted_codes[1:] != sorted_codes[:-1]
+        self._starts = np.flatnonzero(change)
+        self._groups = sorted_codes[self._starts]
+        self._sorted_codes = sorted_codes
+
+    @property
+    def n_groups(self):
+        """
+        Total number of groups
+
+        Returns
+        -------
+        int
+        """
+        return self._n_groups
+
+    @property
+    def groups(self):
+        """
+        Codes of the groups present in the rows
+
+        Returns
+        -------
+        ndarray
+        """
+        return self._groups
+
+    @property
+    def sorted_codes(self):
+        """
+        Group code of each row after sorting, see GroupIndex.sort
+
+        Returns
+        -------
+        ndarray
+        """
+        return self._sorted_codes
+
+    def sort(self, arr):
+        """
+        Sort array rows by group
+
+        Parameters
+        ----------
+        arr : ndarray
+            Array to sort along axis 0
+
+        Returns
+        -------
+        ndarray
+        """
+        if self._order is None:
+            return arr
+
+        return arr[self._order]
+
+    def reduce(self, ufunc, arr, fill=0, sort=True):
+        """
+        Reduce array rows by group
+
+        Parameters
+        ----------
+        ufunc : numpy.ufunc
+            Reduction ufunc, e.g. np.add, np.minimum, np.maximum
+        arr : ndarray
+            Array to reduce along axis 0
+        fill : int | float, optional
+            Value of groups that are not present in the rows, by default 0
+        sort : bool, optional
+            Flag to sort the rows of arr by group, set to False if arr has
+            already been sorted with GroupIndex.sort, by default True
+
+        Returns
+        -------
+        out : ndarray
+            Reduced array of shape (n_groups, ) + arr.shape[1:]
+        """
+        if sort:
+            arr = self.sort(arr)
+
+        out = np.full((self.n_groups, ) + arr.shape[1:], fill,
+                      dtype=arr.dtype)
+        if len(arr):
+            out[self.groups] = ufunc.reduceat(arr, self._starts, axis=0)
+
+        return out
+
+
+class RunningStats:
+    """
+    Mergeable running count, mean, sum of squared deviations (M2), min and
+    max for every (group, site) pair. Chunks of data are combined with
+    Chan et al.'s parallel form of Welford's algorithm, so the statistics of
+    a dataset can be accumulated one time chunk at a time, and accumulators
+    of different chunks, sites slices or files can be merged exactly.
+    NaN values are ignored, matching np.nanmean, np.nanstd, etc.
+    """
+
+    STATS = ('count', 'mean', 'std', 'var', 'min', 'max')
+    ARRAYS = ('count', 'mean', 'm2', 'min', 'max')
+
+    def __init__(self, n_groups, n_sites):
+        """
+        Parameters
+        ----------
+        n_groups : int
+            Number of groups
+        n_sites : int
+            Number of sites
+        """
+        shape = (n_groups, n_sites)
+        self.count = np.zeros(shape, dtype=np.int64)
+        self.mean = np.zeros(shape, dtype=np.float64)
+        self.m2 = np.zeros(shape, dtype=np.float64)
+        self.min = np.full(shape, np.inf, dtype=np.float64)
+        self.max = np.full(shape, -np.inf, dtype=np.float64)
+
+    def __repr__(self):
+        msg = ("{} for {} groups and {} sites"
+               .format(self.__class__.__name__, *self.shape))
+
+        return msg
+
+    @property
+    def shape(self):
+        """
+        (n_groups, n_sites)
+
+        Returns
+        -------
+        tuple
+        """
+        return self.count.shape
+
+    @property
+    def var(self):
+        """
+        Population variance (ddof=0), NaN for groups without valid data
+
+        Returns
+        -------
+        ndarray
+        """
+        return self.get_var()
+
+    @property
+    def std(self):
+        """
+        Population standard deviation (ddof=0), NaN for groups without valid
+        data
+
+        Returns
+        -------
+        ndarray
+        """
+        return np.sqrt(self.var)
+
+    def get_var(self, ddof=0):
+        """
+        Get the variance, NaN for groups with ddof or fewer valid values
+
+        Parameters
+        ----------
+        ddof : int, optional
+            Delta degrees of freedom, the divisor is count - ddof,
+            by default 0 (population variance)
+
+        Returns
+        -------
+        ndarray
+        """
+        dof = self.count - ddof
+        with np.errstate(invalid='ignore', divide='ignore'):
+            var = np.where(dof > 0, self.m2 / dof, np.nan)
+
+        return var
+
+    def get_stat(self, stat, ddof=0):
+        """
+        Get a statistic, NaN for groups without valid data
+
+        Parameters
+        ----------
+        stat : str
+            Statistic name, one of RunningStats.STATS
+        ddof : int, optional
+            Delta degrees of freedom of the 'std' and 'var' statistics,
+            by default 0 (np.nanstd), use 1 to match pandas.DataFrame.std
+
+        Returns
+        -------
+        out : ndarray
+            (n_groups, n_sites) array of statistic values
+        """
+        if stat not in self.STATS:
+            msg = ('Cannot compute {}, must be one of {}'
+                   .format(stat, self.STATS))
+            logger.error(msg)
+            raise KeyError(msg)
+
+        if stat == 'var':
+            out = self.get_var(ddof=ddof)
+        elif stat == 'std':
+            out = np.sqrt(self.get_var(ddof=ddof))
+        else:
+            out = getattr(self, stat)
+
+        if stat != 'count':
+            out = np.where(self.count > 0, out, np.nan)
+
+        return out
+
+    def _combine(self, count, mean, m2, vmin, vmax):
+        """
+        Combine accumulators of another chunk of data into these
+        accumulators in place
+
+        Parameters
+        ----------
+        count, mean, m2, vmin, vmax : ndarray
+            (n_groups, n_sites) accumulators to combine
+        """
+        total = self.count + count
+        with np.errstate(invalid='ignore', divide='ignore'):
+            delta = mean - self.mean
+            frac = np.where(total > 0, count / total, 0)
+
+        self.mean += delta * frac
+        self.m2 += m2 + delta ** 2 * self.count * frac
+        self.count = total
+        np.minimum(self.min, vmin, out=self.min)
+        np.maximum(self.max, vmax, out=self.max)
+
+    def update(self, data, codes):
+        """
+        Add a chunk of data to the accumulators
+
+        Parameters
+        ----------
+        data : ndarray
+            (time, sites) chunk of data
+        codes : ndarray | GroupIndex
+            Group code of each time step in data, or the pre-computed
+            GroupIndex of those codes
+        """
+        if not isinstance(codes, GroupIndex):
+            codes = GroupIndex(codes, self.shape[0])
+
+        data = codes.sort(np.asarray(data, dtype=np.float64))
+        valid = ~np.isnan(data)
+        values = np.where(valid, data, 0)
+
+        count = codes.reduce(np.add, valid.astype(np.int64), sort=False)
+        total = codes.reduce(np.add, values, sort=False)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(count > 0, total / count, 0)
+
+        dev = np.where(valid, data - mean[codes.sorted_codes], 0)
+        m2 = codes.reduce(np.add, dev ** 2, sort=False)
+        vmin = codes.reduce(np.minimum, np.where(valid, data, np.inf),
+                            fill=np.inf, sort=False)
+        vmax = codes.reduce(np.maximum, np.where(valid, data, -np.inf),
+                            fill=-np.inf, sort=False)
+
+        self._combine(count, mean, m2, vmin, vmax)
+
+    def merge(self, other):
+        """
+        Merge the accumulators of another RunningStats instance (e.g. from a
+        different time chunk or file) into this one in place
+
+        Parameters
+        ----------
+        other : RunningStats
+            Accumulators for the same groups and sites
+        """
+        if other.shape != self.shape:
+            msg = ('Cannot merge RunningStats of shape {} into shape {}'
+                   .format(other.shape, self.shape))
+            logger.error(msg)
+            raise ValueError(msg)
+
+        self._combine(other.count, other.mean, other.m2, other.min,
+                      other.max)
+
+    def regroup(self, codes, n_groups):
+        """
+        Merge groups into coarser groups, e.g. month-hour groups into month
+        groups
+
+        Parameters
+        ----------
+        codes : ndarray
+            New group code of each of the current groups
+        n_groups : int
+            Number of new groups
+
+        Returns
+        -------
+        out : RunningStats
+            Accumulators of the new groups
+        """
+        index = GroupIndex(codes, n_groups)
+        count = self.count.astype(np.float64)
+        sums = self.mean * count
+
+        out = RunningStats(n_groups, self.shape[1])
+        out.count = index.reduce(np.add, self.count)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            out.mean = np.where(out.count > 0,
+                                index.reduce(np.add, sums) / out.count, 0)
+
+        dev = self.mean - out.mean[codes]
+        out.m2 = index.reduce(np.add, self.m2 + count * dev ** 2)
+        out.min = index.reduce(np.minimum, self.min, fill=np.inf)
+        out.max = index.reduce(np.maximum, self.max, fill=-np.inf)
+
+        return out
+
+    @classmethod
+    def concat(cls, running_stats):
+        """
+        Concatenate the accumulators of the same groups for different sites
+
+        Parameters
+        ----------
+        running_stats : list
+            List of RunningStats instances in site order
+
+        Returns
+        -------
+        out : RunningStats
+            Accumulators for all sites
+        """
+        out = cls(running_stats[0].shape[0], 0)
+        for name in cls.ARRAYS:
+            setattr(out, name, np.concatenate([getattr(stats, name)
+                                               for stats in running_stats],
+                                              axis=1))
+
+        return out
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch for every (group, site) pair, based on
+    DDSketch (Masson et al., 2019). Values are counted in logarithmically
+    spaced buckets so that every quantile estimate is within a relative
+    error of ``accuracy`` of the true value (values with a magnitude below
+    ``min_value`` are counted as 0 and values above ``max_value`` are
+    clipped). Bucket counts of different time chunks, sites slices or files
+    are merged exactly by adding them. Only non-empty buckets are stored, as
+    a sorted array of (group, site, bucket) keys and their counts, so memory
+    is bounded by the number of values counted and by the number of
+    buckets spanned by the data of each (group, site), e.g. ~415 buckets for
+    wind speeds from 0.01 to 40 m/s at the default 1% accuracy. Month-hour
+    groups of one year of hourly data hold at most ~31 values each.
+    """
+
+    def __init__(self, n_groups, n_sites, accuracy=0.01, min_value=1e-2,
+                 max_value=1e6):
+        """
+        Parameters
+        ----------
+        n_groups : int
+            Number of groups
+        n_sites : int
+            Number of sites
+        accuracy : float, optional
+            Relative accuracy of the quantile estimates, by default 0.01
+        min_value : float, optional
+            Smallest magnitude that is resolved, smaller magnitudes are
+            counted as 0, by default 1e-2
+        max_value : float, optional
+            Largest magnitude that is resolved, larger magnitudes are
+            clipped, by default 1e6
+        """
+        if not 0 < accuracy < 1:
+            msg = ('Quantile sketch accuracy must be between 0 and 1, got {}'
+                   .format(accuracy))
+            logger.error(msg)
+            raise ValueError(msg)
+
+        self._accuracy = accuracy
+        self._min_value = min_value
+        self._max_value = max_value
+        self._gamma = (1 + accuracy) / (1 - accuracy)
+        self._log_gamma = np.log(self._gamma)
+        self._k_min = int(np.ceil(np.log(min_value) / self._log_gamma))
+        k_max = int(np.ceil(np.log(max_value) / self._log_gamma))
+        self._n_log = k_max - self._k_min + 1
+        self._n_buckets = 2 * self._n_log + 1
+
+        self._shape = (n_groups, n_sites)
+        self.keys = np.zeros(0, dtype=np.int64)
+        self.counts = np.zeros(0, dtype=np.uint32)
+
+    def __repr__(self):
+        msg = ("{} for {} groups and {} sites with {:.1%} accuracy"
+               .format(self.__class__.__name__, *self.shape,
+                       self.accuracy))
+
+        return msg
+
+    @property
+    def shape(self):
+        """
+        (n_groups, n_sites)
+
+        Returns
+        -------
+        tuple
+        """
+        return self._shape
+
+    @property
+    def accuracy(self):
+        """
+        Relative accuracy of the quantile estimates
+
+        Returns
+        -------
+        float
+        """
+        return self._accuracy
+
+    @property
+    def params(self):
+        """
+        Sketch parameters, sketches can only be merged if their parameters
+        match
+
+        Returns
+        -------
+        tuple
+            (accuracy, min_value, max_value)
+        """
+        return (self._accuracy, self._min_value, self._max_value)
+
+    @property
+    def count(self):
+        """
+        Number of valid values counted for each (group, site)
+
+        Returns
+        -------
+        ndarray
+        """
+        return self._cell_counts().reshape(self._shape)
+
+    def _cell_counts(self):
+        """
+        Number of valid values counted for each flattened (group, site) cell
+
+        Returns
+        -------
+        ndarray
+        """
+        cells = self.keys // self._n_buckets
+        count = np.bincount(cells, weights=self.counts,
+                            minlength=int(np.prod(self._shape)))
+
+        return count.astype(np.int64)
+
+    def _get_buckets(self, values):
+        """
+        Get the global bucket position of each value. Buckets are ordered by
+        value: negative buckets, the zero bucket at n_log, then the positive
+        buckets.
+
+        Parameters
+        ----------
+        values : ndarray
+            Finite values
+
+        Returns
+        -------
+        ndarray
+        """
+        mag = np.abs(values)
+        with np.errstate(divide='ignore'):
+            keys = np.ceil(np.log(mag) / self._log_gamma)
+
+        keys = np.clip(keys, self._k_min, self._k_min + self._n_log - 1)
+        keys = keys.astype(np.int64) - self._k_min
+        buckets = np.where(values > 0, self._n_log + 1 + keys,
+                           self._n_log - 1 - keys)
+        buckets[mag < self._min_value] = self._n_log
+
+        return buckets
+
+    def _get_values(self, buckets):
+        """
+        Get the representative value of global bucket positions
+
+        Parameters
+        ----------
+        buckets : ndarray
+            Global bucket positions
+
+        Returns
+        -------
+        ndarray
+        """
+        sign = np.sign(buckets - self._n_log)
+        keys = np.where(sign > 0, buckets - self._n_log - 1,
+                        self._n_log - 1 - buckets) + self._k_min
+        values = 2 * self._gamma ** keys / (self._gamma + 1)
+
+        return sign * values
+
+    def _split_keys(self):
+        """
+        Split the stored keys into group, site and bucket positions
+
+        Returns
+        -------
+        groups, sites, buckets : ndarray
+        """
+        cells, buckets = np.divmod(self.keys, self._n_buckets)
+        groups, sites = np.divmod(cells, self._shape[1])
+
+        return groups, sites, buckets
+
+    def _add(self, keys, counts=None):
+        """
+        Add bucket counts to the sketch in place. New keys are merged into
+        the sorted stored keys with a binary search, so the stored keys are
+        never re-sorted.
+
+        Parameters
+        ----------
+        keys : ndarray
+            (group * n_sites + site) * n_buckets + bucket keys, need not be
+            sorted or unique
+        counts : ndarray, optional
+            Count of each key, by default None which counts each key once
+        """
+        keys, inv = np.unique(keys, return_inverse=True)
+        counts = np.bincount(inv.ravel(), weights=counts,
+                             minlength=len(keys)).astype(np.uint32)
+        if not len(self.keys):
+            self.keys = keys
+            self.counts = counts
+            return
+
+        pos = np.searchsorted(self.keys, keys)
+        match = pos < len(self.keys)
+        match[match] = self.keys[pos[match]] == keys[match]
+        self.counts[pos[match]] += counts[match]
+        new = ~match
+        if new.any():
+            self.keys = np.insert(self.keys, pos[new], keys[new])
+            self.counts = np.insert(self.counts, pos[new], counts[new])
+
+    def update(self, data, codes):
+        """
+        Add a chunk of data to the sketch
+
+        Parameters
+        ----------
+        data : ndarray
+            (time, sites) chunk of data
+        codes : ndarray
+            Group code of each time step in data
+        """
+        data = np.asarray(data)
+        rows, sites = np.nonzero(np.isfinite(data))
+        if not len(rows):
+            return
+
+        buckets = self._get_buckets(data[rows, sites])
+        cells = np.asarray(codes)[rows] * self._shape[1] + sites
+        self._add(cells * self._n_buckets + buckets)
+
+    def merge(self, other):
+        """
+        Merge the counts of another sketch (e.g. from a different time chunk
+        or file) into this one in place
+
+        Parameters
+        ----------
+        other : QuantileSketch
+            Sketch for the same groups and sites with the same parameters
+        """
+        if other.shape != self.shape or other.params != self.params:
+            msg = ('Cannot merge {} into {}, the number of groups, sites and '
+                   'the sketch parameters must match!'.format(other, self))
+            logger.error(msg)
+            raise ValueError(msg)
+
+        if len(other.keys):
+            self._add(other.keys, other.counts)
+
+    def regroup(self, codes, n_groups):
+        """
+        Merge groups into coarser groups, e.g. month-hour groups into month
+        groups
+
+        Parameters
+        ----------
+        codes : ndarray
+            New group code of each of the current groups
+        n_groups : int
+            Number of new groups
+
+        Returns
+        -------
+        out : QuantileSketch
+            Sketch of the new groups
+        """
+        out = QuantileSketch(n_groups, self._shape[1], *self.params)
+        if len(self.keys):
+            groups, sites, buckets = self._split_keys()
+            cells = np.asarray(codes)[groups] * self._shape[1] + sites
+            out._add(cells * self._n_buckets + buckets, self.counts)
+
+        return out
+
+    @classmethod
+    def concat(cls, sketches):
+        """
+        Concatenate the sketches of the same groups for different sites
+
+        Parameters
+        ----------
+        sketches : list
+            List of QuantileSketch instances in site order, with the same
+            parameters
+
+        Returns
+        -------
+        out : QuantileSketch
+            Sketch for all sites
+        """
+        first = sketches[0]
+        if any(sketch.params != first.params for sketch in sketches):
+            msg = 'Cannot concatenate sketches with different parameters!'
+            logger.error(msg)
+            raise ValueError(msg)
+
+        n_sites = sum(sketch.shape[1] for sketch in sketches)
+        out = cls(first.shape[0], n_sites, *first.params)
+        keys = []
+        start = 0
+        for sketch in sketches:
+            groups, sites, buckets = sketch._split_keys()
+            cells = groups * n_sites + start + sites
+            keys.append(cells * out._n_buckets + buckets)
+            start += sketch.shape[1]
+
+        counts = np.concatenate([sketch.counts for sketch in sketches])
+        if len(counts):
+            out._add(np.concatenate(keys), counts)
+
+        return out
+
+    def _get_rank_value(self, cum, base, rank, vmin=None, vmax=None):
+        """
+        Estimate the value of the order statistic of the given rank
+
+        Parameters
+        ----------
+        cum : ndarray
+            Cumulative counts of the stored buckets
+        base : ndarray
+            Number of values counted in the cells before each flattened
+            (group, site) cell
+        rank : ndarray
+            (n_groups, n_sites) zero-based ranks
+        vmin : ndarray, optional
+            Exact minimum values used to clamp the estimates, by default None
+        vmax : ndarray, optional
+            Exact maximum values used to clamp the estimates, by default None
+
+        Returns
+        -------
+        values : ndarray
+        """
+        pos = np.searchsorted(cum, base + rank.ravel(), side='right')
+        pos = np.minimum(pos, max(len(cum) - 1, 0))
+        buckets = self.keys[pos] % self._n_buckets if len(cum) else pos
+        values = self._get_values(buckets).reshape(self._shape)
+        if vmin is not None:
+            values = np.maximum(values, vmin)
+
+        if vmax is not None:
+            values = np.minimum(values, vmax)
+
+        return values
+
+    def quantile(self, q, vmin=None, vmax=None):
+        """
+        Estimate quantiles
+
+        Parameters
+        ----------
+        q : float | list | ndarray
+            Quantile(s) to estimate, between 0 and 1
+        vmin : ndarray, optional
+            Exact (n_groups, n_sites) minimum values (e.g. from RunningStats)
+            used to clamp the estimates, by default None
+        vmax : ndarray, optional
+            Exact (n_groups, n_sites) maximum values used to clamp the
+            estimates, by default None
+
+        Returns
+        -------
+        out : ndarray
+            (n_groups, n_sites) estimates if q is a float, else
+            (len(q), n_groups, n_sites), NaN where there is no valid data
+        """
+        scalar = np.isscalar(q)
+        q = np.atleast_1d(q)
+        cum = np.cumsum(self.counts, dtype=np.int64)
+        cell_counts = self._cell_counts()
+        base = np.cumsum(cell_counts) - cell_counts
+        count = cell_counts.reshape(self._shape)
+
+        out = np.full((len(q), ) + self._shape, np.nan)
+        for i, qi in enumerate(q):
+            # interpolate between the bracketing order statistics, matching
+            # the default (linear) method of np.nanquantile
+            rank = qi * np.maximum(count - 1, 0)
+            lower = np.floor(rank)
+            upper = np.minimum(lower + 1, np.maximum(count - 1, 0))
+            lower = self._get_rank_value(cum, base, lower, vmin, vmax)
+            upper = self._get_rank_value(cum, base, upper, vmin, vmax)
+            values = lower + (rank - np.floor(rank)) * (upper - lower)
+            out[i] = np.where(count > 0, values, np.nan)
+
+        if scalar:
+            out = out[0]
+
+        return out
+
+    def cdf(self, vmin, vmax, n_samples=50, sampling='linear', log_base=10):
+        """
+        Estimate the x-values that define the CDF of each (group, site), see
+        rex.temporal_stats.temporal_stats.cdf
+
+        Parameters
+        ----------
+        vmin : ndarray
+            Exact (n_groups, n_sites) minimum values, used as the first
+            x-value
+        vmax : ndarray
+            Exact (n_groups, n_sites) maximum values, used as the last
+            x-value
+        n_samples : int, optional
+            Number of points to fit the CDF, by default 50
+        sampling : str, optional
+            Option for quantile sampling, "linear", "log", or "invlog", see
+            rex.utilities.bc_utils.sample_q, by default 'linear'
+        log_base : int | float, optional
+            Log base value if sampling is "log" or "invlog", by default 10
+
+        Returns
+        -------
+        x_values : ndarray
+            (n_samples, n_groups, n_sites) array of CDF x-values
+        """
+        quantiles = sample_q(n_samples, sampling=sampling, log_base=log_base)
+        x_values = self.quantile(quantiles, vmin=vmin, vmax=vmax)
+        x_values[0] = vmin
+        x_values[-1] = vmax
+
+        return x_values
+
+
+class StreamingStats:
+    """
+    Single-pass streaming temporal statistics engine. Time chunks of a
+    (time, sites) dataset are added one at a time; running accumulators are
+    only kept for the finest requested grouping (e.g. month-hour) and all
+    coarser groupings (full, month, hour) are derived from them exactly when
+    the statistics are requested, so each chunk is only reduced once.
+
+    Examples
+    --------
+    >>> engine = StreamingStats(time_index, n_sites,
+    >>>                         groupings=[(), ('month', ), ('month', 'hour')])
+    >>> for time_slice in time_slices:
+    >>>     engine.update(res[dset, time_slice, sites], time_slice)
+    >>>
+    >>> keys, stats = engine.get_stats(('month', ), ('mean', 'std'))
+
+    Approximate quantiles (e.g. 0.5 for the median) are available when a
+    quantile_accuracy is provided:
+
+    >>> engine = StreamingStats(time_index, n_sites, quantile_accuracy=0.01)
+    >>> ...
+    >>> keys, stats = engine.get_stats((), ('mean', 0.1, 0.5, 0.9))
+    """
+
+    def __init__(self, time_index, n_sites, groupings=((), ),
+                 quantile_accuracy=None):
+        """
+        Parameters
+        ----------
+        time_index : pandas.DatetimeIndex
+            Full time index of the data that will be streamed
+        n_sites : int
+            Number of sites in each chunk
+        groupings : list, optional
+            Groupings to compute stats for, each grouping is a tuple of
+            time_index fields in GROUP_FIELDS, e.g. () for the full time
+            series, ('month', ) for monthly, ('hour', ) for diurnal and
+            ('month', 'hour') for monthly-diurnal stats, by default ((), )
+        quantile_accuracy : float, optional
+            Relative accuracy of approximate quantiles, if provided a
+            QuantileSketch is kept alongside the running stats,
+            by default None
+        """
+        self._groupings = [self._check_grouping(g) for g in groupings]
+        fields = tuple(f for f in GROUP_FIELDS
+                       if any(f in g for g in self._groupings))
+        self._fields = fields
+
+        time_index = pd.DatetimeIndex(time_index)
+        keys = self._get_keys(time_index, fields)
+        uniques, codes = self._unique_keys(keys, fields)
+        self._codes = codes
+        self._field_values = {f: self._decode_keys(uniques, fields, f)
+                              for f in fields}
+        self._stats = RunningStats(len(uniques), n_sites)
+        self._sketch = None
+        if quantile_accuracy is not None:
+            self._sketch = QuantileSketch(len(uniques), n_sites,
+                                          accuracy=quantile_accuracy)
+
+    def __repr__(self):
+        msg = ("{} for groupings {}"
+               .format(self.__class__.__name__, self.groupings))
+
+        return msg
+
+    @staticmethod
+    def _check_grouping(grouping):
+        """
+        Check that grouping is a tuple of valid time_index fields
+
+        Parameters
+        ----------
+        grouping : tuple | list | str
+            Grouping fields
+
+        Returns
+        -------
+        grouping : tuple
+        """
+        if isinstance(grouping, str):
+            grouping = (grouping, )
+
+        grouping = tuple(grouping)
+        for field in grouping:
+            if field not in GROUP_FIELDS:
+                msg = ('Cannot group by {}, must be one of {}'
+                       .format(field, GROUP_FIELDS))
+                logger.error(msg)
+                raise KeyError(msg)
+
+        return tuple(f for f in GROUP_FIELDS if f in grouping)
+
+    @staticmethod
+    def _get_keys(time_index, fields):
+        """
+        Get integer group keys for each time step
+
+        Parameters
+        ----------
+        time_index : pandas.DatetimeIndex
+            Time index
+        fields : tuple
+            Fields to group by
+
+        Returns
+        -------
+        keys : ndarray
+        """
+        keys = np.zeros(len(time_index), dtype=np.int64)
+        for field in fields:
+            keys = keys * 100 + getattr(time_index, field).values
+
+        return keys
+
+    @staticmethod
+    def _unique_keys(keys, fields):
+        """
+        Get the unique group keys and the group code of each key. The full
+        time series (no fields) always has one group so that its stats are
+        NaN for an empty time index, like the legacy pandas stats.
+
+        Parameters
+        ----------
+        keys : ndarray
+            Integer group keys, see _get_keys
+        fields : tuple
+            Fields used to create keys
+
+        Returns
+        -------
+        uniques : ndarray
+            Sorted unique keys
+        codes : ndarray
+            Group code of each key
+        """
+        uniques, codes = np.unique(keys, return_inverse=True)
+        if not fields and not len(uniques):
+            uniques = np.zeros(1, dtype=np.int64)
+
+        return uniques, codes.ravel()
+
+    @staticmethod
+    def _format_keys(values):
+        """
+        Format group keys like pandas groupby keys
+
+        Parameters
+        ----------
+        values : list
+            List of arrays of the group values of each grouping field
+
+        Returns
+        -------
+        keys : list | None
+            Group keys, ints for a single field, tuples of ints for
+            multiple fields, None if there are no grouping fields
+        """
+        if not values:
+            keys = None
+        elif len(values) == 1:
+            keys = values[0].tolist()
+        else:
+            keys = list(zip(*[v.tolist() for v in values]))
+
+        return keys
+
+    @classmethod
+    def get_group_codes(cls, time_index, grouping):
+        """
+        Get the group code of each time step for a grouping
+
+        Parameters
+        ----------
+        time_index : pandas.DatetimeIndex
+            Time index
+        grouping : tuple
+            Grouping fields, e.g. ('month', 'hour')
+
+        Returns
+        -------
+        codes : ndarray
+            Group code of each time step, groups are sorted by key
+        keys : list | None
+            Group keys matching pandas groupby keys, None for the full time
+            series, see _format_keys
+        """
+        grouping = cls._check_grouping(grouping)
+        keys = cls._get_keys(pd.DatetimeIndex(time_index), grouping)
+        uniques, codes = np.unique(keys, return_inverse=True)
+        values = [cls._decode_keys(uniques, grouping, f) for f in grouping]
+
+        return codes.ravel(), cls._format_keys(values)
+
+    @staticmethod
+    def _decode_keys(keys, fields, field):
+        """
+        Decode a field value from integer group keys
+
+        Parameters
+        ----------
+        keys : ndarray
+            Integer group keys, see _get_keys
+        fields : tuple
+            Fields used to create keys
+        field : str
+            Field to decode
+
+        Returns
+        -------
+        ndarray
+        """
+        pos = len(fields) - 1 - fields.index(field)
+
+        return (keys // 100 ** pos) % 100
+
+    @property
+    def groupings(self):
+        """
+        Groupings that stats are computed for
+
+        Returns
+        -------
+        list
+        """
+        return self._groupings
+
+    @property
+    def running_stats(self):
+        """
+        Accumulators of the finest grouping
+
+        Returns
+        -------
+        RunningStats
+        """
+        return self._stats
+
+    @property
+    def quantile_sketch(self):
+        """
+        Quantile sketch of the finest grouping
+
+        Returns
+        -------
+        QuantileSketch | None
+            None if quantile_accuracy was not provided
+        """
+        return self._sketch
+
+    @property
+    def n_sites(self):
+        """
+        Number of sites
+
+        Returns
+        -------
+        int
+        """
+        return self._stats.shape[1]
+
+    @classmethod
+    def concat(cls, engines):
+        """
+        Concatenate engines computed for the same time_index and groupings
+        but different sites, e.g. by different workers
+
+        Parameters
+        ----------
+        engines : list
+            List of StreamingStats instances in site order
+
+        Returns
+        -------
+        out : StreamingStats
+            Engine for all sites
+        """
+        first = engines[0]
+        for engine in engines[1:]:
+            if (engine.groupings != first.groupings
+                    or not np.array_equal(engine._codes, first._codes)
+                    or (engine.quantile_sketch is None)
+                    != (first.quantile_sketch is None)):
+                msg = ('Cannot concatenate {} with {}, the time index, '
+                       'groupings and quantile sketches must match!'
+                       .format(engine, first))
+                logger.error(msg)
+                raise ValueError(msg)
+
+        out = copy.copy(first)
+        out._stats = RunningStats.concat([e.running_stats for e in engines])
+        if first.quantile_sketch is not None:
+            out._sketch = QuantileSketch.concat([e.quantile_sketch
+                                                 for e in engines])
+
+        return out
+
+    def save(self, fpath, meta=None):
+        """
+        Save the engine's partial aggregates to a .npz file so they can be
+        loaded and merged later, see StreamingStats.load. The file is
+        written to a temporary file and then atomically moved into place.
+
+        Parameters
+        ----------
+        fpath : str
+            Path to .npz file to save to
+        meta : dict, optional
+            JSON serializable meta data to save with the partial aggregates,
+            e.g. the source file and dataset, see StreamingStats.load_meta,
+            by default None
+        """
+        arrays = {'codes': self._codes}
+        arrays.update({'field_{}'.format(field): values
+                       for field, values in self._field_values.items()})
+        arrays.update({'stats_{}'.format(name): getattr(self._stats, name)
+                       for name in RunningStats.ARRAYS})
+        info = {'groupings': [list(g) for g in self.groupings],
+                'fields': list(self._fields),
+                'sketch': None,
+                'meta': meta or {}}
+        if self._sketch is not None:
+            arrays['sketch_keys'] = self._sketch.keys
+            arrays['sketch_counts'] = self._sketch.counts
+            info['sketch'] = {'params': list(self._sketch.params),
+                              'shape': list(self._sketch.shape)}
+
+        arrays['info'] = np.array(json.dumps(info))
+
+        out_dir = os.path.dirname(os.path.abspath(fpath))
+        os.makedirs(out_dir, exist_ok=True)
+        with atomic_write(fpath) as f:
+            np.savez(f, **arrays)
+
+        logger.debug('Saved partial aggregates to {}'.format(fpath))
+
+    @staticmethod
+    def _load_info(f):
+        """
+        Load the info dictionary saved with the partial aggregates
+
+        Parameters
+        ----------
+        f : numpy.lib.npyio.NpzFile
+            Open .npz file
+
+        Returns
+        -------
+        dict
+        """
+        return json.loads(str(f['info']))
+
+    @classmethod
+    def load_meta(cls, fpath):
+        """
+        Load the meta data saved with partial aggregates
+
+        Parameters
+        ----------
+        fpath : str
+            Path to .npz file created by StreamingStats.save
+
+        Returns
+        -------
+        dict
+        """
+        with np.load(fpath) as f:
+            meta = cls._load_info(f)['meta']
+
+        return meta
+
+    @classmethod
+    def load(cls, fpath):
+        """
+        Load partial aggregates saved with StreamingStats.save
+
+        Parameters
+        ----------
+        fpath : str
+            Path to .npz file created by StreamingStats.save
+
+        Returns
+        -------
+        out : StreamingStats
+            Engine with the saved partial aggregates, can be updated, merged
+            and used to get stats like the original engine
+        """
+        with np.load(fpath) as f:
+            info = cls._load_info(f)
+            out = cls.__new__(cls)
+            out._groupings = [tuple(g) for g in info['groupings']]
+            out._fields = tuple(info['fields'])
+            out._codes = f['codes']
+            out._field_values = {field: f['field_{}'.format(field)]
+                                 for field in out._fields}
+            out._stats = RunningStats(*f['stats_count'].shape)
+            for name in RunningStats.ARRAYS:
+                setattr(out._stats, name, f['stats_{}'.format(name)])
+
+            out._sketch = None
+            if info['sketch'] is not None:
+                out._sketch = QuantileSketch(*info['sketch']['shape'],
+                                             *info['sketch']['params'])
+                out._sketch.keys = f['sketch_keys']
+                out._sketch.counts = f['sketch_counts']
+
+        logger.debug('Loaded partial aggregates from {}'.format(fpath))
+
+        return out
+
+    def update(self, data, time_slice=slice(None)):
+        """
+        Add a time chunk of data
+
+        Parameters
+        ----------
+        data : ndarray
+            (time, sites) chunk of data
+        time_slice : slice | ndarray, optional
+            Position of the chunk in the time_index, by default slice(None)
+        """
+        codes = self._codes[time_slice]
+        self._stats.update(data, codes)
+        if self._sketch is not None:
+            self._sketch.update(data, codes)
+
+    def merge(self, other):
+        """
+        Merge another engine computed for the same groupings and sites, e.g.
+        from a different file, into this one in place. Groups are matched by
+        their time_index field values, so the engines can cover different
+        time periods (e.g. different years).
+
+        Parameters
+        ----------
+        other : StreamingStats
+            Engine to merge
+        """
+        if (other.groupings != self.groupings
+                or (other.quantile_sketch is None)
+                != (self.quantile_sketch is None)):
+            msg = ('Cannot merge {} into {}, the groupings and quantile '
+                   'sketches must match!'.format(other, self))
+            logger.error(msg)
+            raise ValueError(msg)
+
+        keys = self._get_group_keys(self._fields)
+        other_keys = other._get_group_keys(self._fields)
+        union = np.union1d(keys, other_keys)
+        codes = np.searchsorted(union, keys)
+        if len(union) != len(keys):
+            self._codes = codes[self._codes]
+            self._field_values = {f: self._decode_keys(union, self._fields, f)
+                                  for f in self._fields}
+            self._stats = self._stats.regroup(codes, len(union))
+            if self._sketch is not None:
+                self._sketch = self._sketch.regroup(codes, len(union))
+
+        other_codes = np.searchsorted(union, other_keys)
+        self._stats.merge(other.running_stats.regroup(other_codes,
+                                                      len(union)))
+        if self._sketch is not None:
+            self._sketch.merge(other.quantile_sketch.regroup(other_codes,
+                                                             len(union)))
+
+    def _get_group_keys(self, grouping):
+        """
+        Get the integer key of each group of the finest grouping, see
+        _get_keys
+
+        Parameters
+        ----------
+        grouping : tuple
+            Fields to include in the keys
+
+        Returns
+        -------
+        keys : ndarray
+        """
+        keys = np.zeros(self._stats.shape[0], dtype=np.int64)
+        for field in grouping:
+            keys = keys * 100 + self._field_values[field]
+
+        return keys
+
+    @staticmethod
+    def _get_quantile(sketch, running_stats, q):
+        """
+        Estimate a quantile, clamped to the exact min and max
+
+        Parameters
+        ----------
+        sketch : QuantileSketch
+            Quantile sketch of the grouping
+        running_stats : RunningStats
+            Running stats of the grouping
+        q : float
+            Quantile to estimate, between 0 and 1
+
+        Returns
+        -------
+        ndarray
+        """
+        if sketch is None:
+            msg = ('Cannot compute quantile {} without a quantile sketch, '
+                   'quantile_accuracy must be provided!'.format(q))
+            logger.error(msg)
+            raise KeyError(msg)
+
+        return sketch.quantile(q, vmin=running_stats.get_stat('min'),
+                               vmax=running_stats.get_stat('max'))
+
+    def _regroup(self, grouping, quantiles=True):
+        """
+        Get the accumulators of a grouping
+
+        Parameters
+        ----------
+        grouping : tuple
+            Grouping to get accumulators for, must be one of groupings
+        quantiles : bool, optional
+            Flag to also regroup the quantile sketch, by default True
+
+        Returns
+        -------
+        keys : list | None
+            Group keys (ints or tuples of ints in the order of the grouping
+            fields), None for the full time series
+        running_stats : RunningStats
+            Running stats of the grouping
+        sketch : QuantileSketch | None
+            Quantile sketch of the grouping
+        """
+        grouping = self._check_grouping(grouping)
+        if grouping not in self.groupings:
+            msg = ('Stats were not computed for grouping {}, must be one of '
+                   '{}'.format(grouping, self.groupings))
+            logger.error(msg)
+            raise KeyError(msg)
+
+        running_stats = self._stats
+        sketch = self._sketch if quantiles else None
+        if grouping == self._fields:
+            values = [self._field_values[f] for f in grouping]
+        else:
+            keys = self._get_group_keys(grouping)
+            uniques, codes = self._unique_keys(keys, grouping)
+            running_stats = running_stats.regroup(codes, len(uniques))
+            if sketch is not None:
+                sketch = sketch.regroup(codes, len(uniques))
+
+            values = [self._decode_keys(uniques, grouping, f)
+                      for f in grouping]
+
+        return self._format_keys(values), running_stats, sketch
+
+    def get_stats(self, grouping, stats, ddof=0):
+        """
+        Get statistics for a grouping
+
+        Parameters
+        ----------
+        grouping : tuple
+            Grouping to get stats for, must be one of groupings
+        stats : list | tuple
+            Statistics to get, either names in RunningStats.STATS or
+            quantiles between 0 and 1 (requires quantile_accuracy)
+        ddof : int, optional
+            Delta degrees of freedom of the 'std' and 'var' statistics,
+            by default 0, see RunningStats.get_stat
+
+        Returns
+        -------
+        keys : list | None
+            Group keys (ints or tuples of ints in the order of the grouping
+            fields), None for the full time series
+        out : dict
+            Dictionary of (n_groups, n_sites) statistic arrays
+        """
+        quantiles = any(not isinstance(s, str) for s in stats)
+        keys, running_stats, sketch = self._regroup(grouping,
+                                                    quantiles=quantiles)
+        out = {}
+        for stat in stats:
+            if isinstance(stat, str):
+                out[stat] = running_stats.get_stat(stat, ddof=ddof)
+            else:
+                out[stat] = self._get_quantile(sketch, running_stats, stat)
+
+        return keys, out
+
+    def get_cdf(self, grouping, n_samples=50, sampling='linear',
+                log_base=10):
+        """
+        Get the approximate CDF x-values of a grouping, see
+        QuantileSketch.cdf, requires quantile_accuracy
+
+        Parameters
+        ----------
+        grouping : tuple
+            Grouping to get CDFs for, must be one of groupings
+        n_samples : int, optional
+            Number of points to fit the CDF, by default 50
+        sampling : str, optional
+            Option for quantile sampling, "linear", "log", or "invlog",
+            by default 'linear'
+        log_base : int | float, optional
+            Log base value if sampling is "log" or "invlog", by default 10
+
+        Returns
+        -------
+        keys : list | None
+            Group keys (ints or tuples of ints in the order of the grouping
+            fields), None for the full time series
+        x_values : ndarray
+            (n_samples, n_groups, n_sites) array of CDF x-values
+        """
+        keys, running_stats, sketch = self._regroup(grouping)
+        if sketch is None:
+            msg = ('Cannot compute CDFs without a quantile sketch, '
+                   'quantile_accuracy must be provided!')
+            logger.error(msg)
+            raise KeyError(msg)
+
+        x_values = sketch.cdf(running_stats.get_stat('min'),
+                              running_stats.get_stat('max'),
+                              n_samples=n_samples, sampling=sampling,
+                              log_base=log_base)
+
+        return keys, x_values
+
+
+class GroupReducer:
+    """
+    Vectorized reductions of in-memory (time, sites) arrays by time_index
+    groups (e.g. month-hour) with ufunc.reduceat over precomputed group
+    codes, used in place of pandas groupby aggregations
+    """
+
+    def __init__(self, time_index, grouping=()):
+        """
+        Parameters
+        ----------
+        time_index : pandas.DatetimeIndex
+            Time index of the arrays to reduce
+        grouping : tuple, optional
+            time_index fields to group by, see StreamingStats,
+            by default ()
+        """
+        codes, self._keys = StreamingStats.get_group_codes(time_index,
+                                                           grouping)
+        self._codes = codes
+        self._index = GroupIndex(codes, codes.max() + 1 if len(codes) else 0)
+
+    def __repr__(self):
+        msg = ("{} for {} groups"
+               .format(self.__class__.__name__, self.n_groups))
+
+        return msg
+
+    @property
+    def keys(self):
+        """
+        Group keys, matching pandas groupby keys
+
+        Returns
+        -------
+        list | None
+            None for the full time series
+        """
+        return self._keys
+
+    @property
+    def n_groups(self):
+        """
+        Number of groups
+
+        Returns
+        -------
+        int
+        """
+        return self._index.n_groups
+
+    @property
+    def index(self):
+        """
+        Group index of the time steps
+
+        Returns
+        -------
+        GroupIndex
+        """
+        return self._index
+
+    def running_stats(self, data):
+        """
+        Compute NaN-aware count, mean, std, min and max of each group
+
+        Parameters
+        ----------
+        data : ndarray
+            (time, sites) array
+
+        Returns
+        -------
+        stats : RunningStats
+        """
+        stats = RunningStats(self.n_groups, data.shape[1])
+        stats.update(data, self._codes)
+
+        return stats
+
+    def average(self, data, weights=None):
+        """
+        Compute the (weighted) average of each group, equivalent to
+        np.average(data, weights=weights, axis=0) for each group, NaNs are
+        propagated
+
+        Parameters
+        ----------
+        data : ndarray
+            (time, sites) array
+        weights : ndarray, optional
+            (time, sites) array of weights, by default None
+
+        Returns
+        -------
+        ndarray
+            (n_groups, sites) averages
+        """
+        data = self._index.sort(np.asarray(data, dtype=np.float64))
+        if weights is None:
+            sizes = self._index.reduce(np.add, np.ones(len(data)),
+                                       sort=False)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                out = (self._index.reduce(np.add, data, sort=False)
+                       / sizes[:, None])
+        else:
+            weights = self._index.sort(np.asarray(weights,
+                                                  dtype=np.float64))
+            with np.errstate(invalid='ignore', divide='ignore'):
+                out = (self._index.reduce(np.add, data * weights, sort=False)
+                       / self._index.reduce(np.add, weights, sort=False))
+
+        return out
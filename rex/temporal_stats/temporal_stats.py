@@ -3,88 +3,30 @@
 Temporal Statistics Extraction
 """
 from concurrent.futures import as_completed
+from contextlib import nullcontext
 import gc
+import json
 import logging
 import numpy as np
 import os
 import pandas as pd
 
+from rex.multi_time_resource import MultiTimeH5
 from rex.resource import Resource
-from rex.utilities.bc_utils import (sample_q_linear, sample_q_log,
-                                    sample_q_invlog)
+from rex.temporal_stats.circular_stats import (CircularStats, circular_mean,
+                                               circular_std,
+                                               resultant_length)
+from rex.temporal_stats.streaming import GroupReducer, StreamingStats
+from rex.utilities.bc_utils import sample_q
 from rex.utilities.execution import SpawnProcessPool
 from rex.utilities.loggers import log_mem, log_versions, create_dirs
+from rex.utilities.sidecar_cache import SidecarCache
 from rex.utilities.utilities import get_lat_lon_cols, slice_sites
+from rex.utilities.worker_pool import SharedArray, get_worker_resource
 
 logger = logging.getLogger(__name__)
 
 
-def circular_mean(data, weights=None, degrees=True, axis=0,
-                  exponential_weights=True):
-    """
-    Computed the ciruclar average. if provided compute the weighed average
-    with the given weights. For example, if averaging wind direction with wind
-    speed as weights, wind directions that occur at higher wind speeds will
-    have a larger weight of the final mean value.
-
-    Parameters
-    ----------
-    data : ndarray
-        Data to average
-    weights : ndarray, optional
-        Weights to apply to data during averaging, must be of the same
-        shape as data, by default None
-    degree : bool, optional
-        Flag indicating that data is in degrees and needs to be converted
-        to/from radians during averaging. By default True
-    axis : int, optional
-        Axis to compute average along, by default 0 which will produce
-        site averages
-    norm_weights: : bool, optional
-        Flag to normalize weights, by default True
-    exponential_weights : bool
-        Flag to convert weights to exponential, by default True
-
-    Returns
-    -------
-    mean : ndarray
-        Weighted circular mean along the given axis
-    """
-    if degrees:
-        data = np.radians(data, dtype=np.float32)
-
-    sin = np.sin(data)
-    cos = np.cos(data)
-    if weights is None:
-        sin = np.nanmean(sin, axis=axis)
-        cos = np.nanmean(cos, axis=axis)
-    else:
-        if exponential_weights:
-            weights = np.exp(weights)
-
-        if weights.shape != data.shape:
-            msg = ('The shape of weights {} does not match the shape of the '
-                   'data {} to which it is to be applied!'
-                   .format(weights.shape, data.shape))
-            logger.error(msg)
-            raise RuntimeError(msg)
-
-        n_weights = np.expand_dims(np.nansum(weights, axis=axis), axis)
-        sin = np.nansum(sin * weights, axis=axis) / n_weights
-        cos = np.nansum(cos * weights, axis=axis) / n_weights
-
-    mean = np.arctan2(sin, cos)
-    if degrees:
-        mean = np.degrees(mean)
-        mask = mean < 0
-        if isinstance(mask, np.ndarray):
-            mean[mask] += 360
-        elif mask:
-            mean += 360
-
-    return mean
-
-
 def cdf(data, n_samples=50, sampling='linear', log_base=10, decimals=None):
     """Get a number of x-values that define a CDF for the input data.
 
@@ -122,19 +64,7 @@ def cdf(data, n_samples=50, sampling='linear', log_base=10, decimals=None):
     if nan_mask.all():
         return np.zeros(n_samples)
 
-    sampling = sampling.casefold()
-    if sampling == 'linear':
-        quantiles = sample_q_linear(n_samples)
-    elif sampling == 'log':
-        quantiles = sample_q_log(n_samples, log_base)
-    elif sampling == 'invlog':
-        quantiles = sample_q_invlog(n_samples, log_base)
-    else:
-        msg = ('sampling option must be linear, log, or invlog, but received: '
-               '{}'.format(sampling))
-        logger.error(msg)
-        raise KeyError(msg)
-
+    quantiles = sample_q(n_samples, sampling=sampling, log_base=log_base)
     x_values = np.interp(quantiles, np.linspace(0, 1, len(data[~nan_mask])),
                          sorted(data[~nan_mask]))
 
@@ -157,10 +87,51 @@ class TemporalStats:
     """
     STATS = {'mean': {'func': np.nanmean, 'kwargs': {'axis': 0}},
              'median': {'func': np.nanmedian, 'kwargs': {'axis': 0}},
-             'std': {'func': np.nanstd, 'kwargs': {'axis': 0}}}
+             'std': {'func': np.nanstd, 'kwargs': {'axis': 0}},
+             'min': {'func': np.nanmin, 'kwargs': {'axis': 0}},
+             'max': {'func': np.nanmax, 'kwargs': {'axis': 0}},
+             'p10': {'func': np.nanpercentile, 'kwargs': {'q': 10, 'axis': 0}},
+             'p90': {'func': np.nanpercentile, 'kwargs': {'q': 90, 'axis': 0}}}
+
+    # Statistic functions that can be computed with the single-pass
+    # streaming engine, see rex.temporal_stats.streaming
+    STREAMING_FUNCS = {np.nanmean: 'mean', np.nanstd: 'std',
+                       np.nanmin: 'min', np.nanmax: 'max'}
+
+    # Quantile statistic functions that can be approximated by the streaming
+    # engine when a quantile_accuracy is provided, mapped to the kwarg
+    # holding the quantile (None for the median) and its scale
+    STREAMING_QUANTILE_FUNCS = {np.nanmedian: (None, 1),
+                                np.nanpercentile: ('q', 100),
+                                np.nanquantile: ('q', 1)}
+
+    # Statistic functions computed in memory with vectorized group
+    # reductions instead of pandas groupby, mapped to their supported kwargs
+    GROUP_REDUCE_FUNCS = {np.nanmean: (), np.nanstd: ('ddof', ),
+                          np.nanmin: (), np.nanmax: (),
+                          np.average: ('weights', ),
+                          circular_mean: ('weights', 'degrees',
+                                          'exponential_weights'),
+                          circular_std: ('weights', 'degrees',
+                                         'exponential_weights'),
+                          resultant_length: ('weights', 'degrees',
+                                             'exponential_weights')}
+
+    # Circular statistic functions mapped to the CircularStats statistic
+    # they compute
+    CIRCULAR_FUNCS = {circular_mean: 'mean', circular_std: 'std',
+                      resultant_length: 'resultant_length'}
+
+    # Approximate number of time steps to read per chunk when streaming
+    STREAM_STEPS = 8760
+
+    # Delta degrees of freedom pandas uses to aggregate with np.nanstd, see
+    # _get_std_ddof
+    _PANDAS_STD_DDOF = None
 
     def __init__(self, res_h5, statistics='mean', res_cls=Resource,
-                 hsds=False):
+                 hsds=False, streaming=True, quantile_accuracy=None,
+                 shared_memory=False):
         """
         Parameters
         ----------
@@ -176,6 +147,28 @@ class TemporalStats:
         hsds : bool, optional
             Boolean flag to use h5pyd to handle .h5 'files' hosted on AWS
             behind HSDS, by default False
+        streaming : bool, optional
+            Flag to compute statistics with the single-pass streaming engine
+            (see rex.temporal_stats.streaming) when all of the requested
+            statistics support it (mean, std, min, max, without weights).
+            Time chunks are read and reduced once for all requested
+            groupings instead of loading the full timeseries into a
+            DataFrame, by default True
+        quantile_accuracy : float, optional
+            Relative accuracy of approximate quantile statistics (median,
+            p10, p90, np.nanpercentile or np.nanquantile with a scalar q).
+            If provided, quantiles are estimated in the streaming engine
+            with a mergeable QuantileSketch so that every estimate is within
+            quantile_accuracy of the true value (relative error) instead of
+            being computed exactly from the full timeseries, e.g. 0.01.
+            By default None
+        shared_memory : bool, optional
+            Flag to run parallel computations with long-lived workers that
+            keep res_h5 open across tasks and write their results into a
+            preallocated shared memory array indexed by gid instead of
+            pickling DataFrames back to the main process. Only used when
+            every statistic returns one value per site and group (e.g.
+            mean, std, min, max, quantiles, circular means), by default False
         """
         log_versions(logger)
         self._res_h5 = res_h5
@@ -184,10 +177,16 @@ class TemporalStats:
 
         self._res_cls = res_cls
         self._hsds = hsds
+        self._streaming = streaming
+        self._quantile_accuracy = quantile_accuracy
+        self._shared_memory = shared_memory
 
+        self._meta = None
         with res_cls(res_h5, hsds=self._hsds) as f:
             self._time_index = f.time_index
-            self._meta = f.meta
+            lazy_meta = f.lazy_meta
+            lat_lon_cols = get_lat_lon_cols(lazy_meta)
+            self._lat_lon = lazy_meta[lat_lon_cols]
 
     @property
     def res_h5(self):
@@ -255,6 +254,10 @@ class TemporalStats:
         -------
         pandas.DataFrame
         """
+        if self._meta is None:
+            with self.res_cls(self.res_h5, hsds=self._hsds) as f:
+                self._meta = f.meta
+
         return self._meta
 
     @property
@@ -266,9 +269,7 @@ class TemporalStats:
         -------
         pandas.DataFrame
         """
-        lat_lon_cols = get_lat_lon_cols(self.meta)
-
-        return self.meta[lat_lon_cols]
+        return self._lat_lon
 
     @staticmethod
     def _format_grp_names(grp_names):
@@ -384,10 +385,125 @@ class TemporalStats:
 
         return s_data
 
+    @classmethod
+    def _reduce_stat(cls, reducer, res_data, stat, running_stats=None):
+        """
+        Compute a statistic for each group with vectorized group reductions
+
+        Parameters
+        ----------
+        reducer : rex.temporal_stats.streaming.GroupReducer
+            Group reducer for the res_data time_index and grouping
+        res_data : pandas.DataFrame
+            DataFrame or resource data. Index is time_index, columns are sites
+        stat : dict
+            Statistic function and kwargs
+        running_stats : rex.temporal_stats.streaming.RunningStats, optional
+            Pre-computed running stats of res_data, by default None
+
+        Returns
+        -------
+        s_data : ndarray | None
+            (n_groups, n_sites) statistic array, None if the statistic is
+            not supported by the group reductions
+        running_stats : rex.temporal_stats.streaming.RunningStats | None
+            Running stats of res_data if they were needed
+        """
+        func = stat['func']
+        kwargs = stat.get('kwargs', {}).copy()
+        try:
+            supported = cls.GROUP_REDUCE_FUNCS.get(func)
+        except TypeError:
+            supported = None
+
+        if (supported is None or kwargs.pop('axis', 0) != 0
+                or set(kwargs) - set(supported)):
+            return None, running_stats
+
+        weights = kwargs.pop('weights', None)
+        if isinstance(weights, pd.DataFrame):
+            weights = weights.values
+
+        data = res_data.values
+        if func in cls.STREAMING_FUNCS:
+            if running_stats is None:
+                running_stats = reducer.running_stats(data)
+
+            ddof = cls._get_std_ddof(kwargs) if func is np.nanstd else 0
+            s_data = running_stats.get_stat(cls.STREAMING_FUNCS[func],
+                                            ddof=ddof)
+        elif func is np.average:
+            s_data = reducer.average(data, weights=weights)
+        else:
+            circular_stats = CircularStats(reducer.n_groups, data.shape[1],
+                                           **kwargs)
+            circular_stats.update(data, reducer.index, weights=weights)
+            s_data = circular_stats.get_stat(cls.CIRCULAR_FUNCS[func])
+
+        return s_data, running_stats
+
+    @classmethod
+    def _aggregate_stat(cls, res_data, name, stat, groupby=None,
+                        column_names=None):
+        """
+        Compute a statistic with pandas
+
+        Parameters
+        ----------
+        res_data : pandas.DataFrame | pandas.GroupBy
+            Resource data to compute stats from
+        name : str
+            Statistic name
+        stat : dict
+            Statistic function and kwargs
+        groupby : list, optional
+            Group by values, by default None
+        column_names : dict, optional
+            Dictionary of column names to use for each statistic, required
+            if groupby is provided, by default None
+
+        Returns
+        -------
+        s_data : pandas.DataFrame
+            DataFrame of the statistic
+        """
+        func = stat['func']
+        kwargs = stat.get('kwargs', {}).copy()
+        if name.lower().startswith('weight'):
+            weights = kwargs.pop('weights').copy()
+            if groupby:
+                weights = weights.groupby(groupby)
+                weight_names = column_names[name]
+            else:
+                weight_names = name
+
+            s_data = cls._compute_weighted_stats(func, res_data, weights,
+                                                 weight_names, **kwargs)
+        else:
+            axis = kwargs.pop('axis', 0)
+            s_data = res_data.aggregate(func, axis=axis, **kwargs)
+
+            if groupby:
+                columns = column_names[name]
+                s_data = s_data.T
+                s_data.columns = columns
+            elif not isinstance(s_data, pd.DataFrame):
+                s_data = s_data.to_frame(name=name)
+            elif isinstance(s_data, pd.DataFrame) and len(s_data) > 1:
+                # e.g., if func is scipy.stats.beta.fit(), this collapses
+                # multiple output parameters into list
+                s_data['name'] = name
+                s_data = s_data.groupby('name').agg(list).T
+
+        return s_data
+
     @classmethod
     def _compute_stats(cls, res_data, statistics, diurnal=False, month=False):
         """
-        Compute desired stats for desired time intervals from res_data
+        Compute desired stats for desired time intervals from res_data.
+        Statistics in cls.GROUP_REDUCE_FUNCS are computed with vectorized
+        group reductions over precomputed month/hour group codes, all other
+        statistics are computed with a pandas groupby.
 
         Parameters
         ----------
@@ -405,48 +521,32 @@ class TemporalStats:
         res_stats : pandas.DataFrame
             DataFrame of desired statistics at desired time intervals
         """
-        groupby = []
+        grouping = tuple(field for field, flag
+                         in (('month', month), ('hour', diurnal)) if flag)
+        reducer = GroupReducer(res_data.index, grouping)
         column_names = None
-        if month:
-            groupby.append(res_data.index.month)
-
-        if diurnal:
-            groupby.append(res_data.index.hour)
-
-        if groupby:
-            res_data = res_data.groupby(groupby)
-            column_names = cls._create_names(list(res_data.groups),
-                                             list(statistics))
+        if grouping:
+            column_names = cls._create_names(reducer.keys, list(statistics))
 
+        groupby = [getattr(res_data.index, field) for field in grouping]
+        grouped = None
+        running_stats = None
         res_stats = []
         for name, stat in statistics.copy().items():
-            func = stat['func']
-            kwargs = stat.get('kwargs', {}).copy()
-            if name.lower().startswith('weight'):
-                weights = kwargs.pop('weights').copy()
-                if groupby:
-                    weights = weights.groupby(groupby)
-                    weight_names = column_names[name]
-                else:
-                    weight_names = name
-
-                s_data = cls._compute_weighted_stats(func, res_data, weights,
-                                                     weight_names, **kwargs)
+            s_data, running_stats = cls._reduce_stat(
+                reducer, res_data, stat, running_stats=running_stats)
+            if s_data is not None:
+                columns = column_names[name] if grouping else [name]
+                s_data = pd.DataFrame(s_data.T, index=res_data.columns,
+                                      columns=columns)
             else:
-                axis = kwargs.pop('axis', 0)
-                s_data = res_data.aggregate(func, axis=axis, **kwargs)
-
-                if groupby:
-                    columns = column_names[name]
-                    s_data = s_data.T
-                    s_data.columns = columns
-                elif not isinstance(s_data, pd.DataFrame):
-                    s_data = s_data.to_frame(name=name)
-                elif isinstance(s_data, pd.DataFrame) and len(s_data) > 1:
-                    # e.g., if func is scipy.stats.beta.fit(), this collapses
-                    # multiple output parameters into list
-                    s_data['name'] = name
-                    s_data = s_data.groupby('name').agg(list).T
+                if grouped is None:
+                    grouped = (res_data.groupby(groupby) if groupby
+                               else res_data)
+
+                s_data = cls._aggregate_stat(grouped, name, stat,
+                                             groupby=groupby,
+                                             column_names=column_names)
 
             res_stats.append(s_data)
 
@@ -510,11 +610,371 @@ class TemporalStats:
 
         return pd.DataFrame(weights, index=time_index)
 
+    @classmethod
+    def _get_std_ddof(cls, kwargs):
+        """
+        Get the delta degrees of freedom of a np.nanstd statistic, matching
+        the pandas aggregation of the legacy stats: pandas 2.x dispatches
+        np.nanstd to DataFrame.std (ddof=1) while pandas >= 3 calls
+        np.nanstd (ddof=0)
+
+        Parameters
+        ----------
+        kwargs : dict
+            Statistic function kwargs, an explicit ddof kwarg is used as is
+
+        Returns
+        -------
+        ddof : int
+        """
+        if 'ddof' in kwargs:
+            return kwargs['ddof']
+
+        if cls._PANDAS_STD_DDOF is None:
+            probe = pd.DataFrame({'probe': [0.0, 1.0]}).aggregate(np.nanstd)
+            ddof = 0 if np.isclose(probe.iloc[0], 0.5) else 1
+            cls._PANDAS_STD_DDOF = ddof
+
+        return cls._PANDAS_STD_DDOF
+
+    @classmethod
+    def _get_stream_quantile(cls, func, kwargs):
+        """
+        Get the quantile computed by a quantile statistic function
+
+        Parameters
+        ----------
+        func : callable
+            Statistic function
+        kwargs : dict
+            Statistic function kwargs
+
+        Returns
+        -------
+        q : float | None
+            Quantile between 0 and 1, None if func is not a supported
+            quantile function or its kwargs are not supported
+        """
+        try:
+            q_kwarg, scale = cls.STREAMING_QUANTILE_FUNCS[func]
+        except (KeyError, TypeError):
+            return None
+
+        if set(kwargs) - {'axis', q_kwarg}:
+            return None
+
+        q = 0.5 if q_kwarg is None else kwargs.get(q_kwarg)
+        if not np.isscalar(q):
+            return None
+
+        return float(q) / scale
+
+    @classmethod
+    def _get_streaming_stats(cls, statistics, quantile_accuracy=None):
+        """
+        Get the streaming engine statistic for each requested statistic
+
+        Parameters
+        ----------
+        statistics : dict
+            Dictionary of statistic functions/kwargs to run
+        quantile_accuracy : float, optional
+            Relative accuracy of approximate quantiles, if None quantile
+            statistics cannot be streamed, by default None
+
+        Returns
+        -------
+        stream_stats : dict | None
+            Dictionary mapping each statistic name to the
+            rex.temporal_stats.streaming.RunningStats statistic, a
+            ('std', ddof) tuple or the quantile to compute, None if any of
+            the statistics cannot be streamed
+        """
+        stream_stats = {}
+        for name, stat in statistics.items():
+            kwargs = stat.get('kwargs', {})
+            if kwargs.get('axis', 0) != 0:
+                return None
+
+            try:
+                stream_stat = cls.STREAMING_FUNCS.get(stat['func'])
+            except TypeError:
+                stream_stat = None
+
+            allowed = {'axis', 'ddof'} if stream_stat == 'std' else {'axis'}
+            if stream_stat is not None and set(kwargs) - allowed:
+                stream_stat = None
+            elif stream_stat == 'std':
+                stream_stat = (stream_stat, cls._get_std_ddof(kwargs))
+
+            if stream_stat is None and quantile_accuracy is not None:
+                stream_stat = cls._get_stream_quantile(stat['func'], kwargs)
+
+            if stream_stat is None:
+                return None
+
+            stream_stats[name] = stream_stat
+
+        return stream_stats
+
+    @staticmethod
+    def _get_groupings(diurnal=False, month=False, combinations=False):
+        """
+        Get the time_index groupings to compute stats for
+
+        Parameters
+        ----------
+        diurnal : bool, optional
+            Extract diurnal stats, by default False
+        month : bool, optional
+            Extract monthly stats, by default False
+        combinations : bool, optional
+            Extract all combinations of temporal stats, by default False
+
+        Returns
+        -------
+        groupings : list
+            List of groupings, in the same order as the columns of the
+            legacy (non-streaming) stats output
+        """
+        if combinations:
+            groupings = [()]
+            if month:
+                groupings.append(('month', ))
+
+            if diurnal:
+                groupings.append(('hour', ))
+
+            if month and diurnal:
+                groupings.append(('month', 'hour'))
+        else:
+            groupings = [tuple(field for field, flag
+                               in (('month', month), ('hour', diurnal))
+                               if flag)]
+
+        return groupings
+
+    @classmethod
+    def _get_time_slices(cls, res, dataset, n_steps):
+        """
+        Get the time slices to stream, aligned with the dataset chunks
+
+        Parameters
+        ----------
+        res : rex.Resource
+            Open Resource class or sub-class to extract dataset from
+        dataset : str
+            Dataset to extract
+        n_steps : int
+            Number of time steps in the dataset
+
+        Returns
+        -------
+        time_slices : list
+            List of time slices
+        """
+        step = cls.STREAM_STEPS
+        try:
+            chunks = res.get_dset_properties(dataset)[2]
+        except Exception:
+            chunks = None
+
+        if chunks:
+            step = max(1, int(round(step / chunks[0]))) * chunks[0]
+
+        return [slice(i, min(i + step, n_steps))
+                for i in range(0, n_steps, step)]
+
+    @classmethod
+    def _stream_engine(cls, res, dataset, time_index, sites_slice,
+                       groupings, mask_zeros=False, quantile_accuracy=None):
+        """
+        Stream a dataset through the single-pass streaming engine
+
+        Parameters
+        ----------
+        res : rex.Resource
+            Open Resource class or sub-class to extract dataset from
+        dataset : str
+            Dataset to extract stats for
+        time_index : pandas.DatatimeIndex
+            Resource DatetimeIndex
+        sites_slice : slice | list | ndarray
+            Sites to extract
+        groupings : list
+            Groupings to compute stats for, see _get_groupings
+        mask_zeros : bool
+            Flag to only calculate stats when all data is > 0
+        quantile_accuracy : float, optional
+            Relative accuracy of approximate quantiles, if None quantiles
+            are not tracked, by default None
+
+        Returns
+        -------
+        engine : rex.temporal_stats.streaming.StreamingStats
+            Streaming engine containing the partial aggregates of the data
+        """
+        engine = None
+        for time_slice in cls._get_time_slices(res, dataset, len(time_index)):
+            data = res[dataset, time_slice, sites_slice]
+            if mask_zeros:
+                data = np.where(data == 0, np.nan, data)
+
+            if engine is None:
+                engine = StreamingStats(time_index, data.shape[1],
+                                        groupings=groupings,
+                                        quantile_accuracy=quantile_accuracy)
+
+            engine.update(data, time_slice)
+
+        if engine is None:
+            n_sites = len(np.arange(res.shape[1])[sites_slice])
+            engine = StreamingStats(time_index, n_sites, groupings=groupings,
+                                    quantile_accuracy=quantile_accuracy)
+
+        return engine
+
+    @classmethod
+    def _format_stream_stats(cls, engine, stream_stats, groupings):
+        """
+        Get statistics from the streaming engine in the legacy stats format
+
+        Parameters
+        ----------
+        engine : rex.temporal_stats.streaming.StreamingStats
+            Streaming engine to get statistics from
+        stream_stats : dict
+            Dictionary mapping each statistic name to the streaming engine
+            statistic to compute, see _get_streaming_stats
+        groupings : list
+            Groupings to get stats for, see _get_groupings
+
+        Returns
+        -------
+        res_stats : pandas.DataFrame
+            DataFrame of desired statistics at desired time intervals
+        """
+        res_stats = []
+        for grouping in groupings:
+            stats = {s for s in stream_stats.values()
+                     if not isinstance(s, tuple)}
+            keys, values = engine.get_stats(grouping, stats)
+            for stat, ddof in {s for s in stream_stats.values()
+                               if isinstance(s, tuple)}:
+                values[(stat, ddof)] = engine.get_stats(
+                    grouping, [stat], ddof=ddof)[1][stat]
+
+            if keys:
+                columns_map = cls._create_names(keys, list(stream_stats))
+            elif keys is not None:
+                # no time steps, so no groups
+                columns_map = {name: [] for name in stream_stats}
+
+            for name, stream_stat in stream_stats.items():
+                columns = columns_map[name] if keys is not None else [name]
+                res_stats.append(pd.DataFrame(values[stream_stat].T,
+                                              columns=columns))
+
+        res_stats = pd.concat(res_stats, axis=1)
+
+        return res_stats
+
+    @classmethod
+    def _stream_stats(cls, res, dataset, stream_stats, time_index,
+                      sites_slice, groupings, mask_zeros=False,
+                      quantile_accuracy=None):
+        """
+        Compute statistics with the single-pass streaming engine
+
+        Parameters
+        ----------
+        res : rex.Resource
+            Open Resource class or sub-class to extract dataset from
+        dataset : str
+            Dataset to extract stats for
+        stream_stats : dict
+            Dictionary mapping each statistic name to the streaming engine
+            statistic to compute, see _get_streaming_stats
+        time_index : pandas.DatatimeIndex
+            Resource DatetimeIndex
+        sites_slice : slice | list | ndarray
+            Sites to extract
+        groupings : list
+            Groupings to compute stats for, see _get_groupings
+        mask_zeros : bool
+            Flag to only calculate stats when all data is > 0
+        quantile_accuracy : float, optional
+            Relative accuracy of approximate quantiles, required if any of
+            the stream_stats are quantiles, by default None
+
+        Returns
+        -------
+        res_stats : pandas.DataFrame
+            DataFrame of desired statistics at desired time intervals
+        """
+        engine = cls._stream_engine(res, dataset, time_index, sites_slice,
+                                    groupings, mask_zeros=mask_zeros,
+                                    quantile_accuracy=quantile_accuracy)
+
+        return cls._format_stream_stats(engine, stream_stats, groupings)
+
+    @classmethod
+    def _extract_partial_stats(cls, res_h5, dataset, res_cls=Resource,
+                               hsds=False, time_index=None,
+                               sites_slice=None, groupings=((), ),
+                               mask_zeros=False, quantile_accuracy=None):
+        """
+        Extract mergeable partial aggregates for given dataset and sites
+
+        Parameters
+        ----------
+        res_h5 : str
+            Path to resource h5 file(s)
+        dataset : str
+            Dataset to extract partial aggregates for
+        res_cls : Class, optional
+            Resource class to use to access res_h5, by default Resource
+        hsds : bool, optional
+            Boolean flag to use h5pyd to handle .h5 'files' hosted on AWS
+            behind HSDS, by default False
+        time_index : pandas.DatatimeIndex | None, optional
+            Resource DatetimeIndex, if None extract from res_h5,
+            by default None
+        sites_slice : slice | None, optional
+            Sites to extract, if None all, by default None
+        groupings : list, optional
+            Groupings to compute stats for, see _get_groupings,
+            by default ((), )
+        mask_zeros : bool
+            Flag to only calculate stats when all data is > 0
+        quantile_accuracy : float, optional
+            Relative accuracy of approximate quantiles, if None quantiles
+            are not tracked, by default None
+
+        Returns
+        -------
+        engine : rex.temporal_stats.streaming.StreamingStats
+            Streaming engine containing the partial aggregates of the data
+        """
+        if sites_slice is None:
+            sites_slice = slice(None, None, None)
+
+        with res_cls(res_h5, hsds=hsds) as f:
+            if time_index is None:
+                time_index = f.time_index
+
+            engine = cls._stream_engine(f, dataset, time_index, sites_slice,
+                                        groupings, mask_zeros=mask_zeros,
+                                        quantile_accuracy=quantile_accuracy)
+
+        return engine
+
     @classmethod
     def _extract_stats(cls, res_h5, statistics, dataset, res_cls=Resource,
                        hsds=False, time_index=None, sites_slice=None,
                        diurnal=False, month=False, combinations=False,
-                       mask_zeros=False):
+                       mask_zeros=False, streaming=True,
+                       quantile_accuracy=None, keep_open=False):
         """
         Extract stats for given dataset, sites, and temporal extent
 
@@ -546,6 +1006,16 @@ class TemporalStats:
         mask_zeros : bool
             Flag to only calculate stats when all data is > 0 (useful for
             global horizontal irradiance).
+        streaming : bool, optional
+            Flag to use the single-pass streaming engine if all statistics
+            support it, by default True
+        quantile_accuracy : float, optional
+            Relative accuracy of approximate streaming quantiles, if None
+            quantiles are computed exactly, by default None
+        keep_open : bool, optional
+            Flag to re-use a res_h5 handler that stays open for the life of
+            the (worker) process, see
+            rex.utilities.worker_pool.get_worker_resource, by default False
 
         Returns
         -------
@@ -555,10 +1025,32 @@ class TemporalStats:
         if sites_slice is None:
             sites_slice = slice(None, None, None)
 
-        with res_cls(res_h5, hsds=hsds) as f:
+        if keep_open:
+            res = nullcontext(get_worker_resource(res_cls, res_h5, hsds=hsds))
+        else:
+            res = res_cls(res_h5, hsds=hsds)
+
+        groupings = cls._get_groupings(diurnal=diurnal, month=month,
+                                       combinations=combinations)
+        stream_stats = None
+        if streaming:
+            stream_stats = cls._get_streaming_stats(
+                statistics, quantile_accuracy=quantile_accuracy)
+
+        with res as f:
             if time_index is None:
                 time_index = f.time_index
 
+            if stream_stats is not None:
+                res_stats = cls._stream_stats(
+                    f, dataset, stream_stats, time_index, sites_slice,
+                    groupings, mask_zeros=mask_zeros,
+                    quantile_accuracy=quantile_accuracy)
+                res_stats.index = cls._create_index(sites_slice)
+                res_stats.index.name = 'gid'
+
+                return res_stats
+
             res_data = pd.DataFrame(f[dataset, :, sites_slice],
                                     index=time_index)
 
@@ -572,29 +1064,164 @@ class TemporalStats:
                                                    time_index)
                     statistics[s]['kwargs']['weights'] = weights
 
-        if combinations:
-            res_stats = [cls._compute_stats(res_data, statistics)]
-            if month:
-                res_stats.append(cls._compute_stats(res_data, statistics,
-                                                    month=True))
-
-            if diurnal:
-                res_stats.append(cls._compute_stats(res_data, statistics,
-                                                    diurnal=True))
-            if month and diurnal:
-                res_stats.append(cls._compute_stats(res_data, statistics,
-                                                    month=True, diurnal=True))
-
-            res_stats = pd.concat(res_stats, axis=1)
-        else:
-            res_stats = cls._compute_stats(res_data, statistics,
-                                           diurnal=diurnal, month=month)
+        res_stats = [cls._compute_stats(res_data, statistics,
+                                        diurnal='hour' in grouping,
+                                        month='month' in grouping)
+                     for grouping in groupings]
+        res_stats = pd.concat(res_stats, axis=1)
 
         res_stats.index = cls._create_index(sites_slice)
         res_stats.index.name = 'gid'
 
         return res_stats
 
+    @classmethod
+    def _get_stats_columns(cls, statistics, time_index, diurnal=False,
+                           month=False, combinations=False):
+        """
+        Get the output columns of the statistics
+
+        Parameters
+        ----------
+        statistics : dict
+            Dictionary of statistic functions/kwargs to run
+        time_index : pandas.DatatimeIndex
+            Resource DatetimeIndex
+        diurnal : bool, optional
+            Extract diurnal stats, by default False
+        month : bool, optional
+            Extract monthly stats, by default False
+        combinations : bool, optional
+            Extract all combinations of temporal stats, by default False
+
+        Returns
+        -------
+        columns : list | None
+            Output column names, None if any of the statistics does not
+            return a single value per site and group
+        """
+        for stat in statistics.values():
+            func = stat['func']
+            try:
+                scalar = (func in cls.STREAMING_FUNCS
+                          or func in cls.GROUP_REDUCE_FUNCS)
+            except TypeError:
+                scalar = False
+
+            if not scalar and cls._get_stream_quantile(
+                    func, stat.get('kwargs', {})) is None:
+                return None
+
+        columns = []
+        groupings = cls._get_groupings(diurnal=diurnal, month=month,
+                                       combinations=combinations)
+        for grouping in groupings:
+            _, keys = StreamingStats.get_group_codes(time_index, grouping)
+            if keys is None:
+                columns += list(statistics)
+            else:
+                columns_map = cls._create_names(keys, list(statistics))
+                for name in statistics:
+                    columns += columns_map[name]
+
+        return columns
+
+    @classmethod
+    def _extract_shared_stats(cls, out, rows, columns, res_h5, statistics,
+                              dataset, **kwargs):
+        """
+        Extract stats for given dataset and sites on a long-lived worker
+        and write them into a shared memory array
+
+        Parameters
+        ----------
+        out : rex.utilities.worker_pool.SharedArray
+            Shared (n_sites, n_columns) array of statistics
+        rows : slice
+            Rows of out to write the statistics of sites_slice to
+        columns : list
+            Column names of out, see _get_stats_columns
+        res_h5 : str
+            Path to resource h5 file(s)
+        statistics : dict
+            Statistics to extract a dictionary of the form
+            {'stat_name': {'func': *, 'kwargs: {**}}}
+        dataset : str
+            Dataset to extract stats for
+        kwargs : dict
+            Additional kwargs for _extract_stats, the time_index is decoded
+            from the worker's open res_h5 handler
+
+        Returns
+        -------
+        n_sites : int
+            Number of sites written to out
+        """
+        res_stats = cls._extract_stats(res_h5, statistics, dataset,
+                                       keep_open=True, **kwargs)
+        out.array[rows] = res_stats[columns].values
+        out.close()
+
+        return len(res_stats)
+
+    def _compute_shared_stats(self, dataset, slices, columns, max_workers,
+                              **kwargs):
+        """
+        Compute statistics in parallel with long-lived workers writing into
+        a preallocated shared memory result array
+
+        Parameters
+        ----------
+        dataset : str
+            Dataset to extract stats for
+        slices : list
+            List of sites slices to extract
+        columns : list
+            Output column names, see _get_stats_columns
+        max_workers : int
+            Number of workers to use
+        kwargs : dict
+            Additional kwargs for _extract_stats
+
+        Returns
+        -------
+        res_stats : pandas.DataFrame
+            DataFrame of desired statistics at desired time intervals
+        """
+        gids = [np.asarray(self._create_index(s)) for s in slices]
+        rows = np.cumsum([0] + [len(g) for g in gids])
+        gids = np.concatenate(gids)
+
+        msg = ('Extracting {} for {} in parallel using {} workers and a '
+               'shared memory result array of shape {}'
+               .format(list(self.statistics), dataset, max_workers,
+                       (len(gids), len(columns))))
+        logger.info(msg)
+
+        loggers = [__name__, 'rex']
+        with SharedArray((len(gids), len(columns)), fill=np.nan) as out:
+            with SpawnProcessPool(max_workers=max_workers,
+                                  loggers=loggers) as exe:
+                futures = []
+                for i, sites_slice in enumerate(slices):
+                    future = exe.submit(self._extract_shared_stats, out,
+                                        slice(rows[i], rows[i + 1]),
+                                        columns, self.res_h5, self.statistics,
+                                        dataset, res_cls=self.res_cls,
+                                        hsds=self._hsds,
+                                        sites_slice=sites_slice, **kwargs)
+                    futures.append(future)
+
+                for i, future in enumerate(as_completed(futures)):
+                    future.result()
+                    logger.debug('Completed {} out of {} workers'
+                                 .format((i + 1), len(futures)))
+
+            res_stats = pd.DataFrame(out.array.copy(), columns=columns,
+                                     index=pd.Index(gids, name='gid'))
+
+        return res_stats
+
     def _get_slices(self, dataset, sites=None, chunks_per_slice=5):
         """
         Get slices to extract
@@ -628,7 +1255,8 @@ class TemporalStats:
 
         return slices
 
-    def _check_stats(self, statistics):
+    @classmethod
+    def _check_stats(cls, statistics):
         """
         check desired statistics to make sure inputs are valid
 
@@ -648,7 +1276,7 @@ class TemporalStats:
             statistics = (statistics, )
 
         if isinstance(statistics, (tuple, list)):
-            statistics = {s: self.STATS[s] for s in statistics}
+            statistics = {s: cls.STATS[s] for s in statistics}
 
         for stat in statistics.values():
             msg = 'A "func"(tion) must be provided for each statistic'
@@ -704,7 +1332,20 @@ class TemporalStats:
         if len(slices) == 1:
             max_workers = 1
 
-        if max_workers > 1:
+        columns = None
+        if max_workers > 1 and self._shared_memory:
+            columns = self._get_stats_columns(self.statistics,
+                                              self.time_index,
+                                              diurnal=diurnal, month=month,
+                                              combinations=combinations)
+
+        if columns is not None:
+            res_stats = [self._compute_shared_stats(
+                dataset, slices, columns, max_workers, diurnal=diurnal,
+                month=month, combinations=combinations,
+                mask_zeros=mask_zeros, streaming=self._streaming,
+                quantile_accuracy=self._quantile_accuracy)]
+        elif max_workers > 1:
             msg = ('Extracting {} for {} in parallel using {} workers'
                    .format(list(self.statistics), dataset, max_workers))
             logger.info(msg)
@@ -723,7 +1364,10 @@ class TemporalStats:
                                         diurnal=diurnal,
                                         month=month,
                                         combinations=combinations,
-                                        mask_zeros=mask_zeros)
+                                        mask_zeros=mask_zeros,
+                                        streaming=self._streaming,
+                                        quantile_accuracy=(
+                                            self._quantile_accuracy))
                     futures.append(future)
 
                 res_stats = []
@@ -743,7 +1387,8 @@ class TemporalStats:
                     time_index=self.time_index, sites_slice=sites_slice,
                     diurnal=diurnal, month=month,
                     combinations=combinations,
-                    mask_zeros=mask_zeros))
+                    mask_zeros=mask_zeros, streaming=self._streaming,
+                    quantile_accuracy=self._quantile_accuracy))
                 logger.debug('Completed {} out of {} sets of sites'
                              .format((i + 1), len(slices)))
 
@@ -760,6 +1405,154 @@ class TemporalStats:
 
         return res_stats
 
+    @staticmethod
+    def _get_partial_meta(res_h5, dataset, groupings, mask_zeros=False,
+                          quantile_accuracy=None):
+        """
+        Get the meta data that identifies partial aggregates of res_h5
+
+        Parameters
+        ----------
+        res_h5 : str
+            Path to resource h5 file
+        dataset : str
+            Dataset partial aggregates are computed for
+        groupings : list
+            Groupings partial aggregates are computed for
+        mask_zeros : bool
+            Flag to only calculate stats when all data is > 0
+        quantile_accuracy : float, optional
+            Relative accuracy of approximate quantile statistics,
+            by default None
+
+        Returns
+        -------
+        meta : dict
+            JSON serializable meta data, source is None if res_h5 is not a
+            local file
+        """
+        meta = {'source': SidecarCache.file_signature(res_h5),
+                'dataset': dataset,
+                'groupings': groupings,
+                'mask_zeros': mask_zeros,
+                'quantile_accuracy': quantile_accuracy}
+
+        return json.loads(json.dumps(meta))
+
+    @staticmethod
+    def _load_partial_stats(fpath, meta):
+        """
+        Load saved partial aggregates if they were computed from the current
+        version of the source file with the same inputs
+
+        Parameters
+        ----------
+        fpath : str | None
+            Path to .npz file of saved partial aggregates
+        meta : dict
+            Meta data that identifies the requested partial aggregates, see
+            _get_partial_meta
+
+        Returns
+        -------
+        engine : rex.temporal_stats.streaming.StreamingStats | None
+            Saved partial aggregates, None if they do not exist or do not
+            match meta
+        """
+        if (fpath is None or meta['source'] is None
+                or not os.path.exists(fpath)
+                or StreamingStats.load_meta(fpath) != meta):
+            return None
+
+        return StreamingStats.load(fpath)
+
+    def compute_partial_stats(self, dataset, out_fpath=None, diurnal=False,
+                              month=False, combinations=False,
+                              max_workers=None, chunks_per_worker=5,
+                              mask_zeros=False):
+        """
+        Compute mergeable partial aggregates (count, mean, sum of squared
+        deviations, min, max and quantile sketches if quantile_accuracy was
+        provided) of dataset for all sites. Partial aggregates of different
+        files, e.g. different years, can be merged with
+        StreamingStats.merge to compute multi-year statistics without
+        re-reading every file, see TemporalStats.multi_year.
+
+        Parameters
+        ----------
+        dataset : str
+            Dataset to extract partial aggregates for
+        out_fpath : str, optional
+            Path to .npz file to save the partial aggregates to. If the file
+            already exists and was computed from the current version of
+            res_h5 with the same inputs, it is loaded instead of being
+            re-computed, by default None
+        diurnal : bool, optional
+            Extract diurnal stats, by default False
+        month : bool, optional
+            Extract monthly stats, by default False
+        combinations : bool, optional
+            Extract all combinations of temporal stats, by default False
+        max_workers : None | int, optional
+            Number of workers to use, if 1 run in serial, if None use all
+            available cores, by default None
+        chunks_per_worker : int, optional
+            Number of chunks to extract on each worker, by default 5
+        mask_zeros : bool
+            Flag to only calculate stats when all data is > 0 (useful for
+            global horizontal irradiance).
+
+        Returns
+        -------
+        engine : rex.temporal_stats.streaming.StreamingStats
+            Streaming engine containing the partial aggregates of res_h5
+        """
+        groupings = self._get_groupings(diurnal=diurnal, month=month,
+                                        combinations=combinations)
+        meta = self._get_partial_meta(
+            self.res_h5, dataset, groupings, mask_zeros=mask_zeros,
+            quantile_accuracy=self._quantile_accuracy)
+        engine = self._load_partial_stats(out_fpath, meta)
+        if engine is not None:
+            logger.info('Loading partial aggregates of {} in {} from {}'
+                        .format(dataset, self.res_h5, out_fpath))
+            return engine
+
+        if max_workers is None:
+            max_workers = os.cpu_count()
+
+        slices = self._get_slices(dataset, chunks_per_slice=chunks_per_worker)
+        if len(slices) == 1:
+            max_workers = 1
+
+        kwargs = {'res_cls': self.res_cls, 'hsds': self._hsds,
+                  'time_index': self.time_index, 'groupings': groupings,
+                  'mask_zeros': mask_zeros,
+                  'quantile_accuracy': self._quantile_accuracy}
+        logger.info('Computing partial aggregates of {} in {} using {} '
+                    'workers'.format(dataset, self.res_h5, max_workers))
+        if max_workers > 1:
+            loggers = [__name__, 'rex']
+            with SpawnProcessPool(max_workers=max_workers,
+                                  loggers=loggers) as exe:
+                futures = [exe.submit(self._extract_partial_stats,
+                                      self.res_h5, dataset,
+                                      sites_slice=sites_slice, **kwargs)
+                           for sites_slice in slices]
+                engines = [future.result() for future in futures]
+        else:
+            engines = [self._extract_partial_stats(self.res_h5, dataset,
+                                                   sites_slice=sites_slice,
+                                                   **kwargs)
+                       for sites_slice in slices]
+
+        engine = StreamingStats.concat(engines)
+        if out_fpath is not None:
+            logger.info('Saving partial aggregates to {}'.format(out_fpath))
+            engine.save(out_fpath, meta=meta)
+
+        return engine
+
     def full_stats(self, dataset, sites=None, max_workers=None,
                    chunks_per_worker=5, lat_lon_only=True, mask_zeros=False):
         """
@@ -1300,3 +2093,139 @@ class TemporalStats:
                             mask_zeros=mask_zeros)
 
         return all_stats
+
+    @classmethod
+    def multi_year(cls, res_h5, dataset, partials_dir, statistics='mean',
+                   diurnal=False, month=False, combinations=False,
+                   res_cls=Resource, hsds=False, max_workers=None,
+                   chunks_per_worker=5, lat_lon_only=True, mask_zeros=False,
+                   quantile_accuracy=None, out_path=None):
+        """
+        Compute multi-year temporal stats by merging the partial aggregates
+        of each file (e.g. year). The partial aggregates of each file are
+        saved to partials_dir and re-used as long as the file does not
+        change (checked against the file signature without opening the
+        file), so when a new year of data is added only that year is read.
+        The meta data is read from the last file.
+        Only statistics supported by the streaming engine (mean, std, min,
+        max and, if quantile_accuracy is provided, quantiles) can be
+        merged.
+
+        Parameters
+        ----------
+        res_h5 : str | list
+            Unix shell style pattern path with * wildcards or list of paths
+            to the resource h5 files, e.g. one file per year as used by
+            MultiYearResource. Files must have the same sites.
+        dataset : str
+            Dataset to extract stats for
+        partials_dir : str
+            Directory to save and load the partial aggregates of each file
+        statistics : str | tuple | dict, optional
+            Statistics to extract, either a key or tuple of keys in
+            cls.STATS, or a dictionary of the form
+            {'stat_name': {'func': *, 'kwargs: {**}}},
+            by default 'mean'
+        diurnal : bool, optional
+            Extract diurnal stats, by default False
+        month : bool, optional
+            Extract monthly stats, by default False
+        combinations : bool, optional
+            Extract all combinations of temporal stats, by default False
+        res_cls : Class, optional
+            Resource class to use to access each file, by default Resource
+        hsds : bool, optional
+            Boolean flag to use h5pyd to handle .h5 'files' hosted on AWS
+            behind HSDS, by default False
+        max_workers : None | int, optional
+            Number of workers to use, if 1 run in serial, if None use all
+            available cores, by default None
+        chunks_per_worker : int, optional
+            Number of chunks to extract on each worker, by default 5
+        lat_lon_only : bool, optional
+            Only append lat, lon coordinates to stats, by default True
+        mask_zeros : bool
+            Flag to only calculate stats when all data is > 0 (useful for
+            global horizontal irradiance).
+        quantile_accuracy : float, optional
+            Relative accuracy of approximate quantile statistics, see
+            TemporalStats, by default None
+        out_path : str, optional
+            Directory, .csv, or .json path to save statistics too,
+            by default None
+
+        Returns
+        -------
+        out_stats : pandas.DataFrame
+            DataFrame of multi-year resource statistics
+        """
+        file_paths = sorted(MultiTimeH5._get_file_paths(res_h5, hsds=hsds))
+        logger.info('Computing multi-year temporal stats for {} in {} files'
+                    .format(dataset, len(file_paths)))
+
+        stats = cls._check_stats(statistics)
+        stream_stats = cls._get_streaming_stats(
+            stats, quantile_accuracy=quantile_accuracy)
+        if stream_stats is None:
+            msg = ('Cannot compute multi-year stats for {}, only statistics '
+                   'supported by the streaming engine can be merged!'
+                   .format(list(stats)))
+            logger.error(msg)
+            raise RuntimeError(msg)
+
+        groupings = cls._get_groupings(diurnal=diurnal, month=month,
+                                       combinations=combinations)
+        kwargs = {'statistics': statistics, 'res_cls': res_cls,
+                  'hsds': hsds, 'quantile_accuracy': quantile_accuracy}
+        engine = None
+        for fp in file_paths:
+            name = os.path.splitext(os.path.basename(fp))[0]
+            name = '{}_{}_partial_stats.npz'.format(name, dataset)
+            partial_fpath = os.path.join(partials_dir, name)
+            # only open files whose saved partial aggregates are missing or
+            # out of date
+            res_stats = None
+            partial = cls._load_partial_stats(
+                partial_fpath,
+                cls._get_partial_meta(fp, dataset, groupings,
+                                      mask_zeros=mask_zeros,
+                                      quantile_accuracy=quantile_accuracy))
+            if partial is None:
+                res_stats = cls(fp, **kwargs)
+                partial = res_stats.compute_partial_stats(
+                    dataset, out_fpath=partial_fpath, diurnal=diurnal,
+                    month=month, combinations=combinations,
+                    max_workers=max_workers,
+                    chunks_per_worker=chunks_per_worker,
+                    mask_zeros=mask_zeros)
+            else:
+                logger.info('Loading partial aggregates of {} in {} from {}'
+                            .format(dataset, fp, partial_fpath))
+
+            if engine is None:
+                engine = partial
+            else:
+                engine.merge(partial)
+
+        out_stats = cls._format_stream_stats(engine, stream_stats, groupings)
+        out_stats.index.name = 'gid'
+
+        if res_stats is None:
+            res_stats = cls(file_paths[-1], **kwargs)
+
+        if lat_lon_only:
+            meta = res_stats.lat_lon
+        else:
+            meta = res_stats.meta
+
+        out_stats = meta.join(out_stats, how='inner')
+
+        if out_path is not None:
+            if os.path.isdir(out_path):
+                name = res_h5 if isinstance(res_h5, str) else file_paths[0]
+                name = os.path.splitext(os.path.basename(name))[0]
+                out_path = os.path.join(out_path, name + '.csv')
+
+            res_stats.save_stats(out_stats, out_path)
+
+        return out_stats
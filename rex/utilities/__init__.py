@@ -4,10 +4,13 @@ rex utilities.
 """
 from .fun_utils import (arg_to_str, has_class, get_class, is_standalone_fun,
                         get_fun_str, get_arg_str, get_fun_call_str)
+from .chunk_cache import ChunkCache
 from .execution import SpawnProcessPool
+from .handle_pool import HandlePool, LazyResource
 from .hpc import SLURM, PBS
 from .loggers import (init_logger, init_mult, setup_logger, log_mem,
                       log_versions, LOGGERS)
+from .sidecar_cache import SidecarCache
 from .solar_position import SolarPosition
 from .toml_parser import TOMLParser
 from .utilities import *
@@ -71,6 +71,43 @@ def sample_q_invlog(n_samples, log_base):
     return quantiles
 
 
+def sample_q(n_samples, sampling='linear', log_base=10):
+    """Sample quantiles from 0 to 1 with one of the sampling options
+
+    Parameters
+    ----------
+    n_samples : int
+        Number of points to sample between 0 and 1
+    sampling : str
+        Option for quantile sampling, e.g., how to sample the y-axis of the
+        distribution. "linear" will do even spacing, "log" will concentrate
+        samples near quantile=0, and "invlog" will concentrate samples near
+        quantile=1
+    log_base : int | float
+        Log base value if sampling is "log" or "invlog". A higher value will
+        concentrate more samples at the extreme sides of the distribution.
+
+    Returns
+    -------
+    quantiles : np.ndarray
+        1D array of samples from 0 to 1
+    """
+    sampling = sampling.casefold()
+    if sampling == 'linear':
+        quantiles = sample_q_linear(n_samples)
+    elif sampling == 'log':
+        quantiles = sample_q_log(n_samples, log_base)
+    elif sampling == 'invlog':
+        quantiles = sample_q_invlog(n_samples, log_base)
+    else:
+        msg = ('sampling option must be linear, log, or invlog, but received: '
+               '{}'.format(sampling))
+        logger.error(msg)
+        raise KeyError(msg)
+
+    return quantiles
+
+
 def sample_cdf(quantiles, x_values, n_samples):
     """Randomly draw a number of real values from a CDF.
 
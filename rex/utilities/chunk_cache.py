@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+Size-bounded LRU cache for decompressed HDF5 dataset chunks
+"""
+from collections import OrderedDict
+import logging
+from threading import RLock
+
+logger = logging.getLogger(__name__)
+
+
+class ChunkCache:
+    """
+    Least-recently-used cache of dataset chunks keyed by
+    (file, dataset, chunk coordinates). A single instance can be shared
+    across all datasets of a Resource handler (or across several handlers)
+    so that repeated reads of the same chunks only hit h5py/h5pyd once.
+
+    Examples
+    --------
+    >>> cache = ChunkCache(max_size=512)
+    >>> with Resource(file, chunk_cache=cache) as res:
+    >>>     for gid in gids:
+    >>>         wspd = res['windspeed_100m', :, gid]
+    >>>
+    >>> cache.hits, cache.misses
+    (9900, 100)
+    """
+
+    def __init__(self, max_size=256):
+        """
+        Parameters
+        ----------
+        max_size : int | float, optional
+            Maximum size of cached chunk data in MB, by default 256
+        """
+        self._max_bytes = int(max_size * 1024 ** 2)
+        self._cache = OrderedDict()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = RLock()
+
+    def __repr__(self):
+        msg = ("{} with {} chunks ({:.2f} of {:.2f} MB), hits={}, misses={}"
+               .format(self.__class__.__name__, len(self),
+                       self.size, self.max_size, self.hits, self.misses))
+
+        return msg
+
+    def __len__(self):
+        return len(self._cache)
+
+    def __contains__(self, key):
+        return key in self._cache
+
+    @property
+    def max_size(self):
+        """
+        Maximum size of cached chunk data in MB
+
+        Returns
+        -------
+        float
+        """
+        return self._max_bytes / 1024 ** 2
+
+    @property
+    def size(self):
+        """
+        Current size of cached chunk data in MB
+
+        Returns
+        -------
+        float
+        """
+        return self._nbytes / 1024 ** 2
+
+    @property
+    def hits(self):
+        """
+        Number of chunk requests served from the cache
+
+        Returns
+        -------
+        int
+        """
+        return self._hits
+
+    @property
+    def misses(self):
+        """
+        Number of chunk requests that had to be read from the dataset
+
+        Returns
+        -------
+        int
+        """
+        return self._misses
+
+    @property
+    def hit_rate(self):
+        """
+        Fraction of chunk requests served from the cache
+
+        Returns
+        -------
+        float
+        """
+        total = self._hits + self._misses
+
+        return self._hits / total if total else 0.0
+
+    def get(self, key):
+        """
+        Get a chunk from the cache, updating the hit/miss counters
+
+        Parameters
+        ----------
+        key : tuple
+            (file, dataset, chunk coordinates) key
+
+        Returns
+        -------
+        arr : ndarray | None
+            Cached chunk array, None if key is not in the cache
+        """
+        with self._lock:
+            arr = self._cache.get(key)
+            if arr is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._cache.move_to_end(key)
+
+        return arr
+
+    def put(self, key, arr):
+        """
+        Add a chunk to the cache, evicting least-recently-used chunks until
+        the cache is within max_size. Chunks larger than max_size are not
+        cached.
+
+        Parameters
+        ----------
+        key : tuple
+            (file, dataset, chunk coordinates) key
+        arr : ndarray
+            Chunk array
+        """
+        if arr.nbytes > self._max_bytes:
+            return
+
+        with self._lock:
+            if key in self._cache:
+                self._nbytes -= self._cache.pop(key).nbytes
+
+            self._cache[key] = arr
+            self._nbytes += arr.nbytes
+            while self._nbytes > self._max_bytes:
+                _, old = self._cache.popitem(last=False)
+                self._nbytes -= old.nbytes
+
+    def clear(self):
+        """
+        Remove all chunks from the cache and reset the hit/miss counters
+        """
+        with self._lock:
+            self._cache.clear()
+            self._nbytes = 0
+            self._hits = 0
+            self._misses = 0
@@ -0,0 +1,369 @@
+# -*- coding: utf-8 -*-
+"""
+Lazily opened resource handlers with a bounded LRU pool of open files
+"""
+from collections import OrderedDict
+from contextlib import contextmanager
+import logging
+from threading import RLock
+
+logger = logging.getLogger(__name__)
+
+
+class HandlePool:
+    """
+    Least-recently-used pool of open resource handlers. Handlers are opened
+    on first use through LazyResource and the least-recently-used handler is
+    closed when more than max_open handlers are open, so handlers over
+    hundreds of files never hold more than max_open files open at once.
+    Handlers that are checked out (e.g. by a reading thread) are not closed
+    until they are returned, so the pool can briefly exceed max_open.
+
+    Examples
+    --------
+    >>> pool = HandlePool(max_open=4)
+    >>> handles = [LazyResource(Resource, fp, pool=pool) for fp in files]
+    >>> data = [h['windspeed_100m', :, gid] for h in handles]
+    >>> len(pool), pool.opened
+    (4, 30)
+    """
+
+    def __init__(self, max_open=None):
+        """
+        Parameters
+        ----------
+        max_open : int, optional
+            Maximum number of open handlers, None for no limit, by default
+            None
+        """
+        if max_open is not None and max_open < 1:
+            msg = 'max_open must be at least 1, got {}'.format(max_open)
+            logger.error(msg)
+            raise ValueError(msg)
+
+        self._max_open = max_open
+        self._handlers = OrderedDict()
+        self._in_use = {}
+        self._opened = 0
+        self._lock = RLock()
+
+    def __repr__(self):
+        msg = ("{} with {} of {} handlers open, opened={}"
+               .format(self.__class__.__name__, len(self), self.max_open,
+                       self.opened))
+
+        return msg
+
+    def __len__(self):
+        return len(self._handlers)
+
+    def __contains__(self, handle):
+        return id(handle) in self._handlers
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+        if type is not None:
+            raise
+
+    @property
+    def max_open(self):
+        """
+        Maximum number of open handlers, None for no limit
+
+        Returns
+        -------
+        int | None
+        """
+        return self._max_open
+
+    @property
+    def opened(self):
+        """
+        Number of times a handler was opened by the pool (including
+        re-opens after eviction)
+
+        Returns
+        -------
+        int
+        """
+        return self._opened
+
+    def get(self, handle):
+        """
+        Get the open handler of a LazyResource, opening it (and closing the
+        least-recently-used handler if the pool is full) if needed
+
+        Parameters
+        ----------
+        handle : LazyResource
+            Lazy resource handle
+
+        Returns
+        -------
+        res : rex.Resource
+            Open resource handler
+        """
+        key = id(handle)
+        with self._lock:
+            item = self._handlers.get(key)
+            if item is not None:
+                self._handlers.move_to_end(key)
+                return item[1]
+
+            logger.debug('Opening {}'.format(handle))
+            res = handle.open()
+            self._opened += 1
+            self._handlers[key] = (handle, res)
+            self._evict(keep=key)
+
+        return res
+
+    @contextmanager
+    def checkout(self, handle):
+        """
+        Context manager to use the open handler of a LazyResource without it
+        being closed by other threads opening handlers through the pool
+
+        Parameters
+        ----------
+        handle : LazyResource
+            Lazy resource handle
+
+        Yields
+        ------
+        res : rex.Resource
+            Open resource handler
+        """
+        key = id(handle)
+        with self._lock:
+            self._in_use[key] = self._in_use.get(key, 0) + 1
+
+        try:
+            yield self.get(handle)
+        finally:
+            with self._lock:
+                self._in_use[key] -= 1
+                if not self._in_use[key]:
+                    del self._in_use[key]
+
+                self._evict()
+
+    def _evict(self, keep=None):
+        """
+        Close least-recently-used handlers that are not checked out until the
+        pool is within max_open
+
+        Parameters
+        ----------
+        keep : int, optional
+            Key of a handler to keep open, e.g. the handler that was just
+            opened, by default None
+        """
+        if self._max_open is None:
+            return
+
+        n_close = len(self._handlers) - self._max_open
+        for key in list(self._handlers):
+            if n_close <= 0:
+                break
+
+            if key != keep and key not in self._in_use:
+                handle, res = self._handlers.pop(key)
+                logger.debug('Closing least-recently-used {}'.format(handle))
+                res.close()
+                n_close -= 1
+
+    def release(self, handle):
+        """
+        Close the open handler of a LazyResource (if any) and remove it from
+        the pool
+
+        Parameters
+        ----------
+        handle : LazyResource
+            Lazy resource handle
+        """
+        with self._lock:
+            item = self._handlers.pop(id(handle), None)
+
+        if item is not None:
+            item[1].close()
+
+    def close(self):
+        """
+        Close all open handlers
+        """
+        with self._lock:
+            while self._handlers:
+                _, (_, res) = self._handlers.popitem()
+                res.close()
+
+
+class LazyResource:
+    """
+    Resource handler proxy that does not open its file(s) until an attribute
+    or dataset is accessed. The open handler is held by a HandlePool and can
+    be closed by the pool at any time, in which case the next access simply
+    re-opens it.
+
+    Examples
+    --------
+    >>> h5 = LazyResource(WindResource, file, pool=HandlePool(max_open=8))
+    >>> h5.is_open
+    False
+    >>> wspd = h5['windspeed_100m', :, gid]  # opens the file
+    >>> h5.is_open
+    True
+    """
+
+    def __init__(self, res_cls, res_h5, pool=None, **res_cls_kwargs):
+        """
+        Parameters
+        ----------
+        res_cls : Class
+            Resource class to open res_h5 with
+        res_h5 : str | list
+            Path to resource h5 file(s)
+        pool : HandlePool, optional
+            Pool of open handlers to open res_h5 through, by default None
+            (a private pool without a limit)
+        res_cls_kwargs : dict
+            Kwargs for res_cls
+        """
+        self._res_cls = res_cls
+        self._res_h5 = res_h5
+        self._res_cls_kwargs = res_cls_kwargs
+        self._pool = pool if pool is not None else HandlePool()
+
+    def __repr__(self):
+        msg = ("{} of {} for {}"
+               .format(self.__class__.__name__, self.res_cls.__name__,
+                       self.res_h5))
+
+        return msg
+
+    def __getattr__(self, attr):
+        private = ('_res_cls', '_res_h5', '_res_cls_kwargs', '_pool')
+        if attr.startswith('__') or attr in private:
+            raise AttributeError(attr)
+
+        return getattr(self.handler, attr)
+
+    def __getitem__(self, keys):
+        return self.handler[keys]
+
+    def __contains__(self, dset):
+        return dset in self.handler
+
+    def __len__(self):
+        return len(self.handler)
+
+    def __iter__(self):
+        return iter(self.handler)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+        if type is not None:
+            raise
+
+    @property
+    def res_cls(self):
+        """
+        Resource class used to open res_h5
+
+        Returns
+        -------
+        Class
+        """
+        return self._res_cls
+
+    @property
+    def res_h5(self):
+        """
+        Path to resource h5 file(s)
+
+        Returns
+        -------
+        str | list
+        """
+        return self._res_h5
+
+    @property
+    def res_cls_kwargs(self):
+        """
+        Kwargs for res_cls
+
+        Returns
+        -------
+        dict
+        """
+        return self._res_cls_kwargs
+
+    @property
+    def pool(self):
+        """
+        Pool of open handlers this handle is opened through
+
+        Returns
+        -------
+        HandlePool
+        """
+        return self._pool
+
+    @property
+    def is_open(self):
+        """
+        Flag for whether the handler is currently open
+
+        Returns
+        -------
+        bool
+        """
+        return self in self._pool
+
+    @property
+    def handler(self):
+        """
+        Open resource handler, opened (or re-opened) on access
+
+        Returns
+        -------
+        rex.Resource
+        """
+        return self._pool.get(self)
+
+    def open(self):
+        """
+        Open a new instance of the resource handler. Use the handler
+        property to open the handler through the pool.
+
+        Returns
+        -------
+        rex.Resource
+        """
+        return self.res_cls(self.res_h5, **self.res_cls_kwargs)
+
+    def checkout(self):
+        """
+        Context manager to use the open handler without it being closed by
+        other threads, see HandlePool.checkout
+
+        Returns
+        -------
+        contextmanager
+        """
+        return self._pool.checkout(self)
+
+    def close(self):
+        """
+        Close the handler if it is open
+        """
+        self._pool.release(self)
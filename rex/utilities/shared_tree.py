@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+Share pre-computed cKDTrees between processes through memory mapped files
+"""
+import json
+import logging
+import os
+
+import numpy as np
+import scipy
+from scipy.spatial import cKDTree
+
+from rex.utilities.exceptions import (FileInputError, ResourceRuntimeError,
+                                      ResourceValueError)
+
+logger = logging.getLogger(__name__)
+
+META_FILE = 'tree.json'
+NODES_FILE = 'nodes.npy'
+DATA_FILE = 'data.npy'
+INDICES_FILE = 'indices.npy'
+# number of fields in the (private) cKDTree.__getstate__ tuple this module
+# reads and writes: (nodes, data, n, m, leafsize, maxes, mins, indices,
+# boxsize, boxsize_data)
+STATE_LEN = 10
+
+
+def _check_state(state):
+    """
+    Check that a cKDTree state has the layout this module relies on
+
+    Parameters
+    ----------
+    state : tuple
+        cKDTree state from cKDTree.__getstate__
+    """
+    if len(state) != STATE_LEN:
+        msg = ('Cannot share cKDTrees with scipy {}: expected {} fields in '
+               'the cKDTree state but found {}. Build the tree in each '
+               'process instead.'.format(scipy.__version__, STATE_LEN,
+                                         len(state)))
+        logger.error(msg)
+        raise ResourceRuntimeError(msg)
+
+
+def publish_tree(tree, tree_dir):
+    """
+    Save a cKDTree to a directory so that it can be loaded by other
+    processes with load_shared_tree. The tree's coordinate and index arrays
+    are saved as .npy files which every process memory maps, so the
+    operating system page cache holds a single copy of them no matter how
+    many workers load the tree. The tree node buffer is also saved as a
+    .npy file, but cKDTree copies it into each process when it is loaded.
+
+    This relies on the layout of the private cKDTree pickle state, a
+    ResourceRuntimeError is raised if the installed scipy version uses a
+    different layout.
+
+    Parameters
+    ----------
+    tree : cKDTree
+        Pre-computed cKDTree to share
+    tree_dir : str
+        Directory to save the shared tree to, will be created if needed
+
+    Returns
+    -------
+    tree_dir : str
+        Directory containing the shared tree
+    """
+    state = tree.__getstate__()
+    _check_state(state)
+    # pylint: disable=unbalanced-tuple-unpacking
+    (nodes, data, n, m, leafsize, maxes, mins, indices,
+     boxsize, boxsize_data) = state
+    if boxsize is not None or boxsize_data is not None:
+        msg = 'Periodic cKDTrees cannot be shared!'
+        logger.error(msg)
+        raise ResourceValueError(msg)
+
+    os.makedirs(tree_dir, exist_ok=True)
+    np.save(os.path.join(tree_dir, NODES_FILE), nodes)
+    np.save(os.path.join(tree_dir, DATA_FILE), data)
+    np.save(os.path.join(tree_dir, INDICES_FILE), indices)
+
+    meta = {'n': n, 'm': m, 'leafsize': leafsize,
+            'maxes': maxes.tolist(), 'mins': mins.tolist()}
+    # write the meta last, its existence marks a complete shared tree
+    with open(os.path.join(tree_dir, META_FILE), 'w') as f:
+        json.dump(meta, f)
+
+    logger.debug('Published shared cKDTree to {}'.format(tree_dir))
+
+    return tree_dir
+
+
+def is_shared_tree(tree_dir):
+    """
+    Check if a path is a directory containing a shared tree
+
+    Parameters
+    ----------
+    tree_dir : str
+        Path to check
+
+    Returns
+    -------
+    bool
+    """
+    return (isinstance(tree_dir, str)
+            and os.path.isfile(os.path.join(tree_dir, META_FILE)))
+
+
+def load_shared_tree(tree_dir):
+    """
+    Load a cKDTree saved with publish_tree. The tree's coordinate and index
+    arrays are memory mapped (read-only) instead of being copied into the
+    process. cKDTree.__setstate__ always copies the tree node buffer into
+    its own (private) node storage, so the node buffer cannot be shared
+    and is the only part of the tree each process holds in memory. It is
+    read through a memory map so that it is only copied once.
+
+    A ResourceRuntimeError is raised if the installed scipy version uses a
+    different cKDTree state layout than publish_tree.
+
+    Parameters
+    ----------
+    tree_dir : str
+        Directory containing the shared tree
+
+    Returns
+    -------
+    tree : cKDTree
+        cKDTree backed by the memory mapped arrays in tree_dir
+    """
+    if not is_shared_tree(tree_dir):
+        msg = '{} does not contain a shared cKDTree!'.format(tree_dir)
+        logger.error(msg)
+        raise FileInputError(msg)
+
+    with open(os.path.join(tree_dir, META_FILE)) as f:
+        meta = json.load(f)
+
+    # copied by cKDTree.__setstate__, read it straight from the page cache
+    nodes = np.load(os.path.join(tree_dir, NODES_FILE), mmap_mode='r')
+    data = np.load(os.path.join(tree_dir, DATA_FILE), mmap_mode='r')
+    indices = np.load(os.path.join(tree_dir, INDICES_FILE), mmap_mode='r')
+
+    state = (nodes, data, meta['n'], meta['m'], meta['leafsize'],
+             np.array(meta['maxes']), np.array(meta['mins']), indices,
+             None, None)
+
+    _check_state(cKDTree(np.zeros((1, 2))).__getstate__())
+    tree = cKDTree.__new__(cKDTree)
+    tree.__setstate__(state)
+
+    logger.debug('Loaded shared cKDTree from {}'.format(tree_dir))
+
+    return tree
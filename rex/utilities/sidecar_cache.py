@@ -0,0 +1,392 @@
+# -*- coding: utf-8 -*-
+"""
+Persistent on-disk cache of decoded resource file data (meta, time_index)
+"""
+import base64
+import hashlib
+import json
+import logging
+import os
+import pickle
+from contextlib import contextmanager
+from tempfile import NamedTemporaryFile
+from warnings import warn
+
+import numpy as np
+import pandas as pd
+from numpy.lib.format import descr_to_dtype, dtype_to_descr
+
+from rex.utilities.exceptions import ResourceWarning
+from rex.version import __version__
+
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def atomic_write(fpath, mode='wb'):
+    """
+    Open a temporary file next to fpath for writing. The temporary file is
+    atomically moved into place once the block exits without error (and
+    removed otherwise), so concurrent processes never read a partially
+    written file.
+
+    Parameters
+    ----------
+    fpath : str
+        Path to write to
+    mode : str, optional
+        Mode to open the temporary file with, by default 'wb'
+
+    Yields
+    ------
+    f : file
+        Open temporary file
+    """
+    out_dir = os.path.dirname(os.path.abspath(fpath))
+    f = NamedTemporaryFile(mode=mode, dir=out_dir, suffix='.tmp',
+                           delete=False)
+    try:
+        with f:
+            yield f
+
+        os.replace(f.name, fpath)
+    except BaseException:
+        if os.path.exists(f.name):
+            os.remove(f.name)
+
+        raise
+
+
+def _dtype_descr(dtype):
+    """
+    Get the json serializable description of a dtype, without (e.g. h5py
+    string) metadata that json can't store
+
+    Parameters
+    ----------
+    dtype : numpy.dtype
+        dtype to describe
+
+    Returns
+    -------
+    str | list
+    """
+    dtype = np.dtype(dtype.descr if dtype.names else dtype.str)
+
+    return dtype_to_descr(dtype)
+
+
+def _to_json(obj):
+    """
+    Convert a manifest object to a json serializable object. numpy arrays,
+    scalars and dtypes, bytes, tuples and DatetimeIndex objects are tagged so
+    that _from_json can restore them with their original types.
+
+    Parameters
+    ----------
+    obj : object
+        Manifest object
+
+    Returns
+    -------
+    object
+    """
+    if isinstance(obj, dict):
+        return {k: _to_json(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [_to_json(v) for v in obj]
+    elif isinstance(obj, tuple):
+        return {'__tuple__': [_to_json(v) for v in obj]}
+    elif isinstance(obj, pd.DatetimeIndex):
+        return {'__datetimeindex__': obj.asi8.tolist(), 'unit': obj.unit,
+                'tz': None if obj.tz is None else str(obj.tz),
+                'name': obj.name}
+    elif isinstance(obj, np.dtype):
+        return {'__dtype__': _dtype_descr(obj)}
+    elif isinstance(obj, (np.ndarray, np.generic)):
+        arr = np.asarray(obj)
+        if arr.dtype.hasobject:
+            data = [_to_json(v) for v in arr.ravel().tolist()]
+        else:
+            data = base64.b64encode(arr.tobytes()).decode('ascii')
+
+        return {'__ndarray__': data, 'dtype': _dtype_descr(arr.dtype),
+                'shape': list(arr.shape),
+                'scalar': isinstance(obj, np.generic)}
+    elif isinstance(obj, bytes):
+        return {'__bytes__': base64.b64encode(obj).decode('ascii')}
+
+    return obj
+
+
+def _from_json(obj):
+    """
+    Restore the tagged objects of a json manifest, see _to_json
+
+    Parameters
+    ----------
+    obj : dict
+        Decoded json object
+
+    Returns
+    -------
+    object
+    """
+    if '__tuple__' in obj:
+        return tuple(obj['__tuple__'])
+    elif '__datetimeindex__' in obj:
+        values = np.array(obj['__datetimeindex__'],
+                          dtype='datetime64[{}]'.format(obj['unit']))
+        index = pd.DatetimeIndex(values, name=obj['name'])
+        if obj['tz'] is not None:
+            index = index.tz_localize('UTC').tz_convert(obj['tz'])
+
+        return index
+    elif '__dtype__' in obj:
+        return descr_to_dtype(obj['__dtype__'])
+    elif '__ndarray__' in obj:
+        dtype = descr_to_dtype(obj['dtype'])
+        data = obj['__ndarray__']
+        if dtype.hasobject:
+            arr = np.empty(len(data), dtype=dtype)
+            arr[:] = data
+        else:
+            arr = np.frombuffer(base64.b64decode(data), dtype=dtype).copy()
+
+        arr = arr.reshape(obj['shape'])
+
+        return arr[()] if obj['scalar'] else arr
+    elif '__bytes__' in obj:
+        return base64.b64decode(obj['__bytes__'])
+
+    return obj
+
+
+def load_manifest(manifest):
+    """
+    Load a file manifest saved with save_manifest
+
+    Parameters
+    ----------
+    manifest : str | None
+        Path to .json manifest
+
+    Returns
+    -------
+    entries : dict
+        Dictionary mapping file paths to manifest entries, empty if the
+        manifest does not exist, could not be loaded or was saved by a
+        different version of rex
+    """
+    if manifest is None or not os.path.exists(manifest):
+        return {}
+
+    try:
+        with open(manifest) as f:
+            entries = json.load(f, object_hook=_from_json)
+
+        if entries.get('version') != __version__:
+            msg = ('rex version {} does not match manifest version {}'
+                   .format(__version__, entries.get('version')))
+            raise RuntimeError(msg)
+    except Exception as e:
+        msg = 'Could not load file manifest {}: {}'.format(manifest, e)
+        logger.warning(msg)
+        warn(msg, ResourceWarning)
+        return {}
+
+    logger.debug('Loaded file manifest from {}'.format(manifest))
+
+    return entries['files']
+
+
+def save_manifest(manifest, entries):
+    """
+    Atomically save a file manifest as compact json, tagged with the rex
+    version. Manifests are plain json (never pickled) so that loading a
+    manifest from a shared directory cannot execute code.
+
+    Parameters
+    ----------
+    manifest : str
+        Path to .json manifest
+    entries : dict
+        Dictionary mapping file paths to manifest entries, see _to_json for
+        the supported value types
+    """
+    try:
+        with atomic_write(manifest, mode='w') as f:
+            json.dump(_to_json({'version': __version__, 'files': entries}),
+                      f, separators=(',', ':'))
+    except Exception as e:
+        msg = 'Could not save file manifest {}: {}'.format(manifest, e)
+        logger.warning(msg)
+        warn(msg, ResourceWarning)
+    else:
+        logger.debug('Saved file manifest to {}'.format(manifest))
+
+
+class SidecarCache:
+    """
+    Cache of decoded resource file objects (e.g. the meta DataFrame or the
+    time_index DatetimeIndex) pickled to a shared directory. Cache entries
+    are keyed on a hash of the source file's path, size and modification
+    time plus the dataset name and decoding options, so entries are
+    invalidated automatically when the source file changes. Only local files
+    can be cached.
+
+    Examples
+    --------
+    >>> with Resource(file, cache_dir='/scratch/rex_cache') as res:
+    >>>     meta = res.meta  # decoded and cached on the first open
+    >>>
+    >>> with Resource(file, cache_dir='/scratch/rex_cache') as res:
+    >>>     meta = res.meta  # loaded from the cache
+    """
+
+    EXT = '.pkl'
+
+    def __init__(self, cache_dir):
+        """
+        Parameters
+        ----------
+        cache_dir : str
+            Directory to store cached objects in, will be created if needed
+        """
+        self._cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def __repr__(self):
+        msg = "{} in {}".format(self.__class__.__name__, self.cache_dir)
+
+        return msg
+
+    @property
+    def cache_dir(self):
+        """
+        Cache directory
+
+        Returns
+        -------
+        str
+        """
+        return self._cache_dir
+
+    @staticmethod
+    def file_signature(fpath):
+        """
+        Get the (path, size, modification time) signature of a local file
+
+        Parameters
+        ----------
+        fpath : str
+            Path to source file
+
+        Returns
+        -------
+        signature : tuple | None
+            (absolute path, size in bytes, mtime in ns), None if fpath is not
+            a local file
+        """
+        if not isinstance(fpath, str) or not os.path.isfile(fpath):
+            return None
+
+        stat = os.stat(fpath)
+
+        return (os.path.abspath(fpath), stat.st_size, stat.st_mtime_ns)
+
+    def get_key(self, fpath, *args):
+        """
+        Get the cache key for an object derived from fpath
+
+        Parameters
+        ----------
+        fpath : str
+            Path to source file
+        args : tuple
+            Additional arguments that identify the cached object, e.g.
+            dataset name and decoding options
+
+        Returns
+        -------
+        key : str | None
+            Hex digest cache key, None if fpath cannot be cached
+        """
+        signature = self.file_signature(fpath)
+        if signature is None:
+            return None
+
+        key = (signature + tuple(args) + (__version__, pd.__version__))
+
+        return hashlib.sha1(repr(key).encode()).hexdigest()
+
+    def get_path(self, key):
+        """
+        Get the file path of a cache entry
+
+        Parameters
+        ----------
+        key : str
+            Cache key
+
+        Returns
+        -------
+        str
+        """
+        return os.path.join(self.cache_dir, key + self.EXT)
+
+    def load(self, key):
+        """
+        Load an object from the cache
+
+        Parameters
+        ----------
+        key : str
+            Cache key
+
+        Returns
+        -------
+        obj : object | None
+            Cached object, None if key is not in the cache or the entry could
+            not be loaded
+        """
+        path = self.get_path(key)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, 'rb') as f:
+                obj = pickle.load(f)
+        except Exception as e:
+            msg = 'Could not load cached object from {}: {}'.format(path, e)
+            logger.warning(msg)
+            warn(msg, ResourceWarning)
+            return None
+
+        logger.debug('Loaded cached object from {}'.format(path))
+
+        return obj
+
+    def save(self, key, obj):
+        """
+        Save an object to the cache. The object is written to a temporary
+        file that is then atomically moved into place, so concurrent
+        processes never read a partially written entry.
+
+        Parameters
+        ----------
+        key : str
+            Cache key
+        obj : object
+            Object to cache, must be picklable
+        """
+        path = self.get_path(key)
+        try:
+            with atomic_write(path) as f:
+                pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            msg = 'Could not cache object to {}: {}'.format(path, e)
+            logger.warning(msg)
+            warn(msg, ResourceWarning)
+        else:
+            logger.debug('Cached object to {}'.format(path))
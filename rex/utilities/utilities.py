@@ -953,6 +953,56 @@ def res_dist_threshold(lat_lons, tree=None, margin=1.05):
     return margin * (2 ** 0.5) * (dists.max() / 2)
 
 
+def lat_lon_to_xyz(lat_lon):
+    """
+    Convert (lat, lon) coordinates in degrees to 3D unit vectors. Euclidean
+    (chord) distances between unit vectors increase monotonically with
+    great circle distance, so nearest neighbor searches on the unit vectors
+    (e.g. with a cKDTree) are correct at all latitudes and across the
+    antimeridian.
+
+    Parameters
+    ----------
+    lat_lon : ndarray
+        n x 2 array of (lat, lon) coordinates in degrees
+
+    Returns
+    -------
+    xyz : ndarray
+        n x 3 float64 array of unit vectors
+    """
+    lat_lon = np.radians(np.asarray(lat_lon, dtype=np.float64))
+    lat = lat_lon[..., 0]
+    lon = lat_lon[..., 1]
+    cos_lat = np.cos(lat)
+    xyz = np.stack((cos_lat * np.cos(lon), cos_lat * np.sin(lon),
+                    np.sin(lat)), axis=-1)
+
+    return xyz
+
+
+def chord_to_great_circle(chord, radius=6371.0):
+    """
+    Convert chord distances between unit vectors (see lat_lon_to_xyz) to
+    great circle distances
+
+    Parameters
+    ----------
+    chord : ndarray | float
+        Chord distance(s) between unit vectors
+    radius : float, optional
+        Sphere radius, by default 6371.0, the mean Earth radius in km
+
+    Returns
+    -------
+    ndarray | float
+        Great circle distance(s) in the units of radius
+    """
+    chord = np.clip(np.asarray(chord, dtype=np.float64), 0, 2)
+
+    return 2 * radius * np.arcsin(chord / 2)
+
+
 def get_dtype(col):
     """
     Get column dtype for converstion to records array
@@ -1103,7 +1153,7 @@ def pd_date_range(*args, **kwargs):
     return pd.date_range(*args, **kwargs)
 
 
-def rex_unscale(data, scale_factor=1, adder=0):
+def rex_unscale(data, scale_factor=1, adder=0, out=None):
     """Unscale rex-formatted data
 
     Rex-style unscaling divides by the ``scale_factor`` if ``adder==0``;
@@ -1118,12 +1168,23 @@ def rex_unscale(data, scale_factor=1, adder=0):
         Data scaling factor. By default, ``1``.
     adder : int | float, optional
         Data adder. By default, ``0``.
+    out : ndarray, optional
+        Pre-allocated output array (e.g. float32) with the same shape as
+        ``data``. If provided, the unscaled data is decoded directly into
+        ``out`` without any full-size temporary arrays. By default, ``None``.
 
     Returns
     -------
     array-like
         Unscaled input data.
     """
+    if out is not None:
+        if adder == 0:
+            return np.divide(data, scale_factor, out=out, casting='unsafe')
+
+        np.multiply(data, scale_factor, out=out, casting='unsafe')
+        return np.add(out, adder, out=out, casting='unsafe')
+
     if adder == 0:
         return data / scale_factor
 
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""
+Utilities for long-lived SpawnProcessPool workers: resource handlers that
+stay open for the life of a worker process and result arrays in shared
+memory that workers write to in place
+"""
+import atexit
+import logging
+from multiprocessing import shared_memory
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Open resource handlers of this (worker) process
+WORKER_RESOURCES = {}
+
+
+def get_worker_resource(res_cls, res_h5, hsds=False, **res_cls_kwargs):
+    """
+    Get a resource handler that stays open for the life of the current
+    process. The first task a worker runs on res_h5 opens the file (and
+    decodes e.g. the time_index on first access), every later task on the
+    same worker re-uses the open handler.
+
+    Parameters
+    ----------
+    res_cls : Class
+        Resource class to use to access res_h5
+    res_h5 : str | list
+        Path to resource h5 file(s)
+    hsds : bool, optional
+        Boolean flag to use h5pyd to handle .h5 'files' hosted on AWS
+        behind HSDS, by default False
+    res_cls_kwargs : dict
+        Additional kwargs for res_cls
+
+    Returns
+    -------
+    res : rex.Resource
+        Open instance of res_cls
+    """
+    key = (res_cls, repr(res_h5), hsds, repr(sorted(res_cls_kwargs.items())))
+    res = WORKER_RESOURCES.get(key)
+    if res is None:
+        logger.debug('Opening {} with {} for the life of the worker'
+                     .format(res_h5, res_cls.__name__))
+        res = res_cls(res_h5, hsds=hsds, **res_cls_kwargs)
+        WORKER_RESOURCES[key] = res
+
+    return res
+
+
+@atexit.register
+def close_worker_resources():
+    """
+    Close all resource handlers opened with get_worker_resource
+    """
+    while WORKER_RESOURCES:
+        _, res = WORKER_RESOURCES.popitem()
+        try:
+            res.close()
+        except Exception as e:
+            logger.warning('Could not close {}: {}'.format(res, e))
+
+
+class SharedArray:
+    """
+    Numpy array backed by shared memory. The array is allocated once by the
+    parent process and can be passed to SpawnProcessPool workers, which
+    attach to the same memory and write their results into it in place
+    instead of pickling them back to the parent.
+
+    Examples
+    --------
+    >>> with SharedArray((n_sites, n_stats), fill=np.nan) as out:
+    >>>     with SpawnProcessPool(max_workers=4) as exe:
+    >>>         for rows in row_slices:
+    >>>             exe.submit(func, out, rows)
+    >>>
+    >>>     result = out.array.copy()
+    """
+
+    def __init__(self, shape, dtype=np.float64, fill=None):
+        """
+        Parameters
+        ----------
+        shape : tuple
+            Array shape
+        dtype : np.dtype, optional
+            Array dtype, by default np.float64
+        fill : int | float, optional
+            Value to fill the array with, by default None (uninitialized)
+        """
+        self._shape = tuple(int(s) for s in np.atleast_1d(shape))
+        self._dtype = np.dtype(dtype)
+        nbytes = max(1, int(np.prod(self._shape)) * self._dtype.itemsize)
+        self._shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        self._owner = True
+        self._array = None
+        if fill is not None:
+            self.array[...] = fill
+
+    def __repr__(self):
+        msg = ("{} of shape {} and dtype {} in {}"
+               .format(self.__class__.__name__, self.shape, self.dtype,
+                       self.name))
+
+        return msg
+
+    def __getstate__(self):
+        return {'name': self.name, 'shape': self._shape,
+                'dtype': self._dtype.str}
+
+    def __setstate__(self, state):
+        self._shape = tuple(state['shape'])
+        self._dtype = np.dtype(state['dtype'])
+        self._shm = shared_memory.SharedMemory(name=state['name'])
+        self._owner = False
+        self._array = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+        if type is not None:
+            raise
+
+    @property
+    def name(self):
+        """
+        Name of the shared memory block
+
+        Returns
+        -------
+        str
+        """
+        return self._shm.name
+
+    @property
+    def shape(self):
+        """
+        Array shape
+
+        Returns
+        -------
+        tuple
+        """
+        return self._shape
+
+    @property
+    def dtype(self):
+        """
+        Array dtype
+
+        Returns
+        -------
+        np.dtype
+        """
+        return self._dtype
+
+    @property
+    def array(self):
+        """
+        Numpy view of the shared memory
+
+        Returns
+        -------
+        ndarray
+        """
+        if self._array is None:
+            self._array = np.ndarray(self._shape, dtype=self._dtype,
+                                     buffer=self._shm.buf)
+
+        return self._array
+
+    def close(self):
+        """
+        Detach from the shared memory, the process that created the array
+        also frees the memory
+        """
+        self._array = None
+        if self._shm is not None:
+            self._shm.close()
+            if self._owner:
+                self._shm.unlink()
+
+            self._shm = None
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+pytests for the dataset chunk cache
+"""
+import h5py
+import numpy as np
+import os
+import pytest
+
+from rex import TESTDATADIR
+from rex.renewable_resource import NSRDB
+from rex.resource import Resource
+from rex.utilities.chunk_cache import ChunkCache
+
+PATH = os.path.join(TESTDATADIR, 'nsrdb/nsrdb_wspd_chunked_2012.h5')
+DSET = 'wind_speed'
+
+
+def get_baseline(ds_slice):
+    """
+    Extract baseline data
+    """
+    with h5py.File(PATH, mode='r') as f:
+        arr = f[DSET][...]
+
+    return arr[ds_slice]
+
+
+@pytest.mark.parametrize('ds_slice',
+                         [(slice(None), ),
+                          (slice(None), 5),
+                          (10, slice(None)),
+                          (10, 5),
+                          (-1, -1),
+                          (slice(50, 250), slice(5, 37)),
+                          (slice(1, 1000, 7), slice(3, 60, 4)),
+                          (slice(None), [23, 24, 27, 21, 1, 2, 7, 5]),
+                          ([230, 240, 270, 210, 1, 2, 7, 5],
+                           [23, 24, 27, 21, 1, 2, 7, 5]),
+                          (list(range(8)), slice(None))])
+def test_cached_gets(ds_slice):
+    """
+    Test that reads through the chunk cache match h5py
+    """
+    baseline = get_baseline(ds_slice)
+    cache = ChunkCache(max_size=64)
+    with NSRDB(PATH, unscale=False, chunk_cache=cache) as f:
+        assert f.chunk_cache is cache
+        test = f[(DSET, ) + ds_slice]
+        assert np.array_equal(baseline, test)
+        misses = cache.misses
+        hits = cache.hits
+        assert misses > 0
+
+        test = f[(DSET, ) + ds_slice]
+        assert np.array_equal(baseline, test)
+        assert cache.misses == misses
+        assert cache.hits > hits
+
+
+def test_site_loop():
+    """
+    Test that a site-by-site extraction loop only reads each chunk once
+    """
+    baseline = get_baseline((slice(None), slice(None)))
+    cache = ChunkCache(max_size=64)
+    with Resource(PATH, unscale=False, chunk_cache=cache) as f:
+        chunks = f.chunks[DSET]
+        for gid in range(20):
+            assert np.array_equal(baseline[:, gid], f[DSET, :, gid])
+
+    n_chunks = int(np.ceil(baseline.shape[0] / chunks[0])) * 2
+    assert cache.misses == n_chunks
+    assert cache.hits == 20 * n_chunks // 2 - n_chunks
+    assert len(cache) == n_chunks
+    assert 0 < cache.hit_rate < 1
+
+
+def test_cache_eviction():
+    """
+    Test that the cache stays within its maximum size
+    """
+    cache = ChunkCache(max_size=0.1)
+    with Resource(PATH, unscale=False, chunk_cache=cache) as f:
+        f[DSET, :, :20]  # pylint: disable=W0104
+
+    assert cache.size <= cache.max_size
+    assert 0 < len(cache) < cache.misses
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size == 0
+    assert cache.hits == cache.misses == 0
+
+
+def test_shared_cache():
+    """
+    Test that a cache can be shared across handlers and files
+    """
+    path = os.path.join(TESTDATADIR, 'sza/nsrdb_sza_2012.h5')
+    cache = ChunkCache()
+    with Resource(PATH, chunk_cache=cache) as f:
+        f[DSET, :, 0]  # pylint: disable=W0104
+
+    misses = cache.misses
+    with Resource(PATH, chunk_cache=cache) as f:
+        f[DSET, :, 0]  # pylint: disable=W0104
+
+    assert cache.misses == misses
+    assert cache.hits == misses
+
+    with Resource(path, chunk_cache=cache) as f:
+        f['solar_zenith_angle', :, 0]  # pylint: disable=W0104
+
+    # contiguous datasets are not cached
+    assert cache.misses == misses
+
+
+def execute_pytest(capture='all', flags='-rapP'):
+    """Execute module as pytest with detailed summary report.
+
+    Parameters
+    ----------
+    capture : str
+        Log or stdout/stderr capture option. ex: log (only logger),
+        all (includes stdout/stderr)
+    flags : str
+        Which tests to show logs and results for.
+    """
+
+    fname = os.path.basename(__file__)
+    pytest.main(['-q', '--show-capture={}'.format(capture), fname, flags])
+
+
+if __name__ == '__main__':
+    execute_pytest()
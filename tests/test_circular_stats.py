@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""
+pytests for weighted circular statistics
+"""
+import numpy as np
+import os
+import pandas as pd
+import pytest
+from scipy.stats import circmean, circstd
+
+from rex.temporal_stats.circular_stats import (CircularStats, circular_mean,
+                                               circular_std,
+                                               resultant_length)
+from rex.temporal_stats.streaming import GroupReducer
+from rex.temporal_stats.temporal_stats import TemporalStats
+
+TIME_INDEX = pd.date_range('2012-01-01', '2013-01-01', freq='h',
+                           inclusive='left')
+
+
+def get_data(n_sites=10, seed=42):
+    """
+    Make random wind direction and speed test data with NaNs and an all NaN
+    site
+    """
+    rng = np.random.default_rng(seed)
+    shape = (len(TIME_INDEX), n_sites)
+    wdir = np.degrees(rng.vonmises(1, 2, shape)) % 360
+    wspd = rng.uniform(0, 5, shape)
+    wdir[rng.uniform(size=shape) < 0.1] = np.nan
+    wdir[:, 3] = np.nan
+
+    return wdir.astype(np.float32), wspd.astype(np.float32)
+
+
+def angle_diff(a, b):
+    """
+    Absolute difference between angles in degrees
+    """
+    return np.abs((a - b + 180) % 360 - 180)
+
+
+def test_circular_stats():
+    """
+    Test circular stats against scipy
+    """
+    wdir, wspd = get_data()
+    wdir = wdir[:, :3]
+    wspd = wspd[:, :3]
+    truth = circmean(wdir, high=360, axis=0, nan_policy='omit')
+    assert angle_diff(circular_mean(wdir), truth).max() < 1e-3
+    assert angle_diff(circular_mean(wdir.T, axis=1), truth).max() < 1e-3
+    assert np.isclose(circular_mean(wdir[:, 0]), truth[0], atol=1e-3)
+
+    truth = circstd(wdir, high=360, axis=0, nan_policy='omit')
+    assert np.allclose(circular_std(wdir), truth, atol=1e-3)
+
+    truth = circstd(np.radians(wdir), axis=0, nan_policy='omit')
+    assert np.allclose(circular_std(np.radians(wdir), degrees=False), truth,
+                       atol=1e-5)
+    assert np.allclose(resultant_length(wdir), np.exp(-truth ** 2 / 2))
+
+    # weights are normalized and directions at high wind speed dominate
+    weights = np.where(np.isnan(wdir), 0, np.exp(wspd))
+    rads = np.radians(wdir)
+    sin = np.nansum(np.sin(rads) * weights, axis=0)
+    cos = np.nansum(np.cos(rads) * weights, axis=0)
+    truth = np.degrees(np.arctan2(sin, cos)) % 360
+    test = circular_mean(wdir, weights=wspd)
+    assert angle_diff(test, truth).max() < 1e-3
+    truth = np.hypot(sin, cos) / weights.sum(axis=0)
+    assert np.allclose(resultant_length(wdir, weights=wspd), truth)
+    assert np.allclose(resultant_length(wdir, weights=weights,
+                                        exponential_weights=False), truth)
+
+    with pytest.raises(RuntimeError):
+        circular_mean(wdir, weights=wspd[1:])
+
+
+def test_chunks_merge():
+    """
+    Test that circular stats accumulated in time chunks and sites slices
+    match the full stats
+    """
+    wdir, wspd = get_data()
+    months = TIME_INDEX.month.values - 1
+    truth = CircularStats(12, wdir.shape[1])
+    truth.update(wdir, GroupReducer(TIME_INDEX, ('month', )).index,
+                 weights=wspd)
+
+    test = []
+    for sites in (slice(0, 4), slice(4, None)):
+        stats = CircularStats(12, wdir[:, sites].shape[1])
+        for i in range(0, len(TIME_INDEX), 1000):
+            chunk = CircularStats(12, wdir[:, sites].shape[1])
+            chunk.update(wdir[i:i + 1000, sites], months[i:i + 1000],
+                         weights=wspd[i:i + 1000, sites])
+            stats.merge(chunk)
+
+        test.append(stats)
+
+    test = CircularStats.concat(test)
+    for stat in CircularStats.STATS:
+        assert np.allclose(test.get_stat(stat), truth.get_stat(stat),
+                           equal_nan=True)
+
+    assert np.isnan(truth.mean[:, 3]).all()
+    assert np.isnan(truth.std[:, 3]).all()
+    assert (truth.weight[:, 3] == 0).all()
+
+    total = truth.regroup(np.zeros(12, dtype=int), 1)
+    for stat, func in (('mean', circular_mean), ('std', circular_std),
+                       ('resultant_length', resultant_length)):
+        assert np.allclose(total.get_stat(stat)[0],
+                           func(wdir, weights=wspd), equal_nan=True)
+
+    with pytest.raises(ValueError):
+        truth.merge(CircularStats(12, wdir.shape[1], degrees=False))
+
+    with pytest.raises(KeyError):
+        truth.get_stat('median')
+
+
+@pytest.mark.parametrize(('month', 'diurnal'),
+                         [(False, False), (True, False), (True, True)])
+def test_temporal_stats_groupings(month, diurnal):
+    """
+    Test weighted circular stats by TemporalStats groupings against the
+    per group functions
+    """
+    wdir, wspd = get_data()
+    res_data = pd.DataFrame(wdir, index=TIME_INDEX)
+    weights = pd.DataFrame(wspd, index=TIME_INDEX)
+    statistics = {'mean': {'func': circular_mean,
+                           'kwargs': {'weights': weights}},
+                  'std': {'func': circular_std,
+                          'kwargs': {'weights': weights}},
+                  'r': {'func': resultant_length}}
+    test = TemporalStats._compute_stats(res_data, statistics,
+                                        diurnal=diurnal, month=month)
+
+    by = []
+    if month:
+        by.append(TIME_INDEX.month)
+
+    if diurnal:
+        by.append(TIME_INDEX.hour)
+
+    groups = {(): np.arange(len(TIME_INDEX))}
+    if by:
+        groups = res_data.groupby(by).indices
+
+    assert test.shape == (wdir.shape[1], 3 * len(groups))
+    for i, idx in enumerate(groups.values()):
+        for j, (func, kwargs) in enumerate(
+                [(circular_mean, {'weights': wspd[idx]}),
+                 (circular_std, {'weights': wspd[idx]}),
+                 (resultant_length, {})]):
+            truth = func(wdir[idx], **kwargs)
+            assert np.allclose(test.iloc[:, j * len(groups) + i], truth,
+                               equal_nan=True)
+
+
+def execute_pytest(capture='all', flags='-rapP'):
+    """Execute module as pytest with detailed summary report.
+
+    Parameters
+    ----------
+    capture : str
+        Log or stdout/stderr capture option. ex: log (only logger),
+        all (includes stdout/stderr)
+    flags : str
+        Which tests to show logs and results for.
+    """
+
+    fname = os.path.basename(__file__)
+    pytest.main(['-q', '--show-capture={}'.format(capture), fname, flags])
+
+
+if __name__ == '__main__':
+    execute_pytest()
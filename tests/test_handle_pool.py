@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+pytests for lazily opened resource handlers and the handle pool
+"""
+import numpy as np
+import os
+import pytest
+
+from rex import TESTDATADIR
+from rex.resource import Resource
+from rex.utilities.handle_pool import HandlePool, LazyResource
+
+PATH = os.path.join(TESTDATADIR, 'nsrdb/nsrdb_wspd_chunked_2012.h5')
+DSET = 'wind_speed'
+
+
+def test_lazy_resource():
+    """
+    Test that a lazy resource is only opened on access and matches Resource
+    """
+    with Resource(PATH) as f:
+        truth = f[DSET, :, 5]
+        dsets = f.dsets
+        shape = f.shape
+
+    pool = HandlePool()
+    h5 = LazyResource(Resource, PATH, pool=pool, unscale=False)
+    assert not h5.is_open
+    assert pool.opened == 0
+    assert h5.res_cls is Resource
+    assert h5.res_h5 == PATH
+    assert h5.res_cls_kwargs == {'unscale': False}
+
+    assert h5.shape == shape
+    assert h5.is_open
+    assert DSET in h5
+    assert list(h5) == dsets
+    assert np.allclose(h5[DSET, :, 5] * h5.get_scale_factor(DSET), truth)
+    assert pool.opened == 1
+
+    h5.close()
+    assert not h5.is_open
+    assert len(pool) == 0
+    assert np.allclose(h5[DSET, :, 5] * h5.get_scale_factor(DSET), truth)
+    assert pool.opened == 2
+    pool.close()
+
+
+def test_handle_pool():
+    """
+    Test least-recently-used eviction and check out of open handlers
+    """
+    with HandlePool(max_open=2) as pool:
+        handles = [LazyResource(Resource, PATH, pool=pool) for _ in range(4)]
+        for h5 in handles:
+            assert h5.shape is not None
+            assert len(pool) <= 2
+
+        assert pool.opened == 4
+        assert [h5.is_open for h5 in handles] == [False, False, True, True]
+
+        # touching handles[2] makes handles[3] the least-recently-used
+        assert handles[2].time_index is not None
+        assert handles[0].time_index is not None
+        assert [h5.is_open for h5 in handles] == [True, False, True, False]
+
+        # checked out handlers are not closed until they are returned
+        with handles[0].checkout() as res:
+            with handles[1].checkout():
+                assert handles[3].meta is not None
+                assert handles[0].is_open and handles[1].is_open
+                assert len(pool) == 3
+
+            assert res[DSET, 0, 0] is not None
+            assert len(pool) == 2
+
+        assert pool.opened == 7
+
+    assert len(pool) == 0
+    assert not any(h5.is_open for h5 in handles)
+
+    with pytest.raises(ValueError):
+        HandlePool(max_open=0)
+
+
+def execute_pytest(capture='all', flags='-rapP'):
+    """Execute module as pytest with detailed summary report.
+
+    Parameters
+    ----------
+    capture : str
+        Log or stdout/stderr capture option. ex: log (only logger),
+        all (includes stdout/stderr)
+    flags : str
+        Which tests to show logs and results for.
+    """
+
+    fname = os.path.basename(__file__)
+    pytest.main(['-q', '--show-capture={}'.format(capture), fname, flags])
+
+
+if __name__ == '__main__':
+    execute_pytest()
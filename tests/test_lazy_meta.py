@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""
+pytests for lazy columnar meta access
+"""
+import h5py
+import numpy as np
+import os
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+import tempfile
+
+from rex import TESTDATADIR
+from rex.multi_year_resource import MultiYearResource
+from rex.resource import LazyMeta, Resource
+from rex.resource_extraction import ResourceX
+from rex.temporal_stats import TemporalStats
+from rex.utilities.exceptions import ResourceKeyError
+from rex.utilities.utilities import pd_date_range
+
+SZA_PATH = os.path.join(TESTDATADIR, 'sza/nsrdb_sza_2012.h5')
+WSPD_PATH = os.path.join(TESTDATADIR, 'nsrdb/nsrdb_wspd_chunked_2012.h5')
+
+
+@pytest.mark.parametrize('path', [SZA_PATH, WSPD_PATH])
+def test_lazy_columns(path):
+    """
+    Test that lazy meta columns match the full meta DataFrame
+    """
+    with Resource(path) as f:
+        meta = f.meta
+
+    with Resource(path) as f:
+        lazy_meta = f.lazy_meta
+        assert isinstance(lazy_meta, LazyMeta)
+        assert len(lazy_meta) == len(meta)
+        assert list(lazy_meta.columns) == list(meta.columns)
+        assert f._meta is None
+
+        for col in meta.columns:
+            assert col in lazy_meta
+            truth = meta[col].values
+            test = lazy_meta[col]
+            if np.issubdtype(test.dtype, np.number):
+                assert np.array_equal(truth, test)
+            else:
+                assert (truth == test).all()
+
+            assert lazy_meta[col] is test
+
+        assert_frame_equal(meta[['latitude', 'longitude']],
+                           lazy_meta[['latitude', 'longitude']],
+                           check_index_type=False)
+        assert np.array_equal(f.lat_lon,
+                              meta[['latitude', 'longitude']].values)
+        assert f._meta is None
+
+        assert_frame_equal(meta, lazy_meta.to_frame())
+
+        with pytest.raises(ResourceKeyError):
+            lazy_meta['bad_column']  # pylint: disable=W0104
+
+
+def test_lazy_str_decode():
+    """
+    Test that lazy meta decodes byte strings like the meta DataFrame,
+    including invalid utf-8 bytes
+    """
+    states = [b'Colorado', b'Bad \xff byte', 'Qu\u00e9bec'.encode('utf-8')]
+    meta = np.array(list(zip(np.arange(3.0), np.zeros(3), states)),
+                    dtype=[('latitude', 'f8'), ('longitude', 'f8'),
+                           ('state', 'S16')])
+    time_index = pd_date_range('20210101', '20210102', freq='1h',
+                               closed='right')
+    with tempfile.TemporaryDirectory() as td:
+        fp = os.path.join(td, 'meta_2012.h5')
+        with h5py.File(fp, 'w') as f:
+            f.create_dataset('meta', data=meta)
+            f.create_dataset('time_index',
+                             data=time_index.astype(str).values.astype('S'))
+
+        with Resource(fp) as f:
+            truth = f.meta['state'].values
+
+        with Resource(fp) as f:
+            test = f.lazy_meta['state']
+            assert test.dtype == object
+            assert test.tolist() == ['Colorado', 'Bad  byte', 'Qu\u00e9bec']
+            assert test.tolist() == list(truth)
+
+            # get_meta_arr keeps its strict utf-8 decode
+            lat = f.get_meta_arr('latitude')
+            assert np.allclose(lat, meta['latitude'])
+            assert f.get_meta_arr('state', rows=slice(0, 1)).dtype.kind == 'U'
+
+
+def test_lazy_meta_from_full_meta():
+    """
+    Test that lazy meta uses the full meta DataFrame if already loaded
+    """
+    with Resource(WSPD_PATH) as f:
+        meta = f.meta
+        lazy_meta = f.lazy_meta
+        assert lazy_meta['state'] is meta['state'].values
+        truth = meta['state'].unique()
+        assert np.array_equal(lazy_meta.unique('state'), truth)
+
+        lazy_meta.clear()
+        assert repr(lazy_meta).endswith('(0 loaded)')
+
+
+def test_region_gids():
+    """
+    Test ResourceX region lookups with lazy meta
+    """
+    with ResourceX(WSPD_PATH) as f:
+        meta = f.meta
+
+    with ResourceX(WSPD_PATH) as f:
+        for state in meta['state'].unique():
+            truth = meta.index.values[meta['state'] == state]
+            assert np.array_equal(f.region_gids(state), truth)
+
+        assert np.array_equal(f.states, meta['state'].unique())
+        assert np.array_equal(f.countries, meta['country'].unique())
+        assert f.resource._meta is None
+
+
+def test_multi_year_lazy_meta():
+    """
+    Test lazy meta access through a multi-year handler
+    """
+    path = os.path.join(TESTDATADIR, 'sza/nsrdb_sza_*.h5')
+    with Resource(SZA_PATH) as f:
+        meta = f.meta
+
+    with MultiYearResource(path) as f:
+        assert np.array_equal(f.lazy_meta['latitude'], meta['latitude'])
+        assert np.array_equal(f.lat_lon,
+                              meta[['latitude', 'longitude']].values)
+
+
+def test_temporal_stats_lat_lon():
+    """
+    Test that TemporalStats only reads the lat/lon meta columns unless the
+    full meta is requested
+    """
+    with Resource(SZA_PATH) as f:
+        meta = f.meta
+
+    stats = TemporalStats(SZA_PATH)
+    assert stats._meta is None
+    assert isinstance(stats.lat_lon, pd.DataFrame)
+    assert_frame_equal(stats.lat_lon, meta[['latitude', 'longitude']],
+                       check_index_type=False)
+    assert_frame_equal(stats.meta, meta)
+
+
+def execute_pytest(capture='all', flags='-rapP'):
+    """Execute module as pytest with detailed summary report.
+
+    Parameters
+    ----------
+    capture : str
+        Log or stdout/stderr capture option. ex: log (only logger),
+        all (includes stdout/stderr)
+    flags : str
+        Which tests to show logs and results for.
+    """
+
+    fname = os.path.basename(__file__)
+    pytest.main(['-q', '--show-capture={}'.format(capture), fname, flags])
+
+
+if __name__ == '__main__':
+    execute_pytest()
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+pytests for memory mapped resource reads
+"""
+import h5py
+import numpy as np
+import os
+import pytest
+
+from rex import TESTDATADIR
+from rex.renewable_resource import NSRDB, WaveResource
+from rex.resource import Resource, ResourceDataset
+
+SZA_PATH = os.path.join(TESTDATADIR, 'sza/nsrdb_sza_2012.h5')
+WAVE_PATH = os.path.join(TESTDATADIR, 'wave/ri_wave_2010.h5')
+CHUNKED_PATH = os.path.join(TESTDATADIR, 'nsrdb/nsrdb_wspd_chunked_2012.h5')
+
+
+@pytest.mark.parametrize('ds_slice',
+                         [(slice(None), ),
+                          (slice(None), 5),
+                          (10, slice(None)),
+                          (10, 5),
+                          (slice(50, 250), slice(5, 37)),
+                          (slice(1, 1000, 7), slice(3, 60, 4)),
+                          (slice(None), [23, 24, 27, 21, 1, 2, 7, 5]),
+                          ([230, 240, 270, 210, 1, 2, 7, 5],
+                           [23, 24, 27, 21, 1, 2, 7, 5])])
+@pytest.mark.parametrize('unscale', [True, False])
+def test_mmap_gets(ds_slice, unscale):
+    """
+    Test that memory mapped reads match h5py reads
+    """
+    dset = 'solar_zenith_angle'
+    with NSRDB(SZA_PATH, unscale=unscale) as f:
+        baseline = f[(dset, ) + ds_slice]
+
+    with NSRDB(SZA_PATH, unscale=unscale, mmap=True) as f:
+        assert f._get_mmap(dset) is not None
+        test = f[(dset, ) + ds_slice]
+
+    assert type(test) is type(baseline)
+    assert np.array_equal(baseline, test)
+    if isinstance(test, np.ndarray):
+        assert test.dtype == baseline.dtype
+
+
+def test_mmap_float_dset():
+    """
+    Test memory mapped reads of a float32 dataset
+    """
+    dset = 'significant_wave_height'
+    with h5py.File(WAVE_PATH, mode='r') as f:
+        baseline = f[dset][...]
+
+    with WaveResource(WAVE_PATH, mmap=True) as f:
+        test = f[dset]
+        assert np.array_equal(baseline[:, 10], f[dset, :, 10])
+        assert np.array_equal(baseline[100:200], f[dset, 100:200])
+
+    assert np.array_equal(baseline, test)
+
+
+def test_mmap_writeable():
+    """
+    Test that arrays read from memory maps are writeable and independent
+    """
+    dset = 'solar_zenith_angle'
+    with Resource(SZA_PATH, unscale=False, mmap=True) as f:
+        arr = f[dset, :10]
+        assert arr.flags.writeable
+        baseline = arr.copy()
+        arr[...] = 0
+
+        assert np.array_equal(f[dset, :10], baseline)
+
+
+def test_mmap_fallback():
+    """
+    Test that datasets that cannot be memory mapped are read with h5py
+    """
+    dset = 'wind_speed'
+    with h5py.File(CHUNKED_PATH, mode='r') as f:
+        assert ResourceDataset.open_mmap(f[dset]) is None
+        assert ResourceDataset.open_mmap(f['meta']) is not None
+        baseline = f[dset][...][:, [3, 1, 40]]
+
+    with Resource(CHUNKED_PATH, unscale=False, mmap=True) as f:
+        assert f._get_mmap(dset) is None
+        test = f[dset, :, [3, 1, 40]]
+
+    assert np.array_equal(baseline, test)
+
+    with Resource(SZA_PATH, mmap=False) as f:
+        assert f._get_mmap('solar_zenith_angle') is None
+
+
+def execute_pytest(capture='all', flags='-rapP'):
+    """Execute module as pytest with detailed summary report.
+
+    Parameters
+    ----------
+    capture : str
+        Log or stdout/stderr capture option. ex: log (only logger),
+        all (includes stdout/stderr)
+    flags : str
+        Which tests to show logs and results for.
+    """
+
+    fname = os.path.basename(__file__)
+    pytest.main(['-q', '--show-capture={}'.format(capture), fname, flags])
+
+
+if __name__ == '__main__':
+    execute_pytest()
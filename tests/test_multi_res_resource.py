@@ -5,6 +5,7 @@ pytests for multi-resolution resource handlers
 import pytest
 import h5py
 import numpy as np
+import pandas as pd
 import os
 import shutil
 import tempfile
@@ -147,6 +148,46 @@ def test_mrr_interp(hh, interp_hh):
         mrr.close()
 
 
+def test_time_interp():
+    """Test the temporal interpolation plan against pandas interpolation and
+    time slicing of low-res data with the multi resolution resource handler
+    """
+    with tempfile.TemporaryDirectory() as td:
+        fp_hr, fp_lr = make_multi_res_files(td)
+
+        with MultiResolutionResource(fp_hr, fp_lr,
+                                     handler_class=WindResource) as mrr:
+            left, right, weight = mrr.time_interp_weights
+            assert len(left) == len(mrr.time_index)
+            assert np.allclose(weight[:T_STEP], np.arange(T_STEP) / T_STEP)
+            assert (left[::T_STEP] == right[::T_STEP]).all()
+            assert (weight[::T_STEP] == 0).all()
+
+            dset = 'temperature_100m'
+            lr_data = mrr._lr_res[dset, :, mrr._nn_map]
+            truth = pd.DataFrame(lr_data, index=mrr._lr_res.time_index)
+            truth = truth.reindex(mrr.time_index)
+            truth = truth.interpolate('linear').ffill().bfill().values
+            assert np.allclose(mrr.time_interp(lr_data), truth)
+            assert np.allclose(mrr[dset], truth)
+
+            for dtype in (np.int16, np.float32, np.float64):
+                data = lr_data.astype(dtype)
+                truth_dtype = pd.DataFrame(data, index=mrr._lr_res.time_index)
+                truth_dtype = truth_dtype.reindex(mrr.time_index)
+                truth_dtype = truth_dtype.interpolate('linear').values
+                test = mrr.time_interp(data)
+                assert test.dtype == truth_dtype.dtype
+
+            for t_slice, gids in [(slice(5, 40), [1, 4]),
+                                  (slice(None, None, 5), slice(2, 6)),
+                                  ([3, 50, 7], slice(None))]:
+                test = mrr[dset, t_slice, gids]
+                assert np.allclose(test, truth[t_slice][:, gids])
+
+            assert np.allclose(mrr[dset, 17, 3], truth[17, 3])
+
+
 def test_preload_sam():
     """Test preload of the SAM data object using the multi resolution resource
     handler."""
@@ -172,6 +213,31 @@ def test_preload_sam():
         mrr.close()
 
 
+def test_preload_sam_per_site():
+    """Test preload of the SAM data object with per-site hub-heights using
+    the multi resolution resource handler, including datasets that are only
+    available in the low-res file"""
+    sites = [0, 3, 5, 9]
+    hub_heights = [100, 100, 100, 100]
+    with tempfile.TemporaryDirectory() as td:
+        fp_hr, fp_lr = make_multi_res_files(td)
+        mrr = MultiResolutionResource(fp_hr, fp_lr, handler_class=WindResource)
+        sam = MultiResolutionResource.preload_SAM(fp_hr, fp_lr, sites,
+                                                  hub_heights=hub_heights,
+                                                  handler_class=WindResource)
+
+        for gid, hh in zip(sites, hub_heights):
+            sam_df = sam[gid]
+            for k in ('windspeed', 'temperature', 'pressure'):
+                true = mrr[f'{k}_{hh}m', :, gid]
+                test = sam_df[k].values
+                if k == 'pressure':
+                    true *= 9.86923e-6
+                assert np.allclose(true, test)
+
+        mrr.close()
+
+
 @pytest.mark.timeout(10)
 def test_multi_res_resource_iterator():
     """
@@ -5,13 +5,17 @@ pytests for multi time resource handlers
 """
 import numpy as np
 import os
+import pandas as pd
 from pandas.testing import assert_frame_equal
 import pytest
+import tempfile
 
 from rex import TESTDATADIR
 from rex.multi_time_resource import (MultiTimeH5, MultiTimeResource,
                                      MultiTimeNSRDB, MultiTimeWindResource)
+from rex.outputs import Outputs
 from rex.resource import Resource
+from rex.utilities.utilities import pd_date_range
 
 
 @pytest.fixture
@@ -190,6 +194,40 @@ def check_dset(res_cls, ds_name):
     assert np.allclose(truth[:, [2, 6, 3, 20]], test)
 
 
+def check_time_slices(res_cls, ds_name):
+    """
+    Run tests on time slices of dataset ds_name across file boundaries
+    """
+    truth = []
+    offsets = [0]
+    for h5 in res_cls.h5._h5_map['h5'].unique():
+        truth.append(h5[ds_name])
+        offsets.append(offsets[-1] + len(truth[-1]))
+
+    truth = np.concatenate(truth, axis=0)
+    assert np.array_equal(res_cls.h5.time_offsets, offsets)
+
+    n_steps = len(truth)
+    edge = offsets[1]
+    time_slices = [0, -1, edge - 1, edge, slice(edge - 10, edge + 10),
+                   slice(5, None, 7), slice(None, None, -3),
+                   [edge + 1, 3, edge - 1, 3], np.arange(n_steps) % 5 == 0,
+                   slice(n_steps, None)]
+    for time_slice in time_slices:
+        test = res_cls[ds_name, time_slice]
+        if isinstance(time_slice, int):
+            assert np.allclose(truth[time_slice], test)
+        else:
+            steps = np.unique(np.arange(n_steps)[time_slice])
+            assert np.allclose(truth[steps], test)
+
+    test = res_cls[ds_name, edge - 10:edge + 10, [2, 6, 3]]
+    assert np.allclose(truth[edge - 10:edge + 10][:, [2, 6, 3]], test)
+
+    with pytest.raises(IndexError):
+        res_cls[ds_name, n_steps]
+
+
 def test_time_index_error():
     """
     Test time_index RuntimeError when file time_index overlap
@@ -200,6 +238,94 @@ def test_time_index_error():
             f.time_index  # pylint: disable=pointless-statement
 
 
+@pytest.mark.parametrize('process_pool', [False, True])
+def test_concurrent_reads(process_pool):
+    """
+    Test reading files concurrently into a single output array
+    """
+    path = os.path.join(TESTDATADIR, 'nsrdb/ri_100_nsrdb_*.h5')
+    ds_name = 'dni'
+    with MultiTimeNSRDB(path) as res:
+        truth = res[ds_name]
+
+    with MultiTimeNSRDB(path, max_workers=2,
+                        process_pool=process_pool) as res:
+        test = res[ds_name]
+        assert test.dtype == truth.dtype
+        assert np.allclose(truth, test)
+        assert np.allclose(truth[:, [1, 5, 3]], res[ds_name, :, [1, 5, 3]])
+        assert np.allclose(truth[100:-100:3, 2], res[ds_name, 100:-100:3, 2])
+
+
+@pytest.mark.parametrize(('max_workers', 'process_pool'),
+                         [(None, False), (2, False), (2, True)])
+def test_mixed_dtype_segments(max_workers, process_pool):
+    """
+    Test that segments read from files that store a dataset with different
+    dtypes are not truncated to the dtype of the first file
+    """
+    meta = pd.DataFrame({'latitude': np.arange(4.0),
+                         'longitude': np.zeros(4)})
+    rng = np.random.default_rng(42)
+    truth = []
+    with tempfile.TemporaryDirectory() as td:
+        for year, dtype in ((2012, np.int16), (2013, np.float32),
+                            (2014, np.float64)):
+            time_index = pd_date_range('{}0101'.format(year),
+                                       '{}0102'.format(year), freq='1h',
+                                       closed='right')
+            data = rng.uniform(0, 100, (len(time_index), 4)).astype(dtype)
+            truth.append(data)
+            with Outputs(os.path.join(td, 'mixed_{}.h5'.format(year)),
+                         'w') as f:
+                f.meta = meta
+                f.time_index = time_index
+                f.write_dataset('ghi', data, dtype)
+
+        truth = np.concatenate(truth)
+        path = os.path.join(td, 'mixed_*.h5')
+        with MultiTimeResource(path, max_workers=max_workers,
+                               process_pool=process_pool) as res:
+            test = res['ghi']
+            assert test.dtype == np.float64
+            assert np.allclose(test, truth)
+            assert np.allclose(res['ghi', 20:50, [3, 1]],
+                               truth[20:50][:, [3, 1]])
+
+
+def test_lazy_open_manifest():
+    """
+    Test lazy file opening with a bounded number of open files and a
+    persisted file manifest
+    """
+    path = os.path.join(TESTDATADIR, 'nsrdb/ri_100_nsrdb_*.h5')
+    ds_name = 'dni'
+    with MultiTimeNSRDB(path) as res:
+        truth = res[ds_name]
+        truth_ti = res.time_index
+        meta = res.meta
+
+    with tempfile.TemporaryDirectory() as td:
+        manifest = os.path.join(td, 'manifest.json')
+        with MultiTimeNSRDB(path, manifest=manifest) as res:
+            assert res.h5.handle_pool.opened == len(res.h5_files)
+
+        assert os.path.exists(manifest)
+        with MultiTimeNSRDB(path, max_open=1, manifest=manifest) as res:
+            pool = res.h5.handle_pool
+            assert res.time_index.equals(truth_ti)
+            assert res.shape == truth.shape
+            assert ds_name in res.datasets
+            assert pool.opened == 0
+
+            assert np.allclose(truth, res[ds_name])
+            assert np.allclose(truth[5::7, 7], res[ds_name, 5::7, 7])
+            assert len(pool) == 1
+            assert_frame_equal(meta, res.meta)
+
+        assert len(pool) == 0
+
+
 class TestMultiTimeNSRDB:
     """
     Multi Year NSRDB Resource handler tests
@@ -236,6 +362,7 @@ class TestMultiTimeNSRDB:
         check_dset(MultiTimeNSRDB_res, ds_name)
         check_attrs(MultiTimeNSRDB_res, ds_name)
         check_properties(MultiTimeNSRDB_res, ds_name)
+        check_time_slices(MultiTimeNSRDB_res, ds_name)
         MultiTimeNSRDB_res.close()
 
 
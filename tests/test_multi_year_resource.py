@@ -163,6 +163,40 @@ def check_dset(res_cls, ds_name):
     assert np.allclose(truth[:, [2, 6, 3, 20]], test)
 
 
+def check_time_slices(res_cls, ds_name):
+    """
+    Run tests on time slices of dataset ds_name across file boundaries
+    """
+    truth = []
+    offsets = [0]
+    for h5 in res_cls.h5._h5_map['h5'].unique():
+        truth.append(h5[ds_name])
+        offsets.append(offsets[-1] + len(truth[-1]))
+
+    truth = np.concatenate(truth, axis=0)
+    assert np.array_equal(res_cls.h5.time_offsets, offsets)
+
+    n_steps = len(truth)
+    edge = offsets[1]
+    time_slices = [0, -1, edge - 1, edge, slice(edge - 10, edge + 10),
+                   slice(5, None, 7), slice(None, None, -3),
+                   [edge + 1, 3, edge - 1, 3], np.arange(n_steps) % 5 == 0,
+                   slice(n_steps, None)]
+    for time_slice in time_slices:
+        test = res_cls[ds_name, time_slice]
+        if isinstance(time_slice, int):
+            assert np.allclose(truth[time_slice], test)
+        else:
+            steps = np.unique(np.arange(n_steps)[time_slice])
+            assert np.allclose(truth[steps], test)
+
+    test = res_cls[ds_name, edge - 10:edge + 10, [2, 6, 3]]
+    assert np.allclose(truth[edge - 10:edge + 10][:, [2, 6, 3]], test)
+
+    with pytest.raises(IndexError):
+        res_cls[ds_name, n_steps]
+
+
 def check_years(res_cls, ds_name):
     """
     Run tests on dataset ds_name
@@ -206,6 +240,75 @@ def test_years_error():
         MultiYearWindResource(path, years=years)
 
 
+@pytest.mark.parametrize('process_pool', [False, True])
+def test_concurrent_reads(process_pool):
+    """
+    Test reading years concurrently into a single output array
+    """
+    path = os.path.join(TESTDATADIR, 'nsrdb/ri_100_nsrdb_*.h5')
+    ds_name = 'dni'
+    with MultiYearNSRDB(path) as res:
+        truth = res[ds_name]
+        truth_years = res[ds_name, ['2013', '2012']]
+
+    with MultiYearNSRDB(path, max_workers=2,
+                        process_pool=process_pool) as res:
+        test = res[ds_name]
+        assert test.dtype == truth.dtype
+        assert np.allclose(truth, test)
+        assert np.allclose(truth[:, [1, 5, 3]], res[ds_name, :, [1, 5, 3]])
+        assert np.allclose(truth[100:-100:3, 2], res[ds_name, 100:-100:3, 2])
+        assert np.allclose(truth_years, res[ds_name, ['2013', '2012']])
+
+
+def test_lazy_open_manifest():
+    """
+    Test lazy year opening with a persisted file manifest that is updated
+    when a file changes
+    """
+    source = os.path.join(TESTDATADIR, 'nsrdb/ri_100_nsrdb_*.h5')
+    ds_name = 'dni'
+    with MultiYearNSRDB(source) as res:
+        truth = res[ds_name]
+        truth_ti = res.time_index
+        truth_years = res[ds_name, ['2013', '2012']]
+
+    with tempfile.TemporaryDirectory() as td:
+        for fp in MultiYearH5._get_file_paths(source):
+            shutil.copy(fp, td)
+
+        path = os.path.join(td, 'ri_100_nsrdb_*.h5')
+        manifest = os.path.join(td, 'manifest.json')
+        with MultiYearNSRDB(path, manifest=manifest) as res:
+            assert res.h5.handle_pool.opened == 2
+
+        with MultiYearNSRDB(path, max_open=1, manifest=manifest) as res:
+            assert res.h5.handle_pool.opened == 0
+            assert res.time_index.equals(truth_ti)
+            assert np.allclose(truth, res[ds_name])
+            assert np.allclose(truth[:, 3], res[ds_name, :, 3])
+            assert len(res.h5.handle_pool) == 1
+
+        fp = os.path.join(td, 'ri_100_nsrdb_2013.h5')
+        mtime = os.stat(fp).st_mtime_ns + 10 ** 9
+        os.utime(fp, ns=(mtime, mtime))
+        with MultiYearNSRDB(path, manifest=manifest) as res:
+            assert res.h5.handle_pool.opened == 1
+            assert res.h5[2013].is_open
+            assert not res.h5[2012].is_open
+
+        with MultiYearNSRDB(path, years=[2013], manifest=manifest) as res:
+            assert res.h5.handle_pool.opened == 0
+            assert res.time_index.equals(truth_ti[truth_ti.year == 2013])
+
+        with MultiYearNSRDB(path, manifest=manifest) as res:
+            test = res[ds_name, ['2013', '2012']]
+            assert np.allclose(truth_years, test)
+            for year in (2012, 2013):
+                with res.h5[year].checkout() as f:
+                    assert f._time_index is None
+
+
 class TestMultiYearNSRDB:
     """
     Multi Year NSRDB Resource handler tests
@@ -243,6 +346,7 @@ class TestMultiYearNSRDB:
         check_attrs(MultiYearNSRDB_res, ds_name)
         check_properties(MultiYearNSRDB_res, ds_name)
         check_years(MultiYearNSRDB_res, ds_name)
+        check_time_slices(MultiYearNSRDB_res, ds_name)
         MultiYearNSRDB_res.close()
 
 
@@ -6,6 +6,7 @@ This also includes tests of the MultiFile handlers
 """
 from datetime import datetime
 import h5py
+import json
 import numpy as np
 import os
 import pandas as pd
@@ -17,7 +18,8 @@ from rex import TESTDATADIR, Resource, Outputs
 from rex.multi_file_resource import (MultiH5, MultiH5Path, MultiFileResource,
                                      MultiFileNSRDB, MultiFileWTK)
 from rex.renewable_resource import (NSRDB, WindResource)
-from rex.utilities.exceptions import ResourceKeyError, ResourceRuntimeError
+from rex.utilities.exceptions import (ExtrapolationWarning, ResourceKeyError,
+                                      ResourceRuntimeError, ResourceValueError)
 from rex.utilities.utilities import pd_date_range
 
 
@@ -686,6 +688,87 @@ class TestWindResource:
         check_dset_map(res_cls, ds_name)
         res_cls.close()
 
+    @staticmethod
+    @pytest.mark.parametrize('res_cls',
+                             [WindResource_res(),
+                              FiveMinWind_list()])
+    def test_multi_height(res_cls):
+        """
+        Test extraction of variables at multiple and per-site hub-heights
+        """
+        heights = [80, 90, 100, 110, 150]
+        sites = slice(0, 20, 2)
+        time_slice = slice(100, 200)
+        with pytest.warns(ExtrapolationWarning):
+            for var in ['windspeed', 'winddirection', 'temperature']:
+                test = res_cls.get_multi_height(var, heights, sites=sites,
+                                                time_slice=time_slice)
+                assert test.shape == (len(heights), 100, 10)
+                for i, h in enumerate(heights):
+                    truth = res_cls['{}_{}m'.format(var, h), time_slice,
+                                    sites]
+                    assert np.allclose(test[i], truth)
+
+                site_heights = np.resize(heights, 10)
+                test = res_cls.get_multi_height(var, site_heights,
+                                                sites=sites,
+                                                time_slice=time_slice,
+                                                per_site=True)
+                assert test.shape == (100, 10)
+                gids = range(*sites.indices(sites.stop))
+                for i, (gid, h) in enumerate(zip(gids, site_heights)):
+                    truth = res_cls['{}_{}m'.format(var, h), time_slice, gid]
+                    assert np.allclose(test[:, i], truth, rtol=1e-5)
+
+                test = res_cls.get_multi_height(var, 110, sites=5,
+                                                time_slice=time_slice,
+                                                per_site=True)
+                assert test.shape == (100, 1)
+                truth = res_cls['{}_110m'.format(var), time_slice, 5]
+                assert np.allclose(test[:, 0], truth, rtol=1e-5)
+
+        with pytest.raises(ResourceValueError):
+            res_cls.get_multi_height('windspeed', heights, sites=sites,
+                                     per_site=True)
+
+        res_cls.close()
+
+    @staticmethod
+    def test_monin_obukhov():
+        """
+        Test Monin-Obukhov extrapolation of (time, sites) arrays with
+        shared stability terms
+        """
+        rng = np.random.default_rng(42)
+        ts = rng.uniform(0, 10, (100, 10))
+        z0 = rng.uniform(0.01, 0.5, 10)
+        L = 1 / rng.uniform(-0.05, 0.05, (100, 10))
+
+        zeta = 10 / L
+        test = WindResource.stability_function(zeta)
+        assert test.shape == zeta.shape
+        assert np.allclose(test[:, 3], WindResource.stability_function(
+            zeta[:, 3]))
+        assert (test[zeta > 0] < 0).all()
+        assert (test[zeta < 0] > 0).all()
+
+        # neutral conditions reduce to the log law
+        test = WindResource.monin_obukhov_extrapolation(ts, 80, z0, np.inf,
+                                                        10)
+        truth = ts * np.log(10 / z0) / np.log(80 / z0)
+        assert np.allclose(test, truth)
+
+        terms = WindResource.monin_obukhov_terms(80, z0, L)
+        for h in [10, 20, 50]:
+            truth = WindResource.monin_obukhov_extrapolation(ts, 80, z0, L, h)
+            test = WindResource.monin_obukhov_extrapolation(ts, 80, z0, L, h,
+                                                            terms=terms)
+            assert np.allclose(test, truth)
+            for i in range(ts.shape[1]):
+                site = WindResource.monin_obukhov_extrapolation(
+                    ts[:, i], 80, z0[i], L[:, i], h)
+                assert np.allclose(truth[:, i], site)
+
 
 def test_group_raise():
     """
@@ -740,6 +823,120 @@ def test_check_files():
             check_res(f)
 
 
+def test_multi_file_manifest():
+    """
+    Test building, re-using and invalidating the MultiFileResource manifest
+    """
+    path = os.path.join(TESTDATADIR, 'nsrdb', 'nsrdb*2018.h5')
+    with MultiFileNSRDB(path) as res:
+        truth = res['dni', :, 5]
+        dsets = res.datasets
+        units = res.units
+        shapes = res.shapes
+        dtypes = res.dtypes
+        chunks = res.chunks
+        attrs = res.attrs
+        scale_factors = res.scale_factors
+
+    with tempfile.TemporaryDirectory() as td:
+        h5_files = []
+        for fp in MultiH5Path._get_h5_files(path)[1]:
+            h5_files.append(os.path.join(td, os.path.basename(fp)))
+            shutil.copy(fp, h5_files[-1])
+
+        manifest = os.path.join(td, 'manifest.json')
+        with MultiFileNSRDB(h5_files, manifest=manifest) as res:
+            assert os.path.exists(manifest)
+
+        with MultiFileNSRDB(h5_files, manifest=manifest,
+                            check_files=True) as res:
+            assert not any(res.h5._h5_map.values())
+            assert res.datasets == dsets
+            assert res.shapes == shapes
+            assert res.dtypes == dtypes
+            assert res.chunks == chunks
+            assert res.scale_factors == scale_factors
+            assert res.units == units
+            for dset, dset_attrs in attrs.items():
+                assert res.attrs[dset].keys() == dset_attrs.keys()
+                for k, v in dset_attrs.items():
+                    assert type(res.attrs[dset][k]) is type(v)
+                    assert np.array_equal(res.attrs[dset][k], v)
+
+            assert not any(res.h5._h5_map.values())
+
+            assert np.allclose(res['dni', :, 5], truth)
+            assert sum(h5 is not None for h5 in res.h5._h5_map.values()) >= 1
+
+        # changing a file rebuilds its manifest entry
+        with h5py.File(h5_files[0], 'a') as f:
+            f.create_dataset('new_dset', data=np.ones(shapes['dni']))
+
+        with MultiFileNSRDB(h5_files, manifest=manifest) as res:
+            assert 'new_dset' in res.datasets
+            assert res.shapes['new_dset'] == shapes['dni']
+
+        # mismatched coordinates are caught from the manifest
+        with h5py.File(h5_files[0], 'a') as f:
+            meta = f['meta'][...]
+            meta['latitude'] += 1
+            f['meta'][...] = meta
+
+        with pytest.raises(ResourceRuntimeError):
+            MultiH5(h5_files, check_files=True, manifest=manifest)
+
+
+def test_multi_file_manifest_strict():
+    """
+    Test that the MultiFileResource json manifest round-trips dataset
+    attribute types and that check_files compares coordinates exactly with
+    a manifest
+    """
+    meta = pd.DataFrame({'latitude': np.linspace(40, 41, 10),
+                         'longitude': np.linspace(-105, -104, 10)})
+    time_index = pd_date_range('20120101', '20120102', freq='1h',
+                               closed='right')
+    attrs = {'units': 'W/m2', 'source': np.bytes_(b'psm'),
+             'bounds': np.arange(3), 'scale_factor': np.float64(10)}
+    with tempfile.TemporaryDirectory() as td:
+        h5_files = []
+        for i, dset in enumerate(['dni', 'ghi']):
+            h5_files.append(os.path.join(td, 'test_{}_2012.h5'.format(dset)))
+            with Outputs(h5_files[-1], 'w') as f:
+                f.meta = meta
+                f.time_index = time_index
+                data = np.full((len(time_index), len(meta)), i + 1,
+                               dtype=np.int16)
+                f.write_dataset(dset, data, np.int16, attrs=attrs)
+
+        with MultiFileResource(h5_files) as res:
+            truth = res.attrs
+
+        manifest = os.path.join(td, 'manifest.json')
+        for _ in range(2):
+            with MultiFileResource(h5_files, manifest=manifest) as res:
+                test = res.attrs
+                assert test.keys() == truth.keys()
+                for dset, dset_attrs in truth.items():
+                    assert test[dset].keys() == dset_attrs.keys()
+                    for k, v in dset_attrs.items():
+                        assert type(test[dset][k]) is type(v)
+                        assert np.array_equal(test[dset][k], v)
+
+        with open(manifest) as f:
+            assert json.load(f)['version']
+
+        # coordinates within np.allclose only pass without a manifest
+        with h5py.File(h5_files[1], 'a') as f:
+            file_meta = f['meta'][...]
+            file_meta['latitude'] += 1e-5
+            f['meta'][...] = file_meta
+
+        MultiH5(h5_files, check_files=True)
+        with pytest.raises(ResourceRuntimeError):
+            MultiH5(h5_files, check_files=True, manifest=manifest)
+
+
 def test_time_index_out_of_bounds():
     """
     Test that resource allows a time index that is "out of bounds" for pandas
@@ -949,6 +1146,94 @@ def test_1D_dataset_slicing_spatial_repeat():
                 assert res['dset3', 55, 79].dtype == np.float32
 
 
+def test_get_dset_arr_out():
+    """Test decoding scaled data directly into pre-allocated outputs"""
+    meta = pd.DataFrame({'latitude': np.ones(100),
+                         'longitude': np.zeros(100)})
+    time_index = pd_date_range('20210101', '20220101', freq='1h',
+                               closed='right')
+    data = np.random.uniform(0, 300, (8760, 100)).astype(np.float32)
+    with tempfile.TemporaryDirectory() as td:
+        fp = os.path.join(td, 'outputs.h5')
+
+        with Outputs(fp, 'w') as f:
+            f.meta = meta
+            f.time_index = time_index
+
+        Outputs.add_dataset(fp, 'dset', data, np.int16,
+                            attrs={'scale_factor': 100}, chunks=(100, 10))
+
+        with Resource(fp) as res:
+            baseline = res['dset']
+            assert baseline.dtype == np.float32
+            assert np.allclose(baseline, data, atol=0.01)
+            assert res['dset', 5, 5].dtype == np.float32
+
+            out = np.empty((8760, 100), dtype=np.float32)
+            test = res.get_dset_arr('dset', out=out)
+            assert test is out
+            assert np.array_equal(baseline, out)
+
+            out = np.empty((8760, 4), dtype=np.float32)
+            res.get_dset_arr('dset', (slice(None), [80, 3, 1, 2]), out=out)
+            assert np.array_equal(baseline[:, [80, 3, 1, 2]], out)
+
+            out = np.empty((24, 10), dtype=np.float32)
+            with pytest.raises(ResourceValueError):
+                res.get_dset_arr('dset', (slice(None), slice(10)), out=out)
+
+            res.get_dset_arr('dset', (slice(24), slice(10)), out=out)
+            assert np.array_equal(baseline[:24, :10], out)
+            assert np.array_equal(baseline[:24, :10],
+                                  res.get_dset_arr('dset',
+                                                   (slice(24), slice(10))))
+
+        with Resource(fp, unscale=False) as res:
+            native = res['dset']
+            out = np.empty((8760, 100), dtype=np.float32)
+            res.get_dset_arr('dset', out=out)
+            assert np.array_equal(native, out)
+
+
+def test_get_dset_arr_override():
+    """Test that get_dset_arr with out uses a handler's _get_ds override"""
+    class OffsetResource(Resource):
+        """Resource handler with a derived dataset"""
+        def _get_ds(self, ds_name, ds_slice, out=None):
+            if ds_name == 'dset_plus_one':
+                arr = super()._get_ds('dset', ds_slice) + 1
+                if out is None:
+                    return arr
+
+                out[...] = arr
+
+                return out
+
+            return super()._get_ds(ds_name, ds_slice, out=out)
+
+    meta = pd.DataFrame({'latitude': np.ones(100),
+                         'longitude': np.zeros(100)})
+    time_index = pd_date_range('20210101', '20220101', freq='1h',
+                               closed='right')
+    data = np.random.uniform(0, 300, (8760, 100)).astype(np.float32)
+    with tempfile.TemporaryDirectory() as td:
+        fp = os.path.join(td, 'outputs.h5')
+
+        with Outputs(fp, 'w') as f:
+            f.meta = meta
+            f.time_index = time_index
+
+        Outputs.add_dataset(fp, 'dset', data, np.float32, chunks=(100, 10))
+
+        with OffsetResource(fp) as res:
+            out = np.empty((24, 100), dtype=np.float32)
+            res.get_dset_arr('dset_plus_one', slice(24), out=out)
+            assert np.allclose(out, data[:24] + 1)
+
+            res.get_dset_arr('dset', slice(24), out=out)
+            assert np.allclose(out, data[:24])
+
+
 @pytest.mark.timeout(10)
 def test_resource_iterator():
     """
@@ -14,7 +14,7 @@ from pandas.testing import assert_frame_equal
 import PySAM.Windpower as PySamWindPower
 import PySAM.Pvwattsv8 as PySamPV8
 
-from rex import TESTDATADIR
+from rex import TESTDATADIR, Outputs
 from rex.resource_extraction.resource_extraction import (
     NSRDBX,
     TREE_DIR,
@@ -24,12 +24,15 @@ from rex.resource_extraction.resource_extraction import (
     MultiTimeWindX,
     MultiYearNSRDBX,
     MultiYearWindX,
+    ResourceX,
     WaveX,
     WindX,
 )
 from rex.resource_extraction.wind_cli import main
 from rex.utilities.exceptions import ResourceValueError
 from rex.utilities.loggers import LOGGERS
+from rex.utilities.sidecar_cache import SidecarCache
+from rex.utilities.utilities import pd_date_range
 
 
 @pytest.fixture(scope="module")
@@ -1271,6 +1274,169 @@ def test_save_subset(NSRDBX_cls):
             assert np.allclose(NSRDBX_cls['ghi', :, gids], out['ghi'])
 
 
+@pytest.mark.parametrize('region_col', ['state', 'county', 'timezone'])
+def test_region_index(region_col):
+    """
+    Test the cached region to gid index against meta lookups
+    """
+    path = os.path.join(TESTDATADIR, 'nsrdb/nsrdb_wspd_chunked_2012.h5')
+    with ResourceX(path) as f:
+        meta = f.meta
+        region_index = f.get_region_index(region_col=region_col)
+        assert list(region_index) == list(meta[region_col].unique())
+        for region, gids in region_index.items():
+            truth = meta.index.values[meta[region_col] == region]
+            assert np.array_equal(gids, truth)
+            assert np.array_equal(f.region_gids(region, region_col), truth)
+
+        assert not len(f.region_gids('bad_region', region_col))
+
+        cache = SidecarCache(TREE_DIR.name)
+        key = cache.get_key(path, 'region_index', region_col, True)
+        assert os.path.exists(cache.get_path(key))
+
+    with ResourceX(path) as f:
+        f._build_region_index = None
+        assert (f.get_region_index(region_col=region_col).keys()
+                == region_index.keys())
+
+    with ResourceX(path, str_decode=False) as f:
+        region_index = f.get_region_index(region_col=region_col)
+        if region_col != 'timezone':
+            assert all(isinstance(r, bytes) for r in region_index)
+
+
+def test_region_index_nulls():
+    """
+    Test that null region values are kept in the region index, like
+    meta[col].unique(), but never match in region_gids
+    """
+    values = np.array(['RI', None, 'MA', 'RI', None], dtype=object)
+    region_index = ResourceX._build_region_index(values)
+    truth = pd.Series(values, dtype=object).unique()
+    assert list(region_index) == list(truth) == ['RI', None, 'MA']
+    gids = [gids.tolist() for gids in region_index.values()]
+    assert gids == [[0, 3], [1, 4], [2]]
+
+    meta = pd.DataFrame({'latitude': np.arange(4.0),
+                         'longitude': np.zeros(4),
+                         'country': [1.0, np.nan, 2.0, np.nan]})
+    time_index = pd_date_range('20210101', '20210102', freq='1h',
+                               closed='right')
+    with tempfile.TemporaryDirectory() as td:
+        fp = os.path.join(td, 'nulls_2012.h5')
+        with Outputs(fp, 'w') as f:
+            f.meta = meta
+            f.time_index = time_index
+
+        with ResourceX(fp) as f:
+            countries = f.countries
+            assert len(countries) == len(f.meta['country'].unique()) == 3
+            assert np.isnan(countries[1])
+            assert f.region_gids(2.0, 'country').tolist() == [2]
+            assert not len(f.region_gids(np.nan, 'country'))
+
+
+def test_region_index_signature():
+    """
+    Test that cached region indexes of different files with the same name
+    and number of sites are not mixed up
+    """
+    meta = pd.DataFrame({'latitude': np.arange(10.0),
+                         'longitude': np.zeros(10)})
+    time_index = pd_date_range('20210101', '20210102', freq='1h',
+                               closed='right')
+    with tempfile.TemporaryDirectory() as td:
+        regions = {}
+        for domain, state in (('east', 'Maine'), ('west', 'Oregon')):
+            fp = os.path.join(td, domain, 'domain_2012.h5')
+            os.makedirs(os.path.dirname(fp))
+            meta['state'] = np.array([state] * 5 + ['Other'] * 5,
+                                     dtype='S')
+            with Outputs(fp, 'w') as f:
+                f.meta = meta
+                f.time_index = time_index
+
+            with ResourceX(fp) as f:
+                regions[domain] = list(f.get_region_index('state'))
+
+        assert regions == {'east': ['Maine', 'Other'],
+                           'west': ['Oregon', 'Other']}
+
+
+def test_batch_lat_lon_gid():
+    """
+    Test batch great circle lat/lon lookups against brute force haversine
+    """
+    path = os.path.join(TESTDATADIR, 'nsrdb/nsrdb_wspd_chunked_2012.h5')
+    with ResourceX(path) as f:
+        lat_lon = f.lat_lon
+        gids, dist = f.batch_lat_lon_gid(lat_lon)
+        assert np.array_equal(gids, np.arange(len(lat_lon)))
+        assert np.allclose(dist, 0, atol=1e-3)
+
+        lat_min, lat_max, lon_min, lon_max = f.domain_bounds
+        n = 1000
+        rng = np.random.default_rng(42)
+        points = np.column_stack((rng.uniform(lat_min, lat_max, n),
+                                  rng.uniform(lon_min, lon_max, n)))
+        gids, dist = f.batch_lat_lon_gid(points, check_lat_lon=False,
+                                         workers=2)
+
+        lat1, lon1 = np.radians(points).T[:, :, None]
+        lat2, lon2 = np.radians(lat_lon).T[:, None, :]
+        a = (np.sin((lat2 - lat1) / 2) ** 2
+             + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2)
+        truth = 2 * 6371.0 * np.arcsin(np.sqrt(a))
+        assert np.allclose(dist, truth.min(axis=1))
+        assert np.allclose(truth[np.arange(n), gids], truth.min(axis=1))
+
+        gid, dist = f.batch_lat_lon_gid(lat_lon[10])
+        assert gid.tolist() == [10]
+        assert f.sphere_distance_threshold > 0
+
+        with pytest.raises(ResourceValueError):
+            f.batch_lat_lon_gid([[lat_max + 1, lon_min]])
+
+    tree_file = f._get_tree_file(path).replace('tree.pkl', 'sphere_tree.pkl')
+    assert tree_file in os.listdir(TREE_DIR.name)
+
+
+def test_batch_lat_lon_gid_antimeridian():
+    """
+    Test batch lat/lon lookups on a domain that crosses the antimeridian
+    """
+    lat, lon = np.meshgrid(np.arange(-2.0, 2.5, 0.5),
+                           np.arange(178.0, 182.5, 0.5))
+    lon = (lon + 180) % 360 - 180
+    meta = pd.DataFrame({'latitude': lat.ravel(),
+                         'longitude': lon.ravel()})
+    time_index = pd_date_range('20210101', '20210102', freq='1h',
+                               closed='right')
+    with tempfile.TemporaryDirectory() as td:
+        fp = os.path.join(td, 'antimeridian_2012.h5')
+        with Outputs(fp, 'w') as f:
+            f.meta = meta
+            f.time_index = time_index
+
+        with ResourceX(fp) as f:
+            points = np.array([[0.1, 179.9], [0.1, -179.9], [-1.9, 179.6],
+                               [1.9, -178.1]])
+            gids, dist = f.batch_lat_lon_gid(points)
+            truth = [np.argmin(np.hypot(lat.ravel() - p[0],
+                                        (lon.ravel() - p[1] + 180) % 360
+                                        - 180))
+                     for p in points]
+            assert np.array_equal(gids, truth)
+            assert np.all(dist < f.sphere_distance_threshold)
+
+            with pytest.raises(ResourceValueError):
+                f.batch_lat_lon_gid([[0, 170]])
+
+            with pytest.raises(ResourceValueError):
+                f.batch_lat_lon_gid([[5, 180]])
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 
@@ -9,6 +9,9 @@ import pytest
 
 from rex import TESTDATADIR
 from rex.renewable_resource import NSRDB
+from rex.resource import ResourceDataset
+from rex.utilities.chunk_cache import ChunkCache
+from rex.utilities.exceptions import ResourceRuntimeError, RetryWarning
 
 
 def get_baseline(path, dset, ds_slice):
@@ -83,6 +86,79 @@ def test_4d_list_gets(ds_slice):
     assert np.allclose(baseline, test)
 
 
+def test_plan_list_reads():
+    """
+    Test the chunk-aware list read planner
+    """
+    idx = np.array([95, 3, 11, 3, 57, 12, 0, 41])
+    reads, pos = ResourceDataset._plan_list_reads(idx, 10)
+    assert reads == [slice(0, 13), slice(41, 58), slice(95, 96)]
+
+    buf = np.concatenate([np.arange(r.start, r.stop) for r in reads])
+    assert np.array_equal(buf[pos], idx)
+
+    reads, pos = ResourceDataset._plan_list_reads(idx, 100)
+    assert reads == [slice(0, 96)]
+    assert np.array_equal(pos, idx)
+
+
+@pytest.mark.parametrize('max_workers', [None, 4])
+@pytest.mark.parametrize('time_slice', [slice(None), slice(100, 500), 10,
+                                        list(range(250, 150, -3))])
+def test_random_gid_gets(time_slice, max_workers):
+    """
+    Test random (unsorted, duplicated) gid list gets read each chunk once
+    """
+    path = os.path.join(TESTDATADIR, 'nsrdb/nsrdb_wspd_chunked_2012.h5')
+    dset = 'wind_speed'
+    gids = np.random.choice(100, size=40)
+    if isinstance(time_slice, list):
+        ds_slice = (time_slice, slice(None))
+        list_idx = np.array(time_slice)
+    else:
+        ds_slice = (time_slice, gids)
+        list_idx = gids
+
+    baseline = get_baseline(path, dset, ds_slice)
+
+    cache = ChunkCache()
+    with NSRDB(path, unscale=False, chunk_cache=cache,
+               max_workers=max_workers) as f:
+        test = f[(dset, ) + ds_slice]
+        chunks = f.chunks[dset]
+        shape = f.shape
+
+    assert np.allclose(baseline, test)
+
+    axis = 1 if list_idx is gids else 0
+    n_chunks = len(np.unique(list_idx // chunks[axis]))
+    if isinstance(time_slice, slice):
+        t = range(*time_slice.indices(shape[0]))
+        n_chunks *= len(np.unique(np.array(t) // chunks[0]))
+    elif axis == 0:
+        n_chunks *= len(np.unique(np.arange(100) // chunks[1]))
+
+    assert cache.misses == n_chunks
+
+
+@pytest.mark.parametrize('ds_slice',
+                         [(slice(None), [95, 3, 11, 3, 57, 12, 0, 41]),
+                          ([230, 240, 2700, 210, 1, 2, 7, 5], slice(None)),
+                          (10, [95, 3, 11, 3, 57, 12, 0, 41])])
+def test_concurrent_list_gets(ds_slice):
+    """
+    Test planned list gets fetched from a thread pool
+    """
+    path = os.path.join(TESTDATADIR, 'nsrdb/nsrdb_wspd_chunked_2012.h5')
+    dset = 'wind_speed'
+    baseline = get_baseline(path, dset, ds_slice)
+
+    with NSRDB(path, unscale=False, max_workers=4) as f:
+        test = f[(dset, ) + ds_slice]
+
+    assert np.allclose(baseline, test)
+
+
 def test_index_error():
     """
     test incompatible list IndexError
@@ -96,6 +172,67 @@ def test_index_error():
             f[dset_slice]  # pylint: disable=W0104
 
 
+@pytest.mark.parametrize('max_workers', [None, 4])
+@pytest.mark.parametrize('ds_slice',
+                         [(slice(None), [95, 3, 11, 500]),
+                          ([230, 240, 2700, 20000], slice(None)),
+                          (10, [95, 3, -500])])
+def test_out_of_bounds_list_gets(ds_slice, max_workers):
+    """
+    Test that out of bounds list gets raise the same IndexError with and
+    without a thread pool and that in bounds negative indices are supported
+    """
+    path = os.path.join(TESTDATADIR, 'nsrdb/nsrdb_wspd_chunked_2012.h5')
+    dset = 'wind_speed'
+    with NSRDB(path, unscale=False, max_workers=max_workers) as f:
+        with pytest.raises(IndexError):
+            f[(dset, ) + ds_slice]  # pylint: disable=W0104
+
+        test = f[dset, 10, [95, 3, -5]]
+
+    baseline = get_baseline(path, dset, (10, [95, 3, -5]))
+    assert np.array_equal(baseline, test)
+
+
+def test_fetch_retries(monkeypatch):
+    """
+    Test that threaded fetches only retry transient I/O errors and re-raise
+    the original error
+    """
+    monkeypatch.setattr(ResourceDataset, 'RETRY_WAIT', 0)
+    path = os.path.join(TESTDATADIR, 'nsrdb/nsrdb_wspd_chunked_2012.h5')
+    calls = []
+
+    def flaky_read(arg):
+        calls.append(arg)
+        if calls.count(arg) < 3:
+            raise OSError('HTTP 503')
+
+        return arg
+
+    def bad_read(arg):
+        calls.append(arg)
+        raise ResourceRuntimeError('bad slice')
+
+    def down_read(arg):
+        raise OSError('HTTP 503')
+
+    with h5py.File(path, mode='r') as f:
+        ds = ResourceDataset(f['wind_speed'], max_workers=2)
+        with pytest.warns(RetryWarning):
+            assert ds._fetch(flaky_read, [1, 2]) == [1, 2]
+
+        calls.clear()
+        with pytest.raises(ResourceRuntimeError):
+            ds._fetch(bad_read, [1, 2])
+
+        assert len(calls) == len(set(calls))
+
+        calls.clear()
+        with pytest.raises(OSError), pytest.warns(RetryWarning):
+            ds._fetch(down_read, [1, 2])
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 
@@ -207,6 +207,26 @@ def test_preload_sam_hh():
         assert np.allclose(SAM_res['temperature'].values, t), msg2
 
 
+def test_preload_sam_site_hh():
+    """Test the preload_SAM method with a different hub height at each site
+    against preloading each site at its own hub height
+    """
+    h5 = os.path.join(TESTDATADIR, 'wtk/ri_100_wtk_2012.h5')
+    sites = list(range(0, 30, 3))
+    hub_heights = [80, 85, 90, 95, 100, 110, 120, 90, 80, 100]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        SAM_res = WindResource.preload_SAM(h5, sites, hub_heights,
+                                           require_wind_dir=True)
+        for i, (site, h) in enumerate(zip(sites, hub_heights)):
+            truth = WindResource.preload_SAM(h5, [site], h,
+                                             require_wind_dir=True)
+            for var in SAM_res.var_list:
+                assert np.allclose(SAM_res[var].values[:, i],
+                                   truth[var].values[:, 0], rtol=1e-5)
+
+
 @pytest.mark.parametrize('means', [True, False])
 def test_preload_sam_means(means):
     """Test the preload_SAM method with means=True.
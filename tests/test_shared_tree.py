@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+pytests for sharing cKDTrees between processes
+"""
+import numpy as np
+import os
+import pytest
+from scipy.spatial import cKDTree
+
+from rex import TESTDATADIR
+from rex.resource_extraction import ResourceX
+from rex.utilities.exceptions import FileInputError, ResourceRuntimeError
+from rex.utilities.execution import SpawnProcessPool
+import rex.utilities.shared_tree as shared_tree
+from rex.utilities.shared_tree import (is_shared_tree, load_shared_tree,
+                                       publish_tree)
+
+PATH = os.path.join(TESTDATADIR, 'nsrdb/nsrdb_wspd_chunked_2012.h5')
+
+
+def query_shared_tree(tree_dir, points):
+    """
+    Load a shared tree and query it (run in a worker process)
+    """
+    tree = load_shared_tree(tree_dir)
+
+    return tree.query(points)[1]
+
+
+def test_publish_load(tmpdir):
+    """
+    Test that a published tree loads zero-copy and matches the source tree
+    """
+    rng = np.random.default_rng(42)
+    data = rng.uniform(size=(5000, 2))
+    points = rng.uniform(size=(100, 2))
+    tree = cKDTree(data)
+
+    tree_dir = os.path.join(tmpdir, 'tree')
+    assert not is_shared_tree(tree_dir)
+    with pytest.raises(FileInputError):
+        load_shared_tree(tree_dir)
+
+    publish_tree(tree, tree_dir)
+    assert is_shared_tree(tree_dir)
+
+    shared = load_shared_tree(tree_dir)
+    assert isinstance(shared.data, np.memmap)
+    assert isinstance(shared.indices, np.memmap)
+    assert np.array_equal(shared.data, tree.data)
+    assert np.array_equal(shared.maxes, tree.maxes)
+    assert np.array_equal(shared.mins, tree.mins)
+    for k in (1, 4):
+        dist, idx = tree.query(points, k=k)
+        test_dist, test_idx = shared.query(points, k=k)
+        assert np.array_equal(dist, test_dist)
+        assert np.array_equal(idx, test_idx)
+
+    with SpawnProcessPool(max_workers=2) as exe:
+        futures = [exe.submit(query_shared_tree, tree_dir, points)
+                   for _ in range(2)]
+        for future in futures:
+            assert np.array_equal(future.result(), tree.query(points)[1])
+
+
+def test_resourcex_shared_tree(tmpdir):
+    """
+    Test sharing a ResourceX tree
+    """
+    with ResourceX(PATH) as f:
+        lat_lon = f.lat_lon
+        gids = f.lat_lon_gid(lat_lon[:20])
+        tree_dir = f.share_tree()
+        assert is_shared_tree(tree_dir)
+        assert f.share_tree() == tree_dir
+
+        out_dir = os.path.join(tmpdir, 'shared')
+        assert f.share_tree(out_dir) == out_dir
+
+    with ResourceX(PATH, tree=out_dir) as f:
+        assert isinstance(f.tree.data, np.memmap)
+        assert np.array_equal(f.lat_lon_gid(lat_lon[:20]), gids)
+
+
+def test_state_layout(tmpdir, monkeypatch):
+    """
+    Test that a cKDTree state layout mismatch raises a clear error and
+    that ResourceX falls back to building the tree in each process
+    """
+    with ResourceX(PATH) as f:
+        lat_lon = f.lat_lon
+        gids = f.lat_lon_gid(lat_lon[:20])
+        tree_dir = f.share_tree(os.path.join(tmpdir, 'shared'))
+
+    monkeypatch.setattr(shared_tree, 'STATE_LEN', shared_tree.STATE_LEN + 1)
+    with pytest.raises(ResourceRuntimeError):
+        publish_tree(cKDTree(lat_lon), os.path.join(tmpdir, 'new'))
+
+    with pytest.raises(ResourceRuntimeError):
+        load_shared_tree(tree_dir)
+
+    with ResourceX(PATH, tree=tree_dir) as f:
+        assert not isinstance(f.tree.data, np.memmap)
+        assert np.array_equal(f.lat_lon_gid(lat_lon[:20]), gids)
+        assert f.share_tree(os.path.join(tmpdir, 'new')) is None
+
+
+def execute_pytest(capture='all', flags='-rapP'):
+    """Execute module as pytest with detailed summary report.
+
+    Parameters
+    ----------
+    capture : str
+        Log or stdout/stderr capture option. ex: log (only logger),
+        all (includes stdout/stderr)
+    flags : str
+        Which tests to show logs and results for.
+    """
+
+    fname = os.path.basename(__file__)
+    pytest.main(['-q', '--show-capture={}'.format(capture), fname, flags])
+
+
+if __name__ == '__main__':
+    execute_pytest()
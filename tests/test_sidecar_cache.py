@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+pytests for the persistent meta/time_index sidecar cache
+"""
+import os
+import shutil
+import pytest
+from pandas.testing import assert_frame_equal, assert_index_equal
+
+from rex import TESTDATADIR
+from rex.renewable_resource import NSRDB
+from rex.resource import Resource
+from rex.utilities.sidecar_cache import SidecarCache
+
+SZA_PATH = os.path.join(TESTDATADIR, 'sza/nsrdb_sza_2012.h5')
+
+
+def test_cached_meta_time_index(tmpdir):
+    """
+    Test that meta and time_index are cached to and loaded from disk
+    """
+    cache_dir = os.path.join(tmpdir, 'cache')
+    with Resource(SZA_PATH) as f:
+        meta = f.meta
+        time_index = f.time_index
+
+    with NSRDB(SZA_PATH, cache_dir=cache_dir) as f:
+        assert_frame_equal(meta, f.meta)
+        assert_index_equal(time_index, f.time_index)
+
+    assert len(os.listdir(cache_dir)) == 2
+
+    def _fail(*args, **kwargs):
+        raise RuntimeError('meta should be loaded from the cache!')
+
+    with Resource(SZA_PATH, cache_dir=cache_dir) as f:
+        f._get_meta = _fail
+        f._get_time_index = _fail
+        assert_frame_equal(meta, f.meta)
+        assert_index_equal(time_index, f.time_index)
+
+    with Resource(SZA_PATH, cache_dir=cache_dir, str_decode=False) as f:
+        f.meta  # pylint: disable=W0104
+
+    assert len(os.listdir(cache_dir)) == 3
+
+
+def test_cache_invalidation(tmpdir):
+    """
+    Test that cache entries are invalidated when the source file changes
+    """
+    cache_dir = os.path.join(tmpdir, 'cache')
+    path = os.path.join(tmpdir, os.path.basename(SZA_PATH))
+    shutil.copy(SZA_PATH, path)
+
+    cache = SidecarCache(cache_dir)
+    # key args match Resource: (group, ds_name, str_decode)
+    key = cache.get_key(path, None, 'meta', True)
+    with Resource(path, cache_dir=cache_dir) as f:
+        meta = f.meta
+
+    assert os.path.exists(cache.get_path(key))
+    assert_frame_equal(meta, cache.load(key))
+
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert cache.get_key(path, None, 'meta', True) != key
+
+
+def test_cache_load_save(tmpdir):
+    """
+    Test SidecarCache load and save of arbitrary objects and bad entries
+    """
+    cache = SidecarCache(str(tmpdir))
+    assert cache.get_key('s3://bucket/file.h5', 'meta') is None
+    assert cache.get_key(SZA_PATH, 'meta') == cache.get_key(SZA_PATH, 'meta')
+    assert cache.get_key(SZA_PATH, 'meta') != cache.get_key(SZA_PATH, 'ti')
+
+    key = cache.get_key(SZA_PATH, 'test')
+    assert cache.load(key) is None
+    cache.save(key, {'a': [1, 2, 3]})
+    assert cache.load(key) == {'a': [1, 2, 3]}
+
+    with open(cache.get_path(key), 'w') as f:
+        f.write('corrupt')
+
+    with pytest.warns(Warning):
+        assert cache.load(key) is None
+
+
+def execute_pytest(capture='all', flags='-rapP'):
+    """Execute module as pytest with detailed summary report.
+
+    Parameters
+    ----------
+    capture : str
+        Log or stdout/stderr capture option. ex: log (only logger),
+        all (includes stdout/stderr)
+    flags : str
+        Which tests to show logs and results for.
+    """
+
+    fname = os.path.basename(__file__)
+    pytest.main(['-q', '--show-capture={}'.format(capture), fname, flags])
+
+
+if __name__ == '__main__':
+    execute_pytest()
@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+"""
+pytests for the streaming temporal stats engine
+"""
+import numpy as np
+import os
+import pandas as pd
+import pytest
+import tempfile
+from types import SimpleNamespace
+
+from rex.temporal_stats.streaming import (GroupIndex, GroupReducer,
+                                          QuantileSketch, RunningStats,
+                                          StreamingStats)
+from rex.temporal_stats.temporal_stats import TemporalStats
+
+TIME_INDEX = pd.date_range('2012-01-01', '2013-01-01', freq='30min',
+                           inclusive='left')
+
+
+def get_data(n_sites=10, seed=42):
+    """
+    Make random test data with NaNs and an all NaN site
+    """
+    rng = np.random.default_rng(seed)
+    data = rng.normal(10, 3, (len(TIME_INDEX), n_sites)).astype(np.float32)
+    data[rng.uniform(size=data.shape) < 0.1] = np.nan
+    data[:, 3] = np.nan
+
+    return data
+
+
+def test_group_index():
+    """
+    Test group reductions against bincount
+    """
+    rng = np.random.default_rng(0)
+    codes = rng.integers(0, 7, 1000)
+    codes[codes == 5] = 4
+    arr = rng.uniform(size=(1000, 3))
+    index = GroupIndex(codes, 8)
+    assert np.array_equal(index.groups, [0, 1, 2, 3, 4, 6])
+
+    out = index.reduce(np.add, arr)
+    assert out.shape == (8, 3)
+    for i in range(3):
+        truth = np.bincount(codes, weights=arr[:, i], minlength=8)
+        assert np.allclose(out[:, i], truth)
+
+    out = index.reduce(np.maximum, arr, fill=-1)
+    assert np.all(out[[5, 7]] == -1)
+    assert np.allclose(out[0], arr[codes == 0].max(axis=0))
+
+
+@pytest.mark.parametrize('chunk_size', [100, 1000, len(TIME_INDEX)])
+def test_running_stats(chunk_size):
+    """
+    Test chunked running stats against numpy
+    """
+    data = get_data()
+    codes = np.zeros(len(data), dtype=int)
+    stats = RunningStats(1, data.shape[1])
+    for i in range(0, len(data), chunk_size):
+        stats.update(data[i:i + chunk_size], codes[i:i + chunk_size])
+
+    data = data.astype(np.float64)
+    with pytest.warns(RuntimeWarning):
+        truth = {'mean': np.nanmean(data, axis=0),
+                 'std': np.nanstd(data, axis=0),
+                 'min': np.nanmin(data, axis=0),
+                 'max': np.nanmax(data, axis=0)}
+
+    for stat, arr in truth.items():
+        assert np.allclose(stats.get_stat(stat)[0], arr, equal_nan=True,
+                           rtol=1e-6)
+
+    assert np.array_equal(stats.get_stat('count')[0],
+                          (~np.isnan(data)).sum(axis=0))
+
+
+def test_merge():
+    """
+    Test merging running stats of separate time chunks
+    """
+    data = get_data()
+    codes = TIME_INDEX.month.values - 1
+    truth = RunningStats(12, data.shape[1])
+    truth.update(data, codes)
+
+    split = 5000
+    test = RunningStats(12, data.shape[1])
+    test.update(data[:split], codes[:split])
+    other = RunningStats(12, data.shape[1])
+    other.update(data[split:], codes[split:])
+    test.merge(other)
+
+    for stat in RunningStats.STATS:
+        assert np.allclose(test.get_stat(stat), truth.get_stat(stat),
+                           equal_nan=True)
+
+    with pytest.raises(ValueError):
+        test.merge(RunningStats(1, data.shape[1]))
+
+
+@pytest.mark.parametrize('grouping', [(), ('month', ), ('hour', ),
+                                      ('month', 'hour')])
+def test_streaming_groupings(grouping):
+    """
+    Test that all groupings derived from the finest grouping match pandas
+    groupby stats
+    """
+    data = get_data()
+    groupings = [(), ('month', ), ('hour', ), ('month', 'hour')]
+    engine = StreamingStats(TIME_INDEX, data.shape[1], groupings=groupings)
+    for i in range(0, len(data), 1000):
+        engine.update(data[i:i + 1000], slice(i, i + 1000))
+
+    keys, test = engine.get_stats(grouping, ['mean', 'std', 'min', 'max'])
+
+    df = pd.DataFrame(data, index=TIME_INDEX)
+    if grouping:
+        by = [getattr(TIME_INDEX, f) for f in grouping]
+        df = df.groupby(by if len(by) > 1 else by[0])
+        assert keys == list(df.groups)
+        truth = {'mean': df.mean(), 'std': df.std(ddof=0), 'min': df.min(),
+                 'max': df.max()}
+    else:
+        assert keys is None
+        truth = {'mean': df.mean().to_frame().T,
+                 'std': df.std(ddof=0).to_frame().T,
+                 'min': df.min().to_frame().T,
+                 'max': df.max().to_frame().T}
+
+    for stat, arr in truth.items():
+        assert np.allclose(test[stat], arr.values, equal_nan=True,
+                           rtol=1e-5)
+
+    with pytest.raises(KeyError):
+        StreamingStats(TIME_INDEX, 10, groupings=[('day', )])
+
+
+@pytest.mark.parametrize('accuracy', [0.01, 0.05])
+def test_quantile_sketch(accuracy):
+    """
+    Test chunked sketch quantiles against numpy within the relative accuracy
+    """
+    data = get_data()
+    data[:, 5] -= 10
+    codes = TIME_INDEX.month.values - 1
+    sketch = QuantileSketch(12, data.shape[1], accuracy=accuracy)
+    for i in range(0, len(data), 1000):
+        sketch.update(data[i:i + 1000], codes[i:i + 1000])
+
+    assert np.array_equal(sketch.count.sum(axis=0),
+                          (~np.isnan(data)).sum(axis=0))
+    assert len(sketch.keys) <= (~np.isnan(data)).sum()
+    assert np.all(np.diff(sketch.keys) > 0)
+
+    q = [0.01, 0.1, 0.5, 0.9, 0.99]
+    test = sketch.quantile(q)
+    assert test.shape == (len(q), 12, data.shape[1])
+    assert np.isnan(test[:, :, 3]).all()
+    for month in range(12):
+        with pytest.warns(RuntimeWarning):
+            truth = np.nanquantile(data[codes == month].astype(np.float64),
+                                   q, axis=0)
+
+        error = np.abs(test[:, month] - truth)
+        assert np.all(np.delete(error, 3, axis=1)
+                      <= accuracy * np.abs(np.delete(truth, 3, axis=1))
+                      + 1e-6)
+
+    with pytest.raises(ValueError):
+        QuantileSketch(1, 10, accuracy=1)
+
+
+def test_quantile_cdf():
+    """
+    Test that streaming CDFs span the exact min and max and merged engines
+    match an engine computed in one pass
+    """
+    data = get_data()
+    groupings = [(), ('month', )]
+    truth = StreamingStats(TIME_INDEX, data.shape[1], groupings=groupings,
+                           quantile_accuracy=0.01)
+    truth.update(data)
+
+    split = 5000
+    test = StreamingStats(TIME_INDEX[:split], data.shape[1],
+                          groupings=groupings, quantile_accuracy=0.01)
+    test.update(data[:split])
+    other = StreamingStats(TIME_INDEX[split:], data.shape[1],
+                           groupings=groupings, quantile_accuracy=0.01)
+    other.update(data[split:])
+    test.merge(other)
+
+    for grouping in groupings:
+        keys, x_values = test.get_cdf(grouping, n_samples=20,
+                                      sampling='invlog')
+        truth_keys, truth_x = truth.get_cdf(grouping, n_samples=20,
+                                            sampling='invlog')
+        assert keys == truth_keys
+        assert np.allclose(x_values, truth_x, equal_nan=True)
+        assert x_values.shape[0] == 20
+        assert np.all(np.diff(x_values[:, :, :3], axis=0) >= 0)
+
+        _, stats = test.get_stats(grouping, ['min', 'max', 0.5])
+        assert np.array_equal(x_values[0], stats['min'], equal_nan=True)
+        assert np.array_equal(x_values[-1], stats['max'], equal_nan=True)
+
+    engine = StreamingStats(TIME_INDEX, data.shape[1])
+    with pytest.raises(KeyError):
+        engine.get_stats((), [0.5])
+
+    with pytest.raises(ValueError):
+        test.merge(engine)
+
+
+def test_save_load_concat():
+    """
+    Test concatenating engines of different sites and saving and loading
+    partial aggregates
+    """
+    data = get_data()
+    groupings = [(), ('month', ), ('month', 'hour')]
+    stats = ['mean', 'std', 'min', 'max', 0.5]
+    truth = StreamingStats(TIME_INDEX, data.shape[1], groupings=groupings,
+                           quantile_accuracy=0.01)
+    truth.update(data)
+
+    engines = []
+    for sites in [slice(0, 3), slice(3, 4), slice(4, None)]:
+        engine = StreamingStats(TIME_INDEX, data[:, sites].shape[1],
+                                groupings=groupings, quantile_accuracy=0.01)
+        engine.update(data[:, sites])
+        engines.append(engine)
+
+    test = StreamingStats.concat(engines)
+    assert test.n_sites == data.shape[1]
+
+    with tempfile.TemporaryDirectory() as td:
+        fpath = os.path.join(td, 'partial.npz')
+        test.save(fpath, meta={'dataset': 'test'})
+        assert StreamingStats.load_meta(fpath) == {'dataset': 'test'}
+        test = StreamingStats.load(fpath)
+
+    for grouping in groupings:
+        keys, values = test.get_stats(grouping, stats)
+        truth_keys, truth_values = truth.get_stats(grouping, stats)
+        assert keys == truth_keys
+        for stat in stats:
+            assert np.allclose(values[stat], truth_values[stat],
+                               equal_nan=True)
+
+    engine = StreamingStats(TIME_INDEX, data.shape[1], groupings=groupings)
+    with pytest.raises(ValueError):
+        StreamingStats.concat([test, engine])
+
+
+@pytest.mark.parametrize('grouping', [(), ('month', ), ('month', 'hour')])
+def test_group_reducer(grouping):
+    """
+    Test vectorized group averages against per group numpy functions
+    """
+    data = get_data() * 20
+    data[:, 3] = np.nan
+    weights = np.abs(get_data(seed=0)) / 5
+    weights[:, 3] = 1
+    reducer = GroupReducer(TIME_INDEX, grouping)
+
+    df = pd.DataFrame(data, index=TIME_INDEX)
+    if grouping:
+        by = [getattr(TIME_INDEX, f) for f in grouping]
+        groups = df.groupby(by if len(by) > 1 else by[0]).indices
+        assert reducer.keys == list(groups)
+        groups = list(groups.values())
+    else:
+        assert reducer.keys is None
+        groups = [np.arange(len(data))]
+
+    assert reducer.n_groups == len(groups)
+    assert reducer.index.n_groups == len(groups)
+    average = reducer.average(data, weights=weights)
+    for i, idx in enumerate(groups):
+        assert np.allclose(average[i],
+                           np.average(data[idx], weights=weights[idx],
+                                      axis=0), equal_nan=True)
+
+
+@pytest.mark.parametrize(('month', 'diurnal'),
+                         [(False, False), (True, False), (True, True)])
+def test_stream_std_ddof(month, diurnal, monkeypatch):
+    """
+    Test that streamed and group reduced stds match the ddof of the legacy
+    pandas groupby stats, including an explicit ddof kwarg
+    """
+    data = get_data()
+    statistics = {'mean': TemporalStats.STATS['mean'],
+                  'std': TemporalStats.STATS['std'],
+                  'std_ddof1': {'func': np.nanstd,
+                                'kwargs': {'axis': 0, 'ddof': 1}}}
+    grouping = tuple(field for field, flag
+                     in (('month', month), ('hour', diurnal)) if flag)
+    engine = StreamingStats(TIME_INDEX, data.shape[1], groupings=[grouping])
+    for i in range(0, len(data), 1000):
+        engine.update(data[i:i + 1000], slice(i, i + 1000))
+
+    stream_stats = TemporalStats._get_streaming_stats(statistics)
+    assert stream_stats['std_ddof1'] == ('std', 1)
+    test = TemporalStats._format_stream_stats(engine, stream_stats,
+                                              [grouping])
+
+    res_data = pd.DataFrame(data, index=TIME_INDEX)
+    reduced = TemporalStats._compute_stats(res_data, statistics,
+                                           diurnal=diurnal, month=month)
+    monkeypatch.setattr(TemporalStats, 'GROUP_REDUCE_FUNCS', {})
+    truth = TemporalStats._compute_stats(res_data, statistics,
+                                         diurnal=diurnal, month=month)
+
+    assert list(test.columns) == list(truth.columns)
+    assert np.allclose(test.values, truth.values, equal_nan=True, rtol=1e-5)
+    assert np.allclose(reduced.values, truth.values, equal_nan=True,
+                       rtol=1e-5)
+
+
+def test_stream_empty_time_index():
+    """
+    Test that streaming an empty time index gives NaN full time series stats
+    """
+    res = SimpleNamespace(shape=(0, 10))
+    statistics = {s: TemporalStats.STATS[s] for s in ('mean', 'std')}
+    stream_stats = TemporalStats._get_streaming_stats(statistics)
+    groupings = [(), ('month', )]
+    engine = TemporalStats._stream_engine(res, 'dset', TIME_INDEX[:0],
+                                          slice(None, None, 2), groupings)
+    assert engine.n_sites == 5
+
+    out = TemporalStats._format_stream_stats(engine, stream_stats,
+                                             groupings)
+    assert out.shape == (5, 2)
+    assert list(out.columns) == ['mean', 'std']
+    assert out.isna().all().all()
+
+
+def execute_pytest(capture='all', flags='-rapP'):
+    """Execute module as pytest with detailed summary report.
+
+    Parameters
+    ----------
+    capture : str
+        Log or stdout/stderr capture option. ex: log (only logger),
+        all (includes stdout/stderr)
+    flags : str
+        Which tests to show logs and results for.
+    """
+
+    fname = os.path.basename(__file__)
+    pytest.main(['-q', '--show-capture={}'.format(capture), fname, flags])
+
+
+if __name__ == '__main__':
+    execute_pytest()
@@ -3,9 +3,11 @@
 pytests for TemporalStats
 """
 from click.testing import CliRunner
+from glob import glob
 import numpy as np
 import os
 import pandas as pd
+from pandas.testing import assert_frame_equal
 import pytest
 import scipy
 import tempfile
@@ -411,6 +413,174 @@ def test_scipy_dist_fit():
         assert stats2.loc[gid, 'weibull'][1] == 0
 
 
+@pytest.mark.parametrize(("max_workers", "sites", "mask_zeros"),
+                         [(1, slice(None), False),
+                          (1, slice(None, None, 10), True),
+                          (1, list(range(20)), False),
+                          (None, slice(None), True)])
+def test_streaming_stats(max_workers, sites, mask_zeros):
+    """
+    Test that the streaming engine matches the legacy pandas stats
+    """
+    statistics = ('mean', 'std', 'min', 'max')
+    kwargs = {'sites': sites, 'max_workers': max_workers,
+              'mask_zeros': mask_zeros}
+    test = TemporalStats(RES_H5, statistics=statistics,
+                         res_cls=WindResource)
+    truth = TemporalStats(RES_H5, statistics=statistics,
+                          res_cls=WindResource, streaming=False)
+    assert TemporalStats._get_streaming_stats(test.statistics) is not None
+
+    for method in ['full_stats', 'monthly_stats', 'diurnal_stats',
+                   'monthly_diurnal_stats', 'all_stats']:
+        test_stats = getattr(test, method)(DATASET, **kwargs)
+        truth_stats = getattr(truth, method)(DATASET, **kwargs)
+        assert_frame_equal(test_stats, truth_stats, check_dtype=False,
+                           rtol=1e-5)
+
+
+def test_streaming_fallback():
+    """
+    Test that statistics the streaming engine does not support use the
+    legacy pandas stats
+    """
+    stats = {'min': {'func': np.min, 'kwargs': {'axis': 0}},
+             'mean': {'func': np.nanmean, 'kwargs': {'axis': 0}}}
+    assert TemporalStats._get_streaming_stats(stats) is None
+
+    stats = {'mean': {'func': np.nanmean, 'kwargs': {'axis': 1}}}
+    assert TemporalStats._get_streaming_stats(stats) is None
+
+    stats = {'avg': {'func': np.nanmean}, 'max': TemporalStats.STATS['max']}
+    assert (TemporalStats._get_streaming_stats(stats)
+            == {'avg': 'mean', 'max': 'max'})
+
+
+def test_streaming_quantiles():
+    """
+    Test approximate streaming quantiles against the exact legacy stats
+    """
+    statistics = {s: TemporalStats.STATS[s]
+                  for s in ('median', 'p10', 'p90')}
+    statistics['q75'] = {'func': np.nanquantile,
+                         'kwargs': {'q': 0.75, 'axis': 0}}
+    accuracy = 0.01
+    test = TemporalStats(RES_H5, statistics=statistics,
+                         res_cls=WindResource, quantile_accuracy=accuracy)
+    truth = TemporalStats(RES_H5, statistics=statistics,
+                          res_cls=WindResource)
+    assert TemporalStats._get_streaming_stats(truth.statistics) is None
+    assert (TemporalStats._get_streaming_stats(test.statistics,
+                                               quantile_accuracy=accuracy)
+            == {'median': 0.5, 'p10': 0.1, 'p90': 0.9, 'q75': 0.75})
+
+    test_stats = test.all_stats(DATASET, max_workers=1)
+    truth_stats = truth.all_stats(DATASET, max_workers=1)
+    assert list(test_stats.columns) == list(truth_stats.columns)
+    error = np.abs(test_stats.values - truth_stats.values)
+    assert np.all(error <= accuracy * np.abs(truth_stats.values) + 1e-6)
+
+    stats = {'p': {'func': np.nanpercentile,
+                   'kwargs': {'q': [10, 90], 'axis': 0}}}
+    assert TemporalStats._get_streaming_stats(
+        stats, quantile_accuracy=accuracy) is None
+
+
+def test_multi_year_partials(monkeypatch):
+    """
+    Test multi-year stats merged from per-year partial aggregates against
+    the legacy multi-year stats and that partial aggregates are re-used
+    without opening the files
+    """
+    res_h5 = os.path.join(TESTDATADIR, 'wtk/ri_100_wtk_*.h5')
+    statistics = ('mean', 'std', 'min', 'max')
+    truth = TemporalStats(res_h5, statistics=statistics,
+                          res_cls=MultiYearWindResource, streaming=False)
+    truth = truth.all_stats(DATASET, max_workers=1)
+
+    with tempfile.TemporaryDirectory() as td:
+        kwargs = {'statistics': statistics, 'month': True, 'diurnal': True,
+                  'combinations': True, 'res_cls': WindResource,
+                  'max_workers': 1}
+        test = TemporalStats.multi_year(res_h5, DATASET, td, **kwargs)
+        assert_frame_equal(test, truth, check_dtype=False, rtol=1e-5)
+
+        partials = sorted(os.listdir(td))
+        assert len(partials) == 2
+        mtimes = [os.path.getmtime(os.path.join(td, fp)) for fp in partials]
+        test = TemporalStats.multi_year(res_h5, DATASET, td, **kwargs)
+        assert_frame_equal(test, truth, check_dtype=False, rtol=1e-5)
+        assert mtimes == [os.path.getmtime(os.path.join(td, fp))
+                          for fp in partials]
+
+        opened = []
+        init = TemporalStats.__init__
+
+        def init_spy(self, res_h5, **kwargs):
+            opened.append(res_h5)
+            init(self, res_h5, **kwargs)
+
+        with monkeypatch.context() as m:
+            m.setattr(TemporalStats, '__init__', init_spy)
+            test = TemporalStats.multi_year(res_h5, DATASET, td, **kwargs)
+
+        assert_frame_equal(test, truth, check_dtype=False, rtol=1e-5)
+        assert opened == sorted(glob(res_h5))[-1:]
+
+        kwargs['statistics'] = 'median'
+        with pytest.raises(RuntimeError):
+            TemporalStats.multi_year(res_h5, DATASET, td, **kwargs)
+
+
+@pytest.mark.parametrize(('month', 'diurnal'),
+                         [(False, False), (True, False), (True, True)])
+def test_group_reductions(month, diurnal, monkeypatch):
+    """
+    Test vectorized group reductions against pandas groupby stats
+    """
+    res_data = pd.DataFrame(RES_DATA, index=TIME_INDEX)
+    statistics = {s: TemporalStats.STATS[s] for s in ('mean', 'std', 'max')}
+    statistics['circular_mean'] = {'func': circular_mean}
+    test = TemporalStats._compute_stats(res_data, statistics,
+                                        diurnal=diurnal, month=month)
+
+    monkeypatch.setattr(TemporalStats, 'GROUP_REDUCE_FUNCS', {})
+    truth = TemporalStats._compute_stats(res_data, statistics,
+                                         diurnal=diurnal, month=month)
+    assert_frame_equal(test, truth, check_dtype=False, rtol=1e-4,
+                       atol=1e-3)
+
+
+@pytest.mark.parametrize(("streaming", "sites"),
+                         [(True, slice(None)),
+                          (False, slice(None, None, 10)),
+                          (True, list(range(20)))])
+def test_shared_memory(streaming, sites):
+    """
+    Test parallel stats with long-lived workers and a shared memory result
+    array
+    """
+    statistics = ('mean', 'std', 'max', 'p90')
+    kwargs = {'sites': sites, 'max_workers': 2, 'chunks_per_worker': 1}
+    test = TemporalStats(RES_H5, statistics=statistics, res_cls=WindResource,
+                         streaming=streaming, shared_memory=True)
+    truth = TemporalStats(RES_H5, statistics=statistics, res_cls=WindResource,
+                          streaming=streaming)
+    columns = TemporalStats._get_stats_columns(test.statistics,
+                                               test.time_index, month=True,
+                                               diurnal=True,
+                                               combinations=True)
+    assert columns is not None
+
+    test_stats = test.all_stats(DATASET, **kwargs)
+    truth_stats = truth.all_stats(DATASET, **kwargs)
+    assert_frame_equal(test_stats, truth_stats)
+
+    statistics = {'mode': {'func': mode_func}}
+    assert TemporalStats._get_stats_columns(statistics, test.time_index) \
+        is None
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 
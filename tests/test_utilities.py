@@ -6,10 +6,11 @@ import os
 import json
 from tempfile import TemporaryDirectory
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from rex.utilities import parse_table, check_res_file
+from rex.utilities import parse_table, check_res_file, rex_unscale
 from rex import TESTDATADIR
 
 NSRDB_DIR = os.path.join(TESTDATADIR, 'nsrdb')
@@ -69,6 +70,19 @@ def test_check_res_file_dne():
         assert not hsds
 
 
+@pytest.mark.parametrize(('scale_factor', 'adder'),
+                         [(100, 0), (np.float64(0.01), -10)])
+def test_rex_unscale_out(scale_factor, adder):
+    """Test unscaling directly into a pre-allocated output array"""
+    data = np.random.randint(-1000, 1000, (100, 10)).astype(np.int16)
+    baseline = rex_unscale(data.astype(np.float64), scale_factor, adder)
+
+    out = np.empty(data.shape, dtype=np.float32)
+    test = rex_unscale(data, scale_factor, adder, out=out)
+    assert test is out
+    assert np.allclose(baseline, out, rtol=1e-6, atol=1e-5)
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+pytests for VirtualH5
+"""
+from click.testing import CliRunner
+import h5py
+import numpy as np
+import os
+import pytest
+import tempfile
+import traceback
+
+from rex.multi_file_resource import MultiFileNSRDB
+from rex.multi_year_resource import MultiYearNSRDB
+from rex.rechunk_h5.virtual_h5 import VirtualH5
+from rex.rechunk_h5.virtual_h5_cli import main
+from rex.renewable_resource import NSRDB
+from rex.utilities.loggers import LOGGERS
+from rex import TESTDATADIR
+
+
+@pytest.fixture(scope="module")
+def runner():
+    """
+    cli runner
+    """
+    return CliRunner()
+
+
+def check_virtual(vds, truth):
+    """
+    Compare a virtual .h5 file with a multi-file or multi-year handler
+    """
+    with h5py.File(vds, mode='r') as f:
+        for dset in truth.datasets:
+            if dset not in ('meta', 'time_index', 'coordinates'):
+                assert f[dset].is_virtual
+
+    with NSRDB(vds) as res:
+        assert res.time_index.equals(truth.time_index)
+        assert res.meta.equals(truth.meta)
+        assert sorted(res.datasets) == sorted(truth.datasets)
+        for dset in ('dni', 'ghi'):
+            assert res.shapes[dset] == (len(truth.time_index),
+                                        len(truth.meta))
+            assert res.get_scale_factor(dset) == truth.get_scale_factor(dset)
+            assert np.allclose(res[dset, :, 5], truth[dset, :, 5])
+            assert np.allclose(res[dset, 10:200:3, [2, 7, 40]],
+                               truth[dset, 10:200:3, [2, 7, 40]])
+            assert np.allclose(res[dset, -50:], truth[dset, -50:])
+
+
+def test_multi_year_virtual_h5():
+    """
+    Test a virtual .h5 file of multiple years against MultiYearNSRDB
+    """
+    source = os.path.join(TESTDATADIR, 'nsrdb/ri_100_nsrdb_*.h5')
+    with tempfile.TemporaryDirectory() as td:
+        vds = os.path.join(td, 'vds.h5')
+        VirtualH5.run(vds, source)
+        with MultiYearNSRDB(source) as truth:
+            check_virtual(vds, truth)
+
+        with pytest.raises(FileExistsError):
+            VirtualH5.run(vds, source, overwrite=False)
+
+
+def test_multi_file_virtual_h5(runner):
+    """
+    Test a virtual .h5 file of the multi-file NSRDB layout against
+    MultiFileNSRDB with the CLI
+    """
+    source = os.path.join(TESTDATADIR, 'nsrdb/nsrdb*2018.h5')
+    with tempfile.TemporaryDirectory() as td:
+        vds = os.path.join(td, 'vds.h5')
+        result = runner.invoke(main, ['-vds', vds, '-src', source])
+        msg = ('Failed with error {}'
+               .format(traceback.print_exception(*result.exc_info)))
+        assert result.exit_code == 0, msg
+
+        with MultiFileNSRDB(source) as truth:
+            check_virtual(vds, truth)
+
+    LOGGERS.clear()
+
+
+def execute_pytest(capture='all', flags='-rapP'):
+    """Execute module as pytest with detailed summary report.
+
+    Parameters
+    ----------
+    capture : str
+        Log or stdout/stderr capture option. ex: log (only logger),
+        all (includes stdout/stderr)
+    flags : str
+        Which tests to show logs and results for.
+    """
+
+    fname = os.path.basename(__file__)
+    pytest.main(['-q', '--show-capture={}'.format(capture), fname, flags])
+
+
+if __name__ == '__main__':
+    execute_pytest()
@@ -96,6 +96,21 @@ def test_workers(max_workers):
                        check_index_type=False)
 
 
+@pytest.mark.parametrize("sites", [None, slice(None, None, 10),
+                                   list(range(20))])
+def test_shared_memory(sites):
+    """
+    Test WindRose with long-lived workers and a shared memory result array
+    """
+    kwargs = {'wspd_bins': (0, 30, 1), 'wdir_bins': (0, 360, 5),
+              'sites': sites, 'max_workers': 2, 'chunks_per_worker': 1}
+    test = JointPD.wind_rose(WIND_H5, HUB_HEIGHT, shared_memory=True,
+                             **kwargs)
+    truth = JointPD.wind_rose(WIND_H5, HUB_HEIGHT, **kwargs)
+
+    assert_frame_equal(test, truth)
+
+
 @pytest.mark.parametrize("sites",
                          [slice(None), slice(None, None, 10), list(range(20)),
                           np.random.choice(range(100), 20, replace=False)])
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+pytests for long-lived worker utilities
+"""
+import numpy as np
+import os
+import pytest
+
+from rex import TESTDATADIR
+from rex.resource import Resource
+from rex.utilities.execution import SpawnProcessPool
+from rex.utilities.worker_pool import (WORKER_RESOURCES, SharedArray,
+                                       close_worker_resources,
+                                       get_worker_resource)
+
+PATH = os.path.join(TESTDATADIR, 'nsrdb/nsrdb_wspd_chunked_2012.h5')
+DATASET = 'wind_speed'
+
+
+def fill_rows(out, rows):
+    """
+    Fill rows of a shared array with the mean of a worker resource dataset
+    (run in a worker process)
+    """
+    res = get_worker_resource(Resource, PATH)
+    out.array[rows] = res[DATASET, :, rows].mean(axis=0)
+    out.close()
+
+    return id(res), len(WORKER_RESOURCES)
+
+
+def test_shared_array():
+    """
+    Test filling a shared array from worker processes
+    """
+    with Resource(PATH) as f:
+        truth = f[DATASET].mean(axis=0)
+
+    slices = [slice(i, i + 10) for i in range(0, len(truth), 10)]
+    with SharedArray(len(truth), fill=np.nan) as out:
+        assert out.shape == truth.shape
+        assert out.dtype == np.float64
+        assert np.isnan(out.array).all()
+        with SpawnProcessPool(max_workers=2) as exe:
+            futures = [exe.submit(fill_rows, out, rows) for rows in slices]
+            results = [future.result() for future in futures]
+
+        test = out.array.copy()
+
+    assert np.allclose(test, truth)
+
+    # each worker opened the resource once and re-used it in later tasks
+    assert all(n_open == 1 for _, n_open in results)
+    assert len({res_id for res_id, _ in results}) <= 2
+
+
+def test_worker_resource():
+    """
+    Test that worker resources are cached until they are closed
+    """
+    res = get_worker_resource(Resource, PATH)
+    assert get_worker_resource(Resource, PATH) is res
+    time_index = res.time_index
+    assert get_worker_resource(Resource, PATH).time_index is time_index
+
+    close_worker_resources()
+    assert not WORKER_RESOURCES
+    with pytest.raises(Exception):
+        res[DATASET, 0, 0]
+
+    res = get_worker_resource(Resource, PATH)
+    assert res[DATASET, 0, 0] is not None
+    close_worker_resources()
+
+
+def execute_pytest(capture='all', flags='-rapP'):
+    """Execute module as pytest with detailed summary report.
+
+    Parameters
+    ----------
+    capture : str
+        Log or stdout/stderr capture option. ex: log (only logger),
+        all (includes stdout/stderr)
+    flags : str
+        Which tests to show logs and results for.
+    """
+
+    fname = os.path.basename(__file__)
+    pytest.main(['-q', '--show-capture={}'.format(capture), fname, flags])
+
+
+if __name__ == '__main__':
+    execute_pytest()